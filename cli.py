@@ -0,0 +1,209 @@
+# cli.py
+# GUI 없이 파일 하나를 번역하는 명령줄 진입점 (tkinter를 import하지 않음).
+# 사용 예: python cli.py 발표자료.pptx --src 한국어 --tgt 영어 [--model gemma3:12b] [--no-images] [--gpu] [-o 결과.pptx]
+import argparse
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+# 설정 파일 import
+import config
+from translator import OllamaTranslator
+from pptx_handler import PptxHandler
+from chart_xml_handler import ChartXmlHandler
+from ollama_service import OllamaService
+from cpu_resource_manager import CpuResourceManager
+from memory_governor import MemoryGovernor
+from ocr_engine_registry import OcrEngineRegistry, resolve_ocr_engine
+import utils
+
+logger = logging.getLogger(__name__)
+
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+EXIT_STOPPED = 130 # Ctrl+C로 중지 (부분 결과 저장)
+
+
+def _default_output_path(file_path: str, tgt_lang: str) -> str:
+    # GUI와 같은 규칙: 원본 폴더에 '<원본>_<대상 언어>_translated.pptx'
+    safe_target_lang_suffix = "".join(c if c.isalnum() else "_" for c in tgt_lang)
+    return os.path.join(os.path.dirname(os.path.abspath(file_path)),
+                        f"{os.path.splitext(os.path.basename(file_path))[0]}_{safe_target_lang_suffix}_translated.pptx")
+
+
+def _create_ocr_handler(src_lang: str, use_gpu: bool, debug_enabled: bool) -> Tuple[Optional[Any], Optional[OcrEngineRegistry]]:
+    """원본 언어에 맞는 OCR 핸들러를 만듭니다. 엔진이 없거나 초기화에 실패하면 (None, None) (이미지 번역 없이 진행)."""
+    engine_name_display, engine_name_internal, ocr_lang_code = resolve_ocr_engine(src_lang)
+    if not ocr_lang_code:
+        logger.warning(f"{engine_name_display}: 언어 '{src_lang}'에 대한 OCR 코드가 없어 이미지 번역을 건너뜁니다.")
+        return None, None
+    engine_installed = utils.check_easyocr() if engine_name_internal == "easyocr" else utils.check_paddleocr()
+    if not engine_installed:
+        logger.warning(f"{engine_name_display}이(가) 설치되어 있지 않아 이미지 번역을 건너뜁니다.")
+        return None, None
+    ocr_engine_registry = OcrEngineRegistry(max_engines=1)
+    try:
+        engine_key = OcrEngineRegistry.make_key(engine_name_internal, ocr_lang_code, use_gpu)
+        return ocr_engine_registry.get_handler(engine_key, debug_enabled=debug_enabled, activate=True), ocr_engine_registry
+    except Exception as e_init:
+        logger.error(f"{engine_name_display} 핸들러 초기화 실패, 이미지 번역을 건너뜁니다: {e_init}", exc_info=debug_enabled)
+        ocr_engine_registry.clear()
+        return None, None
+
+
+def translate_file(file_path: str, src_lang: str, tgt_lang: str, model: str, output_path: str,
+                   image_translation_enabled: bool = config.DEFAULT_IMAGE_TRANSLATION_ENABLED,
+                   ocr_temperature: float = config.DEFAULT_OCR_TEMPERATURE, use_gpu: bool = config.DEFAULT_OCR_USE_GPU,
+                   stop_event: Optional[threading.Event] = None, debug_enabled: bool = False) -> int:
+    """
+    GUI의 번역 작업과 같은 순서(파싱 한 번 -> 1단계 텍스트/이미지 -> 2단계 차트)로 번역해 output_path에 저장하고 종료 코드를 반환합니다.
+    중지되면 그때까지의 1단계 결과를 output_path에 저장합니다.
+    """
+    stop_event = stop_event or threading.Event()
+    ollama_service = OllamaService()
+    ollama_running, _ = ollama_service.is_running()
+    if not ollama_running:
+        logger.error("Ollama 서버가 실행 중이 아닙니다. 'ollama serve'로 서버를 먼저 실행하세요.")
+        return EXIT_FAILURE
+
+    translator = OllamaTranslator()
+    pptx_handler = PptxHandler()
+    chart_xml_handler = ChartXmlHandler(translator, ollama_service)
+    cpu_resource_manager = CpuResourceManager()
+    memory_governor = MemoryGovernor()
+
+    os.makedirs(config.LOGS_DIR, exist_ok=True)
+    safe_original_filename_part = "".join(c if c.isalnum() or c in ['.', '_'] else '_' for c in os.path.splitext(os.path.basename(file_path))[0])
+    task_log_filepath = os.path.join(config.LOGS_DIR, f"translation_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{safe_original_filename_part}.log")
+
+    # OCR 엔진/워커 풀은 try 안에서 만들어 분석 실패나 조기 반환 시에도 finally에서 정리되게 함
+    ocr_handler, ocr_engine_registry, ocr_pool = None, None, None
+    temp_dir = None
+    try:
+        if image_translation_enabled:
+            ocr_handler, ocr_engine_registry = _create_ocr_handler(src_lang, use_gpu, debug_enabled)
+            image_translation_enabled = ocr_handler is not None
+            if ocr_handler is not None and config.MAX_OCR_WORKERS > 1:
+                from ocr_pool import OcrProcessPool
+                ocr_pool = OcrProcessPool(ocr_handler.get_engine_spec(), max_workers=config.MAX_OCR_WORKERS)
+
+        deck_analysis = pptx_handler.analyze_presentation(file_path)
+        file_info = deck_analysis.file_info()
+        total_weighted_work = (file_info['total_text_char_count'] * config.WEIGHT_TEXT_CHAR) + \
+                              (file_info['image_elements_count'] * config.WEIGHT_IMAGE) + \
+                              (file_info['chart_elements_count'] * config.WEIGHT_CHART)
+        logger.info(f"번역 시작: '{os.path.basename(file_path)}' ({src_lang} -> {tgt_lang}) using {model}. "
+                    f"슬라이드 {file_info['slide_count']}개, 예상 가중 작업량 {total_weighted_work}, "
+                    f"이미지 번역: {'활성' if image_translation_enabled else '비활성'}")
+        if total_weighted_work == 0:
+            logger.warning("파일에 번역할 내용이 없습니다.")
+            return EXIT_SUCCESS
+
+        progress_state = {'done': 0, 'last_reported_percent': -1}
+        progress_lock = threading.Lock()
+
+        def report_item_completed(slide_info_or_stage: Any, item_type_str: str, weighted_work_for_item: int, text_snippet_str: str):
+            with progress_lock:
+                progress_state['done'] = min(total_weighted_work, progress_state['done'] + weighted_work_for_item)
+                percent = int(progress_state['done'] * 100 / total_weighted_work)
+                if percent // 10 == progress_state['last_reported_percent'] // 10: return # 10% 단위로만 출력
+                progress_state['last_reported_percent'] = percent
+            logger.info(f"진행률 {percent}% ({slide_info_or_stage} {item_type_str})")
+
+        temp_dir = tempfile.mkdtemp(prefix="pptx_trans_cli_")
+        translator.runtime_options = cpu_resource_manager.prepare_translation(ollama_service, model)
+        memory_governor.start(ocr_pool)
+        prs = deck_analysis.prs
+        stage1_success = pptx_handler.translate_presentation_stage1(
+            prs, src_lang, tgt_lang, translator, ocr_handler, model, ollama_service,
+            config.UI_LANG_TO_FONT_CODE_MAP.get(tgt_lang, 'en'), task_log_filepath,
+            report_item_completed, stop_event, image_translation_enabled, ocr_temperature,
+            ocr_pool=ocr_pool, cpu_resource_manager=cpu_resource_manager, memory_governor=memory_governor,
+            deck_analysis=deck_analysis
+        )
+        if stop_event.is_set():
+            prs.save(output_path)
+            logger.warning(f"1단계 중 중지됨. 부분 결과 저장: {output_path}")
+            return EXIT_STOPPED
+        if not stage1_success:
+            logger.error(f"1단계 번역 실패. 작업 로그: {task_log_filepath}")
+            return EXIT_FAILURE
+
+        if deck_analysis.chart_elements_count == 0:
+            prs.save(output_path)
+        else:
+            stage1_output_path = os.path.join(temp_dir, "stage1.pptx")
+            prs.save(stage1_output_path)
+            output_path_charts = chart_xml_handler.translate_charts_in_pptx(
+                pptx_path=stage1_output_path, src_lang_ui_name=src_lang, tgt_lang_ui_name=tgt_lang, model_name=model,
+                output_path=output_path, progress_callback_item_completed=report_item_completed,
+                stop_event=stop_event, task_log_filepath=task_log_filepath
+            )
+            if not (output_path_charts and os.path.exists(output_path_charts)):
+                shutil.copy2(stage1_output_path, output_path)
+                logger.error(f"2단계 차트 번역 실패. 1단계 결과를 저장했습니다: {output_path}")
+                return EXIT_STOPPED if stop_event.is_set() else EXIT_FAILURE
+            if stop_event.is_set():
+                logger.warning(f"2단계 중 중지됨. 부분 결과 저장: {output_path}")
+                return EXIT_STOPPED
+        logger.info(f"번역 완료: {output_path}")
+        return EXIT_SUCCESS
+    finally:
+        memory_governor.stop()
+        if ocr_pool is not None: ocr_pool.shutdown()
+        if ocr_engine_registry is not None: ocr_engine_registry.clear()
+        if temp_dir is not None: shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=f"{config.APP_NAME} - GUI 없이 PowerPoint 파일을 번역합니다.")
+    parser.add_argument("file", help="번역할 .pptx 파일")
+    parser.add_argument("--src", required=True, choices=config.SUPPORTED_LANGUAGES, help="원본 언어")
+    parser.add_argument("--tgt", required=True, choices=config.SUPPORTED_LANGUAGES, help="대상 언어")
+    parser.add_argument("--model", default=config.DEFAULT_OLLAMA_MODEL, help=f"Ollama 번역 모델 (기본값: {config.DEFAULT_OLLAMA_MODEL})")
+    parser.add_argument("-o", "--output", help="결과 파일 경로 (기본값: 원본 폴더의 '<원본>_<대상 언어>_translated.pptx')")
+    parser.add_argument("--no-images", action="store_true", help="이미지 속 텍스트(OCR) 번역을 하지 않음")
+    parser.add_argument("--ocr-temperature", type=float, default=config.DEFAULT_OCR_TEMPERATURE, help="이미지 텍스트 번역 온도")
+    parser.add_argument("--gpu", action="store_true", default=config.DEFAULT_OCR_USE_GPU, help="OCR에 GPU 사용")
+    parser.add_argument("--debug", action="store_true", help="디버그 로그 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=config.DEBUG_LOG_LEVEL if args.debug else config.DEFAULT_LOG_LEVEL,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', stream=sys.stdout)
+    if not os.path.isfile(args.file):
+        parser.error(f"파일을 찾을 수 없습니다: {args.file}")
+
+    stop_event = threading.Event()
+    translation_result = {'exit_code': EXIT_FAILURE}
+
+    def _run():
+        try:
+            translation_result['exit_code'] = translate_file(
+                args.file, args.src, args.tgt, args.model, args.output or _default_output_path(args.file, args.tgt),
+                image_translation_enabled=not args.no_images, ocr_temperature=args.ocr_temperature,
+                use_gpu=args.gpu, stop_event=stop_event, debug_enabled=args.debug)
+        except Exception as e_translate:
+            logger.error(f"번역 중 오류: {e_translate}", exc_info=True)
+
+    # 번역은 별도 스레드에서 실행해 Ctrl+C를 받으면 stop_event로 멈추고 부분 결과를 저장할 때까지 기다림
+    translation_thread = threading.Thread(target=_run, name="CliTranslation")
+    translation_thread.start()
+    try:
+        while translation_thread.is_alive():
+            translation_thread.join(timeout=0.5)
+    except KeyboardInterrupt:
+        logger.warning("Ctrl+C: 번역을 중지합니다 (부분 결과 저장 중)...")
+        stop_event.set()
+        translation_thread.join()
+    return translation_result['exit_code']
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support() # OCR 워커 프로세스(spawn) 지원 (패키징된 실행 파일 포함)
+    sys.exit(main())
@@ -17,11 +17,13 @@ ASSETS_DIR_NAME = "assets"
 FONTS_DIR_NAME = "fonts"
 LOGS_DIR_NAME = "logs"
 HISTORY_DIR_NAME = "hist" # 번역 히스토리 저장 폴더명
+CACHE_DIR_NAME = "cache" # OCR 결과 등 실행 간 재사용하는 디스크 캐시 폴더명
 
 ASSETS_DIR = os.path.join(PROJECT_ROOT_DIR, ASSETS_DIR_NAME)
 FONTS_DIR = os.path.join(PROJECT_ROOT_DIR, FONTS_DIR_NAME)
 LOGS_DIR = os.path.join(PROJECT_ROOT_DIR, LOGS_DIR_NAME)
 HISTORY_DIR = os.path.join(PROJECT_ROOT_DIR, HISTORY_DIR_NAME) # 번역 히스토리 저장 경로
+CACHE_DIR = os.path.join(PROJECT_ROOT_DIR, CACHE_DIR_NAME)
 
 # --- Logging Configuration ---
 DEFAULT_LOG_LEVEL = logging.INFO
@@ -63,6 +65,11 @@ OLLAMA_CONNECT_TIMEOUT = 5  # seconds
 OLLAMA_READ_TIMEOUT = 180   # seconds for general API calls
 OLLAMA_PULL_READ_TIMEOUT = None # 모델 다운로드는 매우 오래 걸릴 수 있음 (None은 무제한 대기)
 MODELS_CACHE_TTL_SECONDS = 300 # 모델 목록 API 결과 캐시 시간 (초), 예: 5분
+OLLAMA_WARMUP_KEEP_ALIVE = "30m" # 시작 시 미리 올린 모델을 메모리에 유지할 시간 (Ollama keep_alive 형식)
+
+# --- Startup Prewarm Configuration (for main.py) ---
+# 시작 시 백그라운드에서 현재 원본 언어의 OCR 엔진과 선택된 번역 모델을 미리 올려 첫 번역의 대기 시간을 줄임
+STARTUP_PREWARM_ENABLED = True
 
 # --- Translator Configuration (for translator.py) ---
 TRANSLATOR_TEMPERATURE_GENERAL = 0.2 # 텍스트 번역 기본 온도
@@ -71,14 +78,130 @@ TRANSLATOR_TEMPERATURE_GENERAL = 0.2 # 텍스트 번역 기본 온도
 # 너무 높으면 Ollama 서버에 부담을 주거나 컨텍스트 스위칭 오버헤드 발생 가능.
 # 여기서는 예시로 8로 설정.
 MAX_TRANSLATION_WORKERS = 8
-# OCR 병렬 처리를 위한 워커 수 (번역 워커와 별도로 설정하거나 공유 가능)
-# 여기서는 번역 워커와 동일하게 설정
-MAX_OCR_WORKERS = MAX_TRANSLATION_WORKERS
+# OCR 병렬 처리를 위한 워커 프로세스 수 (ocr_pool.OcrProcessPool).
+# 워커마다 OCR 엔진(모델)을 따로 올리므로 메모리 사용량이 워커 수에 비례함.
+# CPU 코어의 절반, 최대 4개로 제한. 1 이하이면 워커 풀 없이 현재 프로세스에서 순차 OCR.
+MAX_OCR_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+# OCR 배치 크기. 인식 단계에서 한 번에 추론하는 텍스트 조각 수(PaddleOCR rec_batch_num, EasyOCR batch_size)이자
+# BaseOcrHandler.ocr_images()가 한 번에 묶어 처리하는 이미지 수. 1이면 배치 없이 이미지/조각별 처리.
+OCR_BATCH_SIZE = 8
+# EasyOCR 배치 묶음 단위(px). 가로/세로를 이 단위로 올림한 크기가 같은 이미지끼리 묶고, 묶음에서 가장 큰 크기로 여백을 채워 배치 추론
+# (리사이즈 없음). 클수록 한 배치에 더 많이 묶이지만 여백 영역의 검출 연산도 늘어남.
+EASYOCR_BATCH_BUCKET_PX = 128
+
+# --- OCR Performance Profile (for ocr_tuning.py / ocr_handler.py) ---
+# 엔진별 CPU 추론 설정. 여러 OCR 워커와 Ollama가 같은 코어를 나눠 쓰므로 엔진마다 스레드 수를 제한해야 서로 느려지지 않음.
+# - cpu_threads: 엔진 하나의 추론 스레드 수 (PaddleOCR cpu_threads, EasyOCR은 torch.set_num_threads).
+#   None이면 (CPU 코어 수 - OCR_RESERVED_CPU_CORES) / 동시에 OCR하는 엔진(워커) 수로 자동 계산
+# - enable_mkldnn: PaddleOCR CPU 추론에 MKL-DNN(oneDNN) 사용
+# - rec_batch_size: 인식 단계 배치 크기 (PaddleOCR rec_batch_num, EasyOCR readtext batch_size)
+# - det_max_side: 검출 입력의 긴 변 상한 px (PaddleOCR det_limit_side_len, EasyOCR canvas_size). 결과가 달라지므로 보정 대상 아님
+# 'python ocr_tuning.py --engine paddleocr --lang korean' 으로 이 PC에 맞는 값을 측정해 OCR_TUNING_PROFILE_PATH에 저장하면 기본값보다 우선 적용
+OCR_PERF_PROFILE = {
+    'paddleocr': {'cpu_threads': None, 'enable_mkldnn': True, 'rec_batch_size': OCR_BATCH_SIZE, 'det_max_side': 960},
+    'easyocr': {'cpu_threads': None, 'rec_batch_size': OCR_BATCH_SIZE, 'det_max_side': 2560},
+}
+OCR_RESERVED_CPU_CORES = 2 # OCR 스레드 자동 계산 시 Ollama/UI 몫으로 남겨 둘 코어 수
+OCR_TUNING_PROFILE_PATH = os.path.join(CACHE_DIR, "ocr_tuning.json") # 보정 결과 (엔진/동시 엔진 수/CPU 코어 수별)
+
+# --- CPU Resource Manager Configuration (for cpu_resource_manager.py) ---
+# CPU만 있는 PC에서 OCR 워커와 로컬 Ollama가 코어를 나눠 쓰도록 번역 실행 중 코어 예산을 관리
+CPU_RESOURCE_MANAGER_ENABLED = True
+CPU_OCR_CORE_SHARE = 0.5 # OCR과 텍스트 번역이 동시에 진행될 때 OCR 워커에 줄 코어 비율 (나머지 코어 수가 Ollama num_thread)
+CPU_SHARED_TRANSLATION_SLOTS = 2 # OCR과 동시에 진행될 때 동시에 보낼 번역 요청 수 (OCR이 없으면 MAX_TRANSLATION_WORKERS)
+CPU_REBALANCE_INTERVAL_SECONDS = 0.5 # 남은 작업을 보고 예산을 다시 나누는 주기
+
+# --- Memory Governor Configuration (for memory_governor.py) ---
+# 번역 중 메모리(앱 + OCR 워커 RSS, 시스템 여유 메모리)를 확인해 한도를 넘으면 새 OCR 작업을 멈추고 워커를 줄임
+MEMORY_GOVERNOR_ENABLED = True
+MEMORY_SAMPLE_INTERVAL_SECONDS = 1.0
+MEMORY_SOFT_LIMIT_MB = None # 앱 RSS 한도 (MB). None이면 전체 RAM x MEMORY_SOFT_LIMIT_RATIO
+MEMORY_SOFT_LIMIT_RATIO = 0.6
+MEMORY_MIN_AVAILABLE_MB = 1024 # 시스템 여유 메모리가 이보다 적어도 압박 상태
+MEMORY_MAX_PAUSE_SECONDS = 30 # 압박이 풀리지 않아도 이 시간이 지나면 (워커 1개로) 작업을 계속 진행
+MEMORY_UI_UPDATE_INTERVAL_MS = 2000 # 화면의 메모리 표시 갱신 주기
+
+# --- OCR Resolution Configuration (for ocr_resolution.py) ---
+# 슬라이드에 표시되는 크기(EMU)와 이미지 픽셀 크기로 유효 DPI를 계산해, 이보다 높으면 OCR 입력을 이 DPI로 축소
+# (박스는 원본 해상도 좌표로 되돌려 렌더링). 0이면 축소하지 않음
+OCR_TARGET_DPI = 200
+OCR_DOWNSCALE_MIN_SIDE = 640 # 축소하더라도 OCR 입력의 긴 변은 이 크기 이상 유지 (px)
+# 자르기(crop)로 보이는 영역이 이미지 넓이의 이 비율 미만이면 보이는 영역만 OCR/렌더링 (그 이상이면 전체 이미지 사용)
+OCR_CROP_MIN_SAVING_RATIO = 0.9
+# 슬라이드에 표시되는 글자 높이가 이보다 작으면 (pt) 읽을 수 없으므로 교체하지 않음. 표시 크기가 이 값의 2배 미만인 그림은 OCR 생략
+OCR_MIN_DISPLAY_TEXT_PT = 4
+
+# --- Tiled OCR Configuration (for ocr_tiling.py) ---
+# (축소 후에도) 긴 변 또는 픽셀 수가 한도를 넘는 이미지는 겹치는 타일로 나눠 OCR (이미지당 최대 메모리 일정)
+OCR_TILE_MAX_SIDE = 2560
+OCR_TILE_MAX_PIXELS = 8_000_000
+OCR_TILE_SIZE = 1600 # 타일 한 변 (px). 폭이 OCR_TILE_MAX_SIDE 이하인 이미지는 전체 폭 x 이 높이의 띠로 나눔
+OCR_TILE_OVERLAP = 160 # 이웃 타일과 겹치는 폭 (px). 가장 큰 글자 줄 높이보다 커야 경계에서 잘린 줄을 온전히 얻음
+OCR_TILE_DUPLICATE_OVERLAP = 0.7 # 두 박스가 (작은 박스 기준) 이 비율 이상 겹치면 같은 텍스트로 보고 하나만 유지
+
+# --- OCR Prefilter Configuration (for ocr_prefilter.py) ---
+# 전체 OCR 전에 축소판으로 텍스트 존재 가능성을 빠르게 판단해 사진/아이콘/장식 이미지는 OCR을 생략
+OCR_PREFILTER_ENABLED = True
+OCR_PREFILTER_MAX_SIDE = 640 # 휴리스틱 판단용 축소판의 긴 변 (px)
+OCR_PREFILTER_MIN_SIDE = 16 # 원본의 짧은 변이 이보다 작으면 텍스트 없음으로 간주
+OCR_PREFILTER_MAX_ASPECT_RATIO = 30 # 이보다 가늘고 긴 이미지(선/띠 장식)는 생략
+OCR_PREFILTER_MIN_GRADIENT = 40 # 글자 획으로 볼 최소 경계 대비 (0~255)
+OCR_PREFILTER_MIN_EDGE_DENSITY = 0.002 # 강한 경계 픽셀 비율이 이보다 낮으면 (단색/그라데이션) 생략
+OCR_PREFILTER_MIN_TEXT_REGIONS = 1 # 글자 줄 모양 영역이 이 수 이상이어야 OCR 진행
+# 휴리스틱 통과 이미지에 OCR 엔진의 검출 단계만 축소 해상도로 한 번 더 실행 (정확도 ↑, 이미지당 검출 1회 비용)
+OCR_PREFILTER_USE_DETECTOR = False
+OCR_PREFILTER_DETECTOR_MAX_SIDE = 960
+
+# --- OCR Region Merge Configuration (for ocr_regions.py) ---
+# OCR 엔진이 조각(단어/구) 단위로 돌려준 박스를 줄/단락 영역으로 병합한 뒤 번역/렌더링 (문맥 유지, 번역 호출 수 감소)
+OCR_MERGE_REGIONS = True
+OCR_MERGE_PARAGRAPHS = True # False면 같은 줄까지만 병합
+OCR_MIN_CONFIDENCE = 0.3 # 이 신뢰도 미만 조각은 번역/렌더링에서 제외
+OCR_MERGE_MAX_HEIGHT_RATIO = 1.5 # 같은 줄로 볼 조각 높이 비율 상한
+OCR_MERGE_BASELINE_TOLERANCE = 0.35 # 기준선(아래쪽) 차이 허용치 (조각 높이 대비)
+OCR_MERGE_MAX_WORD_GAP = 1.2 # 같은 줄 조각 사이 가로 간격 상한 (조각 높이 대비)
+OCR_MERGE_MAX_PARAGRAPH_HEIGHT_RATIO = 1.3 # 같은 단락으로 볼 줄 높이 비율 상한
+OCR_MERGE_MAX_LINE_GAP = 0.8 # 같은 단락 줄 사이 세로 간격 상한 (줄 높이 대비)
+OCR_MERGE_MAX_TILT_DEGREES = 10 # 이보다 기울어진 조각은 병합하지 않음
+
+# --- OCR Engine Registry Configuration (for ocr_engine_registry.py) ---
+# 초기화된 OCR 엔진을 (엔진, 언어, GPU) 별로 보관해 언어를 바꿨다 돌아와도 모델을 다시 올리지 않음
+OCR_ENGINE_REGISTRY_MAX_ENGINES = 2 # 동시에 보관할 엔진 수
+OCR_ENGINE_REGISTRY_MAX_MEMORY_MB = 4096 # 보관 엔진들의 추정 메모리 합 상한 (초과 시 오래 사용하지 않은 엔진부터 해제)
+OCR_ENGINE_DEFAULT_FOOTPRINT_MB = 800 # 메모리 사용량을 측정할 수 없을 때 엔진 하나의 추정치
+# 시작 시 백그라운드에서 미리 올려 둘 원본 언어 (UI 언어 이름, 예: ["한국어", "일본어"]). 비어 있으면 사용 안 함
+OCR_PRELOAD_UI_LANGS = []
+
+# --- OCR Result Cache Configuration (for disk_cache.py) ---
+# OCR 결과는 이미지 내용과 엔진/버전/언어/전처리 설정에만 의존하므로 디스크에 저장해 실행 간 재사용 (대상 언어/모델과 무관)
+OCR_CACHE_ENABLED = True
+OCR_CACHE_DIR = os.path.join(CACHE_DIR, "ocr")
+OCR_CACHE_MAX_BYTES = 64 * 1024 * 1024 # 초과 시 오래 사용하지 않은 항목부터 삭제
+# OCR 전처리 방식이 바뀌면 올려서 기존 캐시 항목을 무효화
+OCR_PREPROCESS_VERSION = 1
+
+# --- Rendered Image Cache Configuration (for disk_cache.py) ---
+# 번역/렌더링된 최종 이미지를 (원본 이미지 SHA1, 언어, 모델, 폰트 코드, 렌더링 설정) 기준으로 저장해 두고,
+# 같은 이미지가 다시 나오면 OCR/번역/렌더링 없이 바로 교체 (템플릿 덱의 반복 다이어그램 등)
+RENDER_CACHE_ENABLED = True
+RENDER_CACHE_DIR = os.path.join(CACHE_DIR, "rendered")
+RENDER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+RENDER_CACHE_MAX_AGE_DAYS = 30 # 마지막 사용 후 이 기간이 지난 항목은 무효
+# 렌더링 코드(배경색 추정, 글꼴 크기 탐색 등)가 바뀌면 올려서 기존 렌더링 캐시를 무효화
+RENDER_SETTINGS_VERSION = 1
+
+# --- OCR Rendering Configuration (for font_manager.py) ---
+# 크기별 폰트 객체 LRU 캐시 크기. 폰트는 파일 경로로 로드하므로 항목당 메모리는 FreeType face 정도(수십~수백 KB)로 작음.
+FONT_CACHE_MAX_SIZED_FONTS = 64
 
 
 # --- PPTX Handler Configuration (for pptx_handler.py) ---
 MIN_MEANINGFUL_CHAR_RATIO_SKIP = 0.1
 MIN_MEANINGFUL_CHAR_RATIO_OCR = 0.1
+# 파일 선택 시 정보(슬라이드/글자/이미지/차트 수)를 python-pptx 대신 zip의 슬라이드 XML만 스트리밍해 계산 (pptx_zip_scanner.py)
+# 실패하면 python-pptx 전체 분석으로 대체
+FAST_FILE_INFO_ENABLED = True
 
 # --- Main UI Configuration ---
 UI_LANG_TO_FONT_CODE_MAP = {
@@ -0,0 +1,155 @@
+# cpu_resource_manager.py
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
+
+# 설정 파일 import
+import config
+
+if TYPE_CHECKING:
+    from ocr_pool import OcrProcessPool
+    from ollama_service import OllamaService
+    from translator import TranslationQueue
+
+logger = logging.getLogger(__name__)
+
+
+class CpuBudget(NamedTuple):
+    ocr_cores: List[int] # OCR 워커 프로세스를 묶어 둘 CPU 코어 (affinity)
+    ocr_workers: int # 동시에 이미지를 처리할 OCR 워커 수
+    translation_slots: int # 동시에 보낼 번역 요청 수
+
+
+class CpuResourceManager:
+    """
+    CPU만 있는 PC에서 OCR 워커 풀과 로컬 Ollama가 같은 코어를 두고 경합하지 않도록 코어 예산을 나눕니다.
+    - Ollama: 번역 실행 동안 고정된 num_thread (값이 바뀌면 Ollama가 모델을 다시 올리므로 실행 중에는 바꾸지 않음)
+    - OCR 워커: 코어 affinity와 동시에 일하는 워커 수
+    - 번역: 동시에 보내는 요청 수
+    번역 실행 중에는 보조 스레드가 주기적으로 양쪽의 남은 작업을 보고 예산을 다시 나눕니다.
+    (예: 텍스트 번역이 없으면 OCR에 모든 코어, OCR이 끝나면 번역 요청 수를 최대로)
+    Ollama가 GPU에서 실행 중이면 번역이 CPU를 거의 쓰지 않으므로 OCR에 항상 모든 코어를 줍니다.
+    """
+
+    def __init__(self, total_cores: Optional[int] = None):
+        self.total_cores = max(1, int(total_cores or os.cpu_count() or 1))
+        self.enabled = bool(config.CPU_RESOURCE_MANAGER_ENABLED) and self.total_cores > 1
+        # 둘 다 진행 중일 때 OCR 몫 코어 수 (양쪽 모두 최소 1개), 나머지는 Ollama 몫
+        self.shared_ocr_core_count = max(1, min(self.total_cores - 1, int(round(self.total_cores * config.CPU_OCR_CORE_SHARE))))
+        self.ollama_thread_count = max(1, self.total_cores - self.shared_ocr_core_count)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._ocr_pool: Optional['OcrProcessPool'] = None
+        self._translation_queue: Optional['TranslationQueue'] = None
+        self._ollama_on_gpu = False
+        self._current_budget: Optional[CpuBudget] = None
+        self._pinned_pids: Dict[int, List[int]] = {}
+        self._affinity_supported = True
+
+    def ollama_options(self) -> Dict[str, Any]:
+        """
+        번역/미리 로딩 요청에 넣을 Ollama 옵션. Ollama 몫 코어 수를 num_thread로 고정합니다.
+        GPU 실행이어도 같은 값을 넣어(CPU에 남은 계층에만 영향) 미리 올린 모델이 번역 시작 시 다시 로드되지 않게 합니다.
+        """
+        if not self.enabled: return {}
+        return {'num_thread': self.ollama_thread_count}
+
+    def prepare_translation(self, ollama_service: 'OllamaService', model_name: str) -> Dict[str, Any]:
+        """번역 실행 전에 호출합니다. 모델이 GPU에서 실행 중인지 확인해 두고, 번역 요청에 넣을 Ollama 옵션을 반환합니다."""
+        self._ollama_on_gpu = bool(self.enabled and ollama_service.is_model_on_gpu(model_name))
+        return self.ollama_options()
+
+    def compute_budget(self, ocr_busy: bool, translation_busy: bool) -> CpuBudget:
+        all_cores = list(range(self.total_cores))
+        ocr_pool_workers = self._ocr_pool.max_workers if self._ocr_pool is not None else 1
+        max_translation_slots = max(1, int(config.MAX_TRANSLATION_WORKERS))
+        if self._ollama_on_gpu or not translation_busy:
+            return CpuBudget(all_cores, ocr_pool_workers, max_translation_slots)
+        if not ocr_busy:
+            return CpuBudget(all_cores, ocr_pool_workers, max_translation_slots)
+        # 둘 다 진행 중: OCR은 뒤쪽 코어 묶음만, 번역은 동시 요청 수를 줄여 Ollama 몫 코어 안에서 처리
+        ocr_cores = all_cores[-self.shared_ocr_core_count:]
+        # 워커마다 추론 스레드 수가 고정(OCR_PERF_PROFILE)이므로 OCR 몫 코어를 넘지 않을 만큼만 워커를 돌림
+        threads_per_worker = self._ocr_pool.threads_per_worker if self._ocr_pool is not None else 1
+        ocr_workers = max(1, min(ocr_pool_workers, self.shared_ocr_core_count // max(1, threads_per_worker)))
+        return CpuBudget(ocr_cores, ocr_workers, max(1, min(max_translation_slots, config.CPU_SHARED_TRANSLATION_SLOTS)))
+
+    def start(self, ocr_pool: Optional['OcrProcessPool'], translation_queue: Optional['TranslationQueue']) -> None:
+        """번역 실행 시작 시 호출합니다. 예산을 한 번 적용하고 재분배 스레드를 시작합니다."""
+        if not self.enabled: return
+        self.stop()
+        with self._lock:
+            self._ocr_pool = ocr_pool
+            self._translation_queue = translation_queue
+            self._current_budget = None
+            self._pinned_pids = {}
+        self._stop_event.clear()
+        self._rebalance()
+        self._monitor_thread = threading.Thread(target=self._monitor_loop, name="CpuResourceManager", daemon=True)
+        self._monitor_thread.start()
+        logger.info(f"CPU 자원 관리 시작: 코어 {self.total_cores}개, 공유 시 OCR {self.shared_ocr_core_count}개 / Ollama num_thread {self.ollama_thread_count}"
+                    f"{' (Ollama GPU 실행 중: OCR에 모든 코어)' if self._ollama_on_gpu else ''}")
+
+    def stop(self) -> None:
+        """재분배를 멈추고 OCR 워커 제한을 풀어 원래대로 되돌립니다."""
+        if self._monitor_thread is None: return
+        self._stop_event.set()
+        self._monitor_thread.join(timeout=2)
+        self._monitor_thread = None
+        with self._lock:
+            ocr_pool = self._ocr_pool
+            translation_queue = self._translation_queue
+            self._ocr_pool = None
+            self._translation_queue = None
+        if ocr_pool is not None:
+            ocr_pool.set_active_worker_limit(None)
+            self._apply_affinity(ocr_pool, list(range(self.total_cores)))
+        if translation_queue is not None:
+            translation_queue.set_concurrency_limit(None)
+
+    # --- 내부 구현 ---
+
+    def _monitor_loop(self) -> None:
+        while not self._stop_event.wait(config.CPU_REBALANCE_INTERVAL_SECONDS):
+            try:
+                self._rebalance()
+            except Exception as e_rebalance:
+                logger.warning(f"CPU 예산 재분배 중 오류: {e_rebalance}", exc_info=True)
+
+    def _rebalance(self) -> None:
+        with self._lock:
+            ocr_pool = self._ocr_pool
+            translation_queue = self._translation_queue
+        ocr_busy = ocr_pool is not None and ocr_pool.outstanding_count() > 0
+        translation_busy = translation_queue is not None and translation_queue.inflight_count() > 0
+        budget = self.compute_budget(ocr_busy, translation_busy)
+        if budget != self._current_budget:
+            logger.debug(f"CPU 예산 변경 (OCR 작업 중: {ocr_busy}, 번역 중: {translation_busy}): OCR 코어 {len(budget.ocr_cores)}개, "
+                         f"OCR 워커 {budget.ocr_workers}개, 동시 번역 {budget.translation_slots}건")
+            self._current_budget = budget
+            if ocr_pool is not None: ocr_pool.set_active_worker_limit(budget.ocr_workers)
+            if translation_queue is not None: translation_queue.set_concurrency_limit(budget.translation_slots)
+        if ocr_pool is not None:
+            self._apply_affinity(ocr_pool, budget.ocr_cores) # 재시작된 워커(새 PID)에도 적용
+
+    def _apply_affinity(self, ocr_pool: 'OcrProcessPool', cores: List[int]) -> None:
+        if not self._affinity_supported: return
+        try:
+            import psutil
+        except ImportError:
+            self._affinity_supported = False
+            return
+        for pid in ocr_pool.worker_pids():
+            if self._pinned_pids.get(pid) == cores: continue
+            try:
+                worker_process = psutil.Process(pid)
+                if not hasattr(worker_process, 'cpu_affinity'): # macOS 등 affinity 미지원
+                    self._affinity_supported = False
+                    logger.info("이 운영체제는 프로세스 CPU affinity를 지원하지 않아 OCR 워커 수와 번역 요청 수로만 조절합니다.")
+                    return
+                worker_process.cpu_affinity(cores)
+                self._pinned_pids[pid] = cores
+            except (psutil.NoSuchProcess, psutil.AccessDenied, OSError, ValueError) as e_affinity:
+                logger.debug(f"OCR 워커(PID: {pid}) CPU affinity 설정 실패: {e_affinity}")
@@ -0,0 +1,199 @@
+# disk_cache.py
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, List, Optional, Tuple
+
+# 설정 파일 import
+import config
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = ".bin"
+
+
+class DiskCache:
+    """
+    내용 주소(키의 SHA256) 기반 파일 캐시. 항목 하나가 파일 하나이며, 쓰기는 임시 파일 + os.replace로 원자적으로 처리합니다.
+    - 총 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목(mtime 기준, 조회 시 갱신)부터 삭제
+    - max_age_seconds가 있으면 그보다 오래 사용하지 않은 항목은 조회 시 무효 처리
+    여러 스레드에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, max_age_seconds: Optional[float] = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None # 첫 쓰기 때 디렉터리를 한 번 훑어 계산
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        entry_path = self._entry_path(key)
+        try:
+            entry_stat = os.stat(entry_path)
+            if self.max_age_seconds is not None and time.time() - entry_stat.st_mtime > self.max_age_seconds:
+                self._remove_entry(entry_path, entry_stat.st_size)
+                self.misses += 1
+                return None
+            with open(entry_path, 'rb') as f_entry:
+                data = f_entry.read()
+            os.utime(entry_path, None) # LRU: 사용 시각 갱신
+            self.hits += 1
+            return data
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError as e_read:
+            logger.warning(f"캐시 항목 읽기 실패 ('{entry_path}'): {e_read}")
+            self.misses += 1
+            return None
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        if self.max_bytes <= 0 or len(data) > self.max_bytes: return
+        entry_path = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            with self._lock:
+                self._ensure_total_locked()
+                previous_size = os.path.getsize(entry_path) if os.path.exists(entry_path) else 0
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix=".tmp")
+                try:
+                    with os.fdopen(fd, 'wb') as f_temp:
+                        f_temp.write(data)
+                    os.replace(temp_path, entry_path)
+                except Exception:
+                    try: os.remove(temp_path)
+                    except OSError: pass
+                    raise
+                self._total_bytes += len(data) - previous_size
+                if self._total_bytes > self.max_bytes:
+                    self._evict_locked()
+        except OSError as e_write:
+            logger.warning(f"캐시 항목 저장 실패 ('{entry_path}'): {e_write}")
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry_path, _, _ in self._scan_entries():
+                try: os.remove(entry_path)
+                except OSError: pass
+            self._total_bytes = 0
+
+    # --- 내부 구현 ---
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + CACHE_FILE_SUFFIX)
+
+    def _scan_entries(self) -> List[Tuple[str, int, float]]:
+        entries = []
+        if not os.path.isdir(self.cache_dir): return entries
+        for dir_path, _, file_names in os.walk(self.cache_dir):
+            for file_name in file_names:
+                if not file_name.endswith(CACHE_FILE_SUFFIX): continue
+                entry_path = os.path.join(dir_path, file_name)
+                try:
+                    entry_stat = os.stat(entry_path)
+                except OSError:
+                    continue
+                entries.append((entry_path, entry_stat.st_size, entry_stat.st_mtime))
+        return entries
+
+    def _ensure_total_locked(self) -> None:
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._scan_entries())
+
+    def _evict_locked(self) -> None:
+        # 목표 크기를 최대치의 90%로 잡아 매 쓰기마다 정리가 반복되지 않게 함
+        target_bytes = int(self.max_bytes * 0.9)
+        entries = sorted(self._scan_entries(), key=lambda entry: entry[2])
+        self._total_bytes = sum(size for _, size, _ in entries)
+        now = time.time()
+        evicted_count = 0
+        for entry_path, size, mtime in entries:
+            expired = self.max_age_seconds is not None and now - mtime > self.max_age_seconds
+            if self._total_bytes <= target_bytes and not expired: break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+            self._total_bytes -= size
+            evicted_count += 1
+        if evicted_count:
+            logger.debug(f"캐시 정리 ('{self.cache_dir}'): 항목 {evicted_count}개 삭제, 현재 {self._total_bytes // 1024} KB")
+
+    def _remove_entry(self, entry_path: str, size: int) -> None:
+        try:
+            os.remove(entry_path)
+        except OSError:
+            return
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+
+
+class OcrResultCache(DiskCache):
+    """
+    이미지 내용(SHA1)과 OCR 엔진 지문(엔진/버전/언어/전처리 설정)을 키로 ocr_image 결과를 저장하는 디스크 캐시.
+    OCR 결과는 번역 대상 언어나 모델과 무관하므로 다른 언어로 다시 번역하거나 실패 후 재실행할 때 OCR을 생략할 수 있습니다.
+    결과는 [[x1, y1, ..., x4, y4], text, conf, angle] 형태의 JSON을 zlib으로 압축해 저장합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        super().__init__(cache_dir or config.OCR_CACHE_DIR,
+                         max_bytes if max_bytes is not None else config.OCR_CACHE_MAX_BYTES)
+
+    def get_results(self, image_sha1: str, engine_fingerprint: str) -> Optional[List[Any]]:
+        data = self.get_bytes(self.make_key(image_sha1, engine_fingerprint))
+        if data is None: return None
+        try:
+            compact_results = json.loads(zlib.decompress(data).decode('utf-8'))
+            return [[[[int(flat_box[i]), int(flat_box[i + 1])] for i in range(0, len(flat_box), 2)], (text, float(confidence)), angle]
+                    for flat_box, text, confidence, angle in compact_results]
+        except Exception as e_decode:
+            logger.warning(f"OCR 캐시 항목 해석 실패 (이미지 {image_sha1[:10]}): {e_decode}")
+            return None
+
+    def put_results(self, image_sha1: str, engine_fingerprint: str, ocr_results: List[Any]) -> None:
+        try:
+            compact_results = [[[int(coord) for point in item[0] for coord in point], str(item[1][0]), round(float(item[1][1]), 4),
+                                item[2] if len(item) > 2 else None]
+                               for item in ocr_results]
+            data = zlib.compress(json.dumps(compact_results, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        except Exception as e_encode:
+            logger.warning(f"OCR 결과 캐시 저장용 변환 실패 (이미지 {image_sha1[:10]}): {e_encode}")
+            return
+        self.put_bytes(self.make_key(image_sha1, engine_fingerprint), data)
+
+
+class RenderedImageCache(DiskCache):
+    """
+    번역/렌더링이 끝난 최종 이미지 바이트를 저장하는 디스크 캐시. 키는 원본 이미지 SHA1과 렌더링 지문
+    (원문/대상 언어, 모델, 폰트 코드, OCR 엔진 지문, 렌더링 설정)으로 만들므로 설정이 바뀌면 기존 항목은 자연히 사용되지 않습니다.
+    크기 상한과 함께 마지막 사용 후 max_age_seconds가 지난 항목도 무효 처리합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None,
+                 max_age_seconds: Optional[float] = None):
+        super().__init__(cache_dir or config.RENDER_CACHE_DIR,
+                         max_bytes if max_bytes is not None else config.RENDER_CACHE_MAX_BYTES,
+                         max_age_seconds if max_age_seconds is not None else config.RENDER_CACHE_MAX_AGE_DAYS * 24 * 3600)
+
+    def get_image(self, image_sha1: str, render_fingerprint: str) -> Optional[bytes]:
+        return self.get_bytes(self.make_key(image_sha1, render_fingerprint))
+
+    def put_image(self, image_sha1: str, render_fingerprint: str, image_bytes: bytes) -> None:
+        self.put_bytes(self.make_key(image_sha1, render_fingerprint), image_bytes)
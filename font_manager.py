@@ -0,0 +1,176 @@
+# font_manager.py
+import collections
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from PIL import ImageFont, __version__ as PILLOW_VERSION
+
+# 설정 파일 import
+import config
+
+logger = logging.getLogger(__name__)
+
+PILLOW_VERSION_TUPLE = tuple(map(int, PILLOW_VERSION.split('.')[:3]))
+DEFAULT_FONT_KEY = "<pillow-default>" # Pillow 기본 폰트(폰트 파일 없음)용 캐시 키
+
+
+class FontManager:
+    """
+    OCR 이미지 렌더링용 폰트 관리자.
+    - 크기별 폰트 객체는 파일 경로로 로드해 LRU로 캐시하며
+      (FreeType이 파일을 직접 읽음. 바이트 버퍼로 로드하면 크기마다 폰트 파일 전체가 복사됨)
+    - (폰트, 크기)별 글자 advance 폭을 메모이즈합니다.
+    - 언어 코드별 폰트 파일 대체 순서는 OCR_LANGUAGE_FONT_MAP에서 한 번만 결정합니다.
+    """
+
+    def __init__(self, font_dir: Optional[str] = None, max_sized_fonts: Optional[int] = None):
+        self.font_dir = font_dir or config.FONTS_DIR
+        self.max_sized_fonts = max(1, int(max_sized_fonts or config.FONT_CACHE_MAX_SIZED_FONTS))
+        self._lock = threading.RLock()
+        self._sized_fonts: "collections.OrderedDict[Tuple[str, int], ImageFont.ImageFont]" = collections.OrderedDict()
+        self._advance_cache: Dict[Tuple[str, int], Dict[str, float]] = {}
+        self._fallback_chains: Dict[Tuple[str, bool], List[str]] = {}
+        self._font_keys: Dict[int, Tuple[str, int]] = {} # id(font) -> (font_path, size)
+
+    def resolve_font_paths(self, lang_code: str = 'en', is_bold: bool = False) -> List[str]:
+        """언어 코드/굵기에 대해 실제 존재하는 폰트 파일 경로를 우선순위대로 반환합니다 (결과는 캐시)."""
+        chain_key = (lang_code, is_bold)
+        with self._lock:
+            cached_chain = self._fallback_chains.get(chain_key)
+            if cached_chain is not None:
+                return cached_chain
+
+            language_font_map = config.OCR_LANGUAGE_FONT_MAP
+            candidate_filenames: List[Optional[str]] = []
+            if is_bold:
+                candidate_filenames += [language_font_map.get(lang_code + '_bold'), config.OCR_DEFAULT_BOLD_FONT_FILENAME]
+            candidate_filenames += [language_font_map.get(lang_code), config.OCR_DEFAULT_FONT_FILENAME]
+
+            font_paths: List[str] = []
+            for font_filename in candidate_filenames:
+                if not font_filename: continue
+                font_path = os.path.join(self.font_dir, font_filename)
+                if font_path not in font_paths and os.path.exists(font_path):
+                    font_paths.append(font_path)
+            if not font_paths:
+                logger.warning(f"폰트 코드 '{lang_code}'(bold:{is_bold})에 사용할 폰트 파일이 없습니다. Pillow 기본 폰트를 사용합니다.")
+            self._fallback_chains[chain_key] = font_paths
+            return font_paths
+
+    def get_font(self, font_size: int, lang_code: str = 'en', is_bold: bool = False) -> ImageFont.ImageFont:
+        font_size = max(1, int(font_size))
+        for font_path in self.resolve_font_paths(lang_code, is_bold):
+            sized_font = self._get_sized_font(font_path, font_size)
+            if sized_font is not None:
+                return sized_font
+        return self._get_default_font(font_size)
+
+    def get_char_advance(self, font: ImageFont.ImageFont, char: str) -> float:
+        """글자 하나의 advance 폭(px)을 (폰트, 크기)별로 메모이즈하여 반환합니다."""
+        advances = self._get_advance_table(font)
+        advance = advances.get(char)
+        if advance is None:
+            advance = self._measure_length(font, char)
+            advances[char] = advance
+        return advance
+
+    def get_text_advance(self, font: ImageFont.ImageFont, text: str) -> float:
+        """글자별 advance 합으로 텍스트 폭을 근사합니다 (커닝/합자 무시)."""
+        advances = self._get_advance_table(font)
+        total_advance = 0.0
+        for char in text:
+            advance = advances.get(char)
+            if advance is None:
+                advance = self._measure_length(font, char)
+                advances[char] = advance
+            total_advance += advance
+        return total_advance
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sized_fonts.clear()
+            self._advance_cache.clear()
+            self._fallback_chains.clear()
+            self._font_keys.clear()
+
+    # --- 내부 구현 ---
+
+    def _get_sized_font(self, font_path: str, font_size: int) -> Optional[ImageFont.ImageFont]:
+        cache_key = (font_path, font_size)
+        with self._lock:
+            sized_font = self._sized_fonts.get(cache_key)
+            if sized_font is not None:
+                self._sized_fonts.move_to_end(cache_key)
+                return sized_font
+            try:
+                # 경로로 로드: truetype(BytesIO)는 FreeTypeFont마다 폰트 버퍼 전체를 복사하므로 (CJK .ttc x 64개면 GB 단위) 사용하지 않음
+                sized_font = ImageFont.truetype(font_path, font_size)
+            except IOError as e:
+                logger.warning(f"트루타입 폰트 로드 실패 ('{font_path}', size:{font_size}): {e}. 다음 대체 폰트 시도.")
+                return None
+            except Exception as e_font:
+                logger.error(f"폰트 로드 중 예기치 않은 오류 ('{font_path}', size:{font_size}): {e_font}. 다음 대체 폰트 시도.", exc_info=True)
+                return None
+            self._put_sized_font_locked(cache_key, sized_font)
+            return sized_font
+
+    def _get_default_font(self, font_size: int) -> ImageFont.ImageFont:
+        cache_key = (DEFAULT_FONT_KEY, font_size)
+        with self._lock:
+            sized_font = self._sized_fonts.get(cache_key)
+            if sized_font is not None:
+                self._sized_fonts.move_to_end(cache_key)
+                return sized_font
+            try:
+                # Pillow 10.1.0 부터 load_default()에 size 인자 지원
+                if PILLOW_VERSION_TUPLE >= (10, 1, 0):
+                    sized_font = ImageFont.load_default(size=font_size)
+                else:
+                    sized_font = ImageFont.load_default()
+            except Exception:
+                try:
+                    sized_font = ImageFont.load_default() # 인자 없이 다시 시도
+                except Exception as e_default_font:
+                    logger.critical(f"Pillow 기본 폰트 로드 실패 (size={font_size}): {e_default_font}. 글꼴 렌더링 불가.", exc_info=True)
+                    raise RuntimeError(f"기본 폰트 로드 실패: {e_default_font}")
+            self._put_sized_font_locked(cache_key, sized_font)
+            return sized_font
+
+    def _put_sized_font_locked(self, cache_key: Tuple[str, int], sized_font: ImageFont.ImageFont) -> None:
+        self._sized_fonts[cache_key] = sized_font
+        self._font_keys[id(sized_font)] = cache_key
+        while len(self._sized_fonts) > self.max_sized_fonts:
+            evicted_key, evicted_font = self._sized_fonts.popitem(last=False)
+            self._font_keys.pop(id(evicted_font), None)
+            self._advance_cache.pop(evicted_key, None)
+
+    def _get_advance_table(self, font: ImageFont.ImageFont) -> Dict[str, float]:
+        with self._lock:
+            cache_key = self._font_keys.get(id(font))
+            if cache_key is None: # 이 관리자가 만들지 않은 폰트 (LRU에서 제거된 폰트 포함)는 메모이즈하지 않음
+                return {}
+            return self._advance_cache.setdefault(cache_key, {})
+
+    @staticmethod
+    def _measure_length(font: ImageFont.ImageFont, text: str) -> float:
+        if hasattr(font, 'getlength'):
+            return float(font.getlength(text))
+        if hasattr(font, 'getbbox'):
+            bbox = font.getbbox(text)
+            return float(bbox[2] - bbox[0])
+        return float(font.getsize(text)[0])
+
+
+_default_font_manager: Optional[FontManager] = None
+_default_font_manager_lock = threading.Lock()
+
+
+def get_font_manager() -> FontManager:
+    """프로세스 전역에서 공유하는 FontManager를 반환합니다."""
+    global _default_font_manager
+    with _default_font_manager_lock:
+        if _default_font_manager is None:
+            _default_font_manager = FontManager()
+        return _default_font_manager
@@ -1,6 +1,9 @@
+import startup_timing # 시작 시간 측정 (--startup-timing). 다른 모듈보다 먼저 import해야 import 시간을 기록할 수 있음
+if startup_timing.is_requested(): startup_timing.enable_import_timing()
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
+import multiprocessing
 import os
 import webbrowser
 import time
@@ -14,21 +17,23 @@ import atexit
 import tempfile
 import shutil
 import json # For history
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Tuple
 
 
-from pptx import Presentation
-
 # 프로젝트 설정 파일 import
 import config
 
 # 프로젝트 루트의 다른 .py 파일들 import
 from translator import OllamaTranslator
 from pptx_handler import PptxHandler
-from ocr_handler import PaddleOcrHandler, EasyOcrHandler
+from ocr_engine_registry import OcrEngineRegistry, resolve_ocr_engine
+from cpu_resource_manager import CpuResourceManager
+from memory_governor import MemoryGovernor, format_memory_sample
+from ocr_pool import OcrProcessPool
 from ollama_service import OllamaService
 from chart_xml_handler import ChartXmlHandler
 import utils
+startup_timing.mark("모듈 import 완료")
 
 # --- 로깅 설정 ---
 debug_mode = "--debug" in sys.argv
@@ -100,6 +105,10 @@ class Application(tk.Frame):
         
         self.ocr_handler = None
         self.current_ocr_engine_type = None
+        self.cpu_resource_manager = CpuResourceManager() # OCR 워커와 로컬 Ollama의 CPU 코어 예산 관리
+        self.memory_governor = MemoryGovernor() # 번역 중 메모리 압박 시 OCR 작업/워커 수 조절
+        self.ocr_engine_registry = OcrEngineRegistry() # 초기화된 OCR 엔진을 (엔진, 언어, GPU)별로 보관 (언어 전환 시 재사용)
+        self.ocr_pool: Optional[OcrProcessPool] = None # 엔진을 미리 올려둔 OCR 워커 프로세스 풀
 
         self.translation_thread = None
         self.model_download_thread = None
@@ -141,18 +150,91 @@ class Application(tk.Frame):
         except Exception as e:
             print(f"일반 로그 파일 핸들러 설정 실패: {e}")
 
-    def _destroy_current_ocr_handler(self):
+    def _get_ocr_pool(self) -> Optional[OcrProcessPool]:
+        """현재 OCR 핸들러와 같은 엔진 사양의 워커 풀을 반환합니다. 사양이 바뀌었으면 새로 만듭니다."""
+        if not self.ocr_handler or config.MAX_OCR_WORKERS <= 1:
+            return None
+        engine_spec = self.ocr_handler.get_engine_spec()
+        if self.ocr_pool and self.ocr_pool.matches(engine_spec):
+            return self.ocr_pool
+        self._shutdown_ocr_pool()
+        self.ocr_pool = OcrProcessPool(engine_spec, max_workers=config.MAX_OCR_WORKERS)
+        return self.ocr_pool
+
+    def _shutdown_ocr_pool(self):
+        if self.ocr_pool:
+            try:
+                self.ocr_pool.shutdown()
+            except Exception as e:
+                logger.warning(f"OCR 워커 풀 종료 중 오류: {e}")
+            self.ocr_pool = None
+
+    def _detach_current_ocr_handler(self):
+        """현재 OCR 핸들러 사용을 멈춥니다. 엔진은 레지스트리에 남아 있어 같은 언어로 돌아오면 바로 재사용됩니다."""
         if self.ocr_handler:
-            logger.info(f"기존 OCR 핸들러 ({self.current_ocr_engine_type}) 자원 해제 시도...")
-            if hasattr(self.ocr_handler, 'ocr_engine') and self.ocr_handler.ocr_engine:
-                try:
-                    del self.ocr_handler.ocr_engine
-                    logger.debug(f"{self.current_ocr_engine_type} 엔진 객체 참조 제거됨.")
-                except Exception as e:
-                    logger.warning(f"OCR 엔진 객체('ocr_engine') 삭제 중 오류: {e}")
-            self.ocr_handler = None
-            self.current_ocr_engine_type = None
-            logger.info("기존 OCR 핸들러 자원 해제 완료.")
+            logger.debug(f"OCR 핸들러 ({self.current_ocr_engine_type}) 사용 해제 (엔진은 레지스트리에 보관).")
+        self.ocr_engine_registry.deactivate()
+        self.ocr_handler = None
+        self.current_ocr_engine_type = None
+
+    def _destroy_current_ocr_handler(self):
+        self._shutdown_ocr_pool()
+        self._detach_current_ocr_handler()
+        logger.info("OCR 엔진 레지스트리 자원 해제 시도...")
+        self.ocr_engine_registry.clear()
+        logger.info("OCR 엔진 레지스트리 자원 해제 완료.")
+
+    def _resolve_ocr_engine(self, selected_ui_lang: str) -> Tuple[str, str, Optional[str]]:
+        """원본 UI 언어로 (엔진 표시 이름, 엔진 내부 이름, OCR 언어 코드)를 결정합니다. 언어 코드가 없으면 None."""
+        return resolve_ocr_engine(selected_ui_lang)
+
+    def _preload_ocr_engines(self):
+        """
+        현재 원본 언어(이미지 번역 사용 시)와 OCR_PRELOAD_UI_LANGS의 OCR 엔진을 백그라운드에서 미리 올립니다.
+        라이브러리 import와 모델 로드를 모두 백그라운드 스레드에서 하므로 미설치 엔진은 실패 로그만 남기고 넘어갑니다.
+        번역 시작 시 같은 엔진이 아직 로딩 중이면 check_ocr_engine_status는 그 로딩이 끝나기를 기다립니다.
+        """
+        preload_ui_langs = list(config.OCR_PRELOAD_UI_LANGS)
+        if config.STARTUP_PREWARM_ENABLED and self.image_translation_enabled_var.get():
+            preload_ui_langs.insert(0, self.src_lang_var.get())
+        preload_keys = []
+        for ui_lang in preload_ui_langs:
+            _, engine_name_internal, ocr_lang_code = self._resolve_ocr_engine(ui_lang)
+            if not ocr_lang_code: continue
+            engine_key = OcrEngineRegistry.make_key(engine_name_internal, ocr_lang_code, self.ocr_use_gpu_var.get())
+            if engine_key not in preload_keys and self.ocr_engine_registry.peek(engine_key) is None:
+                preload_keys.append(engine_key)
+        if not preload_keys: return
+        logger.info(f"OCR 엔진 미리 올리기 시작: {preload_keys}")
+        engine_name_display = "EasyOCR" if preload_keys[0][0] == "easyocr" else "PaddleOCR"
+        self.ocr_status_label.config(text=f"{engine_name_display}: 엔진 미리 로딩 중 ({preload_keys[0][1]})...")
+
+        def _on_loaded(key, error):
+            if error is None: logger.info(f"OCR 엔진 미리 올리기 완료: {key}")
+            if hasattr(self, 'master') and self.master.winfo_exists():
+                self.master.after(0, self.update_ocr_status_display)
+        self.ocr_engine_registry.preload(preload_keys, debug_enabled=debug_mode, on_loaded=_on_loaded)
+
+    def _update_memory_status(self):
+        """앱(OCR 워커 포함) 메모리와 시스템 여유 메모리를 주기적으로 표시합니다. 메모리 압박 중이면 함께 표시합니다."""
+        if not (hasattr(self, 'master') and self.master.winfo_exists()): return
+        memory_text = format_memory_sample(self.memory_governor.sample())
+        if self.memory_governor.under_pressure: memory_text += " (메모리 부족: OCR 속도 조절 중)"
+        self.memory_status_label.config(text=memory_text)
+        self.master.after(config.MEMORY_UI_UPDATE_INTERVAL_MS, self._update_memory_status)
+
+    def _prewarm_translation_model(self):
+        """선택된 Ollama 모델을 백그라운드에서 메모리에 올려 첫 번역 요청의 모델 로딩 대기를 없앱니다."""
+        model_name = self.model_var.get()
+        if not config.STARTUP_PREWARM_ENABLED or not model_name: return
+        self.ollama_running_label.config(text=f"Ollama 실행: 실행 중 (모델 '{model_name}' 로딩 중...)")
+
+        def _prewarm_worker():
+            warmed_up = self.ollama_service.warm_up_model(model_name, options=self.cpu_resource_manager.ollama_options())
+            status_text = f"Ollama 실행: 실행 중 (모델 '{model_name}' {'준비됨' if warmed_up else '미리 로딩 실패'})"
+            if hasattr(self, 'master') and self.master.winfo_exists():
+                self.master.after(0, lambda: self.ollama_running_label.config(text=status_text))
+        threading.Thread(target=_prewarm_worker, name="OllamaModelPrewarm", daemon=True).start()
 
     def on_closing(self):
         logger.info("애플리케이션 종료 절차 시작...")
@@ -189,7 +271,11 @@ class Application(tk.Frame):
         logger.debug("초기 점검 시작: OCR 라이브러리 설치 여부 및 Ollama 상태 확인")
         self.update_ocr_status_display()
         self.check_ollama_status_manual(initial_check=True)
+        self._preload_ocr_engines()
+        self._update_memory_status()
         logger.debug("초기 점검 완료.")
+        startup_timing.mark("초기 점검 완료")
+        if startup_timing.is_requested(): startup_timing.report()
 
     def create_widgets(self):
             top_frame = ttk.Frame(self)
@@ -223,6 +309,8 @@ class Application(tk.Frame):
             
             self.os_label = ttk.Label(server_status_frame, text=f"OS: {platform.system()} {platform.release()}")
             self.os_label.grid(row=0, column=0, columnspan=2, padx=5, pady=2, sticky=tk.W)
+            self.memory_status_label = ttk.Label(server_status_frame, text="메모리: 미확인")
+            self.memory_status_label.grid(row=0, column=2, columnspan=2, padx=5, pady=2, sticky=tk.W)
 
             self.ollama_status_label = ttk.Label(server_status_frame, text="Ollama 설치: 미확인")
             self.ollama_status_label.grid(row=1, column=0, padx=5, pady=2, sticky=tk.W)
@@ -528,8 +616,7 @@ class Application(tk.Frame):
 
     def update_ocr_status_display(self):
         selected_ui_lang = self.src_lang_var.get()
-        use_easyocr = selected_ui_lang in config.EASYOCR_SUPPORTED_UI_LANGS
-        engine_name_display = "EasyOCR" if use_easyocr else "PaddleOCR"
+        engine_name_display, engine_name_internal, ocr_lang_code = self._resolve_ocr_engine(selected_ui_lang)
         
         gpu_enabled_for_ocr = self.ocr_use_gpu_var.get()
         gpu_status_text = "(GPU 사용 예정)" if gpu_enabled_for_ocr else "(CPU 사용 예정)"
@@ -543,6 +630,8 @@ class Application(tk.Frame):
             
             gpu_in_use_text = "(GPU 사용 중)" if self.ocr_handler.use_gpu else "(CPU 사용 중)"
             self.ocr_status_label.config(text=f"{engine_name_display}: 준비됨 ({current_handler_lang_display}) {gpu_in_use_text}")
+        elif ocr_lang_code and self.ocr_engine_registry.peek(OcrEngineRegistry.make_key(engine_name_internal, ocr_lang_code, gpu_enabled_for_ocr)):
+            self.ocr_status_label.config(text=f"{engine_name_display}: 미리 로드됨 ({ocr_lang_code}) {gpu_status_text}")
         else:
             self.ocr_status_label.config(text=f"{engine_name_display}: ({selected_ui_lang}) 사용 예정 {gpu_status_text} (미확인)")
 
@@ -568,7 +657,7 @@ class Application(tk.Frame):
         info = {"slide_count": 0, "total_text_char_count":0, "image_elements_count": 0, "chart_elements_count": 0}
         try:
             logger.debug(f"파일 정보 분석 중: {file_path}"); file_name = os.path.basename(file_path)
-            info = self.pptx_handler.get_file_info(file_path)
+            info = self.pptx_handler.get_file_info(file_path) # zip 스캔 (python-pptx 객체 모델을 만들지 않음)
             
             self.current_file_slide_count = info.get('slide_count', 0)
             self.current_file_total_text_chars = info.get('total_text_char_count', 0)
@@ -621,6 +710,7 @@ class Application(tk.Frame):
         if ollama_running:
             logger.info(f"Ollama 실행 중 (포트: {port}). 모델 목록 로드 시도.")
             self.load_ollama_models()
+            if initial_check: self._prewarm_translation_model()
         else:
             logger.warning("Ollama가 설치되었으나 실행 중이지 않습니다. 자동 시작을 시도합니다.")
             self.model_combo.config(values=[], state="disabled"); self.model_var.set("")
@@ -731,15 +821,8 @@ class Application(tk.Frame):
         self.master.update_idletasks()
 
         selected_ui_lang = self.src_lang_var.get()
-        use_easyocr = selected_ui_lang in config.EASYOCR_SUPPORTED_UI_LANGS
-        engine_name_display = "EasyOCR" if use_easyocr else "PaddleOCR"
-        engine_name_internal = engine_name_display.lower()
-
-        ocr_lang_code = None
-        if use_easyocr:
-            ocr_lang_code = config.UI_LANG_TO_EASYOCR_CODE_MAP.get(selected_ui_lang)
-        else:
-            ocr_lang_code = config.UI_LANG_TO_PADDLEOCR_CODE_MAP.get(selected_ui_lang, config.DEFAULT_PADDLE_OCR_LANG)
+        engine_name_display, engine_name_internal, ocr_lang_code = self._resolve_ocr_engine(selected_ui_lang)
+        use_easyocr = engine_name_internal == "easyocr"
 
         if not ocr_lang_code:
             msg = f"{engine_name_display}: 언어 '{selected_ui_lang}'에 대한 OCR 코드 없음."
@@ -760,10 +843,12 @@ class Application(tk.Frame):
             needs_reinit = True
         
         if needs_reinit:
-            self._destroy_current_ocr_handler()
-            logger.info(f"{engine_name_display} 핸들러 (재)초기화 시도 (언어: {ocr_lang_code}, GPU: {gpu_enabled_for_ocr}).")
-            self.current_work_label.config(text=f"{engine_name_display} 엔진 로딩 중 (언어: {ocr_lang_code}, GPU: {gpu_enabled_for_ocr})...")
-            self.master.update_idletasks()
+            self._detach_current_ocr_handler()
+            engine_key = OcrEngineRegistry.make_key(engine_name_internal, ocr_lang_code, gpu_enabled_for_ocr)
+            if self.ocr_engine_registry.peek(engine_key) is None:
+                logger.info(f"{engine_name_display} 핸들러 초기화 시도 (언어: {ocr_lang_code}, GPU: {gpu_enabled_for_ocr}).")
+                self.current_work_label.config(text=f"{engine_name_display} 엔진 로딩 중 (언어: {ocr_lang_code}, GPU: {gpu_enabled_for_ocr})...")
+                self.master.update_idletasks()
             try:
                 if use_easyocr:
                     if not utils.check_easyocr():
@@ -773,7 +858,7 @@ class Application(tk.Frame):
                             else: messagebox.showerror(f"{engine_name_display} 설치 실패", f"{engine_name_display} 설치에 실패했습니다.")
                         self.current_work_label.config(text=f"{engine_name_display} 미설치.")
                         return False
-                    self.ocr_handler = EasyOcrHandler(lang_codes_list=[ocr_lang_code], debug_enabled=debug_mode, use_gpu=gpu_enabled_for_ocr)
+                    self.ocr_handler = self.ocr_engine_registry.get_handler(engine_key, debug_enabled=debug_mode, activate=True)
                     self.current_ocr_engine_type = "easyocr"
                 else:
                     if not utils.check_paddleocr():
@@ -783,7 +868,7 @@ class Application(tk.Frame):
                             else: messagebox.showerror(f"{engine_name_display} 설치 실패", f"{engine_name_display} 설치에 실패했습니다.")
                         self.current_work_label.config(text=f"{engine_name_display} 미설치.")
                         return False
-                    self.ocr_handler = PaddleOcrHandler(lang_code=ocr_lang_code, debug_enabled=debug_mode, use_gpu=gpu_enabled_for_ocr)
+                    self.ocr_handler = self.ocr_engine_registry.get_handler(engine_key, debug_enabled=debug_mode, activate=True)
                     self.current_ocr_engine_type = "paddleocr"
                 
                 logger.info(f"{engine_name_display} 핸들러 초기화 성공 (언어: {ocr_lang_code}, GPU: {gpu_enabled_for_ocr}).")
@@ -793,14 +878,14 @@ class Application(tk.Frame):
                 logger.error(f"{engine_name_display} 핸들러 초기화 실패: {e}", exc_info=True)
                 self.ocr_status_label.config(text=f"{engine_name_display}: 초기화 실패 ({ocr_lang_code}, GPU:{gpu_enabled_for_ocr})")
                 if is_called_from_start_translation: messagebox.showerror(f"{engine_name_display} 오류", f"{engine_name_display} 초기화 중 오류:\n{e}\n\nGPU 관련 문제일 수 있습니다. GPU 사용 옵션을 확인해보세요.")
-                self._destroy_current_ocr_handler()
+                self._detach_current_ocr_handler()
                 self.current_work_label.config(text=f"{engine_name_display} 엔진 초기화 실패!")
                 return False
             except Exception as e_other:
                  logger.error(f"{engine_name_display} 핸들러 생성 중 예기치 않은 오류: {e_other}", exc_info=True)
                  self.ocr_status_label.config(text=f"{engine_name_display}: 알 수 없는 오류")
                  if is_called_from_start_translation: messagebox.showerror(f"{engine_name_display} 오류", f"{engine_name_display} 처리 중 예기치 않은 오류:\n{e_other}")
-                 self._destroy_current_ocr_handler()
+                 self._detach_current_ocr_handler()
                  self.current_work_label.config(text=f"{engine_name_display} 엔진 오류!")
                  return False
 
@@ -842,7 +927,7 @@ class Application(tk.Frame):
                 image_translation_really_enabled = False
         else:
             logger.info("이미지 번역 옵션이 꺼져있으므로 OCR 엔진을 확인하지 않습니다.")
-            self._destroy_current_ocr_handler()
+            self._detach_current_ocr_handler()
 
 
         src_lang, tgt_lang, model = self.src_lang_var.get(), self.tgt_lang_var.get(), self.model_var.get()
@@ -957,7 +1042,12 @@ class Application(tk.Frame):
                 temp_dir_for_pptx_handler_main = tempfile.mkdtemp(prefix="pptx_trans_main_")
                 temp_pptx_for_chart_translation_path: Optional[str] = None
 
-                prs = Presentation(file_path)
+                self.translator.runtime_options = self.cpu_resource_manager.prepare_translation(self.ollama_service, model)
+                # 작업 전체에서 python-pptx 파싱은 이 한 번뿐 (1단계 작업 목록과 2단계 차트 수를 함께 사용)
+                deck_analysis = self.pptx_handler.analyze_presentation(file_path)
+                prs = deck_analysis.prs
+                stage1_ocr_pool = self._get_ocr_pool() if image_translation_enabled else None
+                self.memory_governor.start(stage1_ocr_pool) # 메모리 한도를 넘으면 새 OCR 작업 일시 중지/워커 축소
                 self.master.after(0, lambda: self.current_work_label.config(text="1단계 (텍스트/이미지) 처리 시작..."))
                 
                 stage1_success = self.pptx_handler.translate_presentation_stage1(
@@ -969,7 +1059,11 @@ class Application(tk.Frame):
                     report_item_completed_from_handler,
                     self.stop_event,
                     image_translation_enabled,
-                    ocr_temperature
+                    ocr_temperature,
+                    ocr_pool=stage1_ocr_pool,
+                    cpu_resource_manager=self.cpu_resource_manager,
+                    memory_governor=self.memory_governor,
+                    deck_analysis=deck_analysis
                 )
 
                 if self.stop_event.is_set():
@@ -1000,8 +1094,7 @@ class Application(tk.Frame):
                     if prs: prs.save(temp_pptx_for_chart_translation_path)
                     logger.info(f"1단계 결과 임시 저장: {temp_pptx_for_chart_translation_path}")
 
-                    info_for_charts = self.pptx_handler.get_file_info(temp_pptx_for_chart_translation_path)
-                    num_charts_in_prs = info_for_charts.get('chart_elements_count', 0)
+                    num_charts_in_prs = deck_analysis.chart_elements_count # 1단계는 차트를 추가/삭제하지 않으므로 분석 결과 그대로 사용
 
 
                     if num_charts_in_prs > 0 and not self.stop_event.is_set():
@@ -1121,6 +1214,7 @@ class Application(tk.Frame):
                 self.master.after(0, self._handle_translation_failure, translation_result_status, file_path, task_log_filepath, str(e_worker))
 
         finally:
+            self.memory_governor.stop()
             if hasattr(self, 'master') and self.master.winfo_exists():
                 history_entry = {
                     "name": os.path.basename(file_path),
@@ -1349,7 +1443,8 @@ class TextHandler(logging.Handler):
 
 
 if __name__ == "__main__":
-    
+    multiprocessing.freeze_support() # OCR 워커 프로세스(spawn) 지원 (패키징된 실행 파일 포함)
+
     if debug_mode: logger.info("디버그 모드로 실행 중입니다.")
     else: logger.info("일반 모드로 실행 중입니다.")
     
@@ -1363,6 +1458,7 @@ if __name__ == "__main__":
 
     root = tk.Tk()
     app = Application(master=root)
+    startup_timing.mark("창 생성 완료")
     root.geometry("1024x768")
     root.update_idletasks()
     min_width = root.winfo_reqwidth()
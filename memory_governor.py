@@ -0,0 +1,171 @@
+# memory_governor.py
+import gc
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+
+# 설정 파일 import
+import config
+
+if TYPE_CHECKING:
+    from ocr_pool import OcrProcessPool
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+PRESSURE_RELEASE_RATIO = 0.9 # 압박 상태 해제는 한도의 90% 아래로 내려왔을 때 (경계에서 켜짐/꺼짐 반복 방지)
+
+
+class MemorySample(NamedTuple):
+    rss_bytes: int # 이 프로세스 + 자식 프로세스(OCR 워커) RSS 합
+    available_bytes: int # 시스템 여유 메모리
+    total_bytes: int # 시스템 전체 메모리
+
+
+def format_memory_sample(memory_sample: Optional[MemorySample]) -> str:
+    if memory_sample is None: return "메모리: 확인 불가"
+    return (f"메모리: 앱 {memory_sample.rss_bytes / (1024 * MB):.1f} GB / "
+            f"여유 {memory_sample.available_bytes / (1024 * MB):.1f} GB")
+
+
+class MemoryGovernor:
+    """
+    번역 실행 중 메모리 사용량(앱과 OCR 워커 RSS 합, 시스템 여유 메모리)을 주기적으로 확인해,
+    한도(MEMORY_SOFT_LIMIT_MB 또는 전체 RAM x MEMORY_SOFT_LIMIT_RATIO, 여유 메모리 MEMORY_MIN_AVAILABLE_MB)를 넘으면 압박 상태로 전환합니다.
+    압박 상태에서는
+    - OCR 워커 풀에 새 이미지를 보내지 않고(최대 MEMORY_MAX_PAUSE_SECONDS), 쉬고 있는 워커 프로세스를 1개만 남기고 종료
+    - 프로세스 내 OCR은 wait_for_headroom()에서 여유가 생길 때까지 대기하고 한 장씩 처리
+    - 렌더링용으로 보관하던 디코딩 이미지를 보관하지 않음 (keep_decoded_images() = False)
+    압박이 풀리면 워커 수와 작업 전송을 원래대로 되돌립니다. psutil을 쓸 수 없으면 아무것도 하지 않습니다.
+    """
+
+    def __init__(self, on_sample: Optional[Callable[[MemorySample], None]] = None):
+        self.enabled = bool(config.MEMORY_GOVERNOR_ENABLED)
+        self.on_sample = on_sample
+        self._psutil = None
+        try:
+            import psutil
+            self._psutil = psutil
+        except ImportError:
+            self.enabled = False
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._headroom_event = threading.Event() # 압박 상태가 아니면 set
+        self._headroom_event.set()
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._ocr_pool: Optional['OcrProcessPool'] = None
+        self._pressure_since: Optional[float] = None
+        self.last_sample: Optional[MemorySample] = None
+        self.pressure_events = 0
+
+    @property
+    def under_pressure(self) -> bool:
+        return not self._headroom_event.is_set()
+
+    def sample(self) -> Optional[MemorySample]:
+        if self._psutil is None: return None
+        try:
+            current_process = self._psutil.Process()
+            rss_bytes = current_process.memory_info().rss
+            for child_process in current_process.children(recursive=True):
+                try:
+                    rss_bytes += child_process.memory_info().rss
+                except (self._psutil.NoSuchProcess, self._psutil.AccessDenied):
+                    continue
+            virtual_memory = self._psutil.virtual_memory()
+            self.last_sample = MemorySample(rss_bytes, virtual_memory.available, virtual_memory.total)
+        except Exception as e_sample:
+            logger.debug(f"메모리 사용량 확인 실패: {e_sample}")
+            return None
+        return self.last_sample
+
+    def soft_limit_bytes(self, total_bytes: int) -> int:
+        if config.MEMORY_SOFT_LIMIT_MB: return int(config.MEMORY_SOFT_LIMIT_MB * MB)
+        return int(total_bytes * config.MEMORY_SOFT_LIMIT_RATIO)
+
+    def keep_decoded_images(self) -> bool:
+        """렌더링 단계에서 다시 쓰려고 디코딩한 원본 이미지를 보관해도 되는지 (압박 상태면 False, 렌더링 때 다시 디코딩)."""
+        return not self.under_pressure
+
+    def wait_for_headroom(self, stop_event: Optional[threading.Event] = None) -> None:
+        """압박 상태이면 풀릴 때까지 (최대 MEMORY_MAX_PAUSE_SECONDS) 기다립니다. 한도가 고정 사용량 때문이어도 작업이 멈추지는 않습니다."""
+        if not self.enabled or not self.under_pressure: return
+        deadline = time.monotonic() + config.MEMORY_MAX_PAUSE_SECONDS
+        while not self._headroom_event.wait(timeout=0.2):
+            if (stop_event and stop_event.is_set()) or time.monotonic() >= deadline: return
+
+    def start(self, ocr_pool: Optional['OcrProcessPool'] = None) -> None:
+        if not self.enabled: return
+        self.stop()
+        with self._lock:
+            self._ocr_pool = ocr_pool
+        self._stop_event.clear()
+        self._headroom_event.set()
+        self._pressure_since = None
+        self._check()
+        self._monitor_thread = threading.Thread(target=self._monitor_loop, name="MemoryGovernor", daemon=True)
+        self._monitor_thread.start()
+
+    def stop(self) -> None:
+        if self._monitor_thread is None: return
+        self._stop_event.set()
+        self._monitor_thread.join(timeout=2)
+        self._monitor_thread = None
+        if self.under_pressure: self._leave_pressure()
+        with self._lock:
+            self._ocr_pool = None
+
+    # --- 내부 구현 ---
+
+    def _monitor_loop(self) -> None:
+        while not self._stop_event.wait(config.MEMORY_SAMPLE_INTERVAL_SECONDS):
+            try:
+                self._check()
+            except Exception as e_check:
+                logger.warning(f"메모리 확인 중 오류: {e_check}", exc_info=True)
+
+    def _check(self) -> None:
+        memory_sample = self.sample()
+        if memory_sample is None: return
+        if self.on_sample:
+            try: self.on_sample(memory_sample)
+            except Exception: pass
+        soft_limit = self.soft_limit_bytes(memory_sample.total_bytes)
+        min_available = config.MEMORY_MIN_AVAILABLE_MB * MB
+        if not self.under_pressure:
+            if memory_sample.rss_bytes >= soft_limit or memory_sample.available_bytes <= min_available:
+                self._enter_pressure(memory_sample, soft_limit)
+        else:
+            if (memory_sample.rss_bytes < soft_limit * PRESSURE_RELEASE_RATIO
+                    and memory_sample.available_bytes > min_available / PRESSURE_RELEASE_RATIO):
+                self._leave_pressure()
+            elif self._pressure_since is not None and time.monotonic() - self._pressure_since > config.MEMORY_MAX_PAUSE_SECONDS:
+                # 오래 기다려도 줄지 않으면 (블롭 등 고정 사용량) 워커 1개로 계속 진행
+                with self._lock:
+                    ocr_pool = self._ocr_pool
+                if ocr_pool is not None: ocr_pool.set_paused(False)
+
+    def _enter_pressure(self, memory_sample: MemorySample, soft_limit: int) -> None:
+        self.pressure_events += 1
+        self._pressure_since = time.monotonic()
+        self._headroom_event.clear()
+        logger.warning(f"메모리 압박: 앱 {memory_sample.rss_bytes // MB} MB (한도 {soft_limit // MB} MB), "
+                       f"여유 {memory_sample.available_bytes // MB} MB. 새 OCR 작업을 멈추고 OCR 워커를 줄입니다.")
+        with self._lock:
+            ocr_pool = self._ocr_pool
+        if ocr_pool is not None:
+            ocr_pool.set_paused(True)
+            released_count = ocr_pool.shrink_idle_workers(keep=1)
+            if released_count: logger.info(f"메모리 확보를 위해 쉬고 있는 OCR 워커 {released_count}개 종료.")
+        gc.collect()
+
+    def _leave_pressure(self) -> None:
+        self._pressure_since = None
+        with self._lock:
+            ocr_pool = self._ocr_pool
+        if ocr_pool is not None:
+            ocr_pool.set_paused(False)
+            ocr_pool.restore_workers()
+        self._headroom_event.set()
+        logger.info("메모리 압박 해제. OCR 작업과 워커 수를 원래대로 되돌립니다.")
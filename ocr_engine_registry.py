@@ -0,0 +1,184 @@
+# ocr_engine_registry.py
+import collections
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 설정 파일 import
+import config
+
+if TYPE_CHECKING:
+    from ocr_handler import BaseOcrHandler
+
+logger = logging.getLogger(__name__)
+
+EngineKey = Tuple[str, str, bool] # (engine_name, lang_code, use_gpu)
+
+
+def resolve_ocr_engine(source_ui_lang: str) -> Tuple[str, str, Optional[str]]:
+    """원본 UI 언어로 (엔진 표시 이름, 엔진 내부 이름, OCR 언어 코드)를 결정합니다. 언어 코드가 없으면 None."""
+    use_easyocr = source_ui_lang in config.EASYOCR_SUPPORTED_UI_LANGS
+    engine_name_display = "EasyOCR" if use_easyocr else "PaddleOCR"
+    if use_easyocr:
+        ocr_lang_code = config.UI_LANG_TO_EASYOCR_CODE_MAP.get(source_ui_lang)
+    else:
+        ocr_lang_code = config.UI_LANG_TO_PADDLEOCR_CODE_MAP.get(source_ui_lang, config.DEFAULT_PADDLE_OCR_LANG)
+    return engine_name_display, engine_name_display.lower(), ocr_lang_code
+
+
+def _current_rss_bytes() -> Optional[int]:
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+class _RegistryEntry:
+    def __init__(self, handler: 'BaseOcrHandler', footprint_bytes: int):
+        self.handler = handler
+        self.footprint_bytes = footprint_bytes
+
+
+class OcrEngineRegistry:
+    """
+    초기화된 OCR 핸들러를 (엔진, 언어 코드, GPU 사용) 키로 보관하는 LRU 레지스트리.
+    - 엔진 초기화(모델 로드)는 키마다 한 번만 수행하고, 이후 조회는 즉시 반환
+    - 보관 개수 또는 추정 메모리 사용량(초기화 전후 RSS 차이)이 한도를 넘으면 가장 오래 사용하지 않은 핸들러부터 해제
+    - preload()로 설정된 언어의 엔진을 백그라운드에서 미리 올려 둘 수 있음
+    같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 초기화하고 나머지는 완료를 기다립니다.
+    """
+
+    def __init__(self, max_engines: Optional[int] = None, max_memory_mb: Optional[int] = None):
+        self.max_engines = max(1, int(max_engines if max_engines is not None else config.OCR_ENGINE_REGISTRY_MAX_ENGINES))
+        self.max_memory_bytes = int((max_memory_mb if max_memory_mb is not None else config.OCR_ENGINE_REGISTRY_MAX_MEMORY_MB) * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[EngineKey, _RegistryEntry]" = collections.OrderedDict()
+        self._loading: Dict[EngineKey, threading.Event] = {}
+        self._init_lock = threading.Lock() # 엔진 초기화는 한 번에 하나씩 (RSS 측정 및 라이브러리 import 경합 방지)
+        self._active_key: Optional[EngineKey] = None # 현재 사용 중인 핸들러 키 (해제 대상에서 제외)
+
+    @staticmethod
+    def make_key(engine_name: str, lang_code: str, use_gpu: bool) -> EngineKey:
+        return (engine_name, lang_code, bool(use_gpu))
+
+    def peek(self, key: EngineKey) -> Optional['BaseOcrHandler']:
+        """초기화된 핸들러가 있으면 반환합니다 (초기화하지 않음, LRU 순서 갱신)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None: return None
+            self._entries.move_to_end(key)
+            return entry.handler
+
+    def get_handler(self, key: EngineKey, debug_enabled: bool = False, activate: bool = False) -> 'BaseOcrHandler':
+        """
+        키에 해당하는 핸들러를 반환합니다. 없으면 초기화합니다 (실패 시 RuntimeError 등 핸들러 생성 예외 전달).
+        activate=True이면 이 핸들러를 사용 중으로 표시해 다른 엔진을 올릴 때 해제되지 않게 합니다.
+        """
+        if activate:
+            with self._lock:
+                self._active_key = key
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    return entry.handler
+                loading_event = self._loading.get(key)
+                if loading_event is None:
+                    loading_event = threading.Event()
+                    self._loading[key] = loading_event
+                    break
+            loading_event.wait() # 다른 스레드가 초기화 중 -> 끝나면 다시 조회 (실패했으면 이 스레드가 재시도)
+
+        try:
+            handler, footprint_bytes = self._create_handler(key, debug_enabled)
+            with self._lock:
+                self._entries[key] = _RegistryEntry(handler, footprint_bytes)
+                self._evict_locked(keep_key=key)
+            return handler
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            loading_event.set()
+
+    def preload(self, keys: Iterable[EngineKey], debug_enabled: bool = False,
+                on_loaded: Optional[Callable[[EngineKey, Optional[Exception]], None]] = None) -> threading.Thread:
+        """키 목록의 엔진을 백그라운드 스레드에서 차례로 초기화합니다. 키마다 on_loaded(key, error)를 호출합니다."""
+        keys_to_load: List[EngineKey] = list(keys)
+
+        def _preload_worker():
+            for key in keys_to_load[:self.max_engines]: # 한도를 넘는 미리 올리기는 서로를 밀어내므로 생략
+                error = None
+                try:
+                    self.get_handler(key, debug_enabled=debug_enabled)
+                except Exception as e_preload:
+                    error = e_preload
+                    logger.warning(f"OCR 엔진 미리 올리기 실패 {key}: {e_preload}")
+                if on_loaded:
+                    try: on_loaded(key, error)
+                    except Exception: pass
+
+        preload_thread = threading.Thread(target=_preload_worker, name="OcrEnginePreload", daemon=True)
+        preload_thread.start()
+        return preload_thread
+
+    def deactivate(self) -> None:
+        with self._lock:
+            self._active_key = None
+
+    def release(self, key: EngineKey) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._release_handler(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+            self._active_key = None
+        for key, entry in entries:
+            self._release_handler(key, entry)
+
+    # --- 내부 구현 ---
+
+    def _create_handler(self, key: EngineKey, debug_enabled: bool) -> Tuple['BaseOcrHandler', int]:
+        from ocr_handler import create_ocr_handler
+        engine_name, lang_code, use_gpu = key
+        engine_spec = {
+            'engine': engine_name,
+            'lang_codes': [lang_code] if engine_name == "easyocr" else lang_code,
+            'use_gpu': use_gpu,
+            'debug_enabled': debug_enabled,
+        }
+        with self._init_lock:
+            rss_before = _current_rss_bytes()
+            handler = create_ocr_handler(engine_spec)
+            rss_after = _current_rss_bytes()
+        footprint_bytes = config.OCR_ENGINE_DEFAULT_FOOTPRINT_MB * 1024 * 1024
+        if rss_before is not None and rss_after is not None and rss_after > rss_before:
+            footprint_bytes = rss_after - rss_before
+        logger.info(f"OCR 엔진 등록 {key} (추정 메모리 {footprint_bytes // (1024 * 1024)} MB)")
+        return handler, footprint_bytes
+
+    def _evict_locked(self, keep_key: EngineKey) -> None:
+        while True:
+            total_bytes = sum(entry.footprint_bytes for entry in self._entries.values())
+            if len(self._entries) <= self.max_engines and total_bytes <= self.max_memory_bytes:
+                return
+            evictable_keys = [k for k in self._entries if k != keep_key and k != self._active_key]
+            if not evictable_keys: return
+            oldest_key = evictable_keys[0]
+            entry = self._entries.pop(oldest_key)
+            logger.info(f"OCR 엔진 해제 (LRU) {oldest_key}: 보관 {len(self._entries)}개, 추정 {total_bytes // (1024 * 1024)} MB")
+            self._release_handler(oldest_key, entry)
+
+    @staticmethod
+    def _release_handler(key: EngineKey, entry: _RegistryEntry) -> None:
+        # 다른 곳에서 핸들러를 참조 중이어도 엔진(모델) 참조는 끊어 메모리를 돌려받음 (기존 _destroy_current_ocr_handler와 동일)
+        if getattr(entry.handler, 'ocr_engine', None) is not None:
+            try:
+                entry.handler.ocr_engine = None
+            except Exception as e_release:
+                logger.warning(f"OCR 엔진 해제 중 오류 {key}: {e_release}")
@@ -4,12 +4,14 @@ import cv2
 import os
 import logging
 import io
-import textwrap
-import math
-from typing import List
+import importlib.metadata
 
 # 설정 파일 import
 import config
+from font_manager import get_font_manager
+from text_layout import fit_text_to_box
+from ocr_prefilter import likely_contains_text
+from ocr_tuning import resolve_perf_profile
 
 logger = logging.getLogger(__name__)
 
@@ -21,39 +23,93 @@ FONT_DIR = config.FONTS_DIR
 logger.info(f"OCR Handler: Using Pillow version {PILLOW_VERSION}")
 PILLOW_VERSION_TUPLE = tuple(map(int, PILLOW_VERSION.split('.')))
 
+# 배경색 추정: 채널당 BG_COLOR_BIN_BITS 비트로 색상 구간을 나눠 박스 테두리 링 픽셀의 최빈 구간을 배경색으로 사용
+BG_COLOR_BIN_BITS = 4 # 채널당 16단계 -> 4096개 구간
+BG_RING_RATIO = 0.12 # 박스 짧은 변 대비 테두리 링 두께 (글자 픽셀은 대부분 박스 안쪽에 있음)
+DEFAULT_BG_COLOR = (200, 200, 200)
+
+def _image_to_rgb_array(image_pil):
+    """이미지를 (H, W, 3) uint8 배열로 변환합니다. 투명 영역은 흰 배경에 합성합니다."""
+    if image_pil.mode == 'RGB':
+        return np.asarray(image_pil)
+    if image_pil.mode in ('RGBA', 'LA', 'PA') or (image_pil.mode == 'P' and 'transparency' in image_pil.info):
+        rgba_array = np.asarray(image_pil.convert('RGBA'), dtype=np.float32)
+        alpha = rgba_array[..., 3:4] / 255.0
+        return (rgba_array[..., :3] * alpha + 255.0 * (1.0 - alpha)).astype(np.uint8)
+    return np.asarray(image_pil.convert('RGB'))
+
+def _box_ring_pixels(rgb_array, box):
+    """박스 영역의 테두리 링 픽셀을 (N, 3) 배열로 반환합니다. 박스가 너무 작으면 영역 전체를 사용합니다."""
+    x1, y1, x2, y2 = box
+    region = rgb_array[y1:y2, x1:x2]
+    region_h, region_w = region.shape[:2]
+    ring = max(1, int(round(min(region_w, region_h) * BG_RING_RATIO)))
+    if region_h <= 2 * ring or region_w <= 2 * ring:
+        return region.reshape(-1, 3)
+    return np.concatenate([
+        region[:ring].reshape(-1, 3), region[-ring:].reshape(-1, 3),
+        region[ring:-ring, :ring].reshape(-1, 3), region[ring:-ring, -ring:].reshape(-1, 3),
+    ])
+
+def estimate_background_colors(image_pil, boxes, rgb_array=None):
+    """
+    한 이미지의 여러 박스 (x1, y1, x2, y2) 배경색을 한 번에 추정합니다.
+    이미지를 한 번만 배열로 변환하고, 모든 박스의 테두리 링 픽셀을 (박스, 색상 구간) 코드로 묶어 bincount 한 번으로 집계합니다.
+    각 박스의 최빈 구간에 속한 픽셀들의 평균색을 배경색으로 반환합니다.
+    """
+    if not boxes: return []
+    if rgb_array is None: rgb_array = _image_to_rgb_array(image_pil)
+    bin_bits = BG_COLOR_BIN_BITS
+    bins_per_box = 1 << (3 * bin_bits)
+    shift = 8 - bin_bits
+
+    pixel_chunks, code_chunks = [], []
+    for box_idx, box in enumerate(boxes):
+        ring_pixels = _box_ring_pixels(rgb_array, box)
+        if ring_pixels.size == 0: continue
+        quantized = (ring_pixels >> shift).astype(np.int64)
+        codes = (quantized[:, 0] << (2 * bin_bits)) | (quantized[:, 1] << bin_bits) | quantized[:, 2]
+        pixel_chunks.append(ring_pixels)
+        code_chunks.append(codes + box_idx * bins_per_box)
+    if not pixel_chunks:
+        return [DEFAULT_BG_COLOR] * len(boxes)
+
+    all_pixels = np.concatenate(pixel_chunks).astype(np.float64)
+    all_codes = np.concatenate(code_chunks)
+    total_bins = len(boxes) * bins_per_box
+    counts = np.bincount(all_codes, minlength=total_bins).reshape(len(boxes), bins_per_box)
+    channel_sums = np.stack([
+        np.bincount(all_codes, weights=all_pixels[:, channel], minlength=total_bins).reshape(len(boxes), bins_per_box)
+        for channel in range(3)
+    ], axis=-1)
+
+    dominant_bins = counts.argmax(axis=1)
+    box_indices = np.arange(len(boxes))
+    dominant_counts = counts[box_indices, dominant_bins]
+    dominant_sums = channel_sums[box_indices, dominant_bins]
+
+    colors = []
+    for box_idx in range(len(boxes)):
+        if dominant_counts[box_idx] == 0:
+            colors.append(DEFAULT_BG_COLOR)
+        else:
+            colors.append(tuple(int(round(c)) for c in dominant_sums[box_idx] / dominant_counts[box_idx]))
+    return colors
+
+def get_contrasting_text_colors(bg_colors):
+    """배경색 목록에 대한 글자색(검정/흰색)을 한 번에 계산합니다."""
+    if not bg_colors: return []
+    # get_contrasting_text_color와 같은 정수 가중치 (실수 가중치는 회색 128에서 127.999...로 판정이 뒤집힘)
+    brightness_x1000 = np.asarray(bg_colors, dtype=np.int64) @ np.array([299, 587, 114], dtype=np.int64)
+    return [(0, 0, 0) if value >= 128 * 1000 else (255, 255, 255) for value in brightness_x1000]
+
 def get_quantized_dominant_color(image_roi, num_colors=5):
+    """단일 영역 배경색 추정 (estimate_background_colors를 영역 전체 박스로 호출). num_colors는 하위 호환용."""
     try:
         if image_roi.width == 0 or image_roi.height == 0: return (128, 128, 128)
-        quantizable_image = image_roi.convert('RGB')
-        try:
-            quantized_image = quantizable_image.quantize(colors=num_colors, method=Image.Quantize.FASTOCTREE)
-        except AttributeError: 
-            logger.debug("FASTOCTREE 양자화 실패, MEDIANCUT으로 대체 시도 (Pillow < 9.1.0).")
-            quantized_image = quantizable_image.quantize(colors=num_colors, method=Image.Quantize.MEDIANCUT)
-        except Exception as e_quant:
-             logger.warning(f"색상 양자화 중 오류: {e_quant}. 단순 평균색으로 대체합니다.")
-             return get_simple_average_color(image_roi)
-
-        palette = quantized_image.getpalette()
-        color_counts = quantized_image.getcolors(num_colors * 2)
-        
-        if not color_counts:
-            logger.warning("getcolors()가 None을 반환 (양자화 실패 가능성). 단순 평균색으로 대체.")
-            return get_simple_average_color(image_roi)
-
-        dominant_palette_index = max(color_counts, key=lambda item: item[0])[1]
-        
-        if palette:
-            r = palette[dominant_palette_index * 3]
-            g = palette[dominant_palette_index * 3 + 1]
-            b = palette[dominant_palette_index * 3 + 2]
-            dominant_color = (r, g, b)
-        else:
-             logger.warning("양자화된 이미지에 팔레트가 없습니다. 단순 평균색으로 대체.")
-             return get_simple_average_color(image_roi)
-        return dominant_color
+        return estimate_background_colors(image_roi, [(0, 0, image_roi.width, image_roi.height)])[0]
     except Exception as e:
-        logger.warning(f"양자화된 주요 색상 감지 실패: {e}. 단순 평균색으로 대체.", exc_info=True)
+        logger.warning(f"주요 색상 감지 실패: {e}. 단순 평균색으로 대체.", exc_info=True)
         return get_simple_average_color(image_roi)
 
 def get_simple_average_color(image_roi):
@@ -80,12 +136,31 @@ def get_contrasting_text_color(bg_color_tuple):
     else:
         return (255, 255, 255)
 
+def _crop_text_region(image_cv, box_points):
+    """검출된 사각형(4점) 영역을 원근 변환으로 반듯하게 잘라냅니다 (세로로 긴 조각은 90도 회전)."""
+    points = np.array(box_points, dtype=np.float32)
+    crop_width = int(max(np.linalg.norm(points[0] - points[1]), np.linalg.norm(points[2] - points[3])))
+    crop_height = int(max(np.linalg.norm(points[0] - points[3]), np.linalg.norm(points[1] - points[2])))
+    crop_width, crop_height = max(1, crop_width), max(1, crop_height)
+    target_points = np.float32([[0, 0], [crop_width, 0], [crop_width, crop_height], [0, crop_height]])
+    transform = cv2.getPerspectiveTransform(points, target_points)
+    cropped = cv2.warpPerspective(image_cv, transform, (crop_width, crop_height),
+                                  borderMode=cv2.BORDER_REPLICATE, flags=cv2.INTER_CUBIC)
+    if cropped.shape[0] * 1.0 / cropped.shape[1] >= 1.5:
+        cropped = np.rot90(cropped)
+    return cropped
+
 class BaseOcrHandler:
-    def __init__(self, lang_codes, debug_enabled=False, use_gpu=False):
+    engine_name = None # 'paddleocr' / 'easyocr' (main.py의 current_ocr_engine_type 값과 동일)
+
+    def __init__(self, lang_codes, debug_enabled=False, use_gpu=False, perf_profile=None):
         self.current_lang_codes = lang_codes 
         self.debug_mode = debug_enabled
         self.use_gpu = use_gpu
+        # CPU 추론 설정 (스레드 수, MKL-DNN, 배치/검출 크기). 워커 풀은 워커 수에 맞춘 프로필을 넘겨줌
+        self.perf_profile = dict(perf_profile) if perf_profile is not None else resolve_perf_profile(self.engine_name)
         self.ocr_engine = None
+        self.font_manager = get_font_manager()
         self._initialize_engine()
 
     def _initialize_engine(self):
@@ -94,12 +169,54 @@ class BaseOcrHandler:
     def ocr_image(self, image_pil_rgb):
         raise NotImplementedError("각 OCR 핸들러는 이 메서드를 구현해야 합니다.")
 
+    def ocr_images(self, images_pil_rgb, batch_size=None):
+        """
+        여러 이미지를 OCR하여 입력 순서대로 이미지별 결과 목록을 반환합니다 (각 결과 형식은 ocr_image와 동일).
+        기본 구현은 이미지별 ocr_image 호출이며, 엔진별 핸들러가 배치 추론으로 재정의합니다.
+        """
+        return [self.ocr_image(image_pil_rgb) for image_pil_rgb in images_pil_rgb]
+
+    def detect_text_regions(self, image_pil_rgb):
+        """인식 없이 검출 단계만 실행해 텍스트 영역이 있는지 반환합니다. 지원하지 않는 엔진은 None (판단 불가)."""
+        return None
+
+    @staticmethod
+    def _resolve_batch_size(batch_size=None):
+        return max(1, int(batch_size if batch_size is not None else config.OCR_BATCH_SIZE))
+
+    def get_engine_spec(self):
+        """다른 프로세스(OCR 워커)에서 동일한 엔진을 다시 만들 수 있도록 초기화 인자를 반환합니다."""
+        return {
+            'engine': self.engine_name,
+            'lang_codes': self.current_lang_codes,
+            'use_gpu': self.use_gpu,
+            'debug_enabled': self.debug_mode,
+        }
+
+    def get_cache_fingerprint(self):
+        """
+        OCR 결과 캐시 키에 쓰는 엔진 지문. 결과에 영향을 주는 엔진 종류/버전, 언어 코드, 전처리 설정만 포함합니다
+        (GPU 사용 여부, 디버그 모드는 결과와 무관하므로 제외).
+        """
+        lang_codes = self.current_lang_codes if isinstance(self.current_lang_codes, str) else ",".join(self.current_lang_codes)
+        return f"{self.engine_name}|{self._get_engine_version()}|{lang_codes}|{self._get_preprocess_signature()}|v{config.OCR_PREPROCESS_VERSION}"
+
+    def _get_engine_version(self):
+        try:
+            return importlib.metadata.version(self.engine_name)
+        except Exception:
+            return "unknown"
+
+    def _get_preprocess_signature(self):
+        return "rgb"
+
     def has_text_in_image_bytes(self, image_bytes):
         if not self.ocr_engine: return False
         img_pil = None
         try:
             img_pil = Image.open(io.BytesIO(image_bytes))
             if img_pil.width < 5 or img_pil.height < 5: return False
+            if config.OCR_PREFILTER_ENABLED and not likely_contains_text(image_bytes, self)[0]: return False
             img_pil_rgb = img_pil.convert("RGB")
             if img_pil_rgb.width < 1 or img_pil_rgb.height < 1: return False
             
@@ -120,173 +237,53 @@ class BaseOcrHandler:
                 except Exception: pass
     
     def _get_font(self, font_size, lang_code='en', is_bold=False):
-        # font_size가 0보다 작은 경우를 방지
-        font_size = max(1, int(font_size))
-        # ... (기존 _get_font 내용) ...
-        font_filename = None
-        font_path = None
-
-        language_font_map = config.OCR_LANGUAGE_FONT_MAP
-        default_font_filename = config.OCR_DEFAULT_FONT_FILENAME
-        default_bold_font_filename = config.OCR_DEFAULT_BOLD_FONT_FILENAME
-
-        if is_bold:
-            bold_font_key = lang_code + '_bold'
-            font_filename = language_font_map.get(bold_font_key)
-            if not font_filename:
-                font_filename = default_bold_font_filename
-        
-        if not font_filename:
-            font_filename = language_font_map.get(lang_code, default_font_filename)
-        
-        if not font_filename:
-            font_filename = default_font_filename if not is_bold else default_bold_font_filename
-            # logger.warning(f"요청된 폰트 코드 '{lang_code}'(bold:{is_bold})에 대한 폰트 매핑 없음. 기본 폰트 '{font_filename}' 사용.")
-
-        if font_filename:
-            font_path = os.path.join(FONT_DIR, font_filename) 
-
-        if font_path and os.path.exists(font_path):
-            try:
-                return ImageFont.truetype(font_path, int(font_size))
-            except IOError as e:
-                logger.warning(f"트루타입 폰트 로드 실패 ('{font_path}', size:{font_size}): {e}. Pillow 기본 폰트로 대체.")
-            except Exception as e_font:
-                logger.error(f"폰트 로드 중 예기치 않은 오류 ('{font_path}', size:{font_size}): {e_font}. Pillow 기본 폰트로 대체.", exc_info=True)
-        else:
-            # logger.warning(f"폰트 파일 없음: '{font_path or font_filename}' (요청 코드: {lang_code}, bold: {is_bold}). Pillow 기본 폰트 사용.")
-            pass # 로깅 너무 많을 수 있어 주석 처리
-        
-        try:
-            # Pillow 10.0.0 부터 load_default() 에 size 인자 없음
-            if PILLOW_VERSION_TUPLE >= (10, 0, 0):
-                 return ImageFont.load_default()
-            elif PILLOW_VERSION_TUPLE >= (9, 0, 0): # Pillow 9.x.x 버전과의 호환성
-                 return ImageFont.load_default(size=int(font_size)) # size 인자 있는 경우
-            else: # 그 이전 버전
-                 return ImageFont.load_default() # size 인자 없는 경우
-        except TypeError: # load_default에 size 인자가 없거나 있는 경우의 TypeError 처리
-            try:
-                return ImageFont.load_default() # 인자 없이 다시 시도
-            except Exception as e_default_font_fallback:
-                logger.critical(f"Pillow 기본 폰트 로드조차 실패 (size={font_size}): {e_default_font_fallback}. 글꼴 렌더링 불가.", exc_info=True)
-                raise RuntimeError(f"기본 폰트 로드 실패: {e_default_font_fallback}")
-
-        except Exception as e_default_font:
-            logger.critical(f"Pillow 기본 폰트 로드 실패 (size={font_size}): {e_default_font}. 글꼴 렌더링 불가.", exc_info=True)
-            raise RuntimeError(f"기본 폰트 로드 실패: {e_default_font}")
-
-    def _calculate_text_dimensions(self, draw: ImageDraw.ImageDraw, text: str, font_size: int,
-                                   render_area_width: int, lang_code: str, is_bold: bool, line_spacing: int) -> tuple[int, int, List[str]]:
-        """주어진 폰트 크기로 텍스트를 래핑하고 렌더링될 크기를 계산합니다."""
-        if font_size < 1: font_size = 1 # 폰트 크기는 최소 1
-        current_font = self._get_font(font_size, lang_code=lang_code, is_bold=is_bold)
-        
-        estimated_chars_per_line = 1
-        if render_area_width > 0:
-            try:
-                # Pillow 9.2.0 이상에서 textlength 사용 가능
-                if PILLOW_VERSION_TUPLE >= (9, 2, 0) and hasattr(draw, 'textlength'):
-                    char_w_metric = draw.textlength("W", font=current_font) 
-                    if char_w_metric <= 0: char_w_metric = draw.textlength("가", font=current_font) # 한글 등 다른 문자 시도
-                    if char_w_metric <= 0: char_w_metric = font_size * 0.6 # 최후의 수단
-                else: # 구버전 Pillow 또는 textlength 지원 안될 시
-                    if hasattr(current_font, 'getlength'): # getsize 대신 getlength 사용 (Pillow 8.0.0+)
-                        char_w_metric = current_font.getlength("W")
-                        if char_w_metric <= 0: char_w_metric = current_font.getlength("가")
-                    elif hasattr(current_font, 'getsize'): # 구버전 호환
-                         char_w_metric, _ = current_font.getsize("W")
-                         if char_w_metric <= 0 : char_w_metric, _ = current_font.getsize("가")
-                    else: # getmask().getbbox()는 비효율적이라 최후의 수단
-                        char_w_metric = font_size * 0.6 # 근사치
-                
-                if char_w_metric > 0:
-                    estimated_chars_per_line = max(1, int(render_area_width / char_w_metric))
-                else: # char_w_metric 이 0 이하일 경우 (폰트 문제 등)
-                    estimated_chars_per_line = max(1, int(render_area_width / (font_size * 0.5 + 1)))
-
-
-            except Exception: # 모든 예외 처리
-                estimated_chars_per_line = max(1, int(render_area_width / (font_size * 0.6))) # 보수적인 추정
-
-        wrapper = textwrap.TextWrapper(width=estimated_chars_per_line, break_long_words=True,
-                                       replace_whitespace=False, drop_whitespace=False,
-                                       break_on_hyphens=True)
-        wrapped_lines = wrapper.wrap(text)
-        if not wrapped_lines: wrapped_lines = [" "] # 빈 텍스트도 한 줄로 처리
-
-        rendered_text_height = 0
-        rendered_text_width = 0
-
-        if PILLOW_VERSION_TUPLE >= (9, 2, 0) and hasattr(draw, 'multiline_textbbox'):
-            try:
-                # (0,0) 기준으로 bbox 계산
-                # anchor='lt' (left-top)은 Pillow 9.3.0부터 지원. 이전 버전에서는 사용 불가.
-                # Pillow 버전에 따라 anchor 인자 사용 여부 결정 필요
-                if PILLOW_VERSION_TUPLE >= (9, 3, 0):
-                    text_bbox = draw.multiline_textbbox((0,0), "\n".join(wrapped_lines), font=current_font, spacing=line_spacing, anchor="lt")
-                else: # anchor 미지원 버전
-                    text_bbox = draw.multiline_textbbox((0,0), "\n".join(wrapped_lines), font=current_font, spacing=line_spacing)
-                
-                rendered_text_width = text_bbox[2] - text_bbox[0]
-                rendered_text_height = text_bbox[3] - text_bbox[1]
-            except Exception: # 오류 발생 시 수동 계산으로 fallback
-                max_w_line = 0
-                for line_idx_calc, line_calc in enumerate(wrapped_lines):
-                    if hasattr(draw, 'textbbox'): # Pillow 8.0.0+
-                        if PILLOW_VERSION_TUPLE >= (9, 3, 0):
-                            line_bbox_calc = draw.textbbox((0,0), line_calc, font=current_font, anchor="lt")
-                        else:
-                            line_bbox_calc = draw.textbbox((0,0), line_calc, font=current_font)
-                        line_w = line_bbox_calc[2] - line_bbox_calc[0]
-                        line_h = line_bbox_calc[3] - line_bbox_calc[1]
-                    elif hasattr(current_font, 'getsize'): # 구버전
-                        line_w, line_h = current_font.getsize(line_calc)
-                    else: # 최후의 수단
-                        line_w = len(line_calc) * font_size * 0.6
-                        line_h = font_size
-
-                    rendered_text_height += line_h
-                    if line_w > max_w_line: max_w_line = line_w
-                    if line_idx_calc < len(wrapped_lines) - 1:
-                        rendered_text_height += line_spacing
-                rendered_text_width = max_w_line
-        else: # multiline_textbbox 미지원 시 수동 계산
-            max_w_line = 0
-            for line_idx_calc, line_calc in enumerate(wrapped_lines):
-                if hasattr(current_font, 'getsize'):
-                    line_w, line_h = current_font.getsize(line_calc)
-                else:
-                    try:
-                        # getmask().getbbox() 는 Pillow 10 에서 제거됨. getbbox() 사용.
-                        if hasattr(current_font, 'getbbox'):
-                            # getbbox는 (left, top, right, bottom) 튜플 반환. 텍스트 자체의 바운딩 박스.
-                            bbox = current_font.getbbox(line_calc) 
-                            line_w = bbox[2] - bbox[0]
-                            line_h = bbox[3] - bbox[1]
-                        else: # 정말 최후의 수단
-                            line_w = len(line_calc) * font_size * 0.6
-                            line_h = font_size
-                    except Exception:
-                        line_w = len(line_calc) * font_size * 0.6
-                        line_h = font_size
-                
-                rendered_text_height += line_h
-                if line_w > max_w_line: max_w_line = line_w
-                if line_idx_calc < len(wrapped_lines) - 1:
-                    rendered_text_height += line_spacing
-            rendered_text_width = max_w_line
-            
-        return int(rendered_text_width), int(rendered_text_height), wrapped_lines
-
+        # 폰트 파일 로드/크기별 폰트 생성은 FontManager가 캐시 (binary search 중 반복 호출되어도 파일을 다시 열지 않음)
+        return self.font_manager.get_font(font_size, lang_code=lang_code, is_bold=is_bold)
 
     def render_translated_text_on_image(self, image_pil_original, box, translated_text,
                                         font_code_for_render='en', original_text="", ocr_angle=None):
-        img_to_draw_on = image_pil_original.copy()
+        """단일 박스 렌더링. 한 이미지에 여러 박스를 그릴 때는 render_translated_texts_on_image로 한 번에 처리하세요."""
+        rendered_img, _ = self.render_translated_texts_on_image(
+            image_pil_original, [(box, translated_text, ocr_angle)], font_code_for_render=font_code_for_render
+        )
+        return rendered_img
+
+    def render_translated_texts_on_image(self, image_pil, render_items, font_code_for_render='en', in_place=False):
+        """
+        디코딩된 이미지 하나에 여러 OCR 박스의 번역 텍스트를 한 번에 렌더링합니다.
+        render_items: [(box, translated_text, ocr_angle), ...]
+        배경색은 그리기 전에 원본 영역에서 모두 추정하고, 작업 버퍼 하나(in_place=False면 복사본 1개)에 모든 박스를 그립니다.
+        반환: (렌더링된 이미지, 실제로 그려진 박스 수)
+        """
+        prepared_items = []
+        for box, translated_text, ocr_angle in render_items:
+            box_layout = self._prepare_render_box(image_pil, box, translated_text)
+            if box_layout is not None:
+                prepared_items.append((box_layout, translated_text, ocr_angle))
+        if not prepared_items:
+            return image_pil, 0
+
+        # 모든 박스의 배경색/글자색을 그리기 전 원본에서 한 번에 추정
+        try:
+            bg_colors = estimate_background_colors(image_pil, [box_layout['render_box'] for box_layout, _, _ in prepared_items])
+            text_colors = get_contrasting_text_colors(bg_colors)
+            for (box_layout, _, _), bg_color, text_color in zip(prepared_items, bg_colors, text_colors):
+                box_layout['bg_color'] = bg_color
+                box_layout['text_color'] = text_color
+        except Exception as e_bg:
+            logger.warning(f"배경색 일괄 추정 실패 ({e_bg}), 기본 회색 사용.", exc_info=True)
+
+        img_to_draw_on = image_pil if in_place else image_pil.copy()
         draw = ImageDraw.Draw(img_to_draw_on)
-        
+        rendered_count = 0
+        for box_layout, translated_text, ocr_angle in prepared_items:
+            self._draw_text_in_box(draw, box_layout, translated_text, font_code_for_render, ocr_angle)
+            rendered_count += 1
+        return img_to_draw_on, rendered_count
+
+    def _prepare_render_box(self, image_pil, box, translated_text):
+        """OCR 박스를 이미지 경계에 맞춘 렌더 영역으로 변환합니다. 렌더링할 수 없으면 None. (배경색은 호출 측에서 일괄 추정)"""
         try:
-            # ... (기존 바운딩 박스 계산 로직은 유지) ...
             x_coords = [p[0] for p in box]
             y_coords = [p[1] for p in box]
             min_x, max_x = min(x_coords), max(x_coords)
@@ -294,9 +291,9 @@ class BaseOcrHandler:
 
             if max_x <= min_x or max_y <= min_y:
                 logger.warning(f"렌더링 스킵: 유효하지 않은 바운딩 박스 {box} for '{translated_text[:20]}...'")
-                return image_pil_original
+                return None
 
-            img_w, img_h = img_to_draw_on.size
+            img_w, img_h = image_pil.size
             render_box_x1 = max(0, int(min_x))
             render_box_y1 = max(0, int(min_y))
             render_box_x2 = min(img_w, int(max_x))
@@ -304,26 +301,30 @@ class BaseOcrHandler:
 
             if render_box_x2 <= render_box_x1 or render_box_y2 <= render_box_y1:
                 logger.warning(f"렌더링 스킵: 크기가 0인 렌더 박스 for '{translated_text[:20]}...'")
-                return image_pil_original
-            
-            bbox_width_orig = max_x - min_x
-            bbox_height_orig = max_y - min_y
-            bbox_width_render = render_box_x2 - render_box_x1
-            bbox_height_render = render_box_y2 - render_box_y1
-
+                return None
         except Exception as e_box_calc:
-            logger.error(f"렌더링 바운딩 박스 계산 오류: {e_box_calc}. Box: {box}. 원본 이미지 반환.", exc_info=True)
-            return image_pil_original
+            logger.error(f"렌더링 바운딩 박스 계산 오류: {e_box_calc}. Box: {box}. 박스 건너뜀.", exc_info=True)
+            return None
+
+        return {
+            'render_box': (render_box_x1, render_box_y1, render_box_x2, render_box_y2),
+            'bbox_width_orig': max_x - min_x,
+            'bbox_height_orig': max_y - min_y,
+            'bg_color': DEFAULT_BG_COLOR,
+            'text_color': get_contrasting_text_color(DEFAULT_BG_COLOR),
+        }
+
+    def _draw_text_in_box(self, draw: ImageDraw.ImageDraw, box_layout, translated_text, font_code_for_render, ocr_angle):
+        """준비된 렌더 영역을 배경색으로 덮고, 영역에 맞는 최대 글꼴 크기로 번역 텍스트를 그립니다."""
+        render_box_x1, render_box_y1, render_box_x2, render_box_y2 = box_layout['render_box']
+        bbox_width_orig = box_layout['bbox_width_orig']
+        bbox_height_orig = box_layout['bbox_height_orig']
+        bbox_width_render = render_box_x2 - render_box_x1
+        bbox_height_render = render_box_y2 - render_box_y1
+        estimated_bg_color = box_layout['bg_color']
+        text_color = box_layout['text_color']
 
-        try:
-            text_roi_pil = image_pil_original.crop((render_box_x1, render_box_y1, render_box_x2, render_box_y2))
-            estimated_bg_color = get_quantized_dominant_color(text_roi_pil) if text_roi_pil.width > 0 and text_roi_pil.height > 0 else (200,200,200)
-        except Exception as e_bg:
-            logger.warning(f"배경색 추정 실패 ({e_bg}), 기본 회색 사용.", exc_info=True)
-            estimated_bg_color = (200, 200, 200)
-        
         draw.rectangle([render_box_x1, render_box_y1, render_box_x2, render_box_y2], fill=estimated_bg_color)
-        text_color = get_contrasting_text_color(estimated_bg_color)
 
         padding_x = max(1, int(bbox_width_render * 0.03))
         padding_y = max(1, int(bbox_height_render * 0.03))
@@ -335,7 +336,7 @@ class BaseOcrHandler:
 
         if render_area_width <= 1 or render_area_height <= 1:
             # logger.warning(f"텍스트 '{translated_text[:20]}...' 렌더링 영역 너무 작음 (패딩 후). 스킵.")
-            return img_to_draw_on # 조용히 반환
+            return # 배경만 덮고 조용히 반환
 
         font_size_correction_factor = 1.0
         # ... (기존 font_size_correction_factor 계산 로직 유지) ...
@@ -352,71 +353,28 @@ class BaseOcrHandler:
                 # logger.debug(f"바운딩 박스 비율 ({aspect_ratio_orig:.2f}) 기반 기울기 의심. 글꼴 크기 보정 계수: {font_size_correction_factor:.2f}")
 
 
-        # 초기 목표 폰트 크기 (대략적인 추정)
-        initial_target_font_size = int(min(render_area_height * 0.9, 
-                                    render_area_width * 0.9 / (len(translated_text.splitlines()[0] if translated_text else "A")*0.5 +1) 
-                                   ) * font_size_correction_factor)
-        initial_target_font_size = max(initial_target_font_size, 1) # 최소 1
-        
-        min_font_size = 5 # 렌더링 가능한 최소 폰트 크기
-        if initial_target_font_size < min_font_size: initial_target_font_size = min_font_size
-        
-        is_bold_font = '_bold' in font_code_for_render or 'bold' in font_code_for_render.lower()
-        
-        best_fit_size = min_font_size
-        best_wrapped_lines: List[str] = []
-        best_text_width = 0
-        best_text_height = 0
-
-        # 이진 탐색으로 최적 폰트 크기 찾기
-        low = min_font_size
-        high = initial_target_font_size
-        
-        # 이진 탐색 중 사용할 line_spacing (초기값은 high 기준)
-        # 실제로는 탐색된 폰트 크기에 따라 동적으로 변해야 함
-        # _calculate_text_dimensions 함수 내부에서 font_size에 맞게 line_spacing 계산하도록 수정
-
-        # 반복 횟수 제한 (무한 루프 방지)
-        max_iterations = int(math.log2(high - low + 1)) + 5 if high > low else 5
-
-
-        current_iteration = 0
-        while low <= high and current_iteration < max_iterations:
-            current_iteration +=1
-            mid_font_size = low + (high - low) // 2
-            if mid_font_size < min_font_size : mid_font_size = min_font_size # 최소 크기 보장
-            if mid_font_size == 0 : break # 폰트 크기가 0이 되면 중단
+        # 최대 글꼴 크기는 영역 높이 기준 (폭은 아래 solver가 글자별 폭으로 줄바꿈하며 계산)
+        max_target_font_size = max(int(render_area_height * 0.9 * font_size_correction_factor), 1)
 
-            current_line_spacing = int(mid_font_size * 0.2) # 현재 폰트 크기에 맞는 줄 간격
-
-            w, h, wrapped = self._calculate_text_dimensions(draw, translated_text, mid_font_size, 
-                                                            render_area_width, font_code_for_render, 
-                                                            is_bold_font, current_line_spacing)
-            
-            if w <= render_area_width and h <= render_area_height:
-                # 현재 크기가 영역에 맞으면, 더 큰 크기를 시도해본다.
-                best_fit_size = mid_font_size
-                best_wrapped_lines = wrapped
-                best_text_width = w
-                best_text_height = h
-                low = mid_font_size + 1
-            else:
-                # 현재 크기가 영역에 맞지 않으면, 더 작은 크기를 시도한다.
-                high = mid_font_size - 1
-        
-        if not best_wrapped_lines: # 이진 탐색으로 적절한 크기를 찾지 못한 경우 (예: 텍스트가 너무 길어 min_font_size로도 안 맞는 경우)
-            # min_font_size로 다시 한 번 계산 시도
-            final_line_spacing = int(min_font_size * 0.2)
-            best_text_width, best_text_height, best_wrapped_lines = self._calculate_text_dimensions(
-                draw, translated_text, min_font_size, render_area_width, font_code_for_render, is_bold_font, final_line_spacing
-            )
-            best_fit_size = min_font_size
-            # logger.warning(f"텍스트 '{translated_text[:30]}...'가 영역에 맞지 않아 최소 글꼴 크기 {min_font_size}pt로 설정됨. 잘릴 수 있음.")
+        min_font_size = 5 # 렌더링 가능한 최소 폰트 크기
+        if max_target_font_size < min_font_size: max_target_font_size = min_font_size
 
+        is_bold_font = '_bold' in font_code_for_render or 'bold' in font_code_for_render.lower()
 
-        final_font_size = best_fit_size
+        # 글자 폭은 기준 크기에서 한 번만 측정(FontManager 메모이즈)하고, 크기 탐색은 비례 환산 + 해석적 높이 계산으로 수행.
+        # 줄바꿈은 스크립트별 (CJK 글자 단위, 태국어 단어/클러스터 단위, 그 외 단어 단위)
+        fit_result = fit_text_to_box(
+            translated_text, render_area_width, render_area_height,
+            font_loader=lambda size: self._get_font(size, lang_code=font_code_for_render, is_bold=is_bold_font),
+            advance_fn=self.font_manager.get_text_advance,
+            min_font_size=min_font_size, max_font_size=max_target_font_size, line_spacing_ratio=0.2
+        )
+        final_font_size = fit_result.font_size
+        best_wrapped_lines = fit_result.lines
+        best_text_width = fit_result.width
+        best_text_height = fit_result.height
         final_font = self._get_font(final_font_size, lang_code=font_code_for_render, is_bold=is_bold_font)
-        final_line_spacing_render = int(final_font_size * 0.2)
+        final_line_spacing_render = fit_result.line_spacing
         
         # 최종 텍스트 위치 계산 (가운데 정렬)
         text_x_start = render_area_x_start + (render_area_width - best_text_width) / 2
@@ -466,19 +424,24 @@ class BaseOcrHandler:
 
         except Exception as e_draw:
             logger.error(f"텍스트 렌더링 중 오류: {e_draw}", exc_info=True)
-        
-        return img_to_draw_on
+
 
 class PaddleOcrHandler(BaseOcrHandler):
-    def __init__(self, lang_code='korean', debug_enabled=False, use_gpu=False):
+    engine_name = "paddleocr"
+
+    def __init__(self, lang_code='korean', debug_enabled=False, use_gpu=False, perf_profile=None):
         self.use_angle_cls_paddle = False
-        super().__init__(lang_codes=lang_code, debug_enabled=debug_enabled, use_gpu=use_gpu)
+        super().__init__(lang_codes=lang_code, debug_enabled=debug_enabled, use_gpu=use_gpu, perf_profile=perf_profile)
 
     def _initialize_engine(self):
         try:
             from paddleocr import PaddleOCR
-            logger.info(f"PaddleOCR 초기화 시도 (lang: {self.current_lang_codes}, use_angle_cls: {self.use_angle_cls_paddle}, use_gpu: {self.use_gpu}, debug: {self.debug_mode})...")
-            self.ocr_engine = PaddleOCR(use_angle_cls=self.use_angle_cls_paddle, lang=self.current_lang_codes, use_gpu=self.use_gpu, show_log=self.debug_mode)
+            logger.info(f"PaddleOCR 초기화 시도 (lang: {self.current_lang_codes}, use_angle_cls: {self.use_angle_cls_paddle}, use_gpu: {self.use_gpu}, debug: {self.debug_mode}, 성능 설정: {self.perf_profile})...")
+            self.ocr_engine = PaddleOCR(use_angle_cls=self.use_angle_cls_paddle, lang=self.current_lang_codes, use_gpu=self.use_gpu, show_log=self.debug_mode,
+                                        cpu_threads=self.perf_profile['cpu_threads'],
+                                        enable_mkldnn=bool(self.perf_profile.get('enable_mkldnn')) and not self.use_gpu,
+                                        rec_batch_num=self._resolve_batch_size(self.perf_profile.get('rec_batch_size')),
+                                        det_limit_side_len=self.perf_profile.get('det_max_side', 960), det_limit_type='max')
             logger.info(f"PaddleOCR 초기화 완료 (lang: {self.current_lang_codes}).")
         except ImportError:
             logger.critical("PaddleOCR 라이브러리를 찾을 수 없습니다. 'pip install paddleocr paddlepaddle'로 설치해주세요.")
@@ -487,9 +450,12 @@ class PaddleOcrHandler(BaseOcrHandler):
             logger.error(f"PaddleOCR 초기화 중 오류 (lang: {self.current_lang_codes}): {e}", exc_info=True)
             raise RuntimeError(f"PaddleOCR 초기화 실패 (lang: {self.current_lang_codes}): {e}")
 
+    def _get_preprocess_signature(self):
+        return f"gray;angle_cls={self.use_angle_cls_paddle};det_max_side={self.perf_profile.get('det_max_side', 960)}"
+
     def _preprocess_image_for_ocr(self, image_pil_rgb):
-        image_cv = cv2.cvtColor(np.array(image_pil_rgb), cv2.COLOR_RGB2BGR)
-        gray_img = cv2.cvtColor(image_cv, cv2.COLOR_BGR2GRAY)
+        # RGB -> BGR -> GRAY 배열을 차례로 만들지 않고 Pillow에서 바로 흑백 배열 하나만 생성 (가중치는 cv2와 동일한 ITU-R 601)
+        gray_img = np.asarray(image_pil_rgb.convert('L'))
         if self.debug_mode and gray_img is not None and gray_img.size > 0:
             try:
                 # 디버그 이미지 저장 경로는 BASE_DIR_OCR (ocr_handler.py 위치) 기준으로 생성
@@ -505,42 +471,97 @@ class PaddleOcrHandler(BaseOcrHandler):
         try:
             preprocessed_cv_img = self._preprocess_image_for_ocr(image_pil_rgb)
             ocr_output = self.ocr_engine.ocr(preprocessed_cv_img, cls=self.use_angle_cls_paddle)
-            
-            final_parsed_results = []
-            if ocr_output and isinstance(ocr_output, list) and len(ocr_output) > 0:
-                results_list = ocr_output
-                if isinstance(ocr_output[0], list) and \
-                   (len(ocr_output[0]) == 0 or (len(ocr_output[0]) > 0 and isinstance(ocr_output[0][0], list))):
-                     results_list = ocr_output[0]
-
-                for item in results_list:
-                    if isinstance(item, list) and len(item) >= 2:
-                        box_data = item[0]
-                        text_conf_tuple = item[1]
-                        ocr_angle = None
-
-                        if isinstance(box_data, list) and len(box_data) == 4 and \
-                           all(isinstance(point, list) and len(point) == 2 for point in box_data) and \
-                           isinstance(text_conf_tuple, tuple) and len(text_conf_tuple) == 2:
-                            box_points_int = [[int(coord[0]), int(coord[1])] for coord in box_data]
-                            final_parsed_results.append([box_points_int, text_conf_tuple, ocr_angle])
-                        else:
-                            logger.warning(f"PaddleOCR 결과 항목 형식이 다릅니다 (내부): {item}")
-                    else:
-                        logger.warning(f"PaddleOCR 결과 항목이 리스트가 아니거나 길이가 2 미만입니다 (외부): {item}")
-            return final_parsed_results
+            return self._parse_ocr_output(ocr_output)
         except Exception as e:
             logger.error(f"PaddleOCR ocr_image 중 오류: {e}", exc_info=True)
             return []
 
+    def _parse_ocr_output(self, ocr_output):
+        final_parsed_results = []
+        if ocr_output and isinstance(ocr_output, list) and len(ocr_output) > 0:
+            results_list = ocr_output
+            if isinstance(ocr_output[0], list) and \
+               (len(ocr_output[0]) == 0 or (len(ocr_output[0]) > 0 and isinstance(ocr_output[0][0], list))):
+                 results_list = ocr_output[0]
+
+            for item in results_list:
+                if isinstance(item, list) and len(item) >= 2:
+                    box_data = item[0]
+                    text_conf_tuple = item[1]
+                    ocr_angle = None
+
+                    if isinstance(box_data, list) and len(box_data) == 4 and \
+                       all(isinstance(point, list) and len(point) == 2 for point in box_data) and \
+                       isinstance(text_conf_tuple, tuple) and len(text_conf_tuple) == 2:
+                        box_points_int = [[int(coord[0]), int(coord[1])] for coord in box_data]
+                        final_parsed_results.append([box_points_int, text_conf_tuple, ocr_angle])
+                    else:
+                        logger.warning(f"PaddleOCR 결과 항목 형식이 다릅니다 (내부): {item}")
+                else:
+                    logger.warning(f"PaddleOCR 결과 항목이 리스트가 아니거나 길이가 2 미만입니다 (외부): {item}")
+        return final_parsed_results
+
+    def ocr_images(self, images_pil_rgb, batch_size=None):
+        """
+        검출은 이미지별로 수행하고(PaddleOCR 검출 모델은 이미지 단위), 모든 이미지의 텍스트 조각을 모아
+        인식 단계를 rec_batch_num 단위 배치로 한 번에 추론합니다. 배치 경로가 실패하면 이미지별 호출로 대체합니다.
+        """
+        if not self.ocr_engine: return [[] for _ in images_pil_rgb]
+        if len(images_pil_rgb) <= 1 or self._resolve_batch_size(batch_size) <= 1:
+            return super().ocr_images(images_pil_rgb, batch_size)
+        try:
+            return self._ocr_images_batched(images_pil_rgb)
+        except Exception as e_batch:
+            logger.warning(f"PaddleOCR 배치 OCR 실패, 이미지별 처리로 대체합니다: {e_batch}", exc_info=self.debug_mode)
+            return super().ocr_images(images_pil_rgb, batch_size)
+
+    def detect_text_regions(self, image_pil_rgb):
+        if not self.ocr_engine: return None
+        bgr_img = cv2.cvtColor(self._preprocess_image_for_ocr(image_pil_rgb), cv2.COLOR_GRAY2BGR)
+        det_output = self.ocr_engine.ocr(bgr_img, det=True, rec=False, cls=False)
+        return bool(det_output and det_output[0])
+
+    def _ocr_images_batched(self, images_pil_rgb):
+        text_crops = []
+        crop_owners = [] # (이미지 인덱스, 박스 좌표)
+        for image_idx, image_pil_rgb in enumerate(images_pil_rgb):
+            # ocr()는 흑백 입력을 BGR로 바꾼 뒤 잘라내므로 같은 형태로 맞춤
+            bgr_img = cv2.cvtColor(self._preprocess_image_for_ocr(image_pil_rgb), cv2.COLOR_GRAY2BGR)
+            det_output = self.ocr_engine.ocr(bgr_img, det=True, rec=False, cls=False)
+            det_boxes = det_output[0] if det_output and isinstance(det_output[0], list) else []
+            for box_data in sorted(det_boxes or [], key=lambda b: (b[0][1], b[0][0])):
+                text_crops.append(_crop_text_region(bgr_img, box_data))
+                crop_owners.append((image_idx, box_data))
+
+        results_per_image = [[] for _ in images_pil_rgb]
+        if not text_crops:
+            return results_per_image
+        rec_output = self.ocr_engine.ocr(text_crops, det=False, rec=True, cls=self.use_angle_cls_paddle)
+        rec_results = rec_output[0] if rec_output else []
+        if len(rec_results) != len(text_crops):
+            raise ValueError(f"인식 결과 수 불일치 (조각 {len(text_crops)}개, 결과 {len(rec_results)}개)")
+
+        drop_score = getattr(self.ocr_engine, 'drop_score', 0.5)
+        for (image_idx, box_data), rec_item in zip(crop_owners, rec_results):
+            text, confidence = rec_item[0], float(rec_item[1])
+            if confidence < drop_score: continue
+            box_points_int = [[int(coord[0]), int(coord[1])] for coord in box_data]
+            results_per_image[image_idx].append([box_points_int, (text, confidence), None])
+        return results_per_image
+
 class EasyOcrHandler(BaseOcrHandler):
-    def __init__(self, lang_codes_list=['en'], debug_enabled=False, use_gpu=False):
-        super().__init__(lang_codes=lang_codes_list, debug_enabled=debug_enabled, use_gpu=use_gpu)
+    engine_name = "easyocr"
+
+    def __init__(self, lang_codes_list=['en'], debug_enabled=False, use_gpu=False, perf_profile=None):
+        super().__init__(lang_codes=lang_codes_list, debug_enabled=debug_enabled, use_gpu=use_gpu, perf_profile=perf_profile)
 
     def _initialize_engine(self):
         try:
             import easyocr
-            logger.info(f"EasyOCR 초기화 시도 (langs: {self.current_lang_codes}, gpu: {self.use_gpu}, verbose: {self.debug_mode})...")
+            logger.info(f"EasyOCR 초기화 시도 (langs: {self.current_lang_codes}, gpu: {self.use_gpu}, verbose: {self.debug_mode}, 성능 설정: {self.perf_profile})...")
+            if not self.use_gpu:
+                import torch
+                torch.set_num_threads(self.perf_profile['cpu_threads']) # 프로세스 전체 설정 (워커 프로세스마다 따로 적용됨)
             self.ocr_engine = easyocr.Reader(self.current_lang_codes, gpu=self.use_gpu, verbose=self.debug_mode)
             logger.info(f"EasyOCR 초기화 완료 (langs: {self.current_lang_codes}).")
         except ImportError:
@@ -554,28 +575,117 @@ class EasyOcrHandler(BaseOcrHandler):
         if not self.ocr_engine: return []
         try:
             image_np = np.array(image_pil_rgb.convert('RGB'))
-            ocr_output = self.ocr_engine.readtext(image_np, detail=1, paragraph=False) 
-            
-            formatted_results = []
-            for item_tuple in ocr_output:
-                if not (isinstance(item_tuple, (list, tuple)) and len(item_tuple) >= 2):
-                    logger.warning(f"EasyOCR 결과 항목 형식이 이상합니다: {item_tuple}")
-                    continue
-
-                bbox, text = item_tuple[0], item_tuple[1]
-                confidence = item_tuple[2] if len(item_tuple) > 2 else 0.9
-                ocr_angle = None
-
-                if isinstance(bbox, list) and len(bbox) == 4 and \
-                   all(isinstance(p, (list, np.ndarray)) and len(p) == 2 for p in bbox):
-                    box_points = [[int(coord[0]), int(coord[1])] for coord in bbox]
-                    formatted_results.append([box_points, (text, float(confidence)), ocr_angle])
-                elif isinstance(bbox, np.ndarray) and bbox.shape == (4,2):
-                    box_points = bbox.astype(int).tolist()
-                    formatted_results.append([box_points, (text, float(confidence)), ocr_angle])
-                else:
-                     logger.warning(f"EasyOCR 결과의 bbox 형식이 예상과 다릅니다: {bbox}")
-            return formatted_results
+            ocr_output = self.ocr_engine.readtext(image_np, detail=1, paragraph=False,
+                                                  batch_size=self._resolve_batch_size(self.perf_profile.get('rec_batch_size')),
+                                                  canvas_size=self.perf_profile.get('det_max_side', 2560))
+            return self._format_ocr_output(ocr_output)
         except Exception as e:
             logger.error(f"EasyOCR ocr_image 중 오류: {e}", exc_info=True)
-            return []
\ No newline at end of file
+            return []
+
+    def _get_preprocess_signature(self):
+        return f"rgb;det_max_side={self.perf_profile.get('det_max_side', 2560)}"
+
+    def _format_ocr_output(self, ocr_output):
+        formatted_results = []
+        for item_tuple in ocr_output:
+            if not (isinstance(item_tuple, (list, tuple)) and len(item_tuple) >= 2):
+                logger.warning(f"EasyOCR 결과 항목 형식이 이상합니다: {item_tuple}")
+                continue
+
+            bbox, text = item_tuple[0], item_tuple[1]
+            confidence = item_tuple[2] if len(item_tuple) > 2 else 0.9
+            ocr_angle = None
+
+            if isinstance(bbox, list) and len(bbox) == 4 and \
+               all(isinstance(p, (list, np.ndarray)) and len(p) == 2 for p in bbox):
+                box_points = [[int(coord[0]), int(coord[1])] for coord in bbox]
+                formatted_results.append([box_points, (text, float(confidence)), ocr_angle])
+            elif isinstance(bbox, np.ndarray) and bbox.shape == (4,2):
+                box_points = bbox.astype(int).tolist()
+                formatted_results.append([box_points, (text, float(confidence)), ocr_angle])
+            else:
+                 logger.warning(f"EasyOCR 결과의 bbox 형식이 예상과 다릅니다: {bbox}")
+        return formatted_results
+
+    def detect_text_regions(self, image_pil_rgb):
+        if not self.ocr_engine: return None
+        horizontal_list, free_list = self.ocr_engine.detect(np.array(image_pil_rgb.convert('RGB')),
+                                                            canvas_size=self.perf_profile.get('det_max_side', 2560))
+        return bool((horizontal_list and horizontal_list[0]) or (free_list and free_list[0]))
+
+    def ocr_images(self, images_pil_rgb, batch_size=None):
+        """
+        크기가 비슷한 이미지(가로/세로를 EASYOCR_BATCH_BUCKET_PX 단위로 올림한 크기가 같은 이미지)끼리 묶고,
+        묶음에서 가장 큰 크기에 맞춰 오른쪽/아래쪽 여백을 배경색으로 채운 뒤 readtext_batched로 검출/인식을 배치 추론합니다.
+        리사이즈하지 않으므로 박스는 원본 좌표 그대로이며, 여백으로 넘어간 부분은 원본 크기로 잘라냅니다.
+        혼자인 이미지나 배치 호출이 실패한 묶음은 이미지별 ocr_image로 대체합니다.
+        """
+        if not self.ocr_engine: return [[] for _ in images_pil_rgb]
+        batch_size = self._resolve_batch_size(batch_size)
+        results_per_image = [None] * len(images_pil_rgb)
+        image_arrays = [np.array(image_pil_rgb.convert('RGB')) for image_pil_rgb in images_pil_rgb]
+
+        bucket_px = max(1, int(config.EASYOCR_BATCH_BUCKET_PX))
+        indices_by_bucket = {}
+        for image_idx, image_np in enumerate(image_arrays):
+            height, width = image_np.shape[:2]
+            indices_by_bucket.setdefault((-(-height // bucket_px), -(-width // bucket_px)), []).append(image_idx)
+
+        for bucket_indices in indices_by_bucket.values():
+            for chunk_start in range(0, len(bucket_indices), batch_size):
+                chunk_indices = bucket_indices[chunk_start:chunk_start + batch_size]
+                if len(chunk_indices) > 1:
+                    try:
+                        target_height = max(image_arrays[i].shape[0] for i in chunk_indices)
+                        target_width = max(image_arrays[i].shape[1] for i in chunk_indices)
+                        padded_arrays = [self._pad_to_size(image_arrays[i], target_height, target_width) for i in chunk_indices]
+                        batch_output = self.ocr_engine.readtext_batched(padded_arrays, detail=1, paragraph=False,
+                                                                        batch_size=self._resolve_batch_size(self.perf_profile.get('rec_batch_size')),
+                                                                        canvas_size=self.perf_profile.get('det_max_side', 2560))
+                        if len(batch_output) != len(chunk_indices):
+                            raise ValueError(f"배치 결과 수 불일치 (이미지 {len(chunk_indices)}개, 결과 {len(batch_output)}개)")
+                        for image_idx, ocr_output in zip(chunk_indices, batch_output):
+                            height, width = image_arrays[image_idx].shape[:2]
+                            results_per_image[image_idx] = self._clip_to_image(self._format_ocr_output(ocr_output), width, height)
+                        continue
+                    except Exception as e_batch:
+                        logger.warning(f"EasyOCR 배치 OCR 실패, 이미지별 처리로 대체합니다: {e_batch}", exc_info=self.debug_mode)
+                for image_idx in chunk_indices:
+                    results_per_image[image_idx] = self.ocr_image(images_pil_rgb[image_idx])
+        return results_per_image
+
+    @staticmethod
+    def _pad_to_size(image_np, target_height, target_width):
+        """오른쪽/아래쪽 여백을 가장자리 픽셀의 중앙값(대개 배경색)으로 채워 크기를 맞춥니다 (새 경계선이 글자로 검출되지 않게)."""
+        height, width = image_np.shape[:2]
+        if (height, width) == (target_height, target_width): return image_np
+        border_pixels = np.concatenate([image_np[-1, :, :], image_np[:, -1, :]])
+        padded = np.empty((target_height, target_width, image_np.shape[2]), dtype=image_np.dtype)
+        padded[:] = np.median(border_pixels, axis=0).astype(image_np.dtype)
+        padded[:height, :width] = image_np
+        return padded
+
+    @staticmethod
+    def _clip_to_image(formatted_results, width, height):
+        """여백 영역에만 있는 박스는 버리고, 여백으로 넘어간 좌표는 원본 이미지 안으로 자릅니다."""
+        clipped_results = []
+        for box_points, text_info, ocr_angle in formatted_results:
+            if min(x for x, _ in box_points) >= width or min(y for _, y in box_points) >= height: continue
+            clipped_box = [[min(max(x, 0), width - 1), min(max(y, 0), height - 1)] for x, y in box_points]
+            clipped_results.append([clipped_box, text_info, ocr_angle])
+        return clipped_results
+
+
+def create_ocr_handler(engine_spec):
+    """get_engine_spec()이 반환한 사양으로 OCR 핸들러를 생성합니다."""
+    engine = engine_spec.get('engine')
+    debug_enabled = engine_spec.get('debug_enabled', False)
+    use_gpu = engine_spec.get('use_gpu', False)
+    perf_profile = engine_spec.get('perf_profile')
+    if engine == PaddleOcrHandler.engine_name:
+        return PaddleOcrHandler(lang_code=engine_spec['lang_codes'], debug_enabled=debug_enabled, use_gpu=use_gpu, perf_profile=perf_profile)
+    if engine == EasyOcrHandler.engine_name:
+        return EasyOcrHandler(lang_codes_list=list(engine_spec['lang_codes']), debug_enabled=debug_enabled, use_gpu=use_gpu,
+                              perf_profile=perf_profile)
+    raise ValueError(f"지원하지 않는 OCR 엔진: {engine}")
@@ -0,0 +1,362 @@
+# ocr_pool.py
+import collections
+import itertools
+import logging
+import multiprocessing
+from multiprocessing.connection import wait as mp_wait
+import queue
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+# 설정 파일 import
+import config
+
+logger = logging.getLogger(__name__)
+
+# 워커가 연속으로 비정상 종료될 때 무한 재시작을 막기 위한 상한
+MAX_WORKER_RESPAWNS = 10
+DISPATCH_POLL_INTERVAL = 0.05 # seconds
+
+OcrPoolResult = Tuple[Hashable, Optional[List[Any]], Optional[str]] # (key, ocr_results, error)
+_TaggedResult = Tuple[int, Hashable, Optional[List[Any]], Optional[str]] # (run_id, key, ocr_results, error)
+
+
+def _ocr_worker_main(engine_spec: Dict[str, Any], conn) -> None:
+    """OCR 워커 프로세스 진입점. 엔진을 한 번만 초기화한 뒤 이미지 바이트를 받아 반복 처리합니다."""
+    try:
+        from ocr_handler import create_ocr_handler
+        from ocr_resolution import ocr_images_at_scale, open_for_ocr
+        handler = create_ocr_handler(engine_spec)
+    except Exception as e_init:
+        try: conn.send(('init_error', None, repr(e_init)))
+        except Exception: pass
+        return
+    conn.send(('ready', None, None))
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None: # 종료 신호
+            break
+        task_id, image_bytes, ocr_scale, ocr_region = task
+        try:
+            img_pil, decode_factor = open_for_ocr(image_bytes, ocr_scale)
+            with img_pil:
+                results = ocr_images_at_scale(handler, [img_pil], [ocr_scale], [ocr_region], [decode_factor])[0]
+            conn.send(('result', task_id, results))
+        except Exception as e_task:
+            conn.send(('error', task_id, repr(e_task)))
+
+
+class _WorkerSlot:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.ready = False
+        self.current: Optional[Tuple[int, Hashable, int]] = None # (task_id, key, run_id)
+
+
+class OcrProcessPool:
+    """
+    OCR 엔진을 미리 초기화해 둔 워커 프로세스 풀.
+    각 워커는 자신의 OCR 핸들러를 한 번만 생성하고, 이미지 바이트를 받아 ocr_image 결과를 돌려줍니다.
+    워커마다 한 번에 하나의 작업만 할당하므로 워커가 죽더라도 해당 이미지만 실패 처리됩니다.
+    풀은 번역 실행 사이에 재사용되므로 작업과 결과에 실행 ID(begin_run)를 붙이고, 현재 실행이 아닌 결과는 버립니다.
+    """
+
+    def __init__(self, engine_spec: Dict[str, Any], max_workers: Optional[int] = None):
+        self.engine_spec = dict(engine_spec)
+        requested_workers = max_workers if max_workers is not None else config.MAX_OCR_WORKERS
+        if self.engine_spec.get('use_gpu'):
+            requested_workers = 1 # GPU 사용 시 모델을 여러 번 올리지 않도록 워커 1개로 제한
+        self.max_workers = max(1, int(requested_workers))
+        # 워커들이 코어를 나눠 쓰도록 워커 수에 맞춘 성능 프로필(스레드 수 등)을 워커 엔진 사양에 추가 (matches 비교에는 사용 안 함)
+        self._worker_engine_spec = dict(self.engine_spec)
+        if 'perf_profile' not in self._worker_engine_spec:
+            from ocr_tuning import resolve_perf_profile
+            self._worker_engine_spec['perf_profile'] = resolve_perf_profile(self.engine_spec.get('engine'), concurrent_engines=self.max_workers)
+        self.broken = False # 워커 엔진 초기화 실패 시 True (호출 측에서 프로세스 내 OCR로 대체)
+        self._active_worker_limit: Optional[int] = None # 동시에 작업을 받을 워커 수 상한 (CpuResourceManager가 조절, None이면 전체)
+        self._paused = False # True면 새 작업을 워커에 보내지 않음 (MemoryGovernor가 메모리 압박 시 조절)
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._pending: collections.deque = collections.deque() # (task_id, key, image_bytes, (ocr_scale, ocr_region), run_id)
+        self._results: "queue.Queue[_TaggedResult]" = queue.Queue()
+        self._run_id = 0 # 현재 실행 ID (begin_run/cancel마다 증가)
+        self._workers: List[_WorkerSlot] = []
+        self._retiring: List[_WorkerSlot] = [] # shrink_idle_workers로 뺀 워커. 연결은 디스패처만 닫음 (mp_wait 중 닫히지 않도록)
+        self._dispatcher: Optional[threading.Thread] = None
+        self._closed = False
+        self._respawn_count = 0
+        self._task_ids = itertools.count()
+        logger.info(f"OCR 워커 풀 생성 (엔진: {self.engine_spec.get('engine')}, 언어: {self.engine_spec.get('lang_codes')}, 워커 수: {self.max_workers})")
+
+    def matches(self, engine_spec: Dict[str, Any]) -> bool:
+        return not self._closed and not self.broken and self.engine_spec == dict(engine_spec)
+
+    def begin_run(self) -> int:
+        """새 실행을 시작합니다. 이전 실행에서 남은 대기 작업과 결과를 버리고 새 실행 ID를 반환합니다."""
+        self.cancel()
+        with self._lock:
+            return self._run_id
+
+    def cancel(self) -> None:
+        """
+        현재 실행을 취소합니다 (번역 중단 시 호출). 대기 중인 작업과 아직 가져가지 않은 결과를 버리고,
+        워커에서 처리 중인 작업의 결과는 도착하면 버려집니다.
+        """
+        with self._lock:
+            self._run_id += 1
+            self._pending.clear()
+        while True:
+            try:
+                self._results.get_nowait()
+            except queue.Empty:
+                break
+
+    def submit(self, key: Hashable, image_bytes: bytes, ocr_scale: float = 1.0,
+               ocr_region: Optional[Tuple[int, int, int, int]] = None, run_id: Optional[int] = None) -> None:
+        """
+        이미지 바이트 OCR 작업을 제출합니다. 결과는 get_result()/iter_results()로 완료 순서대로 받습니다.
+        ocr_region이 있으면 그 영역만, ocr_scale < 1이면 축소한 이미지로 OCR하며 박스는 원본 이미지 좌표로 돌려줍니다.
+        run_id(begin_run 반환값)가 현재 실행이 아니면(이미 취소된 실행) 제출하지 않습니다. None이면 현재 실행.
+        """
+        with self._lock:
+            if run_id is None: run_id = self._run_id
+            if run_id != self._run_id: return
+            if self._closed or self.broken:
+                self._results.put((run_id, key, None, "OCR 워커 풀을 사용할 수 없음"))
+                return
+            self._pending.append((next(self._task_ids), key, image_bytes, (ocr_scale, ocr_region), run_id))
+            self._ensure_started_locked()
+
+    def get_result(self, timeout: Optional[float] = None, run_id: Optional[int] = None) -> OcrPoolResult:
+        """현재 실행(또는 run_id)의 결과를 하나 받습니다. 다른 실행의 결과는 버립니다. 시간 초과 시 queue.Empty."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            result_run_id, key, ocr_results, error = self._results.get(timeout=remaining)
+            with self._lock:
+                expected_run_id = run_id if run_id is not None else self._run_id
+            if result_run_id == expected_run_id:
+                return key, ocr_results, error
+            logger.debug(f"이전 실행의 OCR 결과를 버립니다 (키: {key}).")
+
+    def iter_results(self, count: int, stop_event: Optional[threading.Event] = None,
+                     run_id: Optional[int] = None) -> Iterator[OcrPoolResult]:
+        received = 0
+        while received < count:
+            if stop_event and stop_event.is_set(): return
+            if run_id is not None and run_id != self._run_id: return # 실행이 취소됨
+            try:
+                item = self.get_result(timeout=0.2, run_id=run_id)
+            except queue.Empty:
+                continue
+            received += 1
+            yield item
+
+    def outstanding_count(self) -> int:
+        """대기 중이거나 처리 중인 작업 수."""
+        with self._lock:
+            return len(self._pending) + sum(1 for slot in self._workers if slot.current is not None)
+
+    @property
+    def threads_per_worker(self) -> int:
+        return max(1, int(self._worker_engine_spec.get('perf_profile', {}).get('cpu_threads') or 1))
+
+    def worker_pids(self) -> List[int]:
+        with self._lock:
+            return [slot.process.pid for slot in self._workers if slot.process.pid is not None]
+
+    def set_active_worker_limit(self, worker_limit: Optional[int]) -> None:
+        """동시에 작업을 받을 워커 수를 제한합니다 (None이면 제한 없음). 처리 중인 작업은 그대로 끝까지 진행됩니다."""
+        with self._lock:
+            self._active_worker_limit = max(1, int(worker_limit)) if worker_limit is not None else None
+
+    def set_paused(self, paused: bool) -> None:
+        with self._lock:
+            self._paused = bool(paused)
+
+    def shrink_idle_workers(self, keep: int = 1) -> int:
+        """
+        작업이 없는 워커 프로세스를 keep개가 남을 때까지 종료해 엔진 메모리를 돌려받습니다. 종료할 워커 수를 반환합니다.
+        워커는 종료 대상으로만 표시하고, 실제 종료와 연결 정리는 디스패처 스레드가 합니다.
+        """
+        with self._lock:
+            idle_slots = [slot for slot in self._workers if slot.current is None]
+            release_count = max(0, min(len(idle_slots), len(self._workers) - max(1, keep)))
+            released_slots = idle_slots[:release_count]
+            for slot in released_slots:
+                self._workers.remove(slot)
+            self._retiring.extend(released_slots)
+            if self._dispatcher is None: # 디스패처가 없으면 정리할 스레드도 없으므로 바로 종료
+                self._retiring = []
+        if self._dispatcher is None:
+            for slot in released_slots:
+                self._stop_worker(slot, timeout=2)
+        return len(released_slots)
+
+    def restore_workers(self) -> None:
+        """shrink_idle_workers로 줄인 워커를 max_workers개까지 다시 시작합니다 (풀이 시작된 뒤에만)."""
+        with self._lock:
+            if self._closed or self.broken or self._dispatcher is None: return
+            while len(self._workers) < self.max_workers:
+                self._workers.append(self._spawn_worker())
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            if self._closed: return
+            self._closed = True
+            for _, key, _, _, run_id in self._pending:
+                self._results.put((run_id, key, None, "OCR 워커 풀 종료됨"))
+            self._pending.clear()
+        if self._dispatcher and self._dispatcher.is_alive():
+            self._dispatcher.join(timeout=timeout)
+        with self._lock:
+            remaining_slots = self._workers + self._retiring
+            self._workers, self._retiring = [], []
+        for slot in remaining_slots:
+            self._stop_worker(slot, timeout)
+        logger.info("OCR 워커 풀 종료 완료.")
+
+    # --- 내부 구현 ---
+
+    def _ensure_started_locked(self) -> None:
+        if self._dispatcher is not None: return
+        for _ in range(self.max_workers):
+            self._workers.append(self._spawn_worker())
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="OcrPoolDispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def _spawn_worker(self) -> _WorkerSlot:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_ocr_worker_main, args=(self._worker_engine_spec, child_conn), daemon=True)
+        process.start()
+        child_conn.close()
+        logger.debug(f"OCR 워커 프로세스 시작 (PID: {process.pid})")
+        return _WorkerSlot(process, parent_conn)
+
+    def _stop_worker(self, slot: _WorkerSlot, timeout: float) -> None:
+        try: slot.conn.send(None)
+        except Exception: pass
+        slot.process.join(timeout=timeout)
+        if slot.process.is_alive():
+            logger.warning(f"OCR 워커(PID: {slot.process.pid})가 시간 내 종료되지 않아 강제 종료합니다.")
+            slot.process.terminate()
+            slot.process.join(timeout=1)
+        try: slot.conn.close()
+        except Exception: pass
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            try:
+                if not self._dispatch_once(): break
+            except Exception as e_dispatch:
+                # 디스패처가 멈추면 get_result/iter_results가 끝없이 기다리므로, 남은 작업을 모두 실패 처리하고 풀을 사용 중지
+                logger.error(f"OCR 워커 풀 디스패처 오류: {e_dispatch}. 워커 풀을 사용 중지합니다.", exc_info=True)
+                self._mark_broken(f"OCR 워커 풀 디스패처 오류: {e_dispatch!r}")
+                break
+
+    def _dispatch_once(self) -> bool:
+        """디스패처 루프 한 번. 풀이 닫혔으면 False를 반환합니다."""
+        with self._lock:
+            if self._closed: return False
+            retiring_slots, self._retiring = self._retiring, []
+            self._assign_pending_locked()
+            slots = list(self._workers)
+        for slot in retiring_slots:
+            self._stop_worker(slot, timeout=2)
+        if not slots:
+            time.sleep(DISPATCH_POLL_INTERVAL)
+            return True
+        ready = mp_wait([s.conn for s in slots] + [s.process.sentinel for s in slots], timeout=DISPATCH_POLL_INTERVAL)
+        for slot in slots:
+            if slot.conn in ready:
+                try:
+                    message = slot.conn.recv()
+                except (EOFError, OSError):
+                    self._handle_worker_death(slot)
+                    continue
+                self._handle_message(slot, message)
+            elif slot.process.sentinel in ready:
+                self._handle_worker_death(slot)
+        return True
+
+    def _assign_pending_locked(self) -> None:
+        if self._paused: return
+        busy_count = sum(1 for slot in self._workers if slot.current is not None)
+        for slot in self._workers:
+            if not self._pending: return
+            if self._active_worker_limit is not None and busy_count >= self._active_worker_limit: return
+            if not slot.ready or slot.current is not None: continue
+            pending_task = self._pending.popleft()
+            task_id, key, image_bytes, ocr_params, run_id = pending_task
+            try:
+                slot.conn.send((task_id, image_bytes) + ocr_params)
+                slot.current = (task_id, key, run_id)
+                busy_count += 1
+            except (OSError, ValueError) as e_send:
+                logger.warning(f"OCR 워커(PID: {slot.process.pid})로 작업 전송 실패: {e_send}. 작업을 다시 대기열에 넣습니다.")
+                self._pending.appendleft(pending_task)
+                slot.ready = False # 사망 처리는 sentinel 감지 시 진행
+
+    def _handle_message(self, slot: _WorkerSlot, message: Tuple[str, Optional[int], Any]) -> None:
+        kind, task_id, payload = message
+        if kind == 'ready':
+            slot.ready = True
+            logger.debug(f"OCR 워커(PID: {slot.process.pid}) 엔진 준비 완료.")
+        elif kind == 'init_error':
+            if self.broken: return
+            logger.error(f"OCR 워커 엔진 초기화 실패: {payload}. 워커 풀을 사용 중지합니다.")
+            self._mark_broken(f"OCR 워커 초기화 실패: {payload}")
+        elif kind in ('result', 'error'):
+            if slot.current is None or slot.current[0] != task_id:
+                logger.warning(f"OCR 워커 응답의 작업 ID 불일치 (예상: {slot.current}, 수신: {task_id}). 무시합니다.")
+                return
+            _, key, run_id = slot.current
+            slot.current = None
+            if run_id != self._run_id: return # 취소된 실행의 결과
+            if kind == 'result':
+                self._results.put((run_id, key, payload, None))
+            else:
+                logger.warning(f"OCR 워커 작업 오류 (키: {key}): {payload}")
+                self._results.put((run_id, key, None, payload))
+
+    def _handle_worker_death(self, slot: _WorkerSlot) -> None:
+        slot.process.join(timeout=1)
+        exitcode = slot.process.exitcode
+        with self._lock:
+            if slot not in self._workers: return
+            self._workers.remove(slot)
+            if slot.current is not None:
+                _, key, run_id = slot.current
+                logger.error(f"OCR 워커(PID: {slot.process.pid}, 종료 코드: {exitcode})가 작업 중 비정상 종료됨. 해당 이미지만 건너뜁니다 (키: {key}).")
+                self._results.put((run_id, key, None, f"OCR 워커 비정상 종료 (종료 코드: {exitcode})"))
+            if self._closed or self.broken: return
+            if self._respawn_count >= MAX_WORKER_RESPAWNS:
+                logger.error("OCR 워커 재시작 횟수 초과. 워커 풀을 사용 중지합니다.")
+                self._mark_broken_locked("OCR 워커 재시작 횟수 초과")
+                return
+            self._respawn_count += 1
+            self._workers.append(self._spawn_worker())
+        try: slot.conn.close()
+        except Exception: pass
+
+    def _mark_broken(self, reason: str) -> None:
+        with self._lock:
+            self._mark_broken_locked(reason)
+
+    def _mark_broken_locked(self, reason: str) -> None:
+        self.broken = True
+        for _, key, _, _, run_id in self._pending:
+            self._results.put((run_id, key, None, reason))
+        self._pending.clear()
+        for slot in self._workers:
+            if slot.current is not None:
+                _, key, run_id = slot.current
+                self._results.put((run_id, key, None, reason))
+                slot.current = None
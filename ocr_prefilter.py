@@ -0,0 +1,90 @@
+# ocr_prefilter.py
+import io
+import logging
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# 설정 파일 import
+import config
+
+if TYPE_CHECKING:
+    from ocr_handler import BaseOcrHandler
+
+logger = logging.getLogger(__name__)
+
+
+def _load_gray_thumbnail(image_bytes: bytes, max_side: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """이미지를 흑백 축소판으로 읽습니다. JPEG는 draft()로 디코딩 단계에서 축소하므로 원본 해상도로 풀지 않습니다."""
+    with Image.open(io.BytesIO(image_bytes)) as img_pil:
+        original_size = img_pil.size
+        img_pil.draft('L', (max_side, max_side))
+        thumbnail = img_pil.convert('L')
+    thumbnail.thumbnail((max_side, max_side))
+    return np.asarray(thumbnail), original_size
+
+
+def _count_text_like_regions(gray: np.ndarray) -> Tuple[int, float]:
+    """
+    형태학적 기울기로 강한 경계를 찾고, 가로로 이어 붙인 덩어리 중 글자 줄처럼 생긴 영역 수를 셉니다.
+    (텍스트 줄 = 가로로 긴 높이 제한 영역 + 영역 안의 경계 픽셀 비율이 적당함) (글자 줄 후보 수, 경계 밀도)를 반환합니다.
+    """
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, np.ones((3, 3), np.uint8))
+    otsu_threshold, _ = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    # 사진의 부드러운 경계는 제외하도록 최소 대비를 둠 (글자 획은 배경과 대비가 큼)
+    _, binary = cv2.threshold(gradient, max(otsu_threshold, config.OCR_PREFILTER_MIN_GRADIENT), 255, cv2.THRESH_BINARY)
+    edge_density = float(np.count_nonzero(binary)) / binary.size
+    if edge_density < config.OCR_PREFILTER_MIN_EDGE_DENSITY:
+        return 0, edge_density
+
+    line_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1))
+    connected = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, line_kernel)
+    contours, _ = cv2.findContours(connected, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    max_line_height = max(8, int(gray.shape[0] * 0.35))
+    text_like_count = 0
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if h < 5 or h > max_line_height or w < h * 1.2:
+            continue
+        fill_ratio = float(np.count_nonzero(binary[y:y + h, x:x + w])) / (w * h)
+        if 0.15 <= fill_ratio <= 0.9:
+            text_like_count += 1
+    return text_like_count, edge_density
+
+
+def likely_contains_text(image_bytes: bytes, ocr_handler: Optional['BaseOcrHandler'] = None) -> Tuple[bool, str]:
+    """
+    전체 OCR 전에 텍스트가 있을 가능성이 있는지 빠르게 판단합니다. (판단 결과, 사유)를 반환합니다.
+    1) 크기/가로세로 비율 검사 2) 축소판의 경계 밀도 + 글자 줄 모양 영역 휴리스틱
+    3) (설정 시) OCR 엔진의 검출 단계만 축소 해상도로 실행.
+    판단이 불확실하거나 오류가 나면 True를 반환해 전체 OCR로 넘깁니다 (텍스트 누락 방지).
+    """
+    try:
+        gray, (width, height) = _load_gray_thumbnail(image_bytes, config.OCR_PREFILTER_MAX_SIDE)
+    except Exception as e_decode:
+        logger.debug(f"OCR 사전 검사용 이미지 디코딩 실패, 전체 OCR로 진행: {e_decode}")
+        return True, "디코딩 실패"
+
+    if min(width, height) < config.OCR_PREFILTER_MIN_SIDE:
+        return False, f"이미지가 너무 작음 ({width}x{height})"
+    if max(width, height) / max(1, min(width, height)) > config.OCR_PREFILTER_MAX_ASPECT_RATIO:
+        return False, f"가로세로 비율이 선/띠 모양 ({width}x{height})"
+
+    text_like_count, edge_density = _count_text_like_regions(gray)
+    if text_like_count < config.OCR_PREFILTER_MIN_TEXT_REGIONS:
+        return False, f"글자 줄 모양 영역 없음 (경계 밀도 {edge_density:.3f})"
+
+    if config.OCR_PREFILTER_USE_DETECTOR and ocr_handler is not None:
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as img_pil:
+                img_pil.draft('RGB', (config.OCR_PREFILTER_DETECTOR_MAX_SIDE, config.OCR_PREFILTER_DETECTOR_MAX_SIDE))
+                detector_input = img_pil.convert('RGB')
+            detector_input.thumbnail((config.OCR_PREFILTER_DETECTOR_MAX_SIDE, config.OCR_PREFILTER_DETECTOR_MAX_SIDE))
+            has_regions = ocr_handler.detect_text_regions(detector_input)
+            if has_regions is False:
+                return False, "검출 단계에서 텍스트 영역 없음"
+        except Exception as e_detect:
+            logger.debug(f"OCR 사전 검출 실패, 전체 OCR로 진행: {e_detect}")
+    return True, f"글자 줄 후보 {text_like_count}개"
@@ -0,0 +1,164 @@
+# ocr_regions.py
+import logging
+import math
+from typing import Any, List, Optional
+
+# 설정 파일 import
+import config
+from text_layout import char_script
+
+logger = logging.getLogger(__name__)
+
+
+class _Fragment:
+    """OCR 결과 한 항목([box, (text, conf), angle])의 축 정렬 경계 상자와 텍스트."""
+
+    def __init__(self, box_points: List[List[int]], text: str, confidence: float, angle: Optional[float]):
+        x_coords = [p[0] for p in box_points]
+        y_coords = [p[1] for p in box_points]
+        self.x1, self.x2 = min(x_coords), max(x_coords)
+        self.y1, self.y2 = min(y_coords), max(y_coords)
+        self.text = text
+        self.confidence = confidence
+        self.angle = angle
+        self.tilt = self._estimate_tilt(box_points)
+
+    @property
+    def height(self) -> float:
+        return max(1, self.y2 - self.y1)
+
+    @staticmethod
+    def _estimate_tilt(box_points: List[List[int]]) -> float:
+        # OCR 박스는 (좌상, 우상, 우하, 좌하) 순서. 윗변의 기울기(도)
+        try:
+            (x_a, y_a), (x_b, y_b) = box_points[0], box_points[1]
+            return math.degrees(math.atan2(y_b - y_a, x_b - x_a)) if x_b != x_a else 90.0
+        except Exception:
+            return 0.0
+
+
+class _Region:
+    """병합된 영역 (줄 또는 단락). 텍스트는 조각 순서대로 이어 붙입니다."""
+
+    def __init__(self, fragment: _Fragment):
+        self.x1, self.y1, self.x2, self.y2 = fragment.x1, fragment.y1, fragment.x2, fragment.y2
+        self.text = fragment.text
+        self.confidences = [fragment.confidence]
+        self.line_height = fragment.height
+        self.line_count = 1
+        self.angle = fragment.angle
+
+    @property
+    def height(self) -> float:
+        return max(1, self.y2 - self.y1)
+
+    def absorb(self, other: "_Region", separator: str) -> None:
+        self.x1, self.y1 = min(self.x1, other.x1), min(self.y1, other.y1)
+        self.x2, self.y2 = max(self.x2, other.x2), max(self.y2, other.y2)
+        self.text = self.text + separator + other.text
+        self.confidences.extend(other.confidences)
+
+    def to_ocr_result(self) -> List[Any]:
+        box_points = [[int(self.x1), int(self.y1)], [int(self.x2), int(self.y1)],
+                      [int(self.x2), int(self.y2)], [int(self.x1), int(self.y2)]]
+        confidence = sum(self.confidences) / len(self.confidences)
+        return [box_points, (self.text, float(confidence)), self.angle]
+
+
+def _join_separator(left_text: str, right_text: str) -> str:
+    """중국어/일본어처럼 띄어쓰기가 없는 문자 사이는 붙이고, 그 외에는 공백으로 잇습니다."""
+    if left_text and right_text and char_script(left_text[-1]) == 'cjk' and char_script(right_text[0]) == 'cjk':
+        return ""
+    return " "
+
+
+def _same_line(line: _Region, fragment: _Region) -> bool:
+    min_height = min(line.line_height, fragment.height)
+    max_height = max(line.line_height, fragment.height)
+    if max_height / min_height > config.OCR_MERGE_MAX_HEIGHT_RATIO:
+        return False
+    # 기준선(아래쪽) 정렬 및 세로 중심 정렬
+    if abs(line.y2 - fragment.y2) > min_height * config.OCR_MERGE_BASELINE_TOLERANCE:
+        return False
+    horizontal_gap = fragment.x1 - line.x2
+    return -min_height * 0.5 <= horizontal_gap <= min_height * config.OCR_MERGE_MAX_WORD_GAP
+
+
+def _same_paragraph(upper: _Region, lower: _Region) -> bool:
+    min_height = min(upper.line_height, lower.line_height)
+    max_height = max(upper.line_height, lower.line_height)
+    if max_height / min_height > config.OCR_MERGE_MAX_PARAGRAPH_HEIGHT_RATIO:
+        return False
+    vertical_gap = lower.y1 - upper.y2
+    if not (-min_height * 0.3 <= vertical_gap <= min_height * config.OCR_MERGE_MAX_LINE_GAP):
+        return False
+    # 왼쪽 정렬이 비슷하거나, 가로로 충분히 겹쳐야 같은 단락
+    left_aligned = abs(upper.x1 - lower.x1) <= min_height
+    horizontal_overlap = min(upper.x2, lower.x2) - max(upper.x1, lower.x1)
+    narrower_width = max(1, min(upper.x2 - upper.x1, lower.x2 - lower.x1))
+    return left_aligned or horizontal_overlap / narrower_width >= 0.6
+
+
+def merge_ocr_regions(ocr_results: List[Any], merge_paragraphs: Optional[bool] = None,
+                      min_confidence: Optional[float] = None) -> List[Any]:
+    """
+    ocr_image가 반환한 조각 단위 결과 [box, (text, conf), angle]를 기하 정보로 줄/단락 영역으로 병합합니다.
+    - 신뢰도가 min_confidence 미만인 조각은 제외
+    - 같은 줄: 기준선 정렬, 높이 유사, 가로 간격 임계값 이내
+    - 같은 단락: 줄 높이 유사, 줄 간격 임계값 이내, 왼쪽 정렬 또는 가로 겹침
+    - 크게 기울어진 조각은 병합하지 않고 그대로 둡니다.
+    반환 형식은 ocr_image와 같으며, 병합 영역의 박스는 합집합 사각형입니다.
+    """
+    if merge_paragraphs is None: merge_paragraphs = config.OCR_MERGE_PARAGRAPHS
+    if min_confidence is None: min_confidence = config.OCR_MIN_CONFIDENCE
+
+    fragments: List[_Fragment] = []
+    passthrough_results: List[Any] = []
+    for ocr_item in ocr_results or []:
+        try:
+            box_points, (text, confidence) = ocr_item[0], ocr_item[1]
+            angle = ocr_item[2] if len(ocr_item) > 2 else None
+        except (TypeError, ValueError, IndexError):
+            continue
+        if not text or not str(text).strip(): continue
+        if confidence is not None and float(confidence) < min_confidence:
+            logger.debug(f"OCR 조각 제외 (신뢰도 {float(confidence):.2f} < {min_confidence}): '{str(text)[:20]}'")
+            continue
+        fragment = _Fragment(box_points, str(text), float(confidence if confidence is not None else 1.0), angle)
+        if abs(fragment.tilt) > config.OCR_MERGE_MAX_TILT_DEGREES or (isinstance(angle, (int, float)) and abs(angle) > config.OCR_MERGE_MAX_TILT_DEGREES):
+            passthrough_results.append(ocr_item)
+        else:
+            fragments.append(fragment)
+
+    # 1) 줄 병합: 왼쪽부터 훑으며 같은 줄의 마지막 영역 뒤에 이어 붙임
+    lines: List[_Region] = []
+    for fragment in sorted(fragments, key=lambda f: (f.x1, f.y1)):
+        fragment_region = _Region(fragment)
+        target_line = None
+        for line in lines:
+            if _same_line(line, fragment_region) and (target_line is None or line.x2 > target_line.x2):
+                target_line = line
+        if target_line is None:
+            lines.append(fragment_region)
+        else:
+            target_line.absorb(fragment_region, _join_separator(target_line.text, fragment_region.text))
+
+    # 2) 단락 병합: 위에서 아래로, 바로 위 줄들과 이어지는지 확인
+    regions: List[_Region] = []
+    for line in sorted(lines, key=lambda r: (r.y1, r.x1)):
+        target_region = None
+        if merge_paragraphs:
+            for region in regions:
+                if _same_paragraph(region, line): # region.y2는 단락 마지막 줄의 아래쪽
+                    target_region = region
+                    break
+        if target_region is None:
+            regions.append(line)
+        else:
+            target_region.absorb(line, _join_separator(target_region.text, line.text))
+            target_region.line_count += 1
+
+    merged_results = [region.to_ocr_result() for region in sorted(regions, key=lambda r: (r.y1, r.x1))]
+    if len(merged_results) + len(passthrough_results) < len(ocr_results or []):
+        logger.debug(f"OCR 영역 병합: 조각 {len(ocr_results)}개 -> 영역 {len(merged_results) + len(passthrough_results)}개")
+    return merged_results + passthrough_results
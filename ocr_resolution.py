@@ -0,0 +1,204 @@
+# ocr_resolution.py
+import io
+import logging
+import math
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Sequence, Tuple
+
+# 설정 파일 import
+import config
+from ocr_tiling import needs_tiling, ocr_image_tiled
+
+if TYPE_CHECKING:
+    from PIL import Image
+    from ocr_handler import BaseOcrHandler
+
+logger = logging.getLogger(__name__)
+
+EMU_PER_INCH = 914400
+POINTS_PER_INCH = 72
+
+
+class OcrResolutionPlan(NamedTuple):
+    scale: float # OCR 입력 축소 비율 (1.0 = 원본 해상도)
+    effective_dpi: Optional[float] # 슬라이드에 표시되는 유효 해상도 (가장 크게 표시된 그림 기준)
+    px_per_point: Optional[float] # 원본 이미지 픽셀 / 표시 포인트
+    skip_reason: Optional[str] # OCR을 생략할 이유 (없으면 None)
+
+
+class DisplaySpec(NamedTuple):
+    width_emu: int
+    height_emu: int
+    crop_left: float
+    crop_right: float
+    crop_top: float
+    crop_bottom: float
+
+
+def plan_ocr_resolution(image_size: Optional[Tuple[int, int]], display_specs: Sequence[DisplaySpec]) -> OcrResolutionPlan:
+    """
+    이미지 픽셀 크기와 슬라이드 위 표시 크기(EMU, 자르기 반영)로 유효 DPI를 계산하고 OCR 입력 축소 비율을 정합니다.
+    같은 이미지를 여러 그림이 쓰면 가장 크게(낮은 DPI로) 표시된 그림을 기준으로 합니다.
+    표시 크기가 너무 작아 안의 글자를 읽을 수 없는 이미지는 skip_reason을 채웁니다.
+    """
+    if not image_size or not display_specs or min(image_size) <= 0:
+        return OcrResolutionPlan(1.0, None, None, None)
+    image_width, image_height = image_size
+
+    effective_dpi = None
+    largest_display_points = 0.0
+    for spec in display_specs:
+        if spec.width_emu <= 0 or spec.height_emu <= 0: continue
+        visible_width_px = image_width * max(0.01, 1.0 - max(0.0, spec.crop_left) - max(0.0, spec.crop_right))
+        visible_height_px = image_height * max(0.01, 1.0 - max(0.0, spec.crop_top) - max(0.0, spec.crop_bottom))
+        display_dpi = min(visible_width_px / (spec.width_emu / EMU_PER_INCH),
+                          visible_height_px / (spec.height_emu / EMU_PER_INCH))
+        effective_dpi = display_dpi if effective_dpi is None else min(effective_dpi, display_dpi)
+        largest_display_points = max(largest_display_points,
+                                     min(spec.width_emu, spec.height_emu) / EMU_PER_INCH * POINTS_PER_INCH)
+    if effective_dpi is None:
+        return OcrResolutionPlan(1.0, None, None, None)
+
+    px_per_point = effective_dpi / POINTS_PER_INCH
+    if largest_display_points < config.OCR_MIN_DISPLAY_TEXT_PT * 2:
+        return OcrResolutionPlan(1.0, effective_dpi, px_per_point,
+                                 f"표시 크기가 너무 작음 (짧은 변 {largest_display_points:.1f}pt)")
+
+    scale = 1.0
+    if config.OCR_TARGET_DPI and effective_dpi > config.OCR_TARGET_DPI:
+        scale = config.OCR_TARGET_DPI / effective_dpi
+        # 검출기가 다룰 수 있는 최소 크기는 유지
+        min_scale = min(1.0, config.OCR_DOWNSCALE_MIN_SIDE / max(image_width, image_height))
+        scale = max(scale, min_scale)
+    return OcrResolutionPlan(round(scale, 3), effective_dpi, px_per_point, None)
+
+
+def visible_region(image_size: Optional[Tuple[int, int]], display_specs: Sequence[DisplaySpec]) -> Optional[Tuple[int, int, int, int]]:
+    """
+    자르기(crop)로 슬라이드에 보이는 이미지 영역(px, x1, y1, x2, y2)을 반환합니다. 여러 그림이 같은 이미지를 쓰면 보이는 영역의 합집합.
+    이미지 전체가 (거의) 보이면 None. 음수 자르기(여백 확장)는 0으로 취급합니다.
+    """
+    if not image_size or not display_specs or min(image_size) <= 0: return None
+    image_width, image_height = image_size
+    region = None
+    for spec in display_specs:
+        crop_left, crop_right = max(0.0, spec.crop_left), max(0.0, spec.crop_right)
+        crop_top, crop_bottom = max(0.0, spec.crop_top), max(0.0, spec.crop_bottom)
+        if crop_left + crop_right >= 1.0 or crop_top + crop_bottom >= 1.0: continue
+        spec_region = (int(image_width * crop_left), int(image_height * crop_top),
+                       int(round(image_width * (1.0 - crop_right))), int(round(image_height * (1.0 - crop_bottom))))
+        region = spec_region if region is None else (min(region[0], spec_region[0]), min(region[1], spec_region[1]),
+                                                     max(region[2], spec_region[2]), max(region[3], spec_region[3]))
+    if region is None: return None
+    region_area = (region[2] - region[0]) * (region[3] - region[1])
+    if region_area >= image_width * image_height * config.OCR_CROP_MIN_SAVING_RATIO:
+        return None # 잘린 부분이 작으면 전체 이미지를 그대로 사용
+    return region
+
+
+def open_for_ocr(image_bytes: bytes, scale: float = 1.0) -> Tuple['Image.Image', float]:
+    """
+    OCR용으로 이미지를 엽니다 (아직 디코딩하지 않음). scale < 1이면 Image.draft로 JPEG를 1/2, 1/4, 1/8 크기로 바로 디코딩해
+    원본 크기 디코딩을 건너뜁니다 (draft를 지원하지 않는 포맷은 그대로). (이미지, 디코딩 비율 = 디코딩 크기 / 원본 크기)를 반환합니다.
+    """
+    from PIL import Image
+
+    image_pil = Image.open(io.BytesIO(image_bytes))
+    if scale >= 1.0: return image_pil, 1.0
+    original_width = image_pil.width
+    requested_size = (max(1, math.ceil(image_pil.width * scale)), max(1, math.ceil(image_pil.height * scale)))
+    try:
+        image_pil.draft('RGB', requested_size)
+    except Exception as e_draft:
+        logger.debug(f"축소 디코딩(draft) 실패, 원본 크기로 디코딩: {e_draft}")
+    return image_pil, image_pil.width / original_width
+
+
+def _prepare_ocr_input(image_pil: 'Image.Image', scale: float, region: Optional[Tuple[int, int, int, int]],
+                       decode_factor: float) -> Tuple[Optional['Image.Image'], Optional[Tuple[int, int, int, int]], float]:
+    """
+    (OCR 입력 이미지, 타일로 나눌 영역, 입력 좌표 / 원본 좌표 비율)을 반환합니다. 전체 크기 RGB 사본을 만들지 않도록
+    - 축소가 필요하면 resize(box=영역)로 자르기와 축소를 한 번에 하고 (reducing_gap: 정수 배 reduce 후 보간)
+    - 축소 없이 타일이 필요하면 입력 이미지는 None, 원본에서 타일을 바로 잘라냄
+    - 그 외에는 영역만 잘라 RGB로 변환 (이미 RGB이고 영역이 없으면 복사하지 않음)
+    """
+    source_box = None
+    if region:
+        source_box = tuple(int(round(coord * decode_factor)) for coord in region)
+        source_box = (max(0, source_box[0]), max(0, source_box[1]),
+                      min(image_pil.width, max(source_box[0] + 1, source_box[2])),
+                      min(image_pil.height, max(source_box[1] + 1, source_box[3])))
+    box_width, box_height = (source_box[2] - source_box[0], source_box[3] - source_box[1]) if source_box else image_pil.size
+    remaining_scale = scale / decode_factor if decode_factor > 0 else scale
+    if remaining_scale < 1.0:
+        target_size = (max(1, int(round(box_width * remaining_scale))), max(1, int(round(box_height * remaining_scale))))
+        if image_pil.mode in ("1", "P"): # 팔레트/1비트는 resize가 NEAREST로 강제되므로 먼저 변환
+            image_pil = image_pil.convert("RGB")
+        from PIL import Image
+        resample = Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.LANCZOS
+        ocr_input = image_pil.resize(target_size, resample, box=source_box, reducing_gap=3.0)
+        if ocr_input.mode != "RGB": ocr_input = ocr_input.convert("RGB")
+        return ocr_input, None, min(decode_factor, scale)
+    if needs_tiling((box_width, box_height)):
+        return None, source_box or (0, 0, image_pil.width, image_pil.height), decode_factor
+    ocr_input = image_pil.crop(source_box) if source_box else image_pil
+    if ocr_input.mode != "RGB": ocr_input = ocr_input.convert("RGB")
+    return ocr_input, None, decode_factor
+
+
+def scale_ocr_results(ocr_results: List[Any], factor: float) -> List[Any]:
+    """OCR 결과 박스 좌표에 factor를 곱합니다 (축소 입력의 좌표 -> 원본 해상도 좌표)."""
+    if factor == 1.0: return ocr_results
+    return [[[[int(round(point[0] * factor)), int(round(point[1] * factor))] for point in item[0]]] + list(item[1:])
+            for item in ocr_results]
+
+
+def ocr_images_at_scale(ocr_handler: 'BaseOcrHandler', images_pil: List['Image.Image'], scales: Sequence[float],
+                        regions: Optional[Sequence[Optional[Tuple[int, int, int, int]]]] = None,
+                        decode_factors: Optional[Sequence[float]] = None) -> List[List[Any]]:
+    """
+    이미지마다 보이는 영역(regions, 원본 좌표, None이면 전체)만 잘라 정해진 비율로 축소해 OCR하고, 박스를 원본 이미지 좌표로 되돌려 반환합니다.
+    축소 후에도 너무 큰 이미지는 겹치는 타일로 나눠 OCR하고(ocr_tiling), 나머지는 ocr_images로 함께 배치 처리합니다.
+    images_pil은 open_for_ocr로 연 (RGB 변환 전, draft 축소 디코딩일 수 있는) 이미지이며, decode_factors는 그 디코딩 비율입니다.
+    """
+    regions = list(regions) if regions is not None else [None] * len(images_pil)
+    decode_factors = list(decode_factors) if decode_factors is not None else [1.0] * len(images_pil)
+    prepared_inputs = [_prepare_ocr_input(image_pil, scale, region, decode_factor)
+                       for image_pil, scale, region, decode_factor in zip(images_pil, scales, regions, decode_factors)]
+    results_per_image: List[List[Any]] = [[] for _ in prepared_inputs]
+    batch_indices = []
+    for image_idx, (ocr_input, tile_source_box, _) in enumerate(prepared_inputs):
+        if ocr_input is None: # 원본(또는 draft 디코딩)에서 타일을 바로 잘라 OCR
+            results_per_image[image_idx] = ocr_image_tiled(ocr_handler, images_pil[image_idx], tile_source_box)
+        elif needs_tiling(ocr_input.size):
+            results_per_image[image_idx] = ocr_image_tiled(ocr_handler, ocr_input)
+        else:
+            batch_indices.append(image_idx)
+    if batch_indices:
+        batch_results = ocr_handler.ocr_images([prepared_inputs[i][0] for i in batch_indices])
+        for image_idx, ocr_results in zip(batch_indices, batch_results):
+            results_per_image[image_idx] = ocr_results or []
+    for image_idx, (ocr_input, _, _) in enumerate(prepared_inputs):
+        if ocr_input is not None and ocr_input is not images_pil[image_idx]: ocr_input.close()
+    return [offset_ocr_results(scale_ocr_results(ocr_results, 1.0 / input_scale if input_scale < 1.0 else 1.0), region)
+            for ocr_results, (_, _, input_scale), region in zip(results_per_image, prepared_inputs, regions)]
+
+
+def offset_ocr_results(ocr_results: List[Any], region: Optional[Tuple[int, int, int, int]]) -> List[Any]:
+    """잘라낸 영역 기준 좌표를 원본 이미지 좌표로 옮깁니다."""
+    if not region or (region[0] == 0 and region[1] == 0): return ocr_results
+    offset_x, offset_y = region[0], region[1]
+    return [[[[point[0] + offset_x, point[1] + offset_y] for point in item[0]]] + list(item[1:]) for item in ocr_results]
+
+
+def filter_sub_legible_results(ocr_results: List[Any], px_per_point: Optional[float]) -> List[Any]:
+    """슬라이드에 표시되는 글자 높이가 OCR_MIN_DISPLAY_TEXT_PT 미만인 (읽을 수 없어 교체 의미가 없는) 결과를 제외합니다."""
+    if not px_per_point or not config.OCR_MIN_DISPLAY_TEXT_PT: return ocr_results
+    min_height_px = config.OCR_MIN_DISPLAY_TEXT_PT * px_per_point
+    legible_results = []
+    for item in ocr_results:
+        y_coords = [point[1] for point in item[0]]
+        if max(y_coords) - min(y_coords) >= min_height_px:
+            legible_results.append(item)
+    if len(legible_results) < len(ocr_results):
+        logger.debug(f"표시 크기 기준 판독 불가 OCR 결과 {len(ocr_results) - len(legible_results)}개 제외 (최소 {min_height_px:.1f}px)")
+    return legible_results
@@ -0,0 +1,125 @@
+# ocr_tiling.py
+import logging
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+# 설정 파일 import
+import config
+
+if TYPE_CHECKING:
+    from PIL import Image
+    from ocr_handler import BaseOcrHandler
+
+logger = logging.getLogger(__name__)
+
+TileRect = Tuple[int, int, int, int] # (x1, y1, x2, y2)
+EDGE_TOUCH_MARGIN = 2 # px. 타일 안쪽 경계에 이만큼 붙은 박스는 잘린 것으로 간주
+
+
+def needs_tiling(image_size: Tuple[int, int]) -> bool:
+    width, height = image_size
+    return max(width, height) > config.OCR_TILE_MAX_SIDE or width * height > config.OCR_TILE_MAX_PIXELS
+
+
+def plan_tiles(width: int, height: int, tile_width: int, tile_height: int, overlap: int) -> List[TileRect]:
+    """이미지를 tile_width x tile_height 타일로 나누되 이웃 타일과 overlap만큼 겹치게 합니다 (마지막 타일은 끝에 맞춤)."""
+    def _starts(length: int, tile_length: int) -> List[int]:
+        if length <= tile_length: return [0]
+        step = max(1, tile_length - max(0, min(overlap, tile_length // 2)))
+        starts = list(range(0, length - tile_length, step))
+        starts.append(length - tile_length)
+        return starts
+
+    return [(x, y, min(width, x + tile_width), min(height, y + tile_height))
+            for y in _starts(height, tile_height) for x in _starts(width, tile_width)]
+
+
+def _box_bounds(box_points: List[List[int]]) -> TileRect:
+    x_coords = [p[0] for p in box_points]
+    y_coords = [p[1] for p in box_points]
+    return min(x_coords), min(y_coords), max(x_coords), max(y_coords)
+
+
+def _is_cut_at_inner_edge(bounds: TileRect, tile: TileRect, image_size: Tuple[int, int], overlap: int) -> bool:
+    """
+    박스가 이미지 가장자리가 아닌 타일 안쪽 경계에 닿아 잘렸고, 그 방향 크기가 겹침 폭보다 작아
+    이웃 타일에서 온전히 보이는 경우 True. (겹침보다 큰 박스는 어느 타일에서도 온전하지 않으므로 유지)
+    """
+    x1, y1, x2, y2 = bounds
+    tile_x1, tile_y1, tile_x2, tile_y2 = tile
+    width, height = image_size
+    cut_horizontally = (tile_x1 > 0 and x1 - tile_x1 <= EDGE_TOUCH_MARGIN) or (tile_x2 < width and tile_x2 - x2 <= EDGE_TOUCH_MARGIN)
+    cut_vertically = (tile_y1 > 0 and y1 - tile_y1 <= EDGE_TOUCH_MARGIN) or (tile_y2 < height and tile_y2 - y2 <= EDGE_TOUCH_MARGIN)
+    return (cut_horizontally and x2 - x1 < overlap) or (cut_vertically and y2 - y1 < overlap)
+
+
+def _overlap_ratio(bounds_a: TileRect, bounds_b: TileRect) -> float:
+    """교집합 넓이 / 더 작은 박스 넓이. 한 박스가 다른 박스에 거의 포함되면 1에 가까움."""
+    inter_w = min(bounds_a[2], bounds_b[2]) - max(bounds_a[0], bounds_b[0])
+    inter_h = min(bounds_a[3], bounds_b[3]) - max(bounds_a[1], bounds_b[1])
+    if inter_w <= 0 or inter_h <= 0: return 0.0
+    area_a = max(1, (bounds_a[2] - bounds_a[0]) * (bounds_a[3] - bounds_a[1]))
+    area_b = max(1, (bounds_b[2] - bounds_b[0]) * (bounds_b[3] - bounds_b[1]))
+    return inter_w * inter_h / min(area_a, area_b)
+
+
+def merge_tile_results(tile_results: List[Tuple[TileRect, List[Any]]], image_size: Tuple[int, int]) -> List[Any]:
+    """
+    타일별 OCR 결과(이미지 좌표로 변환된 것)를 합치면서 타일 경계(겹침 영역)의 중복 박스를 제거합니다.
+    1) 타일 안쪽 경계에 걸려 잘린 박스는 버림 (겹침 폭보다 작은 박스는 이웃 타일에 온전한 박스가 있음)
+    2) 남은 박스 중 서로 대부분 겹치는 박스는 텍스트가 더 길고 신뢰도가 높은 쪽만 남김
+    """
+    candidates: List[Tuple[TileRect, Any]] = []
+    for tile, ocr_results in tile_results:
+        for item in ocr_results:
+            bounds = _box_bounds(item[0])
+            if _is_cut_at_inner_edge(bounds, tile, image_size, config.OCR_TILE_OVERLAP):
+                continue
+            candidates.append((bounds, item))
+
+    candidates.sort(key=lambda c: (len(str(c[1][1][0])), float(c[1][1][1])), reverse=True)
+    kept: List[Tuple[TileRect, Any]] = []
+    for bounds, item in candidates:
+        if any(_overlap_ratio(bounds, kept_bounds) >= config.OCR_TILE_DUPLICATE_OVERLAP for kept_bounds, _ in kept):
+            continue
+        kept.append((bounds, item))
+    kept.sort(key=lambda c: (c[0][1], c[0][0]))
+    return [item for _, item in kept]
+
+
+def _crop_rgb(image_pil: 'Image.Image', box: TileRect) -> 'Image.Image':
+    tile_image = image_pil.crop(box)
+    if tile_image.mode == "RGB": return tile_image
+    tile_image_rgb = tile_image.convert("RGB")
+    tile_image.close()
+    return tile_image_rgb
+
+
+def ocr_image_tiled(ocr_handler: 'BaseOcrHandler', image_pil: 'Image.Image', source_box: Optional[TileRect] = None) -> List[Any]:
+    """
+    큰 이미지를 겹치는 타일로 나눠 OCR합니다. 타일은 OCR_BATCH_SIZE개씩 잘라 ocr_images로 배치 처리하므로
+    한 번에 메모리에 올라가는 OCR 입력(타일 사본, 엔진 전처리 배열)은 원본 크기와 무관하게 일정합니다.
+    image_pil은 RGB로 변환하지 않은 원본이어도 되며(타일마다 RGB로 변환), source_box가 있으면 그 영역만 타일로 나눕니다.
+    결과 박스는 source_box 기준 좌표입니다.
+    """
+    box_x, box_y = (source_box[0], source_box[1]) if source_box else (0, 0)
+    width, height = (source_box[2] - box_x, source_box[3] - box_y) if source_box else image_pil.size
+    # 폭이 한도 이내면 전체 폭 띠로 나눠 세로 경계에서 글자 줄이 잘리지 않게 함 (세로로 긴 인포그래픽/스크린샷)
+    tile_width = width if width <= config.OCR_TILE_MAX_SIDE else config.OCR_TILE_SIZE
+    tiles = plan_tiles(width, height, tile_width, config.OCR_TILE_SIZE, config.OCR_TILE_OVERLAP)
+    batch_size = max(1, int(config.OCR_BATCH_SIZE))
+    tile_results: List[Tuple[TileRect, List[Any]]] = []
+    for batch_start in range(0, len(tiles), batch_size):
+        batch_tiles = tiles[batch_start:batch_start + batch_size]
+        tile_images = [_crop_rgb(image_pil, (tile[0] + box_x, tile[1] + box_y, tile[2] + box_x, tile[3] + box_y))
+                       for tile in batch_tiles]
+        try:
+            batch_results = ocr_handler.ocr_images(tile_images)
+        finally:
+            for tile_image in tile_images: tile_image.close()
+        for tile, ocr_results in zip(batch_tiles, batch_results):
+            offset_x, offset_y = tile[0], tile[1]
+            tile_results.append((tile, [[[[p[0] + offset_x, p[1] + offset_y] for p in item[0]]] + list(item[1:])
+                                        for item in ocr_results or []]))
+    merged_results = merge_tile_results(tile_results, (width, height))
+    logger.debug(f"타일 OCR: {width}x{height} 이미지를 타일 {len(tiles)}개로 처리, 결과 {len(merged_results)}개")
+    return merged_results
@@ -0,0 +1,185 @@
+# ocr_tuning.py
+import argparse
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+# 설정 파일 import
+import config
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_SAMPLE_LINES = [
+    "Quarterly revenue grew 12% year over year",
+    "분기 매출이 전년 대비 12% 증가했습니다",
+    "Customer satisfaction 4.7 / 5.0",
+    "신규 고객 1,250명 확보 (목표 대비 110%)",
+    "Next steps: expand to APAC markets",
+]
+
+
+def auto_cpu_threads(concurrent_engines: int = 1) -> int:
+    """Ollama/UI용 코어(OCR_RESERVED_CPU_CORES)를 뺀 나머지를 동시에 OCR하는 엔진 수로 나눈 스레드 수."""
+    available_cores = max(1, (os.cpu_count() or 2) - max(0, config.OCR_RESERVED_CPU_CORES))
+    return max(1, available_cores // max(1, concurrent_engines))
+
+
+def _calibration_key(engine_name: str, concurrent_engines: int) -> str:
+    return f"{engine_name}|engines={concurrent_engines}|cpus={os.cpu_count() or 0}"
+
+
+def load_calibrated_profile(engine_name: str, concurrent_engines: int = 1) -> Dict[str, Any]:
+    """보정 명령으로 저장된 설정을 반환합니다. 같은 엔진/동시 엔진 수/CPU 코어 수로 보정한 기록이 없으면 빈 dict."""
+    try:
+        with open(config.OCR_TUNING_PROFILE_PATH, 'r', encoding='utf-8') as f_profile:
+            stored_profiles = json.load(f_profile)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e_load:
+        logger.warning(f"OCR 성능 프로필 파일 읽기 실패 ('{config.OCR_TUNING_PROFILE_PATH}'): {e_load}")
+        return {}
+    stored_entry = stored_profiles.get(_calibration_key(engine_name, concurrent_engines)) or {}
+    return dict(stored_entry.get('settings') or {})
+
+
+def resolve_perf_profile(engine_name: str, concurrent_engines: int = 1) -> Dict[str, Any]:
+    """
+    엔진의 CPU 추론 설정을 결정합니다: config.OCR_PERF_PROFILE 기본값 < 보정 결과 순으로 덮어쓰고,
+    cpu_threads가 None이면 동시에 OCR하는 엔진 수(워커 수)에 맞춰 자동 계산합니다.
+    """
+    perf_profile = dict(config.OCR_PERF_PROFILE.get(engine_name, {}))
+    perf_profile.update(load_calibrated_profile(engine_name, concurrent_engines))
+    if perf_profile.get('cpu_threads') is None:
+        perf_profile['cpu_threads'] = auto_cpu_threads(concurrent_engines)
+    return perf_profile
+
+
+def make_calibration_images(image_count: int) -> List[bytes]:
+    """글자 줄이 그려진 합성 슬라이드 이미지(PNG 바이트)를 만듭니다. 크기를 조금씩 달리해 검출 입력 크기도 섞습니다."""
+    try:
+        font = ImageFont.truetype(os.path.join(config.FONTS_DIR, config.OCR_DEFAULT_FONT_FILENAME), 28)
+    except OSError:
+        font = ImageFont.load_default()
+    images_bytes = []
+    for image_idx in range(image_count):
+        width, height = 960 + (image_idx % 3) * 320, 540 + (image_idx % 2) * 180
+        img_pil = Image.new("RGB", (width, height), (255, 255, 255))
+        draw = ImageDraw.Draw(img_pil)
+        for line_idx in range(6 + image_idx % 4):
+            text = CALIBRATION_SAMPLE_LINES[(image_idx + line_idx) % len(CALIBRATION_SAMPLE_LINES)]
+            draw.text((40, 30 + line_idx * 60), text, fill=(20, 20, 20), font=font)
+        buffer = io.BytesIO()
+        img_pil.save(buffer, format="PNG")
+        images_bytes.append(buffer.getvalue())
+    return images_bytes
+
+
+def _candidate_profiles(engine_name: str, concurrent_engines: int) -> List[Dict[str, Any]]:
+    """비교할 설정 후보: 스레드 수(자동값과 그 절반/두 배) x 인식 배치 크기 (PaddleOCR은 MKL-DNN 켬/끔 포함)."""
+    auto_threads = auto_cpu_threads(concurrent_engines)
+    max_threads = max(1, (os.cpu_count() or 2) // max(1, concurrent_engines))
+    thread_options = sorted({max(1, auto_threads // 2), auto_threads, min(max_threads, auto_threads * 2)})
+    batch_options = sorted({max(1, config.OCR_BATCH_SIZE // 2), config.OCR_BATCH_SIZE, config.OCR_BATCH_SIZE * 2})
+    mkldnn_options = [True, False] if engine_name == "paddleocr" else [None]
+    candidates = []
+    for cpu_threads in thread_options:
+        for rec_batch_size in batch_options:
+            for enable_mkldnn in mkldnn_options:
+                candidate = {'cpu_threads': cpu_threads, 'rec_batch_size': rec_batch_size}
+                if enable_mkldnn is not None: candidate['enable_mkldnn'] = enable_mkldnn
+                candidates.append(candidate)
+    return candidates
+
+
+def _benchmark_profile(engine_spec: Dict[str, Any], perf_profile: Dict[str, Any], images_bytes: List[bytes],
+                       concurrent_engines: int) -> Optional[float]:
+    """워커 concurrent_engines개로 이미지를 모두 OCR하는 데 걸린 시간(초). 엔진 초기화와 첫 추론(워밍업)은 제외합니다."""
+    from ocr_pool import OcrProcessPool
+    ocr_pool = OcrProcessPool({**engine_spec, 'perf_profile': perf_profile}, max_workers=concurrent_engines)
+    try:
+        for warmup_idx in range(concurrent_engines):
+            ocr_pool.submit(('warmup', warmup_idx), images_bytes[warmup_idx % len(images_bytes)])
+        for _, ocr_results, error in ocr_pool.iter_results(concurrent_engines):
+            if error: raise RuntimeError(error)
+        start_time = time.perf_counter()
+        for image_idx, image_bytes in enumerate(images_bytes):
+            ocr_pool.submit(image_idx, image_bytes)
+        for _, ocr_results, error in ocr_pool.iter_results(len(images_bytes)):
+            if error: raise RuntimeError(error)
+        return time.perf_counter() - start_time
+    except Exception as e_bench:
+        logger.warning(f"OCR 성능 측정 실패 ({perf_profile}): {e_bench}")
+        return None
+    finally:
+        ocr_pool.shutdown()
+
+
+def calibrate(engine_name: str, lang_code: str, concurrent_engines: Optional[int] = None,
+              image_count: int = 12) -> Optional[Dict[str, Any]]:
+    """
+    합성 이미지로 설정 후보를 차례로 측정해 가장 빠른 설정을 OCR_TUNING_PROFILE_PATH에 저장하고 반환합니다.
+    실제 번역과 같은 수의 워커를 동시에 돌려 측정하므로 워커 간 코어 경합까지 반영됩니다. 모든 후보가 실패하면 None.
+    """
+    concurrent_engines = max(1, int(concurrent_engines if concurrent_engines is not None else config.MAX_OCR_WORKERS))
+    engine_spec = {
+        'engine': engine_name,
+        'lang_codes': [lang_code] if engine_name == "easyocr" else lang_code,
+        'use_gpu': False,
+        'debug_enabled': False,
+    }
+    images_bytes = make_calibration_images(image_count)
+    base_profile = dict(config.OCR_PERF_PROFILE.get(engine_name, {}))
+    best_settings, best_elapsed = None, None
+    for candidate in _candidate_profiles(engine_name, concurrent_engines):
+        elapsed = _benchmark_profile(engine_spec, {**base_profile, **candidate}, images_bytes, concurrent_engines)
+        if elapsed is None: continue
+        logger.info(f"OCR 성능 측정: {candidate} -> {elapsed:.2f}s ({len(images_bytes) / elapsed:.2f} 이미지/s)")
+        if best_elapsed is None or elapsed < best_elapsed:
+            best_settings, best_elapsed = candidate, elapsed
+    if best_settings is None:
+        logger.error("OCR 성능 보정 실패: 측정에 성공한 설정이 없습니다.")
+        return None
+
+    _store_calibrated_profile(_calibration_key(engine_name, concurrent_engines), {
+        'settings': best_settings,
+        'images_per_second': round(len(images_bytes) / best_elapsed, 3),
+        'calibrated_at': datetime.now().isoformat(timespec='seconds'),
+    })
+    logger.info(f"OCR 성능 보정 완료 ({engine_name}, 동시 엔진 {concurrent_engines}개): {best_settings}")
+    return best_settings
+
+
+def _store_calibrated_profile(calibration_key: str, entry: Dict[str, Any]) -> None:
+    profile_path = config.OCR_TUNING_PROFILE_PATH
+    stored_profiles: Dict[str, Any] = {}
+    try:
+        with open(profile_path, 'r', encoding='utf-8') as f_profile:
+            stored_profiles = json.load(f_profile)
+    except (OSError, ValueError):
+        pass
+    stored_profiles[calibration_key] = entry
+    os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(profile_path), suffix=".tmp")
+    with os.fdopen(fd, 'w', encoding='utf-8') as f_temp:
+        json.dump(stored_profiles, f_temp, ensure_ascii=False, indent=2)
+    os.replace(temp_path, profile_path)
+
+
+if __name__ == "__main__":
+    # 사용 예: python ocr_tuning.py --engine paddleocr --lang korean --workers 2
+    parser = argparse.ArgumentParser(description="OCR 엔진 CPU 설정(스레드 수, MKL-DNN, 인식 배치 크기)을 측정해 가장 빠른 설정을 저장합니다.")
+    parser.add_argument("--engine", choices=["paddleocr", "easyocr"], default="paddleocr")
+    parser.add_argument("--lang", default=None, help="OCR 언어 코드 (기본: PaddleOCR은 DEFAULT_PADDLE_OCR_LANG, EasyOCR은 en)")
+    parser.add_argument("--workers", type=int, default=None, help="동시에 OCR하는 워커 수 (기본: MAX_OCR_WORKERS)")
+    parser.add_argument("--images", type=int, default=12, help="측정에 사용할 합성 이미지 수")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    calibration_lang = args.lang or (config.DEFAULT_PADDLE_OCR_LANG if args.engine == "paddleocr" else "en")
+    calibrate(args.engine, calibration_lang, concurrent_engines=args.workers, image_count=args.images)
@@ -8,7 +8,7 @@ import psutil
 import time # 추가
 import logging
 import json
-from typing import Tuple, Optional, List
+from typing import Any, Dict, Tuple, Optional, List
 import threading
 
 # 설정 파일 import
@@ -215,6 +215,40 @@ class OllamaService:
         self._models_cache = None
         self._models_cache_time = 0 # 다음 호출 시 무조건 새로고침하도록
 
+    def warm_up_model(self, model_name: str, options: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        아주 짧은 generate 요청(빈 프롬프트, 토큰 1개)으로 모델을 메모리에 올려 둡니다.
+        OLLAMA_WARMUP_KEEP_ALIVE 동안 모델이 유지되므로 첫 번역 요청이 모델 로딩을 기다리지 않습니다.
+        options에는 번역 요청과 같은 실행 옵션(num_thread 등)을 넘겨야 번역 시작 시 모델을 다시 올리지 않습니다.
+        """
+        try:
+            start_time = time.time()
+            response = requests.post(
+                f"{self.url}/api/generate",
+                json={"model": model_name, "prompt": "", "stream": False,
+                      "keep_alive": config.OLLAMA_WARMUP_KEEP_ALIVE, "options": {**(options or {}), "num_predict": 1}},
+                timeout=(self.connect_timeout, self.read_timeout)
+            )
+            response.raise_for_status()
+            logger.info(f"Ollama 모델 '{model_name}' 미리 로딩 완료 ({time.time() - start_time:.1f}s).")
+            return True
+        except requests.exceptions.RequestException as e_req:
+            logger.warning(f"Ollama 모델 '{model_name}' 미리 로딩 실패: {e_req}")
+            return False
+
+    def is_model_on_gpu(self, model_name: str) -> Optional[bool]:
+        """/api/ps로 메모리에 올라간 모델이 GPU(VRAM)에 주로 올라가 있는지 확인합니다. 모델이 올라가 있지 않거나 확인 실패 시 None."""
+        try:
+            response = requests.get(f"{self.url}/api/ps", timeout=(self.connect_timeout, self.read_timeout))
+            response.raise_for_status()
+            for loaded_model in response.json().get("models", []):
+                if loaded_model.get("name") == model_name or loaded_model.get("model") == model_name:
+                    total_size = loaded_model.get("size") or 0
+                    return total_size > 0 and (loaded_model.get("size_vram") or 0) >= total_size * 0.5
+        except (requests.exceptions.RequestException, ValueError) as e_ps:
+            logger.debug(f"Ollama 실행 중 모델 조회 실패: {e_ps}")
+        return None
+
     def pull_model_with_progress(self, model_name: str,
                                  progress_callback=None,
                                  stop_event: Optional[threading.Event] = None):
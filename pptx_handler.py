@@ -1,12 +1,6 @@
 # pptx_handler.py
-from pptx import Presentation
-from pptx.util import Pt
-from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.dml.color import RGBColor
-from pptx.enum.dml import MSO_COLOR_TYPE, MSO_THEME_COLOR_INDEX
-from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, PP_ALIGN
-from pptx.enum.lang import MSO_LANGUAGE_ID
-
+# python-pptx(lxml 포함)는 import에 시간이 오래 걸리므로 실제로 프레젠테이션을 다루는 메서드 안에서 import합니다.
+# (PptxHandler 생성과 get_file_info의 zip 스캔은 python-pptx 없이 동작 -> 앱 시작 시 로드하지 않음)
 import os
 import io
 import logging
@@ -14,24 +8,55 @@ import re
 from datetime import datetime
 import hashlib
 import traceback
-from PIL import Image
 import tempfile
 import shutil
+import queue
+import threading
 
 # 설정 파일 import
 import config
+from translator import TranslationQueue
+from ocr_regions import merge_ocr_regions
+from disk_cache import OcrResultCache, RenderedImageCache
+from ocr_resolution import (DisplaySpec, plan_ocr_resolution, visible_region, ocr_images_at_scale, open_for_ocr,
+                            filter_sub_legible_results)
 
 from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Callable, TypedDict # TypedDict 추가
 from concurrent.futures import ThreadPoolExecutor # 추가
 
 
 if TYPE_CHECKING:
+    from PIL import Image
+    from pptx import Presentation
     from translator import OllamaTranslator
     from ollama_service import OllamaService
     from ocr_handler import BaseOcrHandler # BaseOcrHandler로 변경
+    from ocr_pool import OcrProcessPool
+    from cpu_resource_manager import CpuResourceManager
+    from memory_governor import MemoryGovernor
 
 logger = logging.getLogger(__name__)
 
+RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+# OCR 결과 캐시 지문에 포함하는 설정 (큰 이미지의 타일 분할/경계 중복 제거는 반환되는 박스를 바꿈)
+OCR_CACHE_CONFIG_NAMES = (
+    'OCR_TILE_MAX_SIDE', 'OCR_TILE_MAX_PIXELS', 'OCR_TILE_SIZE', 'OCR_TILE_OVERLAP', 'OCR_TILE_DUPLICATE_OVERLAP',
+)
+# 사전 검사의 '텍스트 없음' 판정을 캐시할 때 지문에 포함하는 설정
+PREFILTER_CACHE_CONFIG_NAMES = (
+    'OCR_PREFILTER_MAX_SIDE', 'OCR_PREFILTER_MIN_SIDE', 'OCR_PREFILTER_MAX_ASPECT_RATIO', 'OCR_PREFILTER_MIN_GRADIENT',
+    'OCR_PREFILTER_MIN_EDGE_DENSITY', 'OCR_PREFILTER_MIN_TEXT_REGIONS', 'OCR_PREFILTER_USE_DETECTOR',
+    'OCR_PREFILTER_DETECTOR_MAX_SIDE',
+)
+# 렌더링 캐시 지문에 포함하는 설정 (OCR 대상 선택, 영역 병합/필터 및 렌더링 방식). 이 값이 바뀌면 기존 캐시 항목은 사용되지 않음.
+# OCR 결과에 영향을 주는 설정(타일 등)은 그룹별 렌더링 지문에 OCR 결과 캐시 지문(ocr_cache_fingerprint)을 그대로 넣어 반영
+RENDER_CACHE_CONFIG_NAMES = (
+    'OCR_MERGE_REGIONS', 'OCR_MERGE_PARAGRAPHS', 'OCR_MIN_CONFIDENCE', 'OCR_MERGE_MAX_HEIGHT_RATIO',
+    'OCR_MERGE_BASELINE_TOLERANCE', 'OCR_MERGE_MAX_WORD_GAP', 'OCR_MERGE_MAX_PARAGRAPH_HEIGHT_RATIO',
+    'OCR_MERGE_MAX_LINE_GAP', 'OCR_MERGE_MAX_TILT_DEGREES', 'OCR_TARGET_DPI', 'OCR_DOWNSCALE_MIN_SIDE',
+    'OCR_MIN_DISPLAY_TEXT_PT', 'OCR_CROP_MIN_SAVING_RATIO', 'OCR_PREFILTER_ENABLED', 'RENDER_SETTINGS_VERSION',
+) + PREFILTER_CACHE_CONFIG_NAMES
+
 MEANINGFUL_CHAR_PATTERN = re.compile(
     r'[a-zA-Z'
     r'\u00C0-\u024F'    # Latin Extended-A
@@ -46,6 +71,20 @@ MEANINGFUL_CHAR_PATTERN = re.compile(
     r']'
 )
 
+def config_signature(config_names: Tuple[str, ...]) -> str:
+    return ",".join(f"{name}={getattr(config, name, None)}" for name in config_names)
+
+
+def ocr_cache_fingerprint(engine_fingerprint: str, ocr_scale: float, region: Optional[Tuple[int, int, int, int]]) -> str:
+    """OCR 결과 캐시 지문. 축소 비율, 보이는 영역, 타일 설정이 다르면 OCR 결과도 달라지므로 포함합니다."""
+    return f"{engine_fingerprint}|scale={ocr_scale}|region={region}|{config_signature(OCR_CACHE_CONFIG_NAMES)}"
+
+
+def prefilter_cache_fingerprint(engine_fingerprint: str) -> str:
+    """사전 검사 '텍스트 없음' 판정의 캐시 지문 (검출 단계 사용 시 엔진에 따라 판정이 달라지므로 엔진 지문 포함)."""
+    return f"{engine_fingerprint}|prefilter|{config_signature(PREFILTER_CACHE_CONFIG_NAMES)}"
+
+
 def should_skip_translation(text: str) -> bool:
     if not text: return True
     stripped_text = text.strip()
@@ -108,59 +147,142 @@ class TranslationJob(TypedDict):
     is_ocr: bool
     char_count: int # 가중치 계산용
 
+class DeckAnalysis:
+    """
+    번역 작업마다 한 번 만드는 python-pptx 분석 결과. 1단계 번역(작업 목록)과 2단계(차트 수)가 같은 객체를 함께 씁니다.
+    1단계 번역은 prs를 직접 수정하므로, 번역에 한 번 사용(consumed)한 분석은 다시 쓰지 않습니다.
+    (파일 선택 시 UI 정보는 get_file_info의 zip 스캔으로 따로 계산)
+    """
+
+    def __init__(self, file_path: str, prs: Optional['Presentation']):
+        self.file_path = file_path
+        self.prs = prs
+        self.consumed = False
+        self.slide_count = 0
+        self.text_elements_count = 0
+        self.total_text_char_count = 0
+        self.image_elements_count = 0
+        self.chart_elements_count = 0
+        self.translation_jobs: List[TranslationJob] = [] # 번역 대상 텍스트 상자/표 셀 (건너뛸 텍스트는 제외)
+        self.picture_jobs: List[Dict[str, Any]] = [] # OCR 대상이 될 수 있는 그림 shape
+        self.elements: List[Dict[str, Any]] = [] # 분석 대상 요소 (UI 진행 표시용, 차트 포함)
+        self.chart_partnames: List[str] = [] # 2단계에서 처리할 차트 파트 (/ppt/charts/chartN.xml)
+
+    def file_info(self) -> Dict[str, int]:
+        return {
+            "slide_count": self.slide_count,
+            "text_elements_count": self.text_elements_count, # UI에서 직접 사용 안해도 내부적으론 카운트 가능
+            "total_text_char_count": self.total_text_char_count, # 가중치 계산에 사용
+            "image_elements_count": self.image_elements_count, # 가중치 계산에 사용
+            "chart_elements_count": self.chart_elements_count  # 가중치 계산에 사용
+        }
+
 class PptxHandler:
     def __init__(self):
-        pass
+        # 실행 간 공유하는 OCR 결과 디스크 캐시 (이미지 SHA1 + 엔진 지문 기준)
+        self.ocr_cache: Optional[OcrResultCache] = OcrResultCache() if config.OCR_CACHE_ENABLED else None
+        # 번역/렌더링이 끝난 최종 이미지 디스크 캐시 (이미지 SHA1 + 언어/모델/폰트/렌더링 설정 기준)
+        self.render_cache: Optional[RenderedImageCache] = RenderedImageCache() if config.RENDER_CACHE_ENABLED else None
 
     def get_file_info(self, file_path: str) -> Dict[str, int]:
         logger.info(f"파일 정보 분석 시작: {file_path}")
-        info = {
-            "slide_count": 0,
-            "text_elements_count": 0, # UI에서 직접 사용 안해도 내부적으론 카운트 가능
-            "total_text_char_count": 0, # 가중치 계산에 사용
-            "image_elements_count": 0, # 가중치 계산에 사용
-            "chart_elements_count": 0  # 가중치 계산에 사용
-        }
+        if config.FAST_FILE_INFO_ENABLED:
+            try:
+                from pptx_zip_scanner import scan_file_info
+                info = scan_file_info(file_path, should_skip_translation)
+                logger.info(
+                    f"파일 분석 완료 (zip 스캔): Slides:{info['slide_count']}, "
+                    f"TextElements(internal):{info['text_elements_count']} (TotalChars:{info['total_text_char_count']}), "
+                    f"Images:{info['image_elements_count']}, Charts:{info['chart_elements_count']}"
+                )
+                return info
+            except Exception as e_scan:
+                logger.warning(f"'{os.path.basename(file_path)}' zip 스캔 실패, python-pptx로 분석합니다: {e_scan}")
         try:
-            prs = Presentation(file_path)
-            info["slide_count"] = len(prs.slides)
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    is_counted_as_text_element_for_shape = False
-                    if shape.has_text_frame and hasattr(shape.text_frame, 'text') and \
-                       shape.text_frame.text and shape.text_frame.text.strip():
-                        text_content = shape.text_frame.text
-                        if not should_skip_translation(text_content):
-                            if not is_counted_as_text_element_for_shape:
-                                info["text_elements_count"] += 1
-                                is_counted_as_text_element_for_shape = True
-                            info["total_text_char_count"] += len(text_content)
-
-                    elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                        info["image_elements_count"] += 1
-                    elif shape.has_table:
-                        for r_idx, row in enumerate(shape.table.rows):
-                            for c_idx, cell in enumerate(row.cells):
-                                if hasattr(cell.text_frame, 'text') and cell.text_frame.text and cell.text_frame.text.strip():
-                                    text_content = cell.text_frame.text
-                                    if not should_skip_translation(text_content):
-                                        info["text_elements_count"] += 1 # 테이블 셀은 각 유효 텍스트마다 요소 수 증가
-                                        info["total_text_char_count"] += len(text_content)
-                    elif shape.shape_type == MSO_SHAPE_TYPE.CHART:
-                        info["chart_elements_count"] +=1
-            logger.info(
-                f"파일 분석 완료: Slides:{info['slide_count']}, "
-                f"TextElements(internal):{info['text_elements_count']} (TotalChars:{info['total_text_char_count']}), "
-                f"Images:{info['image_elements_count']}, Charts:{info['chart_elements_count']}"
-            )
+            return self.analyze_presentation(file_path).file_info()
         except Exception as e:
             logger.error(f"'{os.path.basename(file_path)}' 파일 정보 분석 오류: {e}", exc_info=True)
-            # 오류 발생 시 info 딕셔너리는 초기값으로 반환될 것임
-        return info
+            # 오류 발생 시 초기값(모두 0) 반환
+            return DeckAnalysis(file_path, None).file_info()
+
+    def analyze_presentation(self, file_path: str, prs: Optional['Presentation'] = None) -> 'DeckAnalysis':
+        """
+        프레젠테이션을 한 번만 파싱해 슬라이드/텍스트/이미지/차트 수와 1단계 번역 작업 목록(건너뛰기 판단, 글자 수 포함)을 만듭니다.
+        prs를 주면 다시 읽지 않고 그 객체를 분석합니다. 파일을 열 수 없으면 python-pptx 예외가 그대로 전달됩니다.
+        """
+        from pptx import Presentation
+        from pptx.enum.shapes import MSO_SHAPE_TYPE
+        deck_analysis = DeckAnalysis(file_path, prs if prs is not None else Presentation(file_path))
+        deck_analysis.slide_count = len(deck_analysis.prs.slides)
+        for slide_idx, slide in enumerate(deck_analysis.prs.slides):
+            for shape_idx, shape in enumerate(slide.shapes):
+                shape_id = getattr(shape, 'shape_id', f"slide{slide_idx}_shape{shape_idx}")
+                element_name = shape.name or f"S{slide_idx+1}_Shape{shape_idx}_Id{shape_id}"
+                item_base_info = {'slide_idx': slide_idx, 'shape_obj_ref': shape, 'name': element_name, 'shape_id_log': shape_id}
+
+                if shape.shape_type == MSO_SHAPE_TYPE.CHART:
+                    deck_analysis.chart_elements_count += 1
+                    try:
+                        deck_analysis.chart_partnames.append(str(shape.chart_part.partname))
+                    except Exception:
+                        pass
+                    deck_analysis.elements.append({**item_base_info, 'type': 'chart_placeholder', 'char_count':0, 'progress_type': "차트 (2단계 처리)"})
+                    continue
+
+                if shape.has_text_frame and hasattr(shape.text_frame, 'text') and \
+                   shape.text_frame.text and shape.text_frame.text.strip():
+                    original_text = shape.text_frame.text
+                    char_count = 0
+                    if not should_skip_translation(original_text):
+                        char_count = len(original_text)
+                        deck_analysis.text_elements_count += 1
+                        deck_analysis.total_text_char_count += char_count
+                        style_unique_key = (slide_idx, id(shape), 'shape_text')
+                        deck_analysis.translation_jobs.append({
+                            'original_text': original_text,
+                            'context': {**item_base_info, 'item_type_internal': 'text_shape', 'style_unique_key': style_unique_key},
+                            'is_ocr': False,
+                            'char_count': char_count
+                        })
+                    deck_analysis.elements.append({**item_base_info, 'type': 'text_shape', 'original_text': original_text, 'char_count': char_count, 'progress_type': "텍스트"})
+
+                elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                    deck_analysis.image_elements_count += 1
+                    deck_analysis.elements.append({**item_base_info, 'type': 'image', 'progress_type': "이미지 OCR", 'char_count':0}) # char_count는 없지만 가중치 계산 위해 추가
+                    deck_analysis.picture_jobs.append(dict(item_base_info))
+
+                elif shape.has_table:
+                    deck_analysis.elements.append({**item_base_info, 'type': 'table_container', 'progress_type': "표 내부 텍스트", 'char_count':0})
+                    for r_idx, row in enumerate(shape.table.rows):
+                        for c_idx, cell in enumerate(row.cells):
+                            if hasattr(cell.text_frame, 'text') and cell.text_frame.text and cell.text_frame.text.strip():
+                                original_text = cell.text_frame.text
+                                if should_skip_translation(original_text): continue
+                                char_count = len(original_text)
+                                deck_analysis.text_elements_count += 1 # 테이블 셀은 각 유효 텍스트마다 요소 수 증가
+                                deck_analysis.total_text_char_count += char_count
+                                deck_analysis.translation_jobs.append({
+                                    'original_text': original_text,
+                                    'context': {
+                                        'slide_idx': slide_idx, 'table_shape_obj_ref': shape,
+                                        'name': f"{element_name}_R{r_idx}C{c_idx}", 'item_type_internal': 'table_cell',
+                                        'row_idx': r_idx, 'col_idx': c_idx, 'style_unique_key': (slide_idx, id(shape), (r_idx, c_idx)),
+                                        'shape_id_log': shape_id
+                                    },
+                                    'is_ocr': False,
+                                    'char_count': char_count
+                                })
+        logger.info(
+            f"파일 분석 완료: Slides:{deck_analysis.slide_count}, "
+            f"TextElements(internal):{deck_analysis.text_elements_count} (TotalChars:{deck_analysis.total_text_char_count}), "
+            f"Images:{deck_analysis.image_elements_count}, Charts:{deck_analysis.chart_elements_count}"
+        )
+        return deck_analysis
 
     def _get_style_properties(self, font_object) -> Dict[str, Any]:
         if font_object is None:
             return {}
+        from pptx.enum.dml import MSO_COLOR_TYPE
         
         style_props: Dict[str, Any] = {
             'name': None, 'size': None, 'bold': None, 'italic': None,
@@ -210,7 +332,10 @@ class PptxHandler:
     def _apply_style_properties(self, target_font_object, style_dict_to_apply: Dict[str, Any]):
         if not style_dict_to_apply or target_font_object is None:
             return
-        
+        from pptx.dml.color import RGBColor
+        from pptx.enum.dml import MSO_THEME_COLOR_INDEX
+        from pptx.enum.lang import MSO_LANGUAGE_ID
+
         font = target_font_object
         
         if style_dict_to_apply.get('name') is not None: font.name = style_dict_to_apply['name']
@@ -292,424 +417,718 @@ class PptxHandler:
             except Exception as e: logger.warning(f"Run에 하이퍼링크 주소 적용 시도 중 오류 (무시): {e}")
 
 
-    def translate_presentation_stage1(self, prs: Presentation, src_lang_ui_name: str, tgt_lang_ui_name: str,
+    def translate_presentation_stage1(self, prs: 'Presentation', src_lang_ui_name: str, tgt_lang_ui_name: str,
                                       translator: 'OllamaTranslator', ocr_handler: Optional['BaseOcrHandler'],
                                       model_name: str, ollama_service: 'OllamaService',
                                       font_code_for_render: str, task_log_filepath: str,
                                       progress_callback_item_completed: Optional[Callable[[Any, str, int, str], None]] = None,
                                       stop_event: Optional[Any] = None,
                                       image_translation_enabled: bool = True,
-                                      ocr_temperature: Optional[float] = None
+                                      ocr_temperature: Optional[float] = None,
+                                      ocr_pool: Optional['OcrProcessPool'] = None,
+                                      cpu_resource_manager: Optional['CpuResourceManager'] = None,
+                                      memory_governor: Optional['MemoryGovernor'] = None,
+                                      deck_analysis: Optional[DeckAnalysis] = None
                                       ) -> bool:
         
         with open(task_log_filepath, 'a', encoding='utf-8') as f_task_log:
             f_task_log.write("--- 1단계: 차트 외 요소 번역 시작 (translate_presentation_stage1) ---\n")
             logger.info("1단계: 차트 외 요소 (텍스트 상자, 표, OCR 등) 수집 중...")
 
+            # 작업자가 prs를 로드하며 만든 분석 결과가 있으면 다시 순회하지 않고 그 작업 목록을 사용
+            if deck_analysis is None or deck_analysis.prs is not prs or deck_analysis.consumed:
+                deck_analysis = self.analyze_presentation(getattr(deck_analysis, 'file_path', ''), prs)
+            deck_analysis.consumed = True
             # 번역할 텍스트와 컨텍스트 정보를 저장할 리스트
-            translation_jobs: List[TranslationJob] = []
-            # OCR 후 이미지 교체를 위한 정보 저장
-            image_update_jobs: List[Dict[str, Any]] = []
-            
-            elements_to_analyze_stage1: List[Dict[str, Any]] = [] # 분석 대상 요소 (UI 업데이트용)
+            translation_jobs: List[TranslationJob] = deck_analysis.translation_jobs
+            # OCR 대상 그림 shape 정보 (이미지 OCR 후 교체에 사용)
+            picture_jobs: List[Dict[str, Any]] = [dict(picture_job) for picture_job in deck_analysis.picture_jobs] \
+                if image_translation_enabled and ocr_handler else []
+            elements_to_analyze_stage1: List[Dict[str, Any]] = deck_analysis.elements # 분석 대상 요소 (UI 업데이트용)
             original_paragraph_styles_stage1: Dict[Tuple[int, Any, Any], List[Dict[str, Any]]] = {}
 
-
-            # 1단계: 번역 대상 텍스트 및 OCR 작업 수집
-            for slide_idx, slide in enumerate(prs.slides):
-                if stop_event and stop_event.is_set(): break
-                for shape_idx, shape in enumerate(slide.shapes):
-                    if stop_event and stop_event.is_set(): break
-                    
-                    shape_id = getattr(shape, 'shape_id', f"slide{slide_idx}_shape{shape_idx}")
-                    element_name = shape.name or f"S{slide_idx+1}_Shape{shape_idx}_Id{shape_id}"
-                    item_base_info = {'slide_idx': slide_idx, 'shape_obj_ref': shape, 'name': element_name, 'shape_id_log': shape_id}
-                    item_progress_type = "Unknown"
-
-                    if shape.shape_type == MSO_SHAPE_TYPE.CHART:
-                        elements_to_analyze_stage1.append({**item_base_info, 'type': 'chart_placeholder', 'char_count':0, 'progress_type': "차트 (2단계 처리)"})
-                        continue
-
-                    if shape.has_text_frame and hasattr(shape.text_frame, 'text') and \
-                       shape.text_frame.text and shape.text_frame.text.strip():
-                        original_text = shape.text_frame.text
-                        char_count = 0
-                        if not should_skip_translation(original_text):
-                            char_count = len(original_text)
-                            style_key_suffix_val = 'shape_text'
-                            style_unique_key = (slide_idx, id(shape), style_key_suffix_val)
-                            translation_jobs.append({
-                                'original_text': original_text,
-                                'context': {**item_base_info, 'item_type_internal': 'text_shape', 'style_unique_key': style_unique_key},
-                                'is_ocr': False,
-                                'char_count': char_count
-                            })
-                        item_progress_type = "텍스트"
-                        elements_to_analyze_stage1.append({**item_base_info, 'type': 'text_shape', 'original_text': original_text, 'char_count': char_count, 'progress_type': item_progress_type})
-
-                    elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                        item_progress_type = "이미지 OCR"
-                        elements_to_analyze_stage1.append({**item_base_info, 'type': 'image', 'progress_type': item_progress_type, 'char_count':0}) # char_count는 없지만 가중치 계산 위해 추가
-                        if image_translation_enabled and ocr_handler:
-                            # 이미지 OCR 작업은 바로 처리하지 않고, 아래에서 텍스트 번역과 함께 일괄 처리
-                            # 여기서는 image_update_jobs에 추가하여 나중에 처리할 수 있도록 함
-                            pass # 실제 작업은 아래 텍스트 번역 후 진행
-
-                    elif shape.has_table:
-                        item_progress_type = "표 내부 텍스트"
-                        elements_to_analyze_stage1.append({**item_base_info, 'type': 'table_container', 'progress_type': item_progress_type, 'char_count':0})
-                        for r_idx, row in enumerate(shape.table.rows):
-                            for c_idx, cell in enumerate(row.cells):
-                                if hasattr(cell.text_frame, 'text') and cell.text_frame.text and cell.text_frame.text.strip():
-                                    original_text = cell.text_frame.text
-                                    char_count = 0
-                                    if not should_skip_translation(original_text):
-                                        char_count = len(original_text)
-                                        style_key_suffix_val = (r_idx, c_idx)
-                                        style_unique_key = (slide_idx, id(shape), style_key_suffix_val)
-                                        cell_item_name = f"{element_name}_R{r_idx}C{c_idx}"
-                                        translation_jobs.append({
-                                            'original_text': original_text,
-                                            'context': {
-                                                'slide_idx': slide_idx, 'table_shape_obj_ref': shape, 
-                                                'name': cell_item_name, 'item_type_internal': 'table_cell',
-                                                'row_idx': r_idx, 'col_idx': c_idx, 'style_unique_key': style_unique_key,
-                                                'shape_id_log': shape_id 
-                                            },
-                                            'is_ocr': False,
-                                            'char_count': char_count
-                                        })
-                                    # UI 업데이트용 정보도 개별 셀 단위로 추가 가능하나, 여기서는 테이블 단위로 둠
-                                    # elements_to_analyze_stage1.append({'name': cell_item_name, ...})
-            
             f_task_log.write(f"1단계 분석 대상 요소 (UI 진행 표시용): {len(elements_to_analyze_stage1)}개.\n")
             f_task_log.write(f"1단계 번역 작업 수집 완료 (텍스트, 표): {len(translation_jobs)}개 항목.\n")
             logger.info(f"1단계 번역 작업 수집 완료 (텍스트, 표): {len(translation_jobs)}개 항목.")
 
             if not translation_jobs and not (image_translation_enabled and ocr_handler): # OCR도 없으면
-                 is_any_chart_present = any(s.shape_type == MSO_SHAPE_TYPE.CHART for slide in prs.slides for s in slide.shapes)
-                 if not is_any_chart_present:
+                 if not deck_analysis.chart_elements_count:
                     msg = "1단계 번역/처리 대상 요소(텍스트/표)가 없고, OCR 비활성화 또는 핸들러 부재, 차트도 없어 1단계 처리 스킵."
                     f_task_log.write(msg + "\n")
                     logger.info(msg)
                  return True
+            # 2단계: OCR과 텍스트 번역을 동시에 시작
+            # - 이미지 OCR은 워커 풀(또는 보조 스레드)에서 바로 시작하여, 텍스트 번역(Ollama)과 겹쳐서 진행
+            # - 일반 텍스트 번역은 TranslationQueue에 모두 제출하고, 완료되는 대로 적용
+            # - 이미지 하나의 OCR이 끝나면 그 텍스트를 같은 번역 큐에 넣고, 모두 번역되면 렌더링/교체
+            # python-pptx 객체 수정은 모두 이 스레드(이벤트 루프)에서만 수행
+            event_queue: "queue.Queue[Tuple[Any, ...]]" = queue.Queue()
+            translation_queue = TranslationQueue(
+                translator, src_lang_ui_name, tgt_lang_ui_name, model_name, ollama_service,
+                event_queue, ocr_temperature=ocr_temperature, stop_event=stop_event
+            )
+            ocr_enabled_for_stage1 = bool(image_translation_enabled and ocr_handler and picture_jobs)
+            # 같은 이미지(SHA1 동일)를 참조하는 그림들은 한 그룹으로 묶어 OCR/번역/렌더링을 한 번만 수행
+            picture_groups = self._group_picture_jobs(picture_jobs, f_task_log) if ocr_enabled_for_stage1 else []
+            outstanding_text_jobs = len(translation_jobs)
+            outstanding_pictures = len(picture_groups)
+            picture_states: Dict[int, Dict[str, Any]] = {}
+
+            if cpu_resource_manager is not None: # OCR 워커와 Ollama의 코어 예산을 남은 작업에 맞춰 재분배
+                cpu_resource_manager.start(ocr_pool if ocr_enabled_for_stage1 else None, translation_queue)
+            try:
+                if ocr_enabled_for_stage1 and self.render_cache is not None:
+                    # 렌더링 캐시에 있는 이미지는 OCR/번역/렌더링 없이 캐시된 결과로 바로 교체
+                    render_fingerprint = self._get_render_fingerprint(ocr_handler, src_lang_ui_name, tgt_lang_ui_name,
+                                                                      model_name, font_code_for_render, ocr_temperature)
+                    outstanding_pictures -= self._apply_render_cache_hits(picture_groups, render_fingerprint,
+                                                                          ocr_handler.get_cache_fingerprint(), f_task_log,
+                                                                          stop_event, progress_callback_item_completed)
+
+                if ocr_enabled_for_stage1 and outstanding_pictures > 0:
+                    f_task_log.write(f"이미지 OCR 대상 {len(picture_jobs)}개 (고유 이미지 {outstanding_pictures}개) 처리 시작 (워커 풀: {'사용' if ocr_pool else '미사용'}, 텍스트 번역과 동시 진행).\n")
+                    self._start_picture_ocr(picture_groups, ocr_handler, ocr_pool, event_queue, stop_event, memory_governor)
+
+                if translation_jobs:
+                    f_task_log.write(f"일반 텍스트 {len(translation_jobs)}개 번역 요청 제출...\n")
+                    logger.info(f"일반 텍스트 {len(translation_jobs)}개 번역 요청 제출 (완료되는 대로 적용).")
+                    for job_idx, job_data in enumerate(translation_jobs):
+                        if job_data['char_count'] > 0 and not job_data['is_ocr']:
+                            translation_queue.submit(('text', job_idx), job_data['original_text'], is_ocr_text=False)
+                        else: # 번역 불필요 대상은 원문 그대로 바로 적용 처리
+                            event_queue.put(('translation', ('text', job_idx), job_data['original_text']))
+
+                # 3단계: 완료된 번역/OCR 결과를 도착 순서대로 적용
+                decoded_images_released = False
+                while outstanding_text_jobs > 0 or outstanding_pictures > 0:
+                    if stop_event and stop_event.is_set():
+                        f_task_log.write(f"1단계 적용 중 중단 요청 감지.\n")
+                        break
+                    if memory_governor is not None and memory_governor.under_pressure != decoded_images_released:
+                        decoded_images_released = memory_governor.under_pressure
+                        if decoded_images_released: # 메모리 압박: 번역을 기다리는 이미지의 디코딩 사본을 버리고 렌더링 때 다시 디코딩
+                            released_count = self._release_decoded_images(picture_groups)
+                            f_task_log.write(f"메모리 압박 감지: 보관 중이던 디코딩 이미지 {released_count}개 해제, 새 OCR 작업 일시 중지.\n")
+                    try:
+                        event = event_queue.get(timeout=0.2)
+                    except queue.Empty:
+                        continue
 
-            # 2단계: 수집된 모든 텍스트 일괄 번역
-            texts_for_batch_translation = [job['original_text'] for job in translation_jobs if job['char_count'] > 0 and not job['is_ocr']]
-            ocr_texts_for_batch_translation = [] # OCR 텍스트는 별도 처리 또는 함께 처리할지 결정
-
-            translated_texts_batch: List[str] = []
-            if texts_for_batch_translation:
-                f_task_log.write(f"일반 텍스트 {len(texts_for_batch_translation)}개 일괄 번역 시작...\n")
-                logger.info(f"일반 텍스트 {len(texts_for_batch_translation)}개 일괄 번역 시작...")
-                translated_texts_batch = translator.translate_texts_batch(
-                    texts_for_batch_translation, src_lang_ui_name, tgt_lang_ui_name,
-                    model_name, ollama_service, is_ocr_text=False, stop_event=stop_event
-                )
-                f_task_log.write(f"일반 텍스트 일괄 번역 완료. 결과 {len(translated_texts_batch)}개 받음.\n")
-                logger.info(f"일반 텍스트 일괄 번역 완료. 결과 {len(translated_texts_batch)}개 받음.")
-                if len(texts_for_batch_translation) != len(translated_texts_batch):
-                    f_task_log.write(f"경고: 원본 텍스트 수({len(texts_for_batch_translation)})와 번역 결과 수({len(translated_texts_batch)}) 불일치!\n")
-                    logger.warning(f"원본 텍스트 수와 번역 결과 수 불일치! 배치 번역 로직 점검 필요.")
-                    # 불일치 시 안전하게 중단 또는 원본 사용 등의 처리 필요
-                    return False 
-
-
-            # 3단계: 번역된 텍스트를 원본 위치에 적용 및 OCR 처리
-            translated_text_idx = 0
-            for job_idx, job_data in enumerate(translation_jobs):
-                if stop_event and stop_event.is_set():
-                    f_task_log.write(f"1단계 적용 중 중단 요청 감지.\n"); return False
-
-                context = job_data['context']
-                slide_idx = context['slide_idx']
-                item_name_log = context['name']
-                item_type_internal = context['item_type_internal']
-                shape_id_log = context['shape_id_log']
-                
-                current_progress_text = job_data['original_text'][:30]
-                weighted_work_for_item = job_data['char_count'] * config.WEIGHT_TEXT_CHAR
-                
-                f_task_log.write(f"  [1단계 S{slide_idx+1}] 적용 시작: '{item_name_log}' (ID: {shape_id_log}), 타입: {item_type_internal}\n")
-
-                text_frame_for_processing: Optional[Any] = None
-                if item_type_internal == 'text_shape':
-                    shape_obj = context.get('shape_obj_ref')
-                    if shape_obj and shape_obj.has_text_frame:
-                        text_frame_for_processing = shape_obj.text_frame
-                elif item_type_internal == 'table_cell':
-                    table_shape_obj = context.get('table_shape_obj_ref')
-                    row_idx, col_idx = context['row_idx'], context['col_idx']
-                    if table_shape_obj and table_shape_obj.has_table:
-                        try:
-                            text_frame_for_processing = table_shape_obj.table.cell(row_idx, col_idx).text_frame
-                        except IndexError:
-                            err_msg_tbl_idx = f"1단계 테이블 셀 접근 오류 (IndexError): {item_name_log} at R{row_idx}C{col_idx}"
-                            logger.error(err_msg_tbl_idx)
-                            f_task_log.write(f"    오류: {err_msg_tbl_idx}. 건너뜀.\n")
-                            if progress_callback_item_completed:
-                                progress_callback_item_completed(slide_idx + 1, "오류", weighted_work_for_item, f"테이블 접근 실패")
+                    if event[0] == 'translation':
+                        _, translation_key, translated_text_content = event
+                        if translation_key[0] == 'text':
+                            job_data = translation_jobs[translation_key[1]]
+                            current_progress_text = self._apply_translated_text_job(
+                                job_data, translated_text_content, original_paragraph_styles_stage1, f_task_log,
+                                progress_callback_item_completed
+                            )
+                            outstanding_text_jobs -= 1
+                            if current_progress_text is not None and progress_callback_item_completed and not (stop_event and stop_event.is_set()):
+                                progress_callback_item_completed(job_data['context']['slide_idx'] + 1, "텍스트/표 적용",
+                                                                 job_data['char_count'] * config.WEIGHT_TEXT_CHAR, current_progress_text)
+                        else: # ('ocr', group_idx, segment_idx)
+                            _, group_idx, segment_idx = translation_key
+                            picture_state = picture_states[group_idx]
+                            picture_state['translations'][segment_idx] = translated_text_content
+                            picture_state['remaining'] -= 1
+                            if picture_state['remaining'] == 0:
+                                self._finish_picture_group(prs, picture_groups[group_idx], picture_state['segments'],
+                                                           picture_state['translations'], ocr_handler, font_code_for_render,
+                                                           f_task_log, stop_event, progress_callback_item_completed)
+                                del picture_states[group_idx]
+                                outstanding_pictures -= 1
+
+                    elif event[0] == 'ocr':
+                        _, group_idx, ocr_results_list = event
+                        picture_group = picture_groups[group_idx]
+                        segments = self._collect_ocr_segments(picture_group, ocr_results_list, f_task_log)
+                        if not segments:
+                            self._finish_picture_group(prs, picture_group, [], [], ocr_handler, font_code_for_render,
+                                                       f_task_log, stop_event, progress_callback_item_completed)
+                            outstanding_pictures -= 1
                             continue
-                
-                if text_frame_for_processing and job_data['char_count'] > 0:
-                    # 스타일 저장 로직 (기존과 유사하게, 하지만 반복적으로 호출되지 않도록 주의)
-                    style_unique_key = context['style_unique_key']
-                    if style_unique_key not in original_paragraph_styles_stage1:
-                        para_styles_collected: List[Dict[str, Any]] = []
-                        # ... (기존 스타일 수집 로직과 동일하게 original_paragraph_styles_stage1[style_unique_key] 채우기) ...
-                        # 이 부분은 최초 수집 단계에서 한 번만 실행되도록 로직 변경이 필요할 수 있음.
-                        # 여기서는 job 생성 시 스타일 키를 만들고, 적용 시 해당 키로 스타일을 가져온다고 가정.
-                        # 만약 스타일 수집이 여기서 처음이라면, 아래처럼 진행:
-                        for para_obj in text_frame_for_processing.paragraphs:
-                            para_default_font_style = self._get_style_properties(para_obj.font)
-                            runs_info: List[Dict[str, Any]] = []
-                            if para_obj.runs:
-                                for run_obj in para_obj.runs:
-                                    runs_info.append({'text': run_obj.text, 'style': self._get_text_style(run_obj)})
-                            elif para_obj.text and para_obj.text.strip():
-                                run_style_from_para = para_default_font_style.copy()
-                                run_style_from_para['hyperlink_address'] = None
-                                runs_info.append({'text': para_obj.text, 'style': run_style_from_para})
-                            
-                            para_styles_collected.append({
-                                'runs': runs_info, 'alignment': para_obj.alignment, 'level': para_obj.level,
-                                'space_before': para_obj.space_before, 'space_after': para_obj.space_after,
-                                'line_spacing': para_obj.line_spacing,
-                                'paragraph_default_run_style': para_default_font_style
-                            })
-                        original_paragraph_styles_stage1[style_unique_key] = para_styles_collected
-                        f_task_log.write(f"      '{item_name_log}'의 원본 단락 스타일 저장 (1단계 적용 시점).\n")
-
-
-                    translated_text_content = translated_texts_batch[translated_text_idx] if translated_text_idx < len(translated_texts_batch) else job_data['original_text']
-                    translated_text_idx +=1
-                    current_progress_text = translated_text_content[:30].replace('\n',' ')
-
-                    log_trans_text_snippet = translated_text_content.replace('\n', ' / ').strip()[:100]
-                    f_task_log.write(f"    [1단계 적용 전] \"{job_data['original_text'].strip()[:50]}...\" -> [1단계 적용 후] \"{log_trans_text_snippet}...\"\n")
-
-                    if "오류:" not in translated_text_content and translated_text_content.strip():
-                        stored_paras_info_apply = original_paragraph_styles_stage1.get(style_unique_key, [])
-                        # ... (기존 텍스트 프레임에 번역된 텍스트와 스타일 적용하는 로직과 동일하게 진행) ...
-                        # 예: text_frame_for_processing.clear(), add_paragraph(), add_run(), 스타일 적용 등
-                        original_tf_auto_sz = getattr(text_frame_for_processing, 'auto_size', None)
-                        original_tf_word_wrp = getattr(text_frame_for_processing, 'word_wrap', None)
-                        original_tf_v_anchor = getattr(text_frame_for_processing, 'vertical_anchor', None)
-                        original_tf_margins = {
-                            'left': getattr(text_frame_for_processing, 'margin_left', None),
-                            'right': getattr(text_frame_for_processing, 'margin_right', None),
-                            'top': getattr(text_frame_for_processing, 'margin_top', None),
-                            'bottom': getattr(text_frame_for_processing, 'margin_bottom', None),
+                        picture_states[group_idx] = {
+                            'segments': segments, 'translations': [""] * len(segments), 'remaining': len(segments)
                         }
-
-                        if original_tf_auto_sz is not None and original_tf_auto_sz != MSO_AUTO_SIZE.NONE:
-                            try: text_frame_for_processing.auto_size = MSO_AUTO_SIZE.NONE
-                            except Exception as e_auto_sz: logger.debug(f"auto_size=NONE 설정 중 예외 (무시): {e_auto_sz}")
-                        if original_tf_word_wrp is not None:
-                            try: text_frame_for_processing.word_wrap = True
-                            except Exception as e_ww: logger.debug(f"word_wrap=True 설정 중 예외 (무시): {e_ww}")
-
-
-                        text_frame_for_processing.clear()
-                        if hasattr(text_frame_for_processing, '_element') and text_frame_for_processing._element is not None:
-                            txBody_xml = text_frame_for_processing._element
-                            p_tags_to_remove = [child for child in txBody_xml if child.tag.endswith('}p')]
-                            if p_tags_to_remove:
-                                for p_xml_tag in p_tags_to_remove: txBody_xml.remove(p_xml_tag)
-                        
-                        lines_from_translation = translated_text_content.splitlines()
-                        if not lines_from_translation and translated_text_content:
-                            lines_from_translation = [translated_text_content]
-                        elif not lines_from_translation:
-                            lines_from_translation = [" "]
-
-                        for line_idx, line_txt in enumerate(lines_from_translation):
-                            new_para = text_frame_for_processing.add_paragraph()
-                            para_style_template = stored_paras_info_apply[min(line_idx, len(stored_paras_info_apply)-1)] if stored_paras_info_apply else {}
-                            
-                            if para_style_template.get('alignment') is not None: new_para.alignment = para_style_template['alignment']
-                            else: new_para.alignment = PP_ALIGN.LEFT
-
-                            new_para.level = para_style_template.get('level', 0)
-                            if para_style_template.get('space_before') is not None: new_para.space_before = para_style_template['space_before']
-                            if para_style_template.get('space_after') is not None: new_para.space_after = para_style_template['space_after']
-                            if para_style_template.get('line_spacing') is not None: new_para.line_spacing = para_style_template['line_spacing']
-                            
-                            if 'paragraph_default_run_style' in para_style_template:
-                                self._apply_style_properties(new_para.font, para_style_template['paragraph_default_run_style'])
-
-                            new_run = new_para.add_run()
-                            new_run.text = line_txt if line_txt.strip() else " "
-                            if not new_run.text.strip() and new_run.text != " ": new_run.text = " "
-
-                            run_style_to_apply = {}
-                            if para_style_template.get('runs') and para_style_template['runs']:
-                                run_style_to_apply = para_style_template['runs'][0]['style']
-                            elif 'paragraph_default_run_style' in para_style_template:
-                                run_style_to_apply = para_style_template['paragraph_default_run_style'].copy()
-                                run_style_to_apply['hyperlink_address'] = None
-
-                            if run_style_to_apply:
-                                self._apply_text_style(new_run, run_style_to_apply)
-                        
-                        if original_tf_auto_sz is not None:
-                            try: text_frame_for_processing.auto_size = original_tf_auto_sz
-                            except Exception as e_auto_sz2: logger.debug(f"auto_size 복원 중 예외 (무시): {e_auto_sz2}")
-                        if original_tf_word_wrp is not None:
-                            try: text_frame_for_processing.word_wrap = original_tf_word_wrp
-                            except Exception as e_ww2: logger.debug(f"word_wrap 복원 중 예외 (무시): {e_ww2}")
-
-                        if original_tf_v_anchor is not None:
-                            try: text_frame_for_processing.vertical_anchor = original_tf_v_anchor
-                            except Exception as e_va: logger.debug(f"vertical_anchor 복원 중 예외 (무시): {e_va}")
-                        for margin_prop, val in original_tf_margins.items():
-                            if val is not None:
-                                try: setattr(text_frame_for_processing, f"margin_{margin_prop}", val)
-                                except Exception as e_margin: logger.debug(f"margin_{margin_prop} 복원 중 예외 (무시): {e_margin}")
-
-                        f_task_log.write(f"        '{item_name_log}' 1단계 번역된 텍스트 적용 완료.\n")
-                    else:
-                        f_task_log.write(f"      -> 1단계 텍스트 번역 실패 또는 빈 결과: {translated_text_content}\n")
-                
-                elif job_data['char_count'] == 0 and item_type_internal in ['text_shape', 'table_cell']: # 번역 스킵 대상
-                     f_task_log.write(f"      [1단계 스킵됨 - 번역 불필요 또는 의미 없는 텍스트]\n")
-                     # weighted_work_for_item 은 이미 0으로 설정되었을 것임 (job 생성 시 char_count 기반)
-                
-                if progress_callback_item_completed and not (stop_event and stop_event.is_set()):
-                    progress_callback_item_completed(slide_idx + 1, "텍스트/표 적용", weighted_work_for_item, current_progress_text)
-                f_task_log.write("\n")
-
-            # 4단계: OCR 작업 처리 (이미지 번역 및 교체)
-            # OCR 작업은 텍스트 번역과 분리하여 처리하거나, 또는 모든 텍스트(일반+OCR)를 한 번에 모아서 배치 번역할 수도 있음.
-            # 여기서는 텍스트 번역 후 순차적으로 OCR 처리 (OCR 결과도 배치 번역에 포함시키려면 구조 변경 필요)
-            if image_translation_enabled and ocr_handler:
-                for slide_idx, slide in enumerate(prs.slides):
-                    if stop_event and stop_event.is_set(): break
-                    # 이미지 shape만 다시 찾아서 처리 (순서 문제 및 객체 참조 문제 피하기 위해)
-                    # 주의: shapes 리스트는 add_picture 등으로 변경될 수 있으므로, 복사본을 사용하거나 인덱스 대신 shape_id 등으로 식별 필요
-                    
-                    # shapes 리스트는 반복 중 수정될 수 있으므로, 처리할 shape 목록을 미리 만듦
-                    shapes_to_process_for_ocr = [s for s in slide.shapes if s.shape_type == MSO_SHAPE_TYPE.PICTURE]
-
-                    for shape_obj_ocr in shapes_to_process_for_ocr: # 미리 만들어둔 리스트 사용
-                        if stop_event and stop_event.is_set(): break
-                        
-                        shape_id_ocr = getattr(shape_obj_ocr, 'shape_id', f"slide{slide_idx}_shape_ocr_{id(shape_obj_ocr)}")
-                        item_name_ocr = shape_obj_ocr.name or f"S{slide_idx+1}_ImgOCR_Id{shape_id_ocr}"
-                        
-                        f_task_log.write(f"  [1단계 S{slide_idx+1}] OCR 처리 시도: '{item_name_ocr}'\n")
-                        weighted_work_for_ocr_item = config.WEIGHT_IMAGE
-                        current_ocr_progress_text = "[이미지 OCR 처리 중]"
-
-                        try:
-                            img_bytes_io = io.BytesIO(shape_obj_ocr.image.blob)
-                            with Image.open(img_bytes_io) as img_pil_original_ocr:
-                                img_pil_rgb_ocr = img_pil_original_ocr.convert("RGB")
-                                ocr_results_list = ocr_handler.ocr_image(img_pil_rgb_ocr)
-                                
-                                if ocr_results_list:
-                                    f_task_log.write(f"        이미지 내 OCR 텍스트 {len(ocr_results_list)}개 블록 발견.\n")
-                                    
-                                    ocr_texts_to_translate_current_image = []
-                                    ocr_job_contexts_current_image = []
-
-                                    for ocr_res_item in ocr_results_list:
-                                        if not (isinstance(ocr_res_item, (list, tuple)) and len(ocr_res_item) >= 2): continue
-                                        ocr_box_coords, ocr_text_conf_pair = ocr_res_item[0], ocr_res_item[1]
-                                        ocr_angle_info = ocr_res_item[2] if len(ocr_res_item) > 2 else None
-                                        if not (isinstance(ocr_text_conf_pair, (list, tuple)) and len(ocr_text_conf_pair) == 2): continue
-                                        ocr_text_original, ocr_confidence = ocr_text_conf_pair
-                                        
-                                        if is_ocr_text_valid(ocr_text_original) and not should_skip_translation(ocr_text_original):
-                                            ocr_texts_to_translate_current_image.append(ocr_text_original)
-                                            ocr_job_contexts_current_image.append({
-                                                'box': ocr_box_coords, 'original_text': ocr_text_original, 
-                                                'angle': ocr_angle_info, 'confidence': ocr_confidence
-                                            })
-                                        else:
-                                            f_task_log.write(f"          OCR Text 스킵됨 (유효성/번역 불필요): \"{ocr_text_original.strip()[:30]}...\"\n")
-
-                                    if ocr_texts_to_translate_current_image:
-                                        f_task_log.write(f"        이미지 내 유효 OCR 텍스트 {len(ocr_texts_to_translate_current_image)}개 배치 번역 시작...\n")
-                                        translated_ocr_texts_batch = translator.translate_texts_batch(
-                                            ocr_texts_to_translate_current_image, src_lang_ui_name, tgt_lang_ui_name,
-                                            model_name, ollama_service, is_ocr_text=True, ocr_temperature=ocr_temperature,
-                                            stop_event=stop_event
-                                        )
-                                        f_task_log.write(f"        이미지 내 OCR 텍스트 배치 번역 완료. 결과 {len(translated_ocr_texts_batch)}개 받음.\n")
-
-                                        if len(ocr_texts_to_translate_current_image) == len(translated_ocr_texts_batch):
-                                            img_bytes_io.seek(0) # 이미지 재사용 위해 포인터 초기화
-                                            with Image.open(img_bytes_io) as img_to_render_on_base:
-                                                original_img_format = img_to_render_on_base.format
-                                                edited_img_pil = img_to_render_on_base.copy()
-                                                any_ocr_text_rendered = False
-
-                                                for i, translated_ocr_text_val in enumerate(translated_ocr_texts_batch):
-                                                    if stop_event and stop_event.is_set(): break
-                                                    ocr_job_ctx = ocr_job_contexts_current_image[i]
-                                                    current_ocr_progress_text = translated_ocr_text_val[:20].replace('\n',' ')
-
-                                                    f_task_log.write(f"          OCR Text [{i+1}]: \"{ocr_job_ctx['original_text'].strip()[:30]}...\" -> 번역: \"{translated_ocr_text_val.strip()[:30]}...\"\n")
-                                                    if "오류:" not in translated_ocr_text_val and translated_ocr_text_val.strip():
-                                                        try:
-                                                            edited_img_pil = ocr_handler.render_translated_text_on_image(
-                                                                edited_img_pil, ocr_job_ctx['box'], translated_ocr_text_val,
-                                                                font_code_for_render=font_code_for_render,
-                                                                original_text=ocr_job_ctx['original_text'], ocr_angle=ocr_job_ctx['angle']
-                                                            )
-                                                            any_ocr_text_rendered = True
-                                                            f_task_log.write(f"              -> 렌더링 완료.\n")
-                                                        except Exception as e_render:
-                                                            f_task_log.write(f"              오류: OCR 텍스트 렌더링 실패: {e_render}\n")
-                                                            logger.error(f"OCR 텍스트 렌더링 실패 ('{item_name_ocr}'): {e_render}", exc_info=True)
-                                                    else:
-                                                        f_task_log.write(f"            -> 번역 실패 또는 빈 결과로 렌더링 안 함.\n")
-                                                
-                                                if stop_event and stop_event.is_set(): break # OCR 블록 루프 중단 시
-                                                
-                                                if any_ocr_text_rendered:
-                                                    output_img_stream = io.BytesIO()
-                                                    save_format_ocr_img = original_img_format if original_img_format and original_img_format.upper() in ['JPEG', 'PNG', 'GIF', 'BMP', 'TIFF'] else 'PNG'
-                                                    edited_img_pil.save(output_img_stream, format=save_format_ocr_img)
-                                                    output_img_stream.seek(0)
-
-                                                    left, top, width, height = shape_obj_ocr.left, shape_obj_ocr.top, shape_obj_ocr.width, shape_obj_ocr.height
-                                                    name_orig_img = shape_obj_ocr.name
-                                                    
-                                                    sp_xml_elem = shape_obj_ocr.element
-                                                    parent_xml_elem = sp_xml_elem.getparent()
-                                                    if parent_xml_elem is not None:
-                                                        parent_xml_elem.remove(sp_xml_elem)
-                                                        new_pic_shape = prs.slides[slide_idx].shapes.add_picture(
-                                                            output_img_stream, left, top, width=width, height=height
-                                                        )
-                                                        if name_orig_img: new_pic_shape.name = name_orig_img
-                                                        f_task_log.write(f"        이미지 '{item_name_ocr}' 성공적으로 교체됨.\n")
-                                                    else:
-                                                        f_task_log.write(f"        경고: 이미지 '{item_name_ocr}'의 부모 XML 요소 찾지 못해 교체 실패. 원본 유지.\n")
-                                                else:
-                                                     f_task_log.write(f"        이미지 '{item_name_ocr}'에 번역 및 렌더링된 텍스트가 없어 변경 없음.\n")
-                                        else: # 배치 번역 결과 개수 불일치
-                                             f_task_log.write(f"        경고: 이미지 '{item_name_ocr}'의 OCR 텍스트 수와 번역 결과 수 불일치. 이미지 변경 없음.\n")
-                                    else: # 번역할 OCR 텍스트 없음
-                                        f_task_log.write(f"        이미지 '{item_name_ocr}' 내 번역 대상 유효 OCR 텍스트 없음.\n")
-                                else: # OCR 결과 없음
-                                    f_task_log.write(f"        이미지 '{item_name_ocr}' 내에서 OCR 텍스트 발견되지 않음.\n")
-                        
-                        except Exception as e_ocr_general_img:
-                            err_msg_ocr_gen = f"      오류 (1단계 OCR 처리): '{item_name_ocr}' 이미지 처리 중 예기치 않은 오류: {e_ocr_general_img}. 건너뜀.\n"
-                            f_task_log.write(err_msg_ocr_gen)
-                            logger.error(f"Unexpected error processing image OCR for '{item_name_ocr}': {e_ocr_general_img}", exc_info=True)
-                        
-                        if progress_callback_item_completed and not (stop_event and stop_event.is_set()):
-                            progress_callback_item_completed(slide_idx + 1, "이미지 OCR 완료", weighted_work_for_ocr_item, current_ocr_progress_text)
-                        f_task_log.write("\n")
-
+                        f_task_log.write(f"        이미지 '{picture_group['name']}' 내 유효 OCR 텍스트 {len(segments)}개 번역 요청 제출.\n")
+                        for segment_idx, segment in enumerate(segments):
+                            translation_queue.submit(('ocr', group_idx, segment_idx), segment['original_text'], is_ocr_text=True)
+            finally:
+                if cpu_resource_manager is not None: cpu_resource_manager.stop()
+                if ocr_pool is not None and ocr_enabled_for_stage1:
+                    ocr_pool.cancel() # 중단 시 남은 OCR 작업/결과가 다음 실행으로 넘어가지 않도록 버림
+                translation_queue.shutdown()
+                if translation_queue.submitted_count:
+                    f_task_log.write(f"번역 대기열: 요청 {translation_queue.submitted_count}건 중 중복 제외 {translation_queue.request_count}건 번역 요청.\n")
 
             if stop_event and stop_event.is_set():
                 f_task_log.write(f"--- 1단계: 차트 외 요소 번역 중단됨 ---\n")
                 return False
 
             f_task_log.write(f"--- 1단계: 차트 외 요소 번역 완료 ---\n\n")
-            return True
\ No newline at end of file
+            return True
+
+    def _apply_translated_text_job(self, job_data: TranslationJob, translated_text_content: str,
+                                   original_paragraph_styles_stage1: Dict[Tuple[int, Any, Any], List[Dict[str, Any]]],
+                                   f_task_log,
+                                   progress_callback_item_completed: Optional[Callable[[Any, str, int, str], None]] = None) -> Optional[str]:
+        """번역된 텍스트를 원래 텍스트 프레임(텍스트 상자/표 셀)에 스타일을 유지하며 적용합니다. 진행 표시용 텍스트를 반환합니다."""
+        from pptx.enum.text import MSO_AUTO_SIZE, PP_ALIGN
+        context = job_data['context']
+        slide_idx = context['slide_idx']
+        item_name_log = context['name']
+        item_type_internal = context['item_type_internal']
+        shape_id_log = context['shape_id_log']
+
+        current_progress_text = job_data['original_text'][:30]
+        weighted_work_for_item = job_data['char_count'] * config.WEIGHT_TEXT_CHAR
+
+        f_task_log.write(f"  [1단계 S{slide_idx+1}] 적용 시작: '{item_name_log}' (ID: {shape_id_log}), 타입: {item_type_internal}\n")
+
+        text_frame_for_processing: Optional[Any] = None
+        if item_type_internal == 'text_shape':
+            shape_obj = context.get('shape_obj_ref')
+            if shape_obj and shape_obj.has_text_frame:
+                text_frame_for_processing = shape_obj.text_frame
+        elif item_type_internal == 'table_cell':
+            table_shape_obj = context.get('table_shape_obj_ref')
+            row_idx, col_idx = context['row_idx'], context['col_idx']
+            if table_shape_obj and table_shape_obj.has_table:
+                try:
+                    text_frame_for_processing = table_shape_obj.table.cell(row_idx, col_idx).text_frame
+                except IndexError:
+                    err_msg_tbl_idx = f"1단계 테이블 셀 접근 오류 (IndexError): {item_name_log} at R{row_idx}C{col_idx}"
+                    logger.error(err_msg_tbl_idx)
+                    f_task_log.write(f"    오류: {err_msg_tbl_idx}. 건너뜀.\n")
+                    if progress_callback_item_completed:
+                        progress_callback_item_completed(slide_idx + 1, "오류", weighted_work_for_item, f"테이블 접근 실패")
+                    return None
+
+        if text_frame_for_processing and job_data['char_count'] > 0:
+            # 스타일은 텍스트를 지우기 직전(최초 적용 시점)에 한 번만 수집
+            style_unique_key = context['style_unique_key']
+            if style_unique_key not in original_paragraph_styles_stage1:
+                para_styles_collected: List[Dict[str, Any]] = []
+                for para_obj in text_frame_for_processing.paragraphs:
+                    para_default_font_style = self._get_style_properties(para_obj.font)
+                    runs_info: List[Dict[str, Any]] = []
+                    if para_obj.runs:
+                        for run_obj in para_obj.runs:
+                            runs_info.append({'text': run_obj.text, 'style': self._get_text_style(run_obj)})
+                    elif para_obj.text and para_obj.text.strip():
+                        run_style_from_para = para_default_font_style.copy()
+                        run_style_from_para['hyperlink_address'] = None
+                        runs_info.append({'text': para_obj.text, 'style': run_style_from_para})
+
+                    para_styles_collected.append({
+                        'runs': runs_info, 'alignment': para_obj.alignment, 'level': para_obj.level,
+                        'space_before': para_obj.space_before, 'space_after': para_obj.space_after,
+                        'line_spacing': para_obj.line_spacing,
+                        'paragraph_default_run_style': para_default_font_style
+                    })
+                original_paragraph_styles_stage1[style_unique_key] = para_styles_collected
+                f_task_log.write(f"      '{item_name_log}'의 원본 단락 스타일 저장 (1단계 적용 시점).\n")
+
+            current_progress_text = translated_text_content[:30].replace('\n',' ')
+
+            log_trans_text_snippet = translated_text_content.replace('\n', ' / ').strip()[:100]
+            f_task_log.write(f"    [1단계 적용 전] \"{job_data['original_text'].strip()[:50]}...\" -> [1단계 적용 후] \"{log_trans_text_snippet}...\"\n")
+
+            if "오류:" not in translated_text_content and translated_text_content.strip():
+                stored_paras_info_apply = original_paragraph_styles_stage1.get(style_unique_key, [])
+                original_tf_auto_sz = getattr(text_frame_for_processing, 'auto_size', None)
+                original_tf_word_wrp = getattr(text_frame_for_processing, 'word_wrap', None)
+                original_tf_v_anchor = getattr(text_frame_for_processing, 'vertical_anchor', None)
+                original_tf_margins = {
+                    'left': getattr(text_frame_for_processing, 'margin_left', None),
+                    'right': getattr(text_frame_for_processing, 'margin_right', None),
+                    'top': getattr(text_frame_for_processing, 'margin_top', None),
+                    'bottom': getattr(text_frame_for_processing, 'margin_bottom', None),
+                }
+
+                if original_tf_auto_sz is not None and original_tf_auto_sz != MSO_AUTO_SIZE.NONE:
+                    try: text_frame_for_processing.auto_size = MSO_AUTO_SIZE.NONE
+                    except Exception as e_auto_sz: logger.debug(f"auto_size=NONE 설정 중 예외 (무시): {e_auto_sz}")
+                if original_tf_word_wrp is not None:
+                    try: text_frame_for_processing.word_wrap = True
+                    except Exception as e_ww: logger.debug(f"word_wrap=True 설정 중 예외 (무시): {e_ww}")
+
+
+                text_frame_for_processing.clear()
+                if hasattr(text_frame_for_processing, '_element') and text_frame_for_processing._element is not None:
+                    txBody_xml = text_frame_for_processing._element
+                    p_tags_to_remove = [child for child in txBody_xml if child.tag.endswith('}p')]
+                    if p_tags_to_remove:
+                        for p_xml_tag in p_tags_to_remove: txBody_xml.remove(p_xml_tag)
+
+                lines_from_translation = translated_text_content.splitlines()
+                if not lines_from_translation and translated_text_content:
+                    lines_from_translation = [translated_text_content]
+                elif not lines_from_translation:
+                    lines_from_translation = [" "]
+
+                for line_idx, line_txt in enumerate(lines_from_translation):
+                    new_para = text_frame_for_processing.add_paragraph()
+                    para_style_template = stored_paras_info_apply[min(line_idx, len(stored_paras_info_apply)-1)] if stored_paras_info_apply else {}
+
+                    if para_style_template.get('alignment') is not None: new_para.alignment = para_style_template['alignment']
+                    else: new_para.alignment = PP_ALIGN.LEFT
+
+                    new_para.level = para_style_template.get('level', 0)
+                    if para_style_template.get('space_before') is not None: new_para.space_before = para_style_template['space_before']
+                    if para_style_template.get('space_after') is not None: new_para.space_after = para_style_template['space_after']
+                    if para_style_template.get('line_spacing') is not None: new_para.line_spacing = para_style_template['line_spacing']
+
+                    if 'paragraph_default_run_style' in para_style_template:
+                        self._apply_style_properties(new_para.font, para_style_template['paragraph_default_run_style'])
+
+                    new_run = new_para.add_run()
+                    new_run.text = line_txt if line_txt.strip() else " "
+                    if not new_run.text.strip() and new_run.text != " ": new_run.text = " "
+
+                    run_style_to_apply = {}
+                    if para_style_template.get('runs') and para_style_template['runs']:
+                        run_style_to_apply = para_style_template['runs'][0]['style']
+                    elif 'paragraph_default_run_style' in para_style_template:
+                        run_style_to_apply = para_style_template['paragraph_default_run_style'].copy()
+                        run_style_to_apply['hyperlink_address'] = None
+
+                    if run_style_to_apply:
+                        self._apply_text_style(new_run, run_style_to_apply)
+
+                if original_tf_auto_sz is not None:
+                    try: text_frame_for_processing.auto_size = original_tf_auto_sz
+                    except Exception as e_auto_sz2: logger.debug(f"auto_size 복원 중 예외 (무시): {e_auto_sz2}")
+                if original_tf_word_wrp is not None:
+                    try: text_frame_for_processing.word_wrap = original_tf_word_wrp
+                    except Exception as e_ww2: logger.debug(f"word_wrap 복원 중 예외 (무시): {e_ww2}")
+
+                if original_tf_v_anchor is not None:
+                    try: text_frame_for_processing.vertical_anchor = original_tf_v_anchor
+                    except Exception as e_va: logger.debug(f"vertical_anchor 복원 중 예외 (무시): {e_va}")
+                for margin_prop, val in original_tf_margins.items():
+                    if val is not None:
+                        try: setattr(text_frame_for_processing, f"margin_{margin_prop}", val)
+                        except Exception as e_margin: logger.debug(f"margin_{margin_prop} 복원 중 예외 (무시): {e_margin}")
+
+                f_task_log.write(f"        '{item_name_log}' 1단계 번역된 텍스트 적용 완료.\n")
+            else:
+                f_task_log.write(f"      -> 1단계 텍스트 번역 실패 또는 빈 결과: {translated_text_content}\n")
+
+        elif job_data['char_count'] == 0 and item_type_internal in ['text_shape', 'table_cell']: # 번역 스킵 대상
+            f_task_log.write(f"      [1단계 스킵됨 - 번역 불필요 또는 의미 없는 텍스트]\n")
+
+        f_task_log.write("\n")
+        return current_progress_text
+
+    def _group_picture_jobs(self, picture_jobs: List[Dict[str, Any]], f_task_log) -> List[Dict[str, Any]]:
+        """
+        그림 작업을 이미지 SHA1 기준으로 묶습니다. 로고/템플릿 배경/반복 스크린샷처럼 같은 이미지를 참조하는 그림들은
+        한 그룹이 되어 OCR/번역/렌더링을 한 번만 수행하고, 결과 이미지를 모든 그림에 적용합니다.
+        이미지 바이트는 python-pptx 객체를 다른 스레드에서 건드리지 않도록 여기(호출 스레드)에서 미리 읽어 둡니다.
+        그룹마다 슬라이드 표시 크기 기준 OCR 해상도 계획(ocr_plan: 축소 비율, 유효 DPI, 생략 사유)도 여기서 정합니다.
+        """
+        picture_groups: List[Dict[str, Any]] = []
+        group_idx_by_sha1: Dict[str, int] = {}
+        for picture_job in picture_jobs:
+            try:
+                image_obj = picture_job['shape_obj_ref'].image
+                image_sha1, image_bytes = image_obj.sha1, image_obj.blob
+            except Exception as e_blob:
+                f_task_log.write(f"  [1단계 S{picture_job['slide_idx']+1}] 이미지 데이터 읽기 실패 '{picture_job['name']}': {e_blob}\n")
+                image_sha1, image_bytes, image_obj = None, None, None
+
+            if image_sha1 is not None and image_sha1 in group_idx_by_sha1:
+                picture_groups[group_idx_by_sha1[image_sha1]]['jobs'].append(picture_job)
+                continue
+            if image_sha1 is not None:
+                group_idx_by_sha1[image_sha1] = len(picture_groups)
+            try:
+                image_pixel_size = image_obj.size if image_obj is not None else None # 헤더만 읽음 (디코딩 없음)
+            except Exception:
+                image_pixel_size = None
+            picture_groups.append({
+                'sha1': image_sha1, 'image_bytes': image_bytes, 'image_size': image_pixel_size,
+                'name': picture_job['name'], 'slide_idx': picture_job['slide_idx'], 'jobs': [picture_job]
+            })
+
+        for picture_group in picture_groups:
+            display_specs = []
+            for picture_job in picture_group['jobs']:
+                shape = picture_job['shape_obj_ref']
+                try:
+                    display_specs.append(DisplaySpec(int(shape.width or 0), int(shape.height or 0),
+                                                     shape.crop_left, shape.crop_right, shape.crop_top, shape.crop_bottom))
+                except Exception:
+                    continue
+            picture_group['ocr_plan'] = plan_ocr_resolution(picture_group['image_size'], display_specs)
+            # 자르기(crop)된 그림은 보이는 영역만 OCR/렌더링 (숨겨진 부분의 텍스트는 번역하지 않음)
+            picture_group['visible_region'] = visible_region(picture_group['image_size'], display_specs)
+            if picture_group['visible_region'] is not None:
+                f_task_log.write(f"  [1단계 S{picture_group['slide_idx']+1}] 이미지 '{picture_group['name']}' 자르기 적용됨 -> 보이는 영역 {picture_group['visible_region']}만 OCR.\n")
+            if picture_group['ocr_plan'].scale < 1.0:
+                f_task_log.write(f"  [1단계 S{picture_group['slide_idx']+1}] 이미지 '{picture_group['name']}' 표시 해상도 {picture_group['ocr_plan'].effective_dpi:.0f} DPI -> OCR 입력 {picture_group['ocr_plan'].scale:.2f}배로 축소.\n")
+
+        shared_groups = [g for g in picture_groups if len(g['jobs']) > 1]
+        if shared_groups:
+            f_task_log.write(f"반복 사용된 이미지 {len(shared_groups)}개 발견 (그림 {sum(len(g['jobs']) for g in shared_groups)}개가 공유). 이미지당 한 번만 처리합니다.\n")
+        return picture_groups
+
+    def _start_picture_ocr(self, picture_groups: List[Dict[str, Any]], ocr_handler: 'BaseOcrHandler',
+                           ocr_pool: Optional['OcrProcessPool'], event_queue: "queue.Queue[Tuple[Any, ...]]",
+                           stop_event: Optional[Any], memory_governor: Optional['MemoryGovernor'] = None) -> threading.Thread:
+        """
+        고유 이미지 OCR을 보조 스레드에서 시작하고, 결과를 완료되는 순서대로 event_queue에 ('ocr', group_idx, ocr_results_list)로 넣습니다.
+        OCR 결과 캐시에 있는 이미지는 OCR 없이 캐시 결과를 바로 넣고, 새로 OCR한 결과는 캐시에 저장합니다.
+        memory_governor가 메모리 압박 상태이면 프로세스 내 OCR은 여유가 생길 때까지 기다렸다가 한 장씩 처리합니다 (워커 풀은 governor가 직접 멈춤).
+        """
+        from ocr_prefilter import likely_contains_text # cv2/numpy는 이미지 OCR을 실제로 할 때만 로드
+        ocr_cache = self.ocr_cache
+        engine_fingerprint = ocr_handler.get_cache_fingerprint() if ocr_cache is not None else None
+
+        def _cache_fingerprint(group_idx: int) -> str:
+            picture_group = picture_groups[group_idx]
+            return ocr_cache_fingerprint(engine_fingerprint, picture_group['ocr_plan'].scale, picture_group['visible_region'])
+
+        def _store_in_cache(group_idx: int, ocr_results_list: Optional[List[Any]]) -> None:
+            image_sha1 = picture_groups[group_idx]['sha1']
+            if ocr_cache is None or image_sha1 is None or ocr_results_list is None: return
+            ocr_cache.put_results(image_sha1, _cache_fingerprint(group_idx), ocr_results_list)
+
+        def _run_ocr_in_process(group_indices: List[int]) -> List[Optional[List[Any]]]:
+            # 여러 이미지를 ocr_images로 묶어 배치 추론 (이미지 없음/디코딩 실패/OCR 예외는 None)
+            results_by_group: Dict[int, List[Any]] = {}
+            decoded_images: Dict[int, Any] = {}
+            decode_factors: Dict[int, float] = {}
+            for group_idx in group_indices:
+                image_bytes = picture_groups[group_idx]['image_bytes']
+                if not image_bytes: continue
+                try:
+                    # 축소 OCR이면 JPEG는 draft로 축소 디코딩 (RGB 변환은 자른/축소한 입력에만)
+                    img_pil_original_ocr, decode_factors[group_idx] = open_for_ocr(image_bytes, picture_groups[group_idx]['ocr_plan'].scale)
+                    img_pil_original_ocr.load()
+                    decoded_images[group_idx] = img_pil_original_ocr
+                except Exception as e_decode:
+                    logger.error(f"OCR용 이미지 디코딩 실패 ('{picture_groups[group_idx]['name']}'): {e_decode}", exc_info=True)
+            decoded_indices = list(decoded_images)
+            if decoded_indices:
+                try:
+                    batch_results = ocr_images_at_scale(ocr_handler, [decoded_images[i] for i in decoded_indices],
+                                                        [picture_groups[i]['ocr_plan'].scale for i in decoded_indices],
+                                                        [picture_groups[i]['visible_region'] for i in decoded_indices],
+                                                        [decode_factors[i] for i in decoded_indices])
+                except Exception as e_ocr:
+                    logger.error(f"OCR 실패 (이미지 {len(decoded_indices)}개): {e_ocr}", exc_info=True)
+                    for decoded_image in decoded_images.values(): decoded_image.close()
+                    return [None] * len(group_indices)
+                for group_idx, ocr_results_list in zip(decoded_indices, batch_results):
+                    results_by_group[group_idx] = ocr_results_list or []
+                    if ocr_results_list and decode_factors[group_idx] == 1.0 and \
+                            (memory_governor is None or memory_governor.keep_decoded_images()):
+                        # 렌더링 단계에서 다시 디코딩하지 않도록 디코딩된 원본을 보관 (축소 디코딩했거나 메모리 압박 시에는 보관하지 않음)
+                        picture_groups[group_idx]['decoded_image'] = decoded_images[group_idx]
+                    else:
+                        decoded_images[group_idx].close()
+            return [results_by_group.get(group_idx) for group_idx in group_indices]
+
+        reported_indices = set() # 'ocr' 이벤트를 이미 보낸 그룹 (이벤트 루프는 그룹마다 정확히 하나를 기다림)
+
+        def _report(group_idx: int, ocr_results_list: List[Any]) -> None:
+            reported_indices.add(group_idx)
+            event_queue.put(('ocr', group_idx, ocr_results_list))
+
+        def _ocr_feeder_body():
+            pending_indices: List[int] = []
+            for group_idx, picture_group in enumerate(picture_groups):
+                if picture_group.get('render_cache_hit'): continue # 렌더링 캐시로 이미 교체된 이미지
+                if picture_group['ocr_plan'].skip_reason:
+                    picture_group['ocr_skip_reason'] = picture_group['ocr_plan'].skip_reason
+                    _report(group_idx, [])
+                    continue
+                cached_results = None
+                if ocr_cache is not None and picture_group['sha1'] is not None:
+                    cached_results = ocr_cache.get_results(picture_group['sha1'], _cache_fingerprint(group_idx))
+                if cached_results is not None:
+                    picture_group['ocr_cache_hit'] = True
+                    _report(group_idx, cached_results)
+                    continue
+                if config.OCR_PREFILTER_ENABLED and picture_group['image_bytes']:
+                    # 사진/아이콘/장식처럼 텍스트가 없어 보이는 이미지는 전체 OCR 생략. 이 판정도 캐시해 다음 실행에서는 검사도 생략
+                    use_prefilter_cache = ocr_cache is not None and picture_group['sha1'] is not None
+                    if use_prefilter_cache and ocr_cache.get_results(picture_group['sha1'], prefilter_cache_fingerprint(engine_fingerprint)) is not None:
+                        picture_group['ocr_cache_hit'] = True
+                        picture_group['ocr_skip_reason'] = "사전 검사: 텍스트 없음"
+                        _report(group_idx, [])
+                        continue
+                    has_text, prefilter_reason = likely_contains_text(picture_group['image_bytes'], ocr_handler)
+                    if not has_text:
+                        if use_prefilter_cache:
+                            ocr_cache.put_results(picture_group['sha1'], prefilter_cache_fingerprint(engine_fingerprint), [])
+                        picture_group['ocr_skip_reason'] = f"사전 검사: {prefilter_reason}"
+                        _report(group_idx, [])
+                        continue
+                pending_indices.append(group_idx)
+
+            if ocr_pool is None or ocr_pool.broken:
+                batch_size = max(1, int(config.OCR_BATCH_SIZE))
+                batch_start = 0
+                while batch_start < len(pending_indices):
+                    if stop_event and stop_event.is_set(): return
+                    current_batch_size = batch_size
+                    if memory_governor is not None:
+                        memory_governor.wait_for_headroom(stop_event)
+                        if memory_governor.under_pressure: current_batch_size = 1
+                    batch_indices = pending_indices[batch_start:batch_start + current_batch_size]
+                    batch_start += len(batch_indices)
+                    for group_idx, ocr_results_list in zip(batch_indices, _run_ocr_in_process(batch_indices)):
+                        _store_in_cache(group_idx, ocr_results_list)
+                        _report(group_idx, ocr_results_list or [])
+                return
+
+            run_id = ocr_pool.begin_run() # 이전(중단된) 실행의 결과가 섞이지 않도록 이번 실행의 작업/결과에만 같은 ID 사용
+            submitted_count = 0
+            for group_idx in pending_indices:
+                picture_group = picture_groups[group_idx]
+                if picture_group['image_bytes']:
+                    ocr_pool.submit(group_idx, picture_group['image_bytes'], picture_group['ocr_plan'].scale,
+                                    picture_group['visible_region'], run_id=run_id)
+                    submitted_count += 1
+                else:
+                    _report(group_idx, [])
+            for group_idx, ocr_results_list, ocr_error in ocr_pool.iter_results(submitted_count, stop_event, run_id=run_id):
+                if ocr_error:
+                    logger.warning(f"OCR 워커 처리 실패 ('{picture_groups[group_idx]['name']}'): {ocr_error}")
+                    # 워커 엔진 자체를 쓸 수 없는 경우에만 현재 프로세스에서 다시 시도 (워커 비정상 종료 이미지는 건너뜀)
+                    ocr_results_list = _run_ocr_in_process([group_idx])[0] if ocr_pool.broken else None
+                _store_in_cache(group_idx, ocr_results_list)
+                _report(group_idx, ocr_results_list or [])
+
+        def _ocr_feeder():
+            try:
+                _ocr_feeder_body()
+            except Exception as e_feeder:
+                # 스레드가 조용히 죽으면 이벤트 루프가 남은 'ocr' 이벤트를 영원히 기다리므로, 남은 그룹은 OCR 결과 없음으로 처리
+                logger.error(f"이미지 OCR 처리 스레드 오류: {e_feeder}", exc_info=True)
+                for group_idx, picture_group in enumerate(picture_groups):
+                    if group_idx in reported_indices or picture_group.get('render_cache_hit'): continue
+                    picture_group.setdefault('ocr_skip_reason', f"OCR 처리 오류: {e_feeder}")
+                    _report(group_idx, [])
+
+        ocr_thread = threading.Thread(target=_ocr_feeder, name="Stage1OcrFeeder", daemon=True)
+        ocr_thread.start()
+        return ocr_thread
+
+    @staticmethod
+    def _release_decoded_images(picture_groups: List[Dict[str, Any]]) -> int:
+        released_count = 0
+        for picture_group in picture_groups:
+            decoded_image = picture_group.pop('decoded_image', None)
+            if decoded_image is not None:
+                decoded_image.close()
+                released_count += 1
+        return released_count
+
+    def _collect_ocr_segments(self, picture_group: Dict[str, Any], ocr_results_list: List[Any], f_task_log) -> List[Dict[str, Any]]:
+        """OCR 결과에서 번역 대상이 되는 텍스트 블록만 골라 렌더링 컨텍스트 목록으로 반환합니다."""
+        item_name_ocr = picture_group['name']
+        ocr_source_note = ", OCR 캐시 사용" if picture_group.get('ocr_cache_hit') else ""
+        f_task_log.write(f"  [1단계 S{picture_group['slide_idx']+1}] OCR 완료: '{item_name_ocr}' (사용 그림 {len(picture_group['jobs'])}개{ocr_source_note})\n")
+        if picture_group.get('ocr_skip_reason'):
+            f_task_log.write(f"        이미지 '{item_name_ocr}' OCR 생략 ({picture_group['ocr_skip_reason']}).\n")
+            return []
+        # 슬라이드에 표시되는 크기로는 읽을 수 없는 작은 글자는 교체 대상에서 제외
+        ocr_results_list = filter_sub_legible_results(ocr_results_list, picture_group['ocr_plan'].px_per_point)
+        if not ocr_results_list:
+            f_task_log.write(f"        이미지 '{item_name_ocr}' 내에서 OCR 텍스트 발견되지 않음.\n")
+            return []
+        f_task_log.write(f"        이미지 내 OCR 텍스트 {len(ocr_results_list)}개 블록 발견.\n")
+        if config.OCR_MERGE_REGIONS:
+            # 조각 단위 박스를 줄/단락 영역으로 병합하여 영역별로 한 번씩 번역/렌더링
+            fragment_count = len(ocr_results_list)
+            ocr_results_list = merge_ocr_regions(ocr_results_list)
+            f_task_log.write(f"        OCR 조각 {fragment_count}개 -> 병합 영역 {len(ocr_results_list)}개.\n")
+
+        ocr_segments: List[Dict[str, Any]] = []
+        for ocr_res_item in ocr_results_list:
+            if not (isinstance(ocr_res_item, (list, tuple)) and len(ocr_res_item) >= 2): continue
+            ocr_box_coords, ocr_text_conf_pair = ocr_res_item[0], ocr_res_item[1]
+            ocr_angle_info = ocr_res_item[2] if len(ocr_res_item) > 2 else None
+            if not (isinstance(ocr_text_conf_pair, (list, tuple)) and len(ocr_text_conf_pair) == 2): continue
+            ocr_text_original, ocr_confidence = ocr_text_conf_pair
+
+            if is_ocr_text_valid(ocr_text_original) and not should_skip_translation(ocr_text_original):
+                ocr_segments.append({
+                    'box': ocr_box_coords, 'original_text': ocr_text_original,
+                    'angle': ocr_angle_info, 'confidence': ocr_confidence
+                })
+            else:
+                f_task_log.write(f"          OCR Text 스킵됨 (유효성/번역 불필요): \"{ocr_text_original.strip()[:30]}...\"\n")
+
+        if not ocr_segments:
+            f_task_log.write(f"        이미지 '{item_name_ocr}' 내 번역 대상 유효 OCR 텍스트 없음.\n")
+        return ocr_segments
+
+    def _finish_picture_group(self, prs: 'Presentation', picture_group: Dict[str, Any], ocr_segments: List[Dict[str, Any]],
+                              translated_texts: List[str], ocr_handler: 'BaseOcrHandler', font_code_for_render: str,
+                              f_task_log, stop_event: Optional[Any],
+                              progress_callback_item_completed: Optional[Callable[[Any, str, int, str], None]]) -> None:
+        """고유 이미지 하나를 렌더링하고, 그 이미지를 참조하는 모든 그림을 교체한 뒤 그림별 진행 상황을 보고합니다."""
+        current_ocr_progress_text = "[이미지 OCR 처리 중]"
+        rendered_image_stream: Optional[io.BytesIO] = None
+        if ocr_segments:
+            try:
+                rendered_image_stream, rendered_progress_text = self._render_picture_image(
+                    picture_group, ocr_segments, translated_texts, ocr_handler,
+                    font_code_for_render, f_task_log, stop_event
+                )
+                current_ocr_progress_text = rendered_progress_text or current_ocr_progress_text
+            except Exception as e_ocr_general_img:
+                err_msg_ocr_gen = f"      오류 (1단계 OCR 처리): '{picture_group['name']}' 이미지 처리 중 예기치 않은 오류: {e_ocr_general_img}. 건너뜀.\n"
+                f_task_log.write(err_msg_ocr_gen)
+                logger.error(f"Unexpected error processing image OCR for '{picture_group['name']}': {e_ocr_general_img}", exc_info=True)
+
+        # 번역 오류 없이 끝난 렌더링 결과만 캐시 (중단 시에는 저장하지 않음)
+        render_fingerprint = picture_group.get('render_fingerprint')
+        if (rendered_image_stream is not None and render_fingerprint is not None and self.render_cache is not None
+                and not any("오류:" in translated for translated in translated_texts) and not (stop_event and stop_event.is_set())):
+            self.render_cache.put_image(picture_group['sha1'], render_fingerprint, rendered_image_stream.getvalue())
+
+        self._apply_rendered_image(picture_group, rendered_image_stream, current_ocr_progress_text, f_task_log,
+                                   stop_event, progress_callback_item_completed)
+        decoded_image = picture_group.pop('decoded_image', None)
+        if decoded_image is not None: decoded_image.close()
+        f_task_log.write("\n")
+
+    def _apply_rendered_image(self, picture_group: Dict[str, Any], rendered_image_stream: Optional[io.BytesIO],
+                              current_ocr_progress_text: str, f_task_log, stop_event: Optional[Any],
+                              progress_callback_item_completed: Optional[Callable[[Any, str, int, str], None]]) -> None:
+        """렌더링된 이미지(None이면 원본 유지)를 그룹의 모든 그림에 적용하고 그림별 진행 상황을 보고합니다."""
+        for picture_job in picture_group['jobs']:
+            if rendered_image_stream is not None and not (stop_event and stop_event.is_set()):
+                try:
+                    rendered_image_stream.seek(0)
+                    self._replace_picture_shape(picture_job, rendered_image_stream, f_task_log)
+                except Exception as e_replace:
+                    f_task_log.write(f"      오류 (1단계 그림 교체): '{picture_job['name']}' 교체 실패: {e_replace}. 원본 유지.\n")
+                    logger.error(f"그림 교체 실패 ('{picture_job['name']}'): {e_replace}", exc_info=True)
+            if progress_callback_item_completed and not (stop_event and stop_event.is_set()):
+                progress_callback_item_completed(picture_job['slide_idx'] + 1, "이미지 OCR 완료", config.WEIGHT_IMAGE, current_ocr_progress_text)
+
+    def _get_render_fingerprint(self, ocr_handler: 'BaseOcrHandler', src_lang_ui_name: str, tgt_lang_ui_name: str,
+                                model_name: str, font_code_for_render: str, ocr_temperature: Optional[float]) -> str:
+        """렌더링 결과에 영향을 주는 입력(언어, 모델, 폰트 파일, OCR 엔진, 병합/렌더링 설정)을 하나의 지문으로 만듭니다."""
+        font_files = []
+        for is_bold in (False, True):
+            for font_path in ocr_handler.font_manager.resolve_font_paths(font_code_for_render, is_bold):
+                try:
+                    font_files.append(f"{os.path.basename(font_path)}:{os.path.getsize(font_path)}")
+                except OSError:
+                    font_files.append(os.path.basename(font_path))
+        render_settings = {name: getattr(config, name, None) for name in RENDER_CACHE_CONFIG_NAMES}
+        return RenderedImageCache.make_key(
+            src_lang_ui_name, tgt_lang_ui_name, model_name, ocr_temperature, font_code_for_render,
+            ocr_handler.get_cache_fingerprint(), sorted(font_files), sorted(render_settings.items())
+        )
+
+    def _apply_render_cache_hits(self, picture_groups: List[Dict[str, Any]], render_fingerprint: str, engine_fingerprint: str, f_task_log,
+                                 stop_event: Optional[Any],
+                                 progress_callback_item_completed: Optional[Callable[[Any, str, int, str], None]]) -> int:
+        """렌더링 캐시에 있는 고유 이미지를 캐시된 결과로 바로 교체합니다. 처리한 그룹 수를 반환합니다."""
+        hit_count = 0
+        for picture_group in picture_groups:
+            if stop_event and stop_event.is_set(): break
+            if picture_group['sha1'] is None: continue
+            # OCR 결과 캐시 지문(엔진, 축소 비율, 보이는 영역, 타일 설정)과 표시 해상도에 따라 결과가 달라지므로 그룹별 지문에 포함
+            ocr_plan = picture_group['ocr_plan']
+            picture_group['render_fingerprint'] = (f"{render_fingerprint}|{ocr_cache_fingerprint(engine_fingerprint, ocr_plan.scale, picture_group['visible_region'])}"
+                                                   f"|px_per_pt={round(ocr_plan.px_per_point or 0, 1)}")
+            cached_image_bytes = self.render_cache.get_image(picture_group['sha1'], picture_group['render_fingerprint'])
+            if cached_image_bytes is None: continue
+            picture_group['render_cache_hit'] = True
+            hit_count += 1
+            f_task_log.write(f"  [1단계 S{picture_group['slide_idx']+1}] 이미지 '{picture_group['name']}' 렌더링 캐시 사용 (사용 그림 {len(picture_group['jobs'])}개, OCR/번역 생략).\n")
+            self._apply_rendered_image(picture_group, io.BytesIO(cached_image_bytes), "[렌더링 캐시 사용]", f_task_log,
+                                       stop_event, progress_callback_item_completed)
+        if hit_count:
+            logger.info(f"렌더링 캐시 적중: 고유 이미지 {hit_count}/{len(picture_groups)}개")
+        return hit_count
+
+    def _render_picture_image(self, picture_group: Dict[str, Any], ocr_segments: List[Dict[str, Any]],
+                              translated_texts: List[str], ocr_handler: 'BaseOcrHandler', font_code_for_render: str,
+                              f_task_log, stop_event: Optional[Any]) -> Tuple[Optional[io.BytesIO], Optional[str]]:
+        """번역된 OCR 텍스트를 이미지에 렌더링합니다. (렌더링된 이미지 스트림 또는 None, 진행 표시용 텍스트)를 반환합니다."""
+        item_name_ocr = picture_group['name']
+        current_ocr_progress_text = None
+        f_task_log.write(f"  [1단계 S{picture_group['slide_idx']+1}] 이미지 '{item_name_ocr}' OCR 텍스트 {len(translated_texts)}개 번역 완료. 렌더링 시작.\n")
+
+        # 프로세스 내 OCR에서 디코딩한 원본이 있으면 재사용 (워커 풀 사용 시에는 여기서 한 번만 디코딩)
+        img_to_render_on_base = picture_group.pop('decoded_image', None)
+        if img_to_render_on_base is None:
+            from PIL import Image
+            img_to_render_on_base = Image.open(io.BytesIO(picture_group['image_bytes']))
+        try:
+            original_img_format = img_to_render_on_base.format
+            render_items = []
+            for i, translated_ocr_text_val in enumerate(translated_texts):
+                ocr_job_ctx = ocr_segments[i]
+                current_ocr_progress_text = translated_ocr_text_val[:20].replace('\n',' ')
+
+                f_task_log.write(f"          OCR Text [{i+1}]: \"{ocr_job_ctx['original_text'].strip()[:30]}...\" -> 번역: \"{translated_ocr_text_val.strip()[:30]}...\"\n")
+                if "오류:" not in translated_ocr_text_val and translated_ocr_text_val.strip():
+                    render_items.append((ocr_job_ctx['box'], translated_ocr_text_val, ocr_job_ctx['angle']))
+                else:
+                    f_task_log.write(f"            -> 번역 실패 또는 빈 결과로 렌더링 안 함.\n")
+
+            if stop_event and stop_event.is_set(): return None, current_ocr_progress_text
+
+            rendered_box_count = 0
+            if render_items:
+                try:
+                    # 모든 박스를 한 번에 렌더링 (이 이미지는 여기서만 쓰이므로 복사 없이 직접 그림)
+                    edited_img_pil, rendered_box_count = ocr_handler.render_translated_texts_on_image(
+                        img_to_render_on_base, render_items, font_code_for_render=font_code_for_render, in_place=True
+                    )
+                    f_task_log.write(f"              -> {rendered_box_count}/{len(render_items)}개 박스 렌더링 완료.\n")
+                except Exception as e_render:
+                    f_task_log.write(f"              오류: OCR 텍스트 렌더링 실패: {e_render}\n")
+                    logger.error(f"OCR 텍스트 렌더링 실패 ('{item_name_ocr}'): {e_render}", exc_info=True)
+
+            if not rendered_box_count:
+                f_task_log.write(f"        이미지 '{item_name_ocr}'에 번역 및 렌더링된 텍스트가 없어 변경 없음.\n")
+                return None, current_ocr_progress_text
+
+            output_img_stream = io.BytesIO()
+            save_format_ocr_img = original_img_format if original_img_format and original_img_format.upper() in ['JPEG', 'PNG', 'GIF', 'BMP', 'TIFF'] else 'PNG'
+            edited_img_pil.save(output_img_stream, format=save_format_ocr_img)
+            output_img_stream.seek(0)
+        finally:
+            img_to_render_on_base.close()
+        return output_img_stream, current_ocr_progress_text
+
+    def _replace_picture_shape(self, picture_job: Dict[str, Any], image_stream: io.BytesIO, f_task_log) -> None:
+        """
+        그림 도형의 이미지를 렌더링된 이미지로 교체합니다.
+        도형 XML은 그대로 두고 a:blip의 r:embed만 새 이미지 파트로 바꾸므로 z-order, 자르기(crop), 효과, 이름이 유지됩니다.
+        python-pptx는 같은 SHA1의 이미지 파트를 재사용하므로, 같은 그룹의 그림들은 하나의 번역된 이미지 파트를 함께 참조합니다.
+        더 이상 참조되지 않는 기존 관계는 제거하며, 참조가 없어진 이미지 파트는 저장 시 패키지에 기록되지 않습니다.
+        """
+        shape_obj_ocr = picture_job['shape_obj_ref']
+        item_name_ocr = picture_job['name']
+        blip_elem = shape_obj_ocr._element.blipFill.blip
+        if blip_elem is None or blip_elem.rEmbed is None:
+            f_task_log.write(f"        경고: 이미지 '{item_name_ocr}'의 이미지 참조(a:blip r:embed)를 찾지 못해 교체 실패. 원본 유지.\n")
+            return
+
+        slide_part = shape_obj_ocr.part
+        old_rId = blip_elem.rEmbed
+        _, new_rId = slide_part.get_or_add_image_part(image_stream)
+        blip_elem.rEmbed = new_rId
+        if old_rId != new_rId and self._count_rel_references(slide_part, old_rId) == 0:
+            slide_part.drop_rel(old_rId)
+        f_task_log.write(f"        이미지 '{item_name_ocr}' 성공적으로 교체됨 (관계 {old_rId} -> {new_rId}).\n")
+
+    def _count_rel_references(self, part: Any, rId: str) -> int:
+        """파트 XML에서 rId를 참조하는 r:embed/r:link/r:id 등 관계 속성 수를 셉니다. (python-pptx의 drop_rel은 r:id만 셈)"""
+        rel_attr_prefix = "{%s}" % RELATIONSHIPS_NS
+        return sum(1 for elem in part._element.iter() for attr_name, attr_value in elem.attrib.items()
+                   if attr_value == rId and attr_name.startswith(rel_attr_prefix))
@@ -0,0 +1,151 @@
+# pptx_zip_scanner.py
+import logging
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+NS_MAIN = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_PRESENTATION = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_RELATIONSHIPS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PACKAGE_RELATIONSHIPS = "http://schemas.openxmlformats.org/package/2006/relationships"
+RT_OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+GRAPHIC_DATA_URI_CHART = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+GRAPHIC_DATA_URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+
+TAG_SP_TREE = f"{{{NS_PRESENTATION}}}spTree"
+TAG_SP = f"{{{NS_PRESENTATION}}}sp"
+TAG_PIC = f"{{{NS_PRESENTATION}}}pic"
+TAG_GRAPHIC_FRAME = f"{{{NS_PRESENTATION}}}graphicFrame"
+TAG_TX_BODY = f"{{{NS_PRESENTATION}}}txBody"
+# python-pptx slide.shapes가 도형으로 취급하는 spTree 자식 (mc:AlternateContent 등은 제외)
+SHAPE_TAGS = {TAG_SP, TAG_PIC, TAG_GRAPHIC_FRAME, f"{{{NS_PRESENTATION}}}grpSp",
+              f"{{{NS_PRESENTATION}}}cxnSp", f"{{{NS_PRESENTATION}}}contentPart"}
+PARAGRAPH_CONTENT_TAGS = {f"{{{NS_MAIN}}}r", f"{{{NS_MAIN}}}fld", f"{{{NS_MAIN}}}br"}
+
+
+def _resolve_target(source_part: str, target: str) -> str:
+    if target.startswith('/'): return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+def _rels_path(part_name: str) -> str:
+    return posixpath.join(posixpath.dirname(part_name), "_rels", posixpath.basename(part_name) + ".rels")
+
+
+def _read_relationship_targets(zip_ref: zipfile.ZipFile, part_name: str) -> Dict[str, str]:
+    """파트의 관계 파일에서 rId -> 대상 파트 경로 (외부 링크 제외)."""
+    targets: Dict[str, str] = {}
+    rels_root = ET.fromstring(zip_ref.read(_rels_path(part_name)))
+    for rel in rels_root.iter(f"{{{NS_PACKAGE_RELATIONSHIPS}}}Relationship"):
+        if rel.get('TargetMode') == 'External': continue
+        targets[rel.get('Id')] = _resolve_target(part_name, rel.get('Target', ''))
+    return targets
+
+
+def _main_document_part(zip_ref: zipfile.ZipFile) -> str:
+    package_rels = ET.fromstring(zip_ref.read("_rels/.rels"))
+    for rel in package_rels.iter(f"{{{NS_PACKAGE_RELATIONSHIPS}}}Relationship"):
+        if rel.get('Type') == RT_OFFICE_DOCUMENT:
+            return rel.get('Target', '').lstrip('/')
+    return "ppt/presentation.xml"
+
+
+def _slide_part_names(zip_ref: zipfile.ZipFile) -> List[str]:
+    """presentation.xml의 sldIdLst 순서대로 슬라이드 파트 경로 (python-pptx prs.slides와 같은 목록)."""
+    presentation_part = _main_document_part(zip_ref)
+    rel_targets = _read_relationship_targets(zip_ref, presentation_part)
+    slide_parts = []
+    for _, elem in ET.iterparse(zip_ref.open(presentation_part), events=('end',)):
+        if elem.tag == f"{{{NS_PRESENTATION}}}sldId":
+            slide_part = rel_targets.get(elem.get(f"{{{NS_RELATIONSHIPS}}}id"))
+            if slide_part: slide_parts.append(slide_part)
+        elif elem.tag == f"{{{NS_PRESENTATION}}}sldIdLst":
+            break # 슬라이드 목록 이후(노트/확장 정보 등)는 읽지 않음
+    return slide_parts
+
+
+def _text_body_text(tx_body: Optional[ET.Element]) -> str:
+    """python-pptx TextFrame.text와 같은 문자열: 문단은 '\\n', 줄바꿈(a:br)은 '\\v'로 연결."""
+    if tx_body is None: return ""
+    paragraph_texts = []
+    for paragraph in tx_body.findall(f"{{{NS_MAIN}}}p"):
+        paragraph_parts = []
+        for content in paragraph:
+            if content.tag not in PARAGRAPH_CONTENT_TAGS: continue
+            if content.tag == f"{{{NS_MAIN}}}br":
+                paragraph_parts.append("\v")
+            else:
+                paragraph_parts.append(content.findtext(f"{{{NS_MAIN}}}t") or "")
+        paragraph_texts.append("".join(paragraph_parts))
+    return "\n".join(paragraph_texts)
+
+
+def _is_placeholder(shape_elem: ET.Element) -> bool:
+    non_visual_props = shape_elem[0] if len(shape_elem) else None # p:nvSpPr / p:nvPicPr / p:nvGraphicFramePr
+    return non_visual_props is not None and non_visual_props.find(f"{{{NS_PRESENTATION}}}nvPr/{{{NS_PRESENTATION}}}ph") is not None
+
+
+def _count_shape(shape_elem: ET.Element, info: Dict[str, int], should_skip_translation: Callable[[str], bool]) -> None:
+    """도형 하나를 PptxHandler.analyze_presentation과 같은 기준으로 집계합니다."""
+    if shape_elem.tag == TAG_SP: # python-pptx에서 p:sp는 항상 has_text_frame
+        text_content = _text_body_text(shape_elem.find(TAG_TX_BODY))
+        if text_content and text_content.strip() and not should_skip_translation(text_content):
+            info["text_elements_count"] += 1
+            info["total_text_char_count"] += len(text_content)
+    elif shape_elem.tag == TAG_PIC:
+        # 동영상(a:videoFile)은 그림이 아님 (자리 표시자 그림은 python-pptx에서 그림으로 취급)
+        is_movie = shape_elem.find(f"./{{{NS_PRESENTATION}}}nvPicPr/{{{NS_PRESENTATION}}}nvPr/{{{NS_MAIN}}}videoFile") is not None
+        if not is_movie or _is_placeholder(shape_elem):
+            info["image_elements_count"] += 1
+    elif shape_elem.tag == TAG_GRAPHIC_FRAME:
+        graphic_data = shape_elem.find(f"{{{NS_MAIN}}}graphic/{{{NS_MAIN}}}graphicData")
+        graphic_data_uri = graphic_data.get('uri') if graphic_data is not None else None
+        if graphic_data_uri == GRAPHIC_DATA_URI_CHART:
+            info["chart_elements_count"] += 1
+        elif graphic_data_uri == GRAPHIC_DATA_URI_TABLE:
+            for table_cell in graphic_data.iter(f"{{{NS_MAIN}}}tc"):
+                text_content = _text_body_text(table_cell.find(f"{{{NS_MAIN}}}txBody"))
+                if text_content and text_content.strip() and not should_skip_translation(text_content):
+                    info["text_elements_count"] += 1 # 테이블 셀은 각 유효 텍스트마다 요소 수 증가
+                    info["total_text_char_count"] += len(text_content)
+
+
+def _scan_slide(zip_ref: zipfile.ZipFile, slide_part: str, info: Dict[str, int],
+                should_skip_translation: Callable[[str], bool]) -> None:
+    """슬라이드 XML을 iterparse로 스트리밍하며 spTree 바로 아래 도형이 끝날 때마다 집계하고 버립니다."""
+    depth, sp_tree_depth = 0, None
+    for event, elem in ET.iterparse(zip_ref.open(slide_part), events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if elem.tag == TAG_SP_TREE and sp_tree_depth is None: sp_tree_depth = depth
+            continue
+        if sp_tree_depth is not None and depth == sp_tree_depth + 1:
+            if elem.tag in SHAPE_TAGS: _count_shape(elem, info, should_skip_translation)
+            elem.clear()
+        elif elem.tag == TAG_SP_TREE:
+            break # 도형 트리 이후(타이밍/전환 효과 등)는 읽지 않음
+        depth -= 1
+
+
+def scan_file_info(file_path: str, should_skip_translation: Callable[[str], bool]) -> Dict[str, int]:
+    """
+    python-pptx 객체 모델을 만들지 않고 zip에서 presentation.xml, 관계 파일, 슬라이드 XML만 스트리밍해
+    PptxHandler.get_file_info와 같은 값을 계산합니다. 미디어(이미지/동영상)와 차트 파트는 읽지 않습니다.
+    파일이 손상되었거나 구조가 예상과 다르면 zipfile/XML 예외(KeyError 포함)가 그대로 전달됩니다.
+    """
+    info = {
+        "slide_count": 0,
+        "text_elements_count": 0,
+        "total_text_char_count": 0,
+        "image_elements_count": 0,
+        "chart_elements_count": 0
+    }
+    with zipfile.ZipFile(file_path, 'r') as zip_ref:
+        slide_parts = _slide_part_names(zip_ref)
+        info["slide_count"] = len(slide_parts)
+        for slide_part in slide_parts:
+            _scan_slide(zip_ref, slide_part, info, should_skip_translation)
+    return info
@@ -0,0 +1,70 @@
+# startup_timing.py
+import builtins
+import logging
+import sys
+import threading
+import time
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STARTUP_TIMING_FLAG = "--startup-timing"
+
+_start_time = time.perf_counter() # 이 모듈이 처음 import된 시각 (main.py 첫 줄에서 import)
+_marks: List[Tuple[str, float]] = []
+_import_records: List[Tuple[int, str, float]] = [] # (중첩 깊이, 모듈 이름, 누적 소요 시간 s)
+_import_state = threading.local()
+_original_import = None
+
+
+def is_requested(argv: Optional[List[str]] = None) -> bool:
+    return STARTUP_TIMING_FLAG in (argv if argv is not None else sys.argv)
+
+
+def enable_import_timing() -> None:
+    """
+    builtins.__import__를 감싸 처음 로드되는 모듈마다 import 소요 시간(하위 import 포함)을 기록합니다.
+    python -X importtime의 누적(cumulative) 열과 같은 의미이며, 프로그램 안에서 켜고 로그로 볼 수 있습니다.
+    """
+    global _original_import
+    if _original_import is not None: return
+    _original_import = builtins.__import__
+
+    def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level != 0 or name in sys.modules:
+            return _original_import(name, globals, locals, fromlist, level)
+        depth = getattr(_import_state, 'depth', 0)
+        _import_state.depth = depth + 1
+        import_start = time.perf_counter()
+        try:
+            return _original_import(name, globals, locals, fromlist, level)
+        finally:
+            _import_state.depth = depth
+            _import_records.append((depth, name, time.perf_counter() - import_start))
+
+    builtins.__import__ = _timed_import
+
+
+def disable_import_timing() -> None:
+    global _original_import
+    if _original_import is None: return
+    builtins.__import__ = _original_import
+    _original_import = None
+
+
+def mark(label: str) -> None:
+    """시작 단계 경과 시각을 기록합니다 (startup_timing 첫 import 기준)."""
+    _marks.append((label, time.perf_counter() - _start_time))
+
+
+def report(top_n: int = 20) -> None:
+    """기록된 시작 단계 시각과 가장 오래 걸린 import를 로그로 출력합니다."""
+    disable_import_timing()
+    lines = [f"--- 시작 시간 보고 ({STARTUP_TIMING_FLAG}) ---"]
+    for label, elapsed in _marks:
+        lines.append(f"  {elapsed * 1000:8.1f} ms  {label}")
+    if _import_records:
+        lines.append(f"  가장 오래 걸린 import (하위 import 포함, 상위 {top_n}개):")
+        for depth, name, elapsed in sorted(_import_records, key=lambda record: record[2], reverse=True)[:top_n]:
+            lines.append(f"  {elapsed * 1000:8.1f} ms  {'  ' * depth}{name}")
+    logger.info("\n".join(lines))
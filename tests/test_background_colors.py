@@ -0,0 +1,52 @@
+# tests/test_background_colors.py
+# 합성 이미지(단색, 두 색, 잡음 섞인 테두리, 투명)로 bincount 기반 배경색 추정과 글자색 선택을 확인합니다.
+import numpy as np
+from PIL import Image, ImageDraw
+
+from ocr_handler import (DEFAULT_BG_COLOR, estimate_background_colors, get_contrasting_text_color,
+                         get_contrasting_text_colors)
+
+
+def test_solid_fill_returns_exact_color():
+    image_pil = Image.new('RGB', (120, 80), (30, 60, 200))
+    assert estimate_background_colors(image_pil, [(10, 10, 110, 70)]) == [(30, 60, 200)]
+
+
+def test_text_inside_box_does_not_change_background():
+    image_pil = Image.new('RGB', (200, 80), (255, 255, 255))
+    ImageDraw.Draw(image_pil).rectangle((40, 25, 160, 55), fill=(0, 0, 0)) # 박스 안쪽의 굵은 글자 획
+    bg_colors = estimate_background_colors(image_pil, [(10, 10, 190, 70)])
+    assert bg_colors == [(255, 255, 255)]
+    assert get_contrasting_text_colors(bg_colors) == [(0, 0, 0)]
+
+
+def test_two_tone_image_gives_each_box_its_own_background():
+    image_pil = Image.new('RGB', (200, 100), (20, 30, 90))
+    ImageDraw.Draw(image_pil).rectangle((100, 0, 199, 99), fill=(250, 220, 120))
+    assert estimate_background_colors(image_pil, [(10, 10, 90, 90), (110, 10, 190, 90)]) == [(20, 30, 90), (250, 220, 120)]
+
+
+def test_noisy_border_averages_the_dominant_bin():
+    rng = np.random.default_rng(0)
+    pixels = np.clip(240 + rng.integers(-3, 4, size=(100, 160, 3)), 0, 255).astype(np.uint8)
+    outliers = rng.integers(0, 100, size=(60, 2)) # 테두리에 섞인 점 잡음 (최빈 구간에 들지 않음)
+    pixels[outliers[:, 0], outliers[:, 1] % 160] = (255, 0, 0)
+    bg_color = estimate_background_colors(Image.fromarray(pixels), [(0, 0, 160, 100)])[0]
+    assert all(abs(channel - 240) <= 3 for channel in bg_color)
+
+
+def test_transparent_area_is_composited_on_white():
+    image_pil = Image.new('RGBA', (60, 40), (0, 0, 0, 0))
+    assert estimate_background_colors(image_pil, [(0, 0, 60, 40)]) == [(255, 255, 255)]
+
+
+def test_empty_inputs():
+    image_pil = Image.new('RGB', (20, 20), (0, 0, 0))
+    assert estimate_background_colors(image_pil, []) == []
+    assert estimate_background_colors(image_pil, [(5, 5, 5, 5)]) == [DEFAULT_BG_COLOR] # 넓이 0 박스
+    assert get_contrasting_text_colors([]) == []
+
+
+def test_batched_text_colors_match_single_version():
+    bg_colors = [(0, 0, 0), (255, 255, 255), (200, 200, 200), (20, 40, 160), (128, 128, 128), (127, 127, 127)]
+    assert get_contrasting_text_colors(bg_colors) == [get_contrasting_text_color(bg_color) for bg_color in bg_colors]
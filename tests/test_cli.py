@@ -0,0 +1,78 @@
+# tests/test_cli.py
+# Ollama/OCR 엔진 대신 가짜 객체를 넣고, 분석 실패나 번역할 내용이 없는 조기 반환에서도 워커 풀과 엔진이 정리되는지 확인합니다.
+import subprocess
+import sys
+
+import pytest
+from pptx import Presentation
+
+import cli
+import config
+import ocr_pool
+
+
+class _FakeRegistry:
+    def __init__(self):
+        self.cleared = False
+
+    def clear(self):
+        self.cleared = True
+
+
+class _FakeOcrHandler:
+    def get_engine_spec(self):
+        return {'engine': 'fake', 'lang_codes': 'en'}
+
+
+class _FakePool:
+    instances = []
+
+    def __init__(self, engine_spec, max_workers=None):
+        self.shut_down = False
+        _FakePool.instances.append(self)
+
+    def shutdown(self, timeout=5.0):
+        self.shut_down = True
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch, tmp_path):
+    registry = _FakeRegistry()
+    _FakePool.instances = []
+    monkeypatch.setattr(cli.OllamaService, 'is_running', lambda self: (True, '11434'))
+    monkeypatch.setattr(cli, '_create_ocr_handler', lambda *args: (_FakeOcrHandler(), registry))
+    monkeypatch.setattr(ocr_pool, 'OcrProcessPool', _FakePool)
+    monkeypatch.setattr(config, 'MAX_OCR_WORKERS', 2)
+    monkeypatch.setattr(config, 'LOGS_DIR', str(tmp_path / "logs"))
+    return registry
+
+
+def _translate(deck_path, tmp_path):
+    return cli.translate_file(deck_path, '영어', '한국어', 'model', str(tmp_path / "out.pptx"), image_translation_enabled=True)
+
+
+def test_empty_deck_releases_ocr_resources(fake_ocr, tmp_path):
+    deck_path = tmp_path / "empty.pptx"
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[6])
+    prs.save(str(deck_path))
+
+    assert _translate(str(deck_path), tmp_path) == cli.EXIT_SUCCESS # 번역할 내용이 없어 조기 반환
+    assert fake_ocr.cleared and [pool.shut_down for pool in _FakePool.instances] == [True]
+
+
+def test_analysis_failure_releases_ocr_resources(fake_ocr, tmp_path):
+    deck_path = tmp_path / "broken.pptx"
+    deck_path.write_bytes(b"not a pptx file")
+
+    with pytest.raises(Exception):
+        _translate(str(deck_path), tmp_path)
+    assert fake_ocr.cleared and [pool.shut_down for pool in _FakePool.instances] == [True]
+
+
+def test_importing_cli_does_not_load_heavy_modules():
+    # 이미 모듈을 불러온 테스트 프로세스가 아닌 새 인터프리터에서 확인
+    probe = "import cli, sys; print(sorted(m for m in ('PIL', 'pptx', 'numpy', 'cv2') if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", probe], cwd=config.PROJECT_ROOT_DIR,
+                               capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "[]"
@@ -0,0 +1,105 @@
+# tests/test_cpu_resource_manager.py
+# os.cpu_count와 psutil(affinity)을 바꿔 넣고 코어 예산 분배와 affinity 미지원 시 대체 동작을 확인합니다.
+import os
+import sys
+import types
+
+import pytest
+
+import config
+from cpu_resource_manager import CpuBudget, CpuResourceManager
+
+
+class _FakePool:
+    def __init__(self, max_workers=4, threads_per_worker=1, pids=(101, 102)):
+        self.max_workers = max_workers
+        self.threads_per_worker = threads_per_worker
+        self._pids = list(pids)
+
+    def worker_pids(self):
+        return self._pids
+
+
+@pytest.fixture(autouse=True)
+def _budget_settings(monkeypatch):
+    monkeypatch.setattr(config, 'CPU_RESOURCE_MANAGER_ENABLED', True)
+    monkeypatch.setattr(config, 'CPU_OCR_CORE_SHARE', 0.5)
+    monkeypatch.setattr(config, 'CPU_SHARED_TRANSLATION_SLOTS', 2)
+    monkeypatch.setattr(config, 'MAX_TRANSLATION_WORKERS', 6)
+
+
+def _manager(monkeypatch, cpu_count, ocr_pool=None):
+    monkeypatch.setattr(os, 'cpu_count', lambda: cpu_count)
+    cpu_resource_manager = CpuResourceManager()
+    cpu_resource_manager._ocr_pool = ocr_pool
+    return cpu_resource_manager
+
+
+def test_core_split_follows_cpu_count(monkeypatch):
+    cpu_resource_manager = _manager(monkeypatch, 8)
+    assert cpu_resource_manager.enabled
+    assert (cpu_resource_manager.shared_ocr_core_count, cpu_resource_manager.ollama_thread_count) == (4, 4)
+    assert cpu_resource_manager.ollama_options() == {'num_thread': 4}
+
+    # 코어가 하나뿐이거나 알 수 없으면 나눌 것이 없으므로 사용하지 않음
+    for cpu_count in (1, None):
+        single_core_manager = _manager(monkeypatch, cpu_count)
+        assert single_core_manager.total_cores == 1 and not single_core_manager.enabled
+        assert single_core_manager.ollama_options() == {}
+
+
+def test_budget_when_both_sides_are_busy(monkeypatch):
+    cpu_resource_manager = _manager(monkeypatch, 8, _FakePool(max_workers=4, threads_per_worker=2))
+    # OCR은 뒤쪽 4개 코어에 워커 2개(워커당 2 스레드), 번역은 동시 2건
+    assert cpu_resource_manager.compute_budget(ocr_busy=True, translation_busy=True) == CpuBudget([4, 5, 6, 7], 2, 2)
+
+
+@pytest.mark.parametrize("ocr_busy, translation_busy", [(True, False), (False, True), (False, False)])
+def test_idle_side_gives_all_cores_to_the_other(monkeypatch, ocr_busy, translation_busy):
+    cpu_resource_manager = _manager(monkeypatch, 8, _FakePool(max_workers=4))
+    assert cpu_resource_manager.compute_budget(ocr_busy, translation_busy) == CpuBudget(list(range(8)), 4, 6)
+
+
+def test_ollama_on_gpu_leaves_cpu_to_ocr(monkeypatch):
+    cpu_resource_manager = _manager(monkeypatch, 8, _FakePool(max_workers=4))
+    cpu_resource_manager._ollama_on_gpu = True
+    assert cpu_resource_manager.compute_budget(ocr_busy=True, translation_busy=True) == CpuBudget(list(range(8)), 4, 6)
+
+
+def test_small_machine_keeps_at_least_one_core_each(monkeypatch):
+    cpu_resource_manager = _manager(monkeypatch, 2, _FakePool(max_workers=3, threads_per_worker=4))
+    assert (cpu_resource_manager.shared_ocr_core_count, cpu_resource_manager.ollama_thread_count) == (1, 1)
+    assert cpu_resource_manager.compute_budget(ocr_busy=True, translation_busy=True) == CpuBudget([1], 1, 2)
+
+
+def _fake_psutil(with_affinity, affinity_calls):
+    class _Process:
+        def __init__(self, pid):
+            self.pid = pid
+
+    if with_affinity:
+        _Process.cpu_affinity = lambda self, cores: affinity_calls.append((self.pid, list(cores)))
+    return types.SimpleNamespace(Process=_Process, NoSuchProcess=ProcessLookupError, AccessDenied=PermissionError)
+
+
+def test_affinity_is_applied_once_per_worker(monkeypatch):
+    affinity_calls = []
+    monkeypatch.setitem(sys.modules, 'psutil', _fake_psutil(True, affinity_calls))
+    cpu_resource_manager = _manager(monkeypatch, 8)
+    ocr_pool = _FakePool(pids=(101, 102))
+    cpu_resource_manager._apply_affinity(ocr_pool, [4, 5, 6, 7])
+    cpu_resource_manager._apply_affinity(ocr_pool, [4, 5, 6, 7]) # 같은 코어면 다시 설정하지 않음
+    assert affinity_calls == [(101, [4, 5, 6, 7]), (102, [4, 5, 6, 7])]
+
+
+@pytest.mark.parametrize("psutil_module", [None, "no-affinity"], ids=["psutil-missing", "affinity-unsupported"])
+def test_missing_affinity_falls_back_to_worker_limits(monkeypatch, psutil_module):
+    affinity_calls = []
+    # None이면 import psutil이 ImportError, 아니면 cpu_affinity가 없는 (macOS 같은) psutil
+    monkeypatch.setitem(sys.modules, 'psutil', None if psutil_module is None else _fake_psutil(False, affinity_calls))
+    cpu_resource_manager = _manager(monkeypatch, 8)
+    cpu_resource_manager._apply_affinity(_FakePool(), [4, 5, 6, 7])
+    assert not cpu_resource_manager._affinity_supported and affinity_calls == []
+    # 예산(워커 수/번역 요청 수) 계산은 affinity와 무관하게 동작
+    cpu_resource_manager._ocr_pool = _FakePool(max_workers=4)
+    assert cpu_resource_manager.compute_budget(ocr_busy=True, translation_busy=True).ocr_workers == 4
@@ -0,0 +1,98 @@
+# tests/test_deck_analysis.py
+# 작업자가 한 번 만든 DeckAnalysis를 1단계가 다시 파싱하지 않고 쓰는지, 이미 사용했거나 다른 prs의 분석은 새로 만드는지 확인합니다.
+import threading
+
+import pytest
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches
+
+import pptx_handler
+import translator
+
+
+class _FakeTranslator(translator.OllamaTranslator):
+    def translate_text(self, text, *args, **kwargs):
+        return "T(" + text + ")"
+
+
+class _FakeOllama:
+    url = 'http://localhost'
+    connect_timeout = 1
+    read_timeout = 1
+
+    def is_running(self):
+        return True, '11434'
+
+
+@pytest.fixture
+def deck_path(tmp_path):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "Quarterly revenue"
+    table = slide.shapes.add_table(1, 2, Inches(1), Inches(2), Inches(4), Inches(1)).table
+    table.cell(0, 0).text = "Region"
+    table.cell(0, 1).text = "12" # 숫자만 있는 셀은 번역 제외
+    chart_data = CategoryChartData()
+    chart_data.categories = ["Q1", "Q2"]
+    chart_data.add_series("Sales", (1, 2))
+    slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(3), Inches(4), Inches(2), chart_data)
+    path = tmp_path / "deck.pptx"
+    prs.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def counting_handler(monkeypatch):
+    handler = pptx_handler.PptxHandler()
+    handler.ocr_cache = handler.render_cache = None
+    analyzed = []
+    original_analyze = pptx_handler.PptxHandler.analyze_presentation
+
+    def _counting_analyze(self, file_path, prs=None):
+        analyzed.append(file_path)
+        return original_analyze(self, file_path, prs)
+
+    monkeypatch.setattr(pptx_handler.PptxHandler, 'analyze_presentation', _counting_analyze)
+    return handler, analyzed
+
+
+def _run_stage1(handler, prs, deck_analysis, tmp_path):
+    return handler.translate_presentation_stage1(
+        prs, '영어', '한국어', _FakeTranslator(), None, 'model', _FakeOllama(), 'ko',
+        str(tmp_path / "task.log"), None, threading.Event(), False, 0.4, deck_analysis=deck_analysis)
+
+
+def test_analysis_counts_jobs_and_charts(deck_path, counting_handler):
+    handler, _ = counting_handler
+    deck_analysis = handler.analyze_presentation(deck_path)
+    assert deck_analysis.file_info() == {'slide_count': 1, 'text_elements_count': 2, 'total_text_char_count': len("Quarterly revenue") + len("Region"),
+                                         'image_elements_count': 0, 'chart_elements_count': 1}
+    assert [job['original_text'] for job in deck_analysis.translation_jobs] == ["Quarterly revenue", "Region"]
+    assert deck_analysis.chart_partnames == ["/ppt/charts/chart1.xml"]
+
+
+def test_stage1_reuses_worker_analysis_without_reparsing(deck_path, counting_handler, tmp_path):
+    handler, analyzed = counting_handler
+    deck_analysis = handler.analyze_presentation(deck_path) # 작업자가 prs를 로드하며 한 번 분석
+    assert _run_stage1(handler, deck_analysis.prs, deck_analysis, tmp_path)
+    assert analyzed == [deck_path] and deck_analysis.consumed
+    assert deck_analysis.prs.slides[0].shapes[0].text_frame.text == "T(Quarterly revenue)"
+
+
+def test_consumed_or_foreign_analysis_is_rebuilt(deck_path, counting_handler, tmp_path):
+    handler, analyzed = counting_handler
+    deck_analysis = handler.analyze_presentation(deck_path)
+    _run_stage1(handler, deck_analysis.prs, deck_analysis, tmp_path)
+
+    # 이미 번역된 prs의 작업 목록을 다시 쓰면 번역문을 또 번역하게 되므로 새로 분석
+    assert _run_stage1(handler, deck_analysis.prs, deck_analysis, tmp_path)
+    assert len(analyzed) == 2
+
+    # 다른 prs를 분석한 결과는 그 prs의 shape를 가리키므로 사용하지 않음
+    other_prs = Presentation(deck_path)
+    foreign_analysis = handler.analyze_presentation(deck_path)
+    assert _run_stage1(handler, other_prs, foreign_analysis, tmp_path)
+    assert len(analyzed) == 4 and not foreign_analysis.consumed
+    assert other_prs.slides[0].shapes[0].text_frame.text == "T(Quarterly revenue)"
@@ -0,0 +1,63 @@
+# tests/test_disk_cache.py
+import os
+import time
+
+from disk_cache import DiskCache, OcrResultCache, RenderedImageCache
+
+OCR_RESULTS = [[[[10, 20], [110, 20], [110, 45], [10, 45]], ("안녕하세요", 0.93), None],
+               [[[10, 60], [90, 60], [90, 80], [10, 80]], ("world", 0.8), 12.5]]
+
+
+def test_ocr_results_round_trip(tmp_path):
+    cache = OcrResultCache(str(tmp_path), max_bytes=1024 * 1024)
+    cache.put_results("sha1-a", "paddleocr|korean|scale=1.0", OCR_RESULTS)
+    assert cache.get_results("sha1-a", "paddleocr|korean|scale=1.0") == OCR_RESULTS
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_fingerprint_mismatch_is_a_miss(tmp_path):
+    cache = OcrResultCache(str(tmp_path), max_bytes=1024 * 1024)
+    cache.put_results("sha1-a", "paddleocr|korean|scale=1.0", OCR_RESULTS)
+    # 같은 이미지라도 엔진 설정(축소 비율 등)이 다르면 이전 결과를 쓰지 않음
+    assert cache.get_results("sha1-a", "paddleocr|korean|scale=0.5") is None
+    assert cache.get_results("sha1-b", "paddleocr|korean|scale=1.0") is None
+    assert cache.misses == 2
+
+
+def test_empty_results_are_a_cache_hit(tmp_path):
+    # 텍스트가 없는 이미지도 결과(빈 목록)를 캐시해 다음 실행에서 OCR을 생략
+    cache = OcrResultCache(str(tmp_path), max_bytes=1024 * 1024)
+    cache.put_results("sha1-a", "fp", [])
+    assert cache.get_results("sha1-a", "fp") == []
+
+
+def test_corrupt_entry_is_ignored(tmp_path):
+    cache = OcrResultCache(str(tmp_path), max_bytes=1024 * 1024)
+    cache.put_bytes(cache.make_key("sha1-a", "fp"), b"not zlib")
+    assert cache.get_results("sha1-a", "fp") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=350)
+    for index in range(3):
+        cache.put_bytes(f"key-{index}", bytes(100))
+        entry_path = cache._entry_path(f"key-{index}")
+        os.utime(entry_path, (time.time() - 100 + index, time.time() - 100 + index))
+    cache.get_bytes("key-0") # 조회하면 최근 사용으로 갱신
+    cache.put_bytes("key-3", bytes(100))
+
+    # 400바이트 > 350바이트: 가장 오래 사용하지 않은 key-1만 지워 목표(90%) 이하로 줄임
+    assert cache.get_bytes("key-1") is None
+    assert all(cache.get_bytes(key) is not None for key in ("key-0", "key-2", "key-3"))
+
+
+
+
+def test_expired_rendered_image_is_a_miss(tmp_path):
+    cache = RenderedImageCache(str(tmp_path), max_bytes=1024 * 1024, max_age_seconds=60)
+    cache.put_image("sha1-a", "render-fp", b"png bytes")
+    assert cache.get_image("sha1-a", "render-fp") == b"png bytes"
+    entry_path = cache._entry_path(cache.make_key("sha1-a", "render-fp"))
+    os.utime(entry_path, (time.time() - 120, time.time() - 120))
+    assert cache.get_image("sha1-a", "render-fp") is None
+    assert not os.path.exists(entry_path)
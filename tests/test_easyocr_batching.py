@@ -0,0 +1,68 @@
+# tests/test_easyocr_batching.py
+# EasyOCR 엔진 대신 입력 배열 크기를 기록하는 가짜 엔진으로 크기별 묶음/여백 채우기/좌표 자르기를 확인합니다.
+import numpy as np
+from PIL import Image
+
+import config
+from ocr_handler import EasyOcrHandler
+
+
+class _FakeEasyOcrEngine:
+    def __init__(self):
+        self.batched_shapes = []
+        self.single_shapes = []
+
+    def readtext_batched(self, image_arrays, **kwargs):
+        self.batched_shapes.append([image_np.shape[:2] for image_np in image_arrays])
+        # 이미지마다 왼쪽 위 박스 하나와 여백 영역까지 걸친 박스 하나를 돌려줌
+        outputs = []
+        for image_np in image_arrays:
+            height, width = image_np.shape[:2]
+            outputs.append([([[0, 0], [10, 0], [10, 10], [0, 10]], "in", 0.9),
+                            ([[width - 5, 0], [width + 50, 0], [width + 50, 10], [width - 5, 10]], "edge", 0.9)])
+        return outputs
+
+    def readtext(self, image_np, **kwargs):
+        self.single_shapes.append(image_np.shape[:2])
+        return [([[0, 0], [10, 0], [10, 10], [0, 10]], "single", 0.9)]
+
+
+def _make_handler():
+    handler = EasyOcrHandler.__new__(EasyOcrHandler)
+    handler.ocr_engine = _FakeEasyOcrEngine()
+    handler.perf_profile = {}
+    handler.debug_mode = False
+    return handler
+
+
+def test_similar_sizes_are_padded_into_one_batch(monkeypatch):
+    monkeypatch.setattr(config, 'EASYOCR_BATCH_BUCKET_PX', 128)
+    handler = _make_handler()
+    images = [Image.new('RGB', (200, 100), 'white'), Image.new('RGB', (190, 110), 'white'), Image.new('RGB', (600, 400), 'white')]
+
+    results = handler.ocr_images(images, batch_size=8)
+
+    # 200x100과 190x110은 같은 묶음(가장 큰 크기 200x110으로 여백 채움), 600x400은 혼자라 이미지별 처리
+    assert handler.ocr_engine.batched_shapes == [[(110, 200), (110, 200)]]
+    assert handler.ocr_engine.single_shapes == [(400, 600)]
+    assert [text for _, (text, _), _ in results[2]] == ["single"]
+
+
+def test_boxes_are_clipped_to_original_size():
+    handler = _make_handler()
+    results = handler.ocr_images([Image.new('RGB', (200, 100)), Image.new('RGB', (190, 110))], batch_size=8)
+
+    # 두 번째 이미지(가로 190)는 여백까지 합쳐 가로 200으로 추론되므로, 'edge' 박스(x=195~250)는 여백에만 있어 버려짐
+    assert [text for _, (text, _), _ in results[1]] == ["in"]
+    edge_box = next(box for box, (text, _), _ in results[0] if text == "edge")
+    assert max(x for x, _ in edge_box) == 199
+
+
+def test_padding_uses_edge_color():
+    image_np = np.zeros((4, 6, 3), dtype=np.uint8)
+    image_np[:] = 255 # 흰 배경
+    image_np[0, 0] = 0
+    padded = EasyOcrHandler._pad_to_size(image_np, 8, 10)
+    assert padded.shape == (8, 10, 3)
+    assert (padded[4:, :] == 255).all() and (padded[:, 6:] == 255).all()
+    assert (padded[:4, :6] == image_np).all()
@@ -0,0 +1,56 @@
+# tests/test_font_manager.py
+# 크기별 폰트 LRU와 글자 advance 메모이즈, 언어별 폰트 대체 순서를 확인합니다.
+import os
+import shutil
+
+import pytest
+
+import config
+from font_manager import FontManager
+
+THAI_FONT_PATH = os.path.join(config.FONTS_DIR, "NotoSansThai-VariableFont_wdth,wght.ttf")
+
+
+def test_sized_fonts_are_cached_with_lru_eviction(tmp_path):
+    font_manager = FontManager(font_dir=str(tmp_path), max_sized_fonts=3) # 폰트 파일 없음 -> Pillow 기본 폰트
+    fonts = {size: font_manager.get_font(size) for size in (10, 11, 12)}
+    assert all(font_manager.get_font(size) is font for size, font in fonts.items())
+
+    font_manager.get_font(10) # 10을 최근 사용으로 갱신 -> 다음 해제 대상은 11
+    font_manager.get_font(13)
+    assert [size for _, size in font_manager._sized_fonts] == [12, 10, 13]
+    assert font_manager.get_font(10) is fonts[10] and font_manager.get_font(11) is not fonts[11]
+
+
+def test_char_advances_are_memoized_per_font(tmp_path, monkeypatch):
+    font_manager = FontManager(font_dir=str(tmp_path), max_sized_fonts=1)
+    measured = []
+    original_measure = FontManager._measure_length
+
+    def _counting_measure(font, text):
+        measured.append(text)
+        return original_measure(font, text)
+
+    monkeypatch.setattr(FontManager, '_measure_length', staticmethod(_counting_measure))
+    font = font_manager.get_font(20)
+    first_width = font_manager.get_text_advance(font, "abca")
+    assert font_manager.get_text_advance(font, "cab") + font_manager.get_char_advance(font, "a") == pytest.approx(first_width)
+    assert measured == ["a", "b", "c"]
+
+    font_manager.get_font(21) # 한도 1 -> 20 크기 폰트와 그 advance 표 해제
+    font_manager.get_char_advance(font, "a") # 해제된 폰트는 메모이즈 없이 측정만
+    font_manager.get_char_advance(font, "a")
+    assert measured == ["a", "b", "c", "a", "a"]
+
+
+@pytest.mark.skipif(not os.path.exists(THAI_FONT_PATH), reason="테스트용 폰트 없음")
+def test_font_fallback_chain_uses_existing_files(tmp_path, monkeypatch):
+    shutil.copy(THAI_FONT_PATH, tmp_path / "thai.ttf")
+    monkeypatch.setattr(config, 'OCR_LANGUAGE_FONT_MAP', {'th': 'thai.ttf', 'th_bold': 'missing-bold.ttf'})
+    font_manager = FontManager(font_dir=str(tmp_path))
+
+    assert font_manager.resolve_font_paths('th', is_bold=True) == [str(tmp_path / "thai.ttf")] # 없는 굵은 폰트는 건너뜀
+    assert font_manager.resolve_font_paths('en') == []
+    thai_font = font_manager.get_font(24, 'th')
+    assert thai_font.path == str(tmp_path / "thai.ttf") and thai_font.size == 24
+    assert font_manager.get_font(24, 'th', is_bold=True) is thai_font # 같은 (경로, 크기)는 한 객체를 공유
@@ -0,0 +1,92 @@
+# tests/test_memory_governor.py
+# psutil 측정 대신 정해 둔 MemorySample을 돌려주고, 모니터 스레드 없이 _check()를 직접 호출해 상태 전환을 확인합니다.
+import threading
+import time
+
+import pytest
+
+import config
+from memory_governor import MB, MemoryGovernor, MemorySample
+
+TOTAL_BYTES = 16 * 1024 * MB
+
+
+class _FakePool:
+    def __init__(self):
+        self.calls = []
+
+    def set_paused(self, paused):
+        self.calls.append(('set_paused', paused))
+
+    def shrink_idle_workers(self, keep):
+        self.calls.append(('shrink_idle_workers', keep))
+        return 2
+
+    def restore_workers(self):
+        self.calls.append(('restore_workers',))
+
+
+@pytest.fixture
+def governor(monkeypatch):
+    monkeypatch.setattr(config, 'MEMORY_SOFT_LIMIT_MB', 1000)
+    monkeypatch.setattr(config, 'MEMORY_MIN_AVAILABLE_MB', 512)
+    monkeypatch.setattr(config, 'MEMORY_MAX_PAUSE_SECONDS', 30)
+    memory_governor = MemoryGovernor()
+    memory_governor.enabled = True
+    memory_governor.samples = []
+    monkeypatch.setattr(memory_governor, 'sample', lambda: memory_governor.samples.pop(0))
+    fake_pool = _FakePool()
+    memory_governor._ocr_pool = fake_pool
+    return memory_governor, fake_pool
+
+
+def _sample(rss_mb, available_mb=8192):
+    return MemorySample(rss_mb * MB, available_mb * MB, TOTAL_BYTES)
+
+
+def test_pressure_pauses_pool_and_releases_with_hysteresis(governor):
+    memory_governor, fake_pool = governor
+    memory_governor.samples = [_sample(500), _sample(1100), _sample(950), _sample(850)]
+
+    memory_governor._check()
+    assert not memory_governor.under_pressure and memory_governor.keep_decoded_images()
+
+    memory_governor._check() # 한도(1000 MB) 초과
+    assert memory_governor.under_pressure and not memory_governor.keep_decoded_images()
+    assert fake_pool.calls == [('set_paused', True), ('shrink_idle_workers', 1)]
+
+    memory_governor._check() # 한도 아래지만 해제 기준(90%) 위 -> 유지
+    assert memory_governor.under_pressure
+
+    memory_governor._check()
+    assert not memory_governor.under_pressure
+    assert fake_pool.calls[-2:] == [('set_paused', False), ('restore_workers',)]
+    assert memory_governor.pressure_events == 1
+
+
+def test_low_available_memory_is_pressure(governor):
+    memory_governor, _ = governor
+    memory_governor.samples = [_sample(100, available_mb=400)]
+    memory_governor._check()
+    assert memory_governor.under_pressure
+
+
+def test_long_pressure_resumes_pool_without_releasing(governor):
+    memory_governor, fake_pool = governor
+    memory_governor.samples = [_sample(1100), _sample(1100)]
+    memory_governor._check()
+    memory_governor._pressure_since = time.monotonic() - 31 # 고정 사용량이라 줄지 않는 경우
+    memory_governor._check()
+    assert memory_governor.under_pressure
+    assert fake_pool.calls[-1] == ('set_paused', False)
+
+
+def test_wait_for_headroom_returns_on_stop(governor):
+    memory_governor, _ = governor
+    memory_governor.samples = [_sample(1100)]
+    memory_governor._check()
+    stop_event = threading.Event()
+    stop_event.set()
+    started = time.monotonic()
+    memory_governor.wait_for_headroom(stop_event)
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,95 @@
+# tests/test_ocr_engine_registry.py
+# 실제 엔진 대신 생성 횟수를 세는 가짜 핸들러 팩토리로 레지스트리의 재사용, 보관 한도, LRU 해제 순서를 확인합니다.
+import threading
+import time
+
+import pytest
+
+from ocr_engine_registry import OcrEngineRegistry
+
+MB = 1024 * 1024
+
+
+class _StubHandler:
+    def __init__(self, key):
+        self.key = key
+        self.ocr_engine = object()
+
+
+@pytest.fixture
+def make_registry(monkeypatch):
+    created_keys = []
+
+    def _make(max_engines=2, max_memory_mb=1024, footprint_mb=100, init_delay=0.0):
+        registry = OcrEngineRegistry(max_engines=max_engines, max_memory_mb=max_memory_mb)
+
+        def _create_handler(key, debug_enabled):
+            if init_delay: time.sleep(init_delay)
+            created_keys.append(key)
+            return _StubHandler(key), footprint_mb * MB
+
+        monkeypatch.setattr(registry, '_create_handler', _create_handler)
+        return registry
+
+    return _make, created_keys
+
+
+KEY_EN = OcrEngineRegistry.make_key("paddleocr", "en", False)
+KEY_KO = OcrEngineRegistry.make_key("paddleocr", "korean", False)
+KEY_JA = OcrEngineRegistry.make_key("easyocr", "ja", False)
+
+
+def test_cached_engine_is_reused(make_registry):
+    make, created_keys = make_registry
+    registry = make()
+    handler = registry.get_handler(KEY_EN)
+    assert registry.get_handler(KEY_EN) is handler and registry.peek(KEY_EN) is handler
+    assert created_keys == [KEY_EN]
+    assert registry.peek(KEY_KO) is None and created_keys == [KEY_EN] # peek은 초기화하지 않음
+
+
+def test_capacity_evicts_least_recently_used(make_registry):
+    make, created_keys = make_registry
+    registry = make(max_engines=2)
+    en_handler = registry.get_handler(KEY_EN)
+    registry.get_handler(KEY_KO)
+    registry.get_handler(KEY_EN) # en을 최근 사용으로 갱신 -> 다음 해제 대상은 korean
+
+    registry.get_handler(KEY_JA)
+    assert registry.peek(KEY_KO) is None
+    assert registry.peek(KEY_EN) is en_handler and registry.peek(KEY_JA) is not None
+    assert en_handler.ocr_engine is not None
+
+    registry.get_handler(KEY_KO) # 다시 요청하면 새로 초기화
+    assert created_keys == [KEY_EN, KEY_KO, KEY_JA, KEY_KO]
+
+
+def test_memory_limit_evicts_and_released_engine_is_dropped(make_registry):
+    make, _ = make_registry
+    registry = make(max_engines=5, max_memory_mb=250, footprint_mb=100)
+    en_handler = registry.get_handler(KEY_EN)
+    registry.get_handler(KEY_KO)
+    registry.get_handler(KEY_JA) # 300 MB > 250 MB -> 가장 오래된 en 해제
+    assert registry.peek(KEY_EN) is None and en_handler.ocr_engine is None
+
+
+def test_active_engine_is_not_evicted(make_registry):
+    make, _ = make_registry
+    registry = make(max_engines=1)
+    active_handler = registry.get_handler(KEY_EN, activate=True)
+    registry.get_handler(KEY_KO) # 한도를 넘어도 사용 중인 엔진은 유지
+    assert registry.peek(KEY_EN) is active_handler
+
+    registry.deactivate()
+    registry.get_handler(KEY_JA)
+    assert registry.peek(KEY_EN) is None
+
+
+def test_concurrent_requests_initialize_once(make_registry):
+    make, created_keys = make_registry
+    registry = make(init_delay=0.1)
+    handlers = []
+    threads = [threading.Thread(target=lambda: handlers.append(registry.get_handler(KEY_EN))) for _ in range(4)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    assert created_keys == [KEY_EN] and len({id(handler) for handler in handlers}) == 1
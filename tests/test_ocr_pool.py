@@ -0,0 +1,176 @@
+# tests/test_ocr_pool.py
+# 워커 프로세스는 띄우지 않고, 디스패처가 하는 일(작업 할당/응답 처리)을 직접 호출해 실행 ID 격리를 확인합니다.
+import multiprocessing
+import os
+import queue
+import threading
+
+import pytest
+
+import ocr_pool as ocr_pool_module
+from ocr_pool import OcrProcessPool, _WorkerSlot
+
+
+class _FakeConn:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+class _FakeProcess:
+    pid = 12345
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    ocr_pool = OcrProcessPool({'engine': 'fake', 'lang_codes': 'en', 'perf_profile': {'cpu_threads': 1}}, max_workers=1)
+    monkeypatch.setattr(ocr_pool, '_ensure_started_locked', lambda: None)
+    slot = _WorkerSlot(_FakeProcess(), _FakeConn())
+    slot.ready = True
+    ocr_pool._workers = [slot]
+    return ocr_pool, slot
+
+
+def _dispatch(ocr_pool, slot):
+    with ocr_pool._lock:
+        ocr_pool._assign_pending_locked()
+    return slot.conn.sent[-1][0] # task_id
+
+
+def test_results_of_cancelled_run_are_dropped(pool):
+    ocr_pool, slot = pool
+    first_run = ocr_pool.begin_run()
+    ocr_pool.submit(0, b"image-a", run_id=first_run)
+    ocr_pool.submit(1, b"image-b", run_id=first_run)
+    first_task_id = _dispatch(ocr_pool, slot) # key 0은 워커에서 처리 중, key 1은 대기 중
+
+    ocr_pool.cancel() # 번역 중단
+    assert ocr_pool.outstanding_count() == 1 # 대기 작업은 버려지고 처리 중인 작업만 남음
+
+    second_run = ocr_pool.begin_run()
+    ocr_pool._handle_message(slot, ('result', first_task_id, ["stale"])) # 이전 실행 결과가 늦게 도착
+    ocr_pool.submit(0, b"image-c", run_id=second_run)
+    second_task_id = _dispatch(ocr_pool, slot)
+    ocr_pool._handle_message(slot, ('result', second_task_id, ["fresh"]))
+
+    assert list(ocr_pool.iter_results(1, run_id=second_run)) == [(0, ["fresh"], None)]
+    with pytest.raises(queue.Empty):
+        ocr_pool.get_result(timeout=0.05, run_id=second_run)
+
+
+def test_submit_for_cancelled_run_is_ignored(pool):
+    ocr_pool, _ = pool
+    old_run = ocr_pool.begin_run()
+    ocr_pool.begin_run()
+    ocr_pool.submit(0, b"image", run_id=old_run)
+    assert ocr_pool.outstanding_count() == 0
+
+
+def test_iter_results_stops_when_run_is_cancelled(pool):
+    ocr_pool, _ = pool
+    run_id = ocr_pool.begin_run()
+    ocr_pool.submit(0, b"image", run_id=run_id)
+    ocr_pool.cancel()
+    assert list(ocr_pool.iter_results(1, run_id=run_id)) == []
+
+
+def test_cancel_drains_queued_results(pool):
+    ocr_pool, slot = pool
+    run_id = ocr_pool.begin_run()
+    ocr_pool.submit(0, b"image", run_id=run_id)
+    task_id = _dispatch(ocr_pool, slot)
+    ocr_pool._handle_message(slot, ('result', task_id, ["done"])) # 결과는 왔지만 아무도 가져가지 않음
+    ocr_pool.cancel()
+    with pytest.raises(queue.Empty):
+        ocr_pool.get_result(timeout=0.05)
+
+
+class _ThreadProcess:
+    """워커 프로세스 대신 스레드로 워커 프로토콜을 흉내 냅니다. 종료하면 sentinel(파이프 읽기 끝)이 준비 상태가 됩니다."""
+
+    def __init__(self, conn):
+        self.sentinel, self._sentinel_writer = os.pipe()
+        self.exitcode = None
+        self._thread = threading.Thread(target=self._run, args=(conn,), daemon=True)
+        self._thread.start()
+        self.pid = self._thread.ident
+
+    def _run(self, conn):
+        conn.send(('ready', None, None))
+        while True:
+            try:
+                task = conn.recv()
+            except (EOFError, OSError):
+                break
+            if task is None: break
+            conn.send(('result', task[0], [task[1].decode()]))
+        self.exitcode = 0
+        os.close(self._sentinel_writer)
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def terminate(self):
+        pass
+
+
+def _spawn_thread_worker():
+    parent_conn, child_conn = multiprocessing.Pipe()
+    return _WorkerSlot(_ThreadProcess(child_conn), parent_conn)
+
+
+def test_shrinking_while_dispatcher_waits_keeps_results_flowing(monkeypatch):
+    ocr_pool = OcrProcessPool({'engine': 'fake', 'lang_codes': 'en', 'perf_profile': {'cpu_threads': 1}}, max_workers=3)
+    monkeypatch.setattr(ocr_pool, '_spawn_worker', _spawn_thread_worker)
+    shrink_counts = []
+
+    def _wait_after_shrink(connections, timeout=None):
+        # 디스패처가 워커 목록을 복사한 뒤 mp_wait에 들어가기 전에 다른 스레드(MemoryGovernor)가 워커를 줄이는 상황
+        if not shrink_counts and len(ocr_pool._workers) == 3:
+            shrink_thread = threading.Thread(target=lambda: shrink_counts.append(ocr_pool.shrink_idle_workers(keep=1)))
+            shrink_thread.start()
+            shrink_thread.join()
+        return real_mp_wait(connections, timeout=timeout)
+
+    real_mp_wait = ocr_pool_module.mp_wait
+    monkeypatch.setattr(ocr_pool_module, 'mp_wait', _wait_after_shrink)
+    try:
+        run_id = ocr_pool.begin_run()
+        job_count = 20
+        for key in range(job_count):
+            ocr_pool.submit(key, f"image-{key}".encode(), run_id=run_id)
+        results = [ocr_pool.get_result(timeout=5, run_id=run_id) for _ in range(job_count)]
+
+        assert shrink_counts == [2]
+        assert sorted(key for key, _, _ in results) == list(range(job_count))
+        assert all(error is None and ocr_results == [f"image-{key}"] for key, ocr_results, error in results)
+        assert ocr_pool._dispatcher.is_alive() and not ocr_pool.broken
+
+        ocr_pool.restore_workers()
+        ocr_pool.submit("after-restore", b"image-r", run_id=run_id)
+        assert ocr_pool.get_result(timeout=5, run_id=run_id) == ("after-restore", ["image-r"], None)
+    finally:
+        ocr_pool.shutdown(timeout=2)
+
+
+def test_dispatcher_error_fails_pending_jobs(pool, monkeypatch):
+    ocr_pool, _ = pool
+    run_id = ocr_pool.begin_run()
+    ocr_pool.submit(0, b"image-a", run_id=run_id)
+    ocr_pool.submit(1, b"image-b", run_id=run_id)
+
+    def _broken_dispatch():
+        raise RuntimeError("dispatch failed")
+
+    monkeypatch.setattr(ocr_pool, '_dispatch_once', _broken_dispatch)
+    ocr_pool._dispatch_loop() # 예외로 루프가 끝나도 기다리는 쪽이 멈추지 않아야 함
+
+    results = list(ocr_pool.iter_results(2, run_id=run_id))
+    assert [key for key, _, _ in results] == [0, 1]
+    assert all(ocr_results is None and "디스패처 오류" in error for _, ocr_results, error in results)
+    assert ocr_pool.broken
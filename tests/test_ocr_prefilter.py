@@ -0,0 +1,89 @@
+# tests/test_ocr_prefilter.py
+# 합성 이미지로 OCR 사전 검사가 빈 이미지/사진 같은 이미지는 거르고 글자가 있는 이미지는 통과시키는지 확인합니다.
+import io
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+import config
+from ocr_prefilter import likely_contains_text
+
+
+def _encode(image_pil, image_format='PNG'):
+    stream = io.BytesIO()
+    image_pil.save(stream, format=image_format)
+    return stream.getvalue()
+
+
+def _text_image(lines, size=(640, 360), font_size=28):
+    image_pil = Image.new('RGB', size, (250, 250, 245))
+    draw = ImageDraw.Draw(image_pil)
+    for line_idx, line in enumerate(lines):
+        draw.text((30, 30 + line_idx * (font_size + 16)), line, fill=(20, 20, 20), font=ImageFont.load_default(size=font_size))
+    return image_pil
+
+
+def _photo_like_image(size=(640, 360)):
+    # 부드러운 그라데이션 위에 흐린 원형 덩어리 (사진의 완만한 경계)
+    rng = np.random.default_rng(1)
+    width, height = size
+    gradient = np.linspace(60, 200, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    pixels = np.stack([gradient, gradient * 0.8 + 30, 255 - gradient], axis=-1)
+    for _ in range(12):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        cv2.circle(pixels, center, int(rng.integers(20, 90)), [float(c) for c in rng.integers(40, 220, size=3)], -1)
+    pixels = cv2.GaussianBlur(pixels, (0, 0), 12)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+
+@pytest.fixture(autouse=True)
+def _no_detector(monkeypatch):
+    monkeypatch.setattr(config, 'OCR_PREFILTER_USE_DETECTOR', False)
+
+
+@pytest.mark.parametrize("image_pil", [
+    Image.new('RGB', (640, 360), (255, 255, 255)),
+    Image.new('RGB', (640, 360), (12, 80, 160)),
+    _photo_like_image(),
+], ids=["white", "solid-color", "photo-like"])
+def test_images_without_text_are_rejected(image_pil):
+    assert likely_contains_text(_encode(image_pil))[0] is False
+
+
+@pytest.mark.parametrize("image_format", ['PNG', 'JPEG'])
+def test_text_images_are_accepted(image_format):
+    image_pil = _text_image(["Quarterly revenue summary", "Growth by region and product", "Next steps for the team"])
+    assert likely_contains_text(_encode(image_pil, image_format))[0] is True
+
+
+def test_text_over_photo_is_accepted():
+    image_pil = _photo_like_image()
+    draw = ImageDraw.Draw(image_pil)
+    for line_idx in range(3):
+        draw.text((40, 60 + line_idx * 50), "Caption over a photo", fill=(255, 255, 255), font=ImageFont.load_default(size=30))
+    assert likely_contains_text(_encode(image_pil))[0] is True
+
+
+def test_tiny_and_strip_images_are_rejected():
+    assert likely_contains_text(_encode(Image.new('RGB', (12, 12), 'white')))[0] is False
+    assert likely_contains_text(_encode(_text_image(["Divider"], size=(2000, 40), font_size=20)))[0] is False
+
+
+def test_undecodable_bytes_go_to_full_ocr():
+    assert likely_contains_text(b"not an image")[0] is True
+
+
+def test_detector_verdict_can_reject(monkeypatch):
+    class _StubDetector:
+        def __init__(self, has_regions):
+            self.has_regions = has_regions
+
+        def detect_text_regions(self, image_pil):
+            return self.has_regions
+
+    monkeypatch.setattr(config, 'OCR_PREFILTER_USE_DETECTOR', True)
+    image_bytes = _encode(_text_image(["Quarterly revenue summary", "Growth by region and product"]))
+    assert likely_contains_text(image_bytes, _StubDetector(False))[0] is False
+    assert likely_contains_text(image_bytes, _StubDetector(None))[0] is True # 판단 불가 -> 전체 OCR
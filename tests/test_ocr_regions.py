@@ -0,0 +1,43 @@
+# tests/test_ocr_regions.py
+from ocr_regions import merge_ocr_regions
+
+
+def _item(x1, y1, x2, y2, text, confidence=0.9, angle=None):
+    return [[[x1, y1], [x2, y1], [x2, y2], [x1, y2]], (text, confidence), angle]
+
+
+def _texts(merged_results):
+    return [text for _, (text, _), _ in merged_results]
+
+
+def test_words_on_a_line_and_lines_of_a_paragraph_are_merged():
+    fragments = [_item(120, 10, 200, 30, "world"), _item(10, 10, 100, 30, "Hello"),
+                 _item(10, 38, 150, 58, "second line")]
+    merged = merge_ocr_regions(fragments, merge_paragraphs=True, min_confidence=0.3)
+
+    assert _texts(merged) == ["Hello world second line"]
+    # 병합 박스는 조각들의 합집합 사각형
+    assert merged[0][0] == [[10, 10], [200, 10], [200, 58], [10, 58]]
+
+
+def test_paragraph_merge_can_be_disabled():
+    fragments = [_item(10, 10, 100, 30, "first"), _item(10, 38, 100, 58, "second")]
+    assert _texts(merge_ocr_regions(fragments, merge_paragraphs=False, min_confidence=0.3)) == ["first", "second"]
+
+
+def test_cjk_fragments_are_joined_without_space():
+    fragments = [_item(10, 10, 60, 30, "你好"), _item(66, 10, 116, 30, "世界")]
+    assert _texts(merge_ocr_regions(fragments, merge_paragraphs=False, min_confidence=0.3)) == ["你好世界"]
+
+
+def test_distant_and_low_confidence_fragments_stay_apart():
+    fragments = [_item(10, 10, 100, 30, "left"), _item(400, 10, 480, 30, "right"),
+                 _item(10, 200, 100, 220, "noise", confidence=0.1)]
+    assert _texts(merge_ocr_regions(fragments, merge_paragraphs=True, min_confidence=0.3)) == ["left", "right"]
+
+
+def test_tilted_fragments_pass_through_unmerged():
+    tilted = [[[10, 40], [100, 10], [110, 30], [20, 60]], ("tilted", 0.9), None]
+    fragments = [_item(10, 100, 100, 120, "flat"), tilted]
+    merged = merge_ocr_regions(fragments, merge_paragraphs=True, min_confidence=0.3)
+    assert merged[-1] is tilted and _texts(merged) == ["flat", "tilted"]
@@ -0,0 +1,127 @@
+# tests/test_ocr_resolution.py
+# 슬라이드 표시 크기(EMU)와 이미지 픽셀 크기로 정하는 OCR 축소 비율/생략 판단과 좌표 복원을 확인합니다.
+import io
+
+import pytest
+from PIL import Image
+
+import config
+from ocr_resolution import (DisplaySpec, filter_sub_legible_results, ocr_images_at_scale, offset_ocr_results, open_for_ocr,
+                            plan_ocr_resolution, scale_ocr_results, visible_region)
+
+EMU_PER_INCH = 914400
+
+
+def _spec(width_in, height_in, crop_left=0.0, crop_right=0.0, crop_top=0.0, crop_bottom=0.0):
+    return DisplaySpec(int(width_in * EMU_PER_INCH), int(height_in * EMU_PER_INCH), crop_left, crop_right, crop_top, crop_bottom)
+
+
+def _item(x1, y1, x2, y2, text="text"):
+    return [[[x1, y1], [x2, y1], [x2, y2], [x1, y2]], (text, 0.9), None]
+
+
+def _encode(size, image_format):
+    stream = io.BytesIO()
+    Image.new('RGB', size, (200, 120, 40)).save(stream, format=image_format)
+    return stream.getvalue()
+
+
+class _StubOcr:
+    """입력 크기를 기록하고, 입력 좌표 (10, 10)-(50, 20) 박스 하나를 돌려주는 가짜 OCR 핸들러."""
+
+    def __init__(self):
+        self.input_sizes = []
+
+    def ocr_images(self, images_pil):
+        self.input_sizes.extend((image_pil.size, image_pil.mode) for image_pil in images_pil)
+        return [[_item(10, 10, 50, 20)] for _ in images_pil]
+
+
+@pytest.fixture(autouse=True)
+def _resolution_settings(monkeypatch):
+    monkeypatch.setattr(config, 'OCR_TARGET_DPI', 200)
+    monkeypatch.setattr(config, 'OCR_DOWNSCALE_MIN_SIDE', 640)
+    monkeypatch.setattr(config, 'OCR_MIN_DISPLAY_TEXT_PT', 4)
+    monkeypatch.setattr(config, 'OCR_CROP_MIN_SAVING_RATIO', 0.9)
+
+
+@pytest.mark.parametrize("image_size, display_specs, expected_scale", [
+    ((2000, 1000), [_spec(4, 2)], 0.4), # 500 DPI -> 200 DPI
+    ((2000, 1000), [_spec(4, 2), _spec(8, 4)], 0.8), # 가장 크게(250 DPI) 표시된 그림 기준
+    ((2000, 1000), [_spec(2, 2, crop_left=0.5)], 0.4), # 보이는 1000px을 2인치에 표시
+    ((1000, 500), [_spec(1, 0.5)], 0.64), # 1000 DPI지만 긴 변 640px 아래로는 줄이지 않음
+    ((400, 200), [_spec(4, 2)], 1.0), # 100 DPI: 이미 목표 이하
+])
+def test_scale_targets_display_dpi(image_size, display_specs, expected_scale):
+    ocr_plan = plan_ocr_resolution(image_size, display_specs)
+    assert ocr_plan.scale == expected_scale and ocr_plan.skip_reason is None
+    assert ocr_plan.px_per_point == pytest.approx(ocr_plan.effective_dpi / 72)
+
+
+def test_tiny_display_is_skipped():
+    # 짧은 변이 2 x OCR_MIN_DISPLAY_TEXT_PT(8pt) 미만이면 안의 글자를 읽을 수 없으므로 OCR 생략
+    assert plan_ocr_resolution((800, 100), [_spec(1, 0.1)]).skip_reason is not None # 7.2pt
+    assert plan_ocr_resolution((800, 100), [_spec(1, 0.12)]).skip_reason is None # 8.64pt
+    # 같은 이미지가 한 곳에서라도 크게 표시되면 생략하지 않음
+    assert plan_ocr_resolution((800, 100), [_spec(1, 0.1), _spec(4, 0.5)]).skip_reason is None
+
+
+def test_unknown_size_or_display_keeps_full_resolution():
+    assert plan_ocr_resolution(None, [_spec(4, 2)]) == (1.0, None, None, None)
+    assert plan_ocr_resolution((2000, 1000), []) == (1.0, None, None, None)
+    assert plan_ocr_resolution((2000, 1000), [DisplaySpec(0, 0, 0.0, 0.0, 0.0, 0.0)]) == (1.0, None, None, None)
+
+
+def test_boxes_are_scaled_back_to_original_resolution():
+    ocr_results = [_item(10, 20, 50, 30)]
+    assert scale_ocr_results(ocr_results, 2.5) == [_item(25, 50, 125, 75)]
+    assert scale_ocr_results(ocr_results, 1.0) is ocr_results
+
+
+def test_sub_legible_results_are_dropped():
+    ocr_results = [_item(0, 0, 100, 7, "small"), _item(0, 20, 100, 28, "legible")]
+    # px_per_point 2 -> 4pt = 8px 미만 높이 제외
+    assert filter_sub_legible_results(ocr_results, 2.0) == [ocr_results[1]]
+    assert filter_sub_legible_results(ocr_results, None) is ocr_results
+
+
+def test_open_for_ocr_decodes_jpeg_at_reduced_size():
+    image_pil, decode_factor = open_for_ocr(_encode((1600, 800), 'JPEG'), 0.3)
+    # 480px 이상을 유지하는 가장 작은 JPEG 축소 디코딩 (1/2)
+    assert image_pil.size == (800, 400) and decode_factor == 0.5
+
+    image_pil, decode_factor = open_for_ocr(_encode((1600, 800), 'PNG'), 0.3)
+    assert image_pil.size == (1600, 800) and decode_factor == 1.0 # draft 미지원 포맷은 원본 크기
+    assert open_for_ocr(_encode((1600, 800), 'JPEG'), 1.0)[1] == 1.0
+
+
+def test_downscaled_input_boxes_map_back_to_original_pixels():
+    image_pil, decode_factor = open_for_ocr(_encode((1600, 800), 'JPEG'), 0.3)
+    stub_ocr = _StubOcr()
+    ocr_results = ocr_images_at_scale(stub_ocr, [image_pil], [0.3], [None], [decode_factor])[0]
+    # 1/2 디코딩 후 나머지(0.6)만 리샘플링해 480x240 RGB 입력, 박스는 1/0.3배로 복원
+    assert stub_ocr.input_sizes == [((480, 240), 'RGB')]
+    assert ocr_results == [_item(33, 33, 167, 67)]
+
+
+@pytest.mark.parametrize("display_specs, expected_region", [
+    ([_spec(2, 2, crop_left=0.25, crop_right=0.25)], (100, 0, 300, 200)),
+    ([_spec(2, 2, crop_top=0.5), _spec(2, 2, crop_left=0.5, crop_bottom=0.25)], None), # 두 그림의 보이는 영역 합집합이 전체
+    ([_spec(2, 2, crop_left=0.5, crop_top=0.5), _spec(2, 2, crop_left=0.25, crop_top=0.25, crop_right=0.5)], (100, 50, 400, 200)),
+    ([_spec(2, 2, crop_left=0.02)], None), # 잘린 부분이 작으면 전체 이미지 사용
+    ([_spec(2, 2, crop_left=-0.2, crop_right=0.6)], (0, 0, 160, 200)), # 음수 자르기(여백 확장)는 0으로 취급
+    ([_spec(2, 2, crop_left=0.6, crop_right=0.6)], None), # 보이는 영역이 없는 잘못된 자르기
+])
+def test_visible_region_of_cropped_pictures(display_specs, expected_region):
+    assert visible_region((400, 200), display_specs) == expected_region
+
+
+def test_region_boxes_are_offset_to_original_coordinates():
+    assert offset_ocr_results([_item(10, 10, 50, 20)], (100, 50, 300, 150)) == [_item(110, 60, 150, 70)]
+
+    image_pil, decode_factor = open_for_ocr(_encode((400, 200), 'PNG'), 0.5)
+    stub_ocr = _StubOcr()
+    ocr_results = ocr_images_at_scale(stub_ocr, [image_pil], [0.5], [(100, 50, 300, 150)], [decode_factor])[0]
+    # 보이는 영역(200x100)만 잘라 절반으로 축소해 OCR, 박스는 2배 후 영역 위치만큼 이동
+    assert stub_ocr.input_sizes == [((100, 50), 'RGB')]
+    assert ocr_results == [_item(120, 70, 200, 90)]
@@ -0,0 +1,94 @@
+# tests/test_ocr_tiling.py
+# OCR 엔진 대신 입력 이미지의 어두운 사각형을 찾아 박스로 돌려주는 가짜 핸들러로 타일/축소/영역 좌표 변환을 확인합니다.
+import io
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+import config
+from ocr_resolution import ocr_images_at_scale, open_for_ocr
+from ocr_tiling import merge_tile_results, plan_tiles
+
+
+class _DarkBoxOcrHandler:
+    def __init__(self):
+        self.inputs = [] # (크기, 모드)
+
+    def ocr_images(self, images_pil_rgb):
+        results = []
+        for image_pil in images_pil_rgb:
+            self.inputs.append((image_pil.size, image_pil.mode))
+            dark_y, dark_x = np.nonzero(np.asarray(image_pil.convert('L')) < 128)
+            if not len(dark_x):
+                results.append([])
+                continue
+            x1, y1, x2, y2 = int(dark_x.min()), int(dark_y.min()), int(dark_x.max()), int(dark_y.max())
+            results.append([[[[x1, y1], [x2, y1], [x2, y2], [x1, y2]], ("text", 0.9), None]])
+        return results
+
+
+def _image_with_box(size, box, mode='RGB'):
+    image_pil = Image.new('RGB', size, 'white')
+    ImageDraw.Draw(image_pil).rectangle(box, fill='black')
+    return image_pil.convert(mode) if mode != 'RGB' else image_pil
+
+
+def _bounds(ocr_results):
+    box_points = ocr_results[0][0]
+    return (min(p[0] for p in box_points), min(p[1] for p in box_points),
+            max(p[0] for p in box_points), max(p[1] for p in box_points))
+
+
+def test_plan_tiles_covers_image_with_overlap():
+    tiles = plan_tiles(3000, 1000, 1600, 1600, 160)
+    assert tiles == [(0, 0, 1600, 1000), (1400, 0, 3000, 1000)]
+    assert plan_tiles(800, 600, 1600, 1600, 160) == [(0, 0, 800, 600)]
+
+
+def test_merge_drops_duplicates_and_boxes_cut_at_inner_edge(monkeypatch):
+    monkeypatch.setattr(config, 'OCR_TILE_OVERLAP', 100)
+    left_tile, right_tile = (0, 0, 1000, 500), (900, 0, 1900, 500)
+    whole = [[[950, 10], [980, 10], [980, 40], [950, 40]], ("word", 0.9), None]
+    cut = [[[995, 10], [1000, 10], [1000, 40], [995, 40]], ("w", 0.8), None]
+    merged = merge_tile_results([(left_tile, [whole, cut]), (right_tile, [whole])], (1900, 500))
+    assert merged == [whole]
+
+
+def test_tiled_ocr_maps_boxes_back_to_region_coordinates(monkeypatch):
+    monkeypatch.setattr(config, 'OCR_TILE_MAX_SIDE', 1000)
+    monkeypatch.setattr(config, 'OCR_TILE_SIZE', 600)
+    handler = _DarkBoxOcrHandler()
+    image_pil = _image_with_box((2000, 800), (1500, 300, 1560, 340), mode='P')
+
+    results = ocr_images_at_scale(handler, [image_pil], [1.0], [(200, 100, 1800, 700)])[0]
+
+    assert _bounds(results) == (1500, 300, 1560, 340)
+    # 타일만 RGB로 변환되고 영역 밖/전체 크기 이미지는 OCR 입력으로 만들지 않음
+    assert all(mode == 'RGB' and max(size) <= 600 for size, mode in handler.inputs)
+
+
+def test_downscaled_region_maps_back_to_original_coordinates():
+    handler = _DarkBoxOcrHandler()
+    image_pil = _image_with_box((1000, 800), (400, 400, 599, 499))
+
+    results = ocr_images_at_scale(handler, [image_pil], [0.5], [(200, 200, 1000, 800)])[0]
+
+    assert handler.inputs == [((400, 300), 'RGB')]
+    x1, y1, x2, y2 = _bounds(results)
+    assert abs(x1 - 400) <= 2 and abs(y1 - 400) <= 2 and abs(x2 - 599) <= 3 and abs(y2 - 499) <= 3
+
+
+def test_jpeg_is_draft_decoded_and_mapped_back():
+    jpeg_stream = io.BytesIO()
+    _image_with_box((1600, 1200), (800, 600, 999, 799)).save(jpeg_stream, format='JPEG', quality=95)
+    image_pil, decode_factor = open_for_ocr(jpeg_stream.getvalue(), 0.3)
+    assert decode_factor == pytest.approx(0.5) # draft는 요청 크기 이상인 1/2, 1/4, 1/8 중 가장 작은 크기
+    assert image_pil.size == (800, 600)
+
+    handler = _DarkBoxOcrHandler()
+    results = ocr_images_at_scale(handler, [image_pil], [0.3], [None], [decode_factor])[0]
+
+    assert handler.inputs == [((480, 360), 'RGB')]
+    x1, y1, x2, y2 = _bounds(results)
+    assert abs(x1 - 800) <= 5 and abs(y1 - 600) <= 5 and abs(x2 - 999) <= 5 and abs(y2 - 799) <= 5
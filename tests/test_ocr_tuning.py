@@ -0,0 +1,77 @@
+# tests/test_ocr_tuning.py
+# 엔진 라이브러리 대신 초기화 인자를 기록하는 가짜 PaddleOCR/EasyOCR로, 성능 프로필(스레드 수, 인식 배치 크기, 검출 입력 한도)이
+# 엔진 초기화와 추론 호출까지 전달되는지와 프로필 결정 순서를 확인합니다.
+import json
+import os
+import sys
+import types
+
+import pytest
+from PIL import Image
+
+import config
+import ocr_tuning
+from ocr_handler import EasyOcrHandler, create_ocr_handler
+
+
+class _FakePaddleOCR:
+    init_kwargs = []
+
+    def __init__(self, **kwargs):
+        _FakePaddleOCR.init_kwargs.append(kwargs)
+
+
+@pytest.fixture
+def fake_paddleocr(monkeypatch):
+    _FakePaddleOCR.init_kwargs = []
+    monkeypatch.setitem(sys.modules, 'paddleocr', types.SimpleNamespace(PaddleOCR=_FakePaddleOCR))
+    return _FakePaddleOCR.init_kwargs
+
+
+def test_paddle_profile_reaches_engine_init(fake_paddleocr):
+    perf_profile = {'cpu_threads': 3, 'enable_mkldnn': True, 'rec_batch_size': 12, 'det_max_side': 1280}
+    handler = create_ocr_handler({'engine': 'paddleocr', 'lang_codes': 'en', 'perf_profile': perf_profile})
+    init_kwargs = fake_paddleocr[-1]
+    assert (init_kwargs['cpu_threads'], init_kwargs['enable_mkldnn'], init_kwargs['rec_batch_num']) == (3, True, 12)
+    assert (init_kwargs['det_limit_side_len'], init_kwargs['det_limit_type']) == (1280, 'max')
+    assert "det_max_side=1280" in handler.get_cache_fingerprint() # 검출 한도가 바뀌면 OCR 결과 캐시도 구분
+
+    create_ocr_handler({'engine': 'paddleocr', 'lang_codes': 'en', 'use_gpu': True, 'perf_profile': perf_profile})
+    assert fake_paddleocr[-1]['enable_mkldnn'] is False # MKL-DNN은 CPU 추론에만 사용
+
+
+def test_missing_batch_size_falls_back_to_ocr_batch_size(fake_paddleocr, monkeypatch):
+    monkeypatch.setattr(config, 'OCR_BATCH_SIZE', 7)
+    create_ocr_handler({'engine': 'paddleocr', 'lang_codes': 'en', 'perf_profile': {'cpu_threads': 2}})
+    assert fake_paddleocr[-1]['rec_batch_num'] == 7 and fake_paddleocr[-1]['det_limit_side_len'] == 960
+
+
+def test_easyocr_profile_reaches_readtext():
+    calls = []
+
+    class _FakeReader:
+        def readtext(self, image_np, **kwargs):
+            calls.append(kwargs)
+            return []
+
+    handler = EasyOcrHandler.__new__(EasyOcrHandler)
+    handler.ocr_engine = _FakeReader()
+    handler.perf_profile = {'cpu_threads': 2, 'rec_batch_size': 16, 'det_max_side': 1600}
+    handler.ocr_image(Image.new('RGB', (40, 20), 'white'))
+    assert (calls[-1]['batch_size'], calls[-1]['canvas_size']) == (16, 1600)
+
+
+def test_profile_resolution_order(monkeypatch, tmp_path):
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+    monkeypatch.setattr(config, 'OCR_RESERVED_CPU_CORES', 2)
+    monkeypatch.setattr(config, 'OCR_PERF_PROFILE', {'paddleocr': {'cpu_threads': None, 'rec_batch_size': 6, 'det_max_side': 960}})
+    monkeypatch.setattr(config, 'OCR_TUNING_PROFILE_PATH', str(tmp_path / "ocr_tuning.json"))
+
+    # 보정 기록 없음: 기본값 + (8 - 2)코어를 워커 2개가 나눠 3 스레드
+    assert ocr_tuning.resolve_perf_profile('paddleocr', concurrent_engines=2) == {'cpu_threads': 3, 'rec_batch_size': 6, 'det_max_side': 960}
+
+    # 같은 엔진/워커 수/코어 수로 보정한 결과가 기본값을 덮어씀 (다른 워커 수의 기록은 사용하지 않음)
+    stored_profiles = {ocr_tuning._calibration_key('paddleocr', 2): {'settings': {'cpu_threads': 4, 'rec_batch_size': 12}}}
+    (tmp_path / "ocr_tuning.json").write_text(json.dumps(stored_profiles), encoding='utf-8')
+    assert ocr_tuning.resolve_perf_profile('paddleocr', concurrent_engines=2) == {'cpu_threads': 4, 'rec_batch_size': 12, 'det_max_side': 960}
+    assert ocr_tuning.resolve_perf_profile('paddleocr', concurrent_engines=1)['cpu_threads'] == 6
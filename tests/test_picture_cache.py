@@ -0,0 +1,147 @@
+# tests/test_picture_cache.py
+# 가짜 OCR 엔진/번역기로 1단계를 두 번 실행해 OCR 결과 캐시와 렌더링 캐시가 다음 실행에서 쓰이는지 확인합니다.
+import io
+import shutil
+import threading
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+from pptx import Presentation
+from pptx.util import Inches
+
+import config
+import ocr_handler
+import ocr_prefilter
+import pptx_handler
+import translator
+from disk_cache import OcrResultCache, RenderedImageCache
+
+
+class _FakeOcr(ocr_handler.BaseOcrHandler):
+    engine_name = 'fake'
+    image_sizes = []
+
+    def _initialize_engine(self):
+        self.ocr_engine = object()
+
+    def ocr_image(self, image_pil_rgb):
+        _FakeOcr.image_sizes.append(image_pil_rgb.size)
+        return [[[[20, 20], [200, 20], [200, 60], [20, 60]], ("이미지 글자", 0.95), None]]
+
+
+class _FakeTranslator(translator.OllamaTranslator):
+    def translate_text(self, text, *args, **kwargs):
+        return "T(" + text + ")"
+
+
+class _FakeOllama:
+    url = 'http://localhost'
+    connect_timeout = 1
+    read_timeout = 1
+
+    def is_running(self):
+        return True, '11434'
+
+
+def _png(draw_text):
+    image_pil = Image.new('RGB', (400, 200), (240, 240, 240))
+    if draw_text:
+        draw = ImageDraw.Draw(image_pil)
+        for line_idx in range(3):
+            draw.text((20, 30 + line_idx * 40), "Sample caption text", fill=(0, 0, 0), font=ImageFont.load_default(size=24))
+    stream = io.BytesIO()
+    image_pil.save(stream, 'PNG')
+    stream.seek(0)
+    return stream
+
+
+@pytest.fixture
+def deck_path(tmp_path):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_picture(_png(draw_text=True), Inches(1), Inches(1), Inches(4), Inches(2))
+    slide.shapes.add_picture(_png(draw_text=False), Inches(1), Inches(4), Inches(4), Inches(2)) # 빈 이미지 (사전 검사에서 생략)
+    path = tmp_path / "deck.pptx"
+    prs.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    prefilter_calls = []
+    original_prefilter = ocr_prefilter.likely_contains_text
+
+    def _counting_prefilter(image_bytes, handler=None):
+        prefilter_calls.append(len(image_bytes))
+        return original_prefilter(image_bytes, handler)
+
+    monkeypatch.setattr(ocr_prefilter, 'likely_contains_text', _counting_prefilter)
+    monkeypatch.setattr(config, 'OCR_PREFILTER_ENABLED', True)
+    _FakeOcr.image_sizes = []
+    return prefilter_calls
+
+
+def _run_stage1(deck_path, tmp_path, with_render_cache=False):
+    handler = pptx_handler.PptxHandler()
+    handler.ocr_cache = OcrResultCache(str(tmp_path / "ocr"), max_bytes=1 << 20)
+    handler.render_cache = RenderedImageCache(str(tmp_path / "rendered"), max_bytes=1 << 22) if with_render_cache else None
+    prs = Presentation(deck_path)
+    stage1_success = handler.translate_presentation_stage1(
+        prs, '영어', '한국어', _FakeTranslator(), _FakeOcr('en'), 'model', _FakeOllama(), 'ko',
+        str(tmp_path / "task.log"), None, threading.Event(), True, 0.4)
+    assert stage1_success
+    return prs
+
+
+def test_ocr_results_and_no_text_verdicts_are_reused(deck_path, tmp_path, counters):
+    prefilter_calls = counters
+    _run_stage1(deck_path, tmp_path)
+    assert len(prefilter_calls) == 2 and len(_FakeOcr.image_sizes) == 1
+
+    _run_stage1(deck_path, tmp_path)
+    # 텍스트 이미지는 OCR 결과 캐시, 빈 이미지는 '텍스트 없음' 판정 캐시를 사용해 OCR도 사전 검사도 다시 하지 않음
+    assert len(prefilter_calls) == 2 and len(_FakeOcr.image_sizes) == 1
+
+
+def test_tile_settings_change_invalidates_ocr_results(deck_path, tmp_path, counters, monkeypatch):
+    _run_stage1(deck_path, tmp_path)
+    monkeypatch.setattr(config, 'OCR_TILE_OVERLAP', config.OCR_TILE_OVERLAP + 40)
+    _run_stage1(deck_path, tmp_path)
+    assert len(_FakeOcr.image_sizes) == 2
+
+
+def test_prefilter_settings_change_invalidates_no_text_verdict(deck_path, tmp_path, counters, monkeypatch):
+    prefilter_calls = counters
+    _run_stage1(deck_path, tmp_path)
+    monkeypatch.setattr(config, 'OCR_PREFILTER_MIN_EDGE_DENSITY', config.OCR_PREFILTER_MIN_EDGE_DENSITY / 2)
+    _run_stage1(deck_path, tmp_path)
+    # 텍스트 이미지는 OCR 결과 캐시를 쓰고, 빈 이미지만 바뀐 설정으로 다시 검사
+    assert len(prefilter_calls) == 3 and len(_FakeOcr.image_sizes) == 1
+
+
+
+def _rendered_entries(tmp_path):
+    return {path.name for path in (tmp_path / "rendered").rglob("*.bin")}
+
+
+def test_rendered_images_are_reused(deck_path, tmp_path, counters):
+    _run_stage1(deck_path, tmp_path, with_render_cache=True)
+    assert _rendered_entries(tmp_path) and len(_FakeOcr.image_sizes) == 1
+
+    shutil.rmtree(tmp_path / "ocr") # OCR 결과 캐시 없이 렌더링 캐시만으로 교체되는지 확인
+    _run_stage1(deck_path, tmp_path, with_render_cache=True)
+    assert len(_FakeOcr.image_sizes) == 1
+
+
+@pytest.mark.parametrize("config_name, new_value", [
+    ('OCR_TILE_OVERLAP', 200), ('OCR_CROP_MIN_SAVING_RATIO', 0.5), ('OCR_PREFILTER_MIN_GRADIENT', 60.0),
+])
+def test_ocr_settings_change_invalidates_rendered_images(deck_path, tmp_path, counters, monkeypatch,
+                                                         config_name, new_value):
+    _run_stage1(deck_path, tmp_path, with_render_cache=True)
+    stored_entries = _rendered_entries(tmp_path)
+
+    monkeypatch.setattr(config, config_name, new_value)
+    _run_stage1(deck_path, tmp_path, with_render_cache=True)
+    # 기존 항목을 쓰지 않고 새 지문으로 다시 렌더링해 저장
+    assert _rendered_entries(tmp_path) - stored_entries
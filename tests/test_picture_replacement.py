@@ -0,0 +1,78 @@
+# tests/test_picture_replacement.py
+# 같은 이미지를 여러 슬라이드/도형에서 쓰는 발표 자료로 SHA1 그룹화와 r:embed 교체, 참조가 없어진 기존 관계 정리를 확인합니다.
+import io
+import zipfile
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from pptx_handler import PptxHandler
+
+
+def _png(color):
+    stream = io.BytesIO()
+    Image.new('RGB', (60, 30), color).save(stream, format='PNG')
+    stream.seek(0)
+    return stream
+
+
+@pytest.fixture
+def deck(tmp_path):
+    prs = Presentation()
+    first_slide = prs.slides.add_slide(prs.slide_layouts[6])
+    first_slide.shapes.add_picture(_png('red'), Inches(1), Inches(1))
+    first_slide.shapes.add_picture(_png('red'), Inches(3), Inches(1)) # 같은 슬라이드에서 같은 이미지 (같은 관계 공유)
+    second_slide = prs.slides.add_slide(prs.slide_layouts[6])
+    second_slide.shapes.add_picture(_png('red'), Inches(1), Inches(1)) # 다른 슬라이드에서 같은 이미지
+    second_slide.shapes.add_picture(_png('blue'), Inches(3), Inches(1))
+    path = tmp_path / "deck.pptx"
+    prs.save(str(path))
+    prs = Presentation(str(path))
+    picture_jobs = [{'slide_idx': slide_idx, 'shape_obj_ref': shape, 'name': shape.name, 'shape_id_log': shape.shape_id}
+                    for slide_idx, slide in enumerate(prs.slides) for shape in slide.shapes]
+    return prs, picture_jobs
+
+
+def _image_rel_ids(slide):
+    return sorted(rId for rId, rel in slide.part.rels.items() if rel.reltype.endswith('/image'))
+
+
+def test_duplicate_images_are_grouped_by_sha1(deck):
+    _, picture_jobs = deck
+    picture_groups = PptxHandler()._group_picture_jobs(picture_jobs, io.StringIO())
+
+    assert [len(picture_group['jobs']) for picture_group in picture_groups] == [3, 1]
+    red_group, blue_group = picture_groups
+    assert red_group['sha1'] == picture_jobs[0]['shape_obj_ref'].image.sha1 != blue_group['sha1']
+    assert red_group['image_size'] == (60, 30) and red_group['image_bytes'] == picture_jobs[2]['shape_obj_ref'].image.blob
+
+
+def test_replacement_drops_old_relationship_only_when_unreferenced(deck, tmp_path):
+    prs, picture_jobs = deck
+    handler = PptxHandler()
+    first_slide, second_slide = prs.slides
+    shared_rId = picture_jobs[0]['shape_obj_ref']._element.blipFill.blip.rEmbed
+    assert picture_jobs[1]['shape_obj_ref']._element.blipFill.blip.rEmbed == shared_rId
+    translated_png = _png('green').getvalue()
+
+    handler._replace_picture_shape(picture_jobs[0], io.BytesIO(translated_png), io.StringIO())
+    # 같은 슬라이드의 두 번째 그림이 아직 기존 관계를 참조하므로 유지
+    assert shared_rId in _image_rel_ids(first_slide) and handler._count_rel_references(first_slide.part, shared_rId) == 1
+
+    handler._replace_picture_shape(picture_jobs[1], io.BytesIO(translated_png), io.StringIO())
+    assert shared_rId not in _image_rel_ids(first_slide) and len(_image_rel_ids(first_slide)) == 1
+
+    handler._replace_picture_shape(picture_jobs[2], io.BytesIO(translated_png), io.StringIO())
+    for picture_job in picture_jobs[:3]:
+        assert picture_job['shape_obj_ref'].image.blob == translated_png
+    assert picture_jobs[3]['shape_obj_ref'].image.sha1 != picture_jobs[0]['shape_obj_ref'].image.sha1 # 다른 이미지는 그대로
+
+    output_path = tmp_path / "replaced.pptx"
+    prs.save(str(output_path))
+    with zipfile.ZipFile(output_path) as zip_file:
+        media_names = [name for name in zip_file.namelist() if name.startswith('ppt/media/')]
+        media_blobs = [zip_file.read(name) for name in media_names]
+    # 원래 빨간 이미지 파트는 더 이상 참조되지 않아 저장되지 않고, 번역된 이미지는 한 파트를 함께 사용
+    assert len(media_names) == 2 and media_blobs.count(translated_png) == 1
@@ -0,0 +1,71 @@
+# tests/test_pptx_zip_scanner.py
+# zip 스캔 결과가 python-pptx로 파싱한 결과(analyze_presentation)와 같은지 여러 도형 종류가 섞인 발표 자료로 확인합니다.
+import io
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches
+
+import config
+from pptx_handler import PptxHandler, should_skip_translation
+from pptx_zip_scanner import scan_file_info
+
+
+def _png_bytes():
+    stream = io.BytesIO()
+    Image.new('RGB', (40, 20), 'white').save(stream, format='PNG')
+    stream.seek(0)
+    return stream
+
+
+@pytest.fixture
+def deck_path(tmp_path):
+    prs = Presentation()
+    title_slide = prs.slides.add_slide(prs.slide_layouts[0]) # 자리 표시자 (제목/부제목)
+    title_slide.shapes.title.text = "발표 제목"
+    title_slide.placeholders[1].text = "부제목\v줄바꿈 포함"
+
+    content_slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_box = content_slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+    text_box.text_frame.text = "첫 문단"
+    text_box.text_frame.add_paragraph().text = "둘째 문단"
+    content_slide.shapes.add_textbox(Inches(1), Inches(2), Inches(2), Inches(1)).text_frame.text = "   " # 공백만
+    content_slide.shapes.add_textbox(Inches(1), Inches(3), Inches(2), Inches(1)).text_frame.text = "12345" # 번역 스킵
+    table = content_slide.shapes.add_table(2, 2, Inches(1), Inches(4), Inches(4), Inches(1)).table
+    table.cell(0, 0).text = "표 머리글"
+    table.cell(1, 1).text = "값 설명"
+    content_slide.shapes.add_picture(_png_bytes(), Inches(5), Inches(1))
+    content_slide.shapes.add_picture(_png_bytes(), Inches(6), Inches(1)) # 같은 이미지를 쓰는 두 번째 그림
+
+    chart_slide = prs.slides.add_slide(prs.slide_layouts[5]) # 제목 자리 표시자 (비어 있음)
+    chart_data = CategoryChartData()
+    chart_data.categories = ['가', '나']
+    chart_data.add_series('시리즈', (1, 2))
+    chart_slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(2), Inches(4), Inches(3), chart_data)
+
+    prs.slides.add_slide(prs.slide_layouts[6]) # 빈 슬라이드
+    path = tmp_path / "deck.pptx"
+    prs.save(str(path))
+    return str(path)
+
+
+def test_scan_matches_python_pptx_analysis(deck_path):
+    expected = PptxHandler().analyze_presentation(deck_path).file_info()
+    scanned = scan_file_info(deck_path, should_skip_translation)
+
+    assert scanned == expected
+    assert scanned['slide_count'] == 4 and scanned['image_elements_count'] == 2 and scanned['chart_elements_count'] == 1
+
+
+def test_get_file_info_falls_back_to_python_pptx(deck_path, monkeypatch):
+    expected = PptxHandler().analyze_presentation(deck_path).file_info()
+
+    def _broken_scan(*args):
+        raise KeyError("ppt/slides/slide1.xml")
+
+    monkeypatch.setattr('pptx_zip_scanner._scan_slide', _broken_scan)
+    monkeypatch.setattr(config, 'FAST_FILE_INFO_ENABLED', True)
+    assert PptxHandler().get_file_info(deck_path) == expected
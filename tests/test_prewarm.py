@@ -0,0 +1,95 @@
+# tests/test_prewarm.py
+# 시작 시 미리 올리기: Ollama 모델 워밍업 요청, 현재 원본 언어의 OCR 엔진 선택, 로딩 중인 엔진을 번역 시작이 기다려 재사용하는지 확인합니다.
+import time
+import types
+
+import pytest
+import requests
+
+import config
+import main
+import ollama_service
+from ocr_engine_registry import OcrEngineRegistry, resolve_ocr_engine
+
+
+class _FakeResponse:
+    def raise_for_status(self):
+        pass
+
+
+def test_warm_up_model_sends_one_token_keep_alive_request(monkeypatch):
+    posted = []
+    monkeypatch.setattr(ollama_service.requests, 'post', lambda url, json=None, timeout=None: posted.append((url, json)) or _FakeResponse())
+    service = ollama_service.OllamaService("http://ollama.test:11434")
+
+    assert service.warm_up_model("gemma3:12b", options={'num_thread': 4}) is True
+    url, payload = posted[-1]
+    assert url == "http://ollama.test:11434/api/generate"
+    assert payload['model'] == "gemma3:12b" and payload['prompt'] == "" and payload['keep_alive'] == config.OLLAMA_WARMUP_KEEP_ALIVE
+    # 번역 요청과 같은 num_thread를 넣어야 번역 시작 시 모델을 다시 올리지 않음
+    assert payload['options'] == {'num_thread': 4, 'num_predict': 1}
+
+
+def test_warm_up_failure_is_reported_not_raised(monkeypatch):
+    def _refused(*args, **kwargs):
+        raise requests.exceptions.ConnectionError("refused")
+
+    monkeypatch.setattr(ollama_service.requests, 'post', _refused)
+    assert ollama_service.OllamaService("http://ollama.test:11434").warm_up_model("gemma3:12b") is False
+
+
+class _RecordingRegistry:
+    def __init__(self):
+        self.preloaded = []
+
+    def peek(self, key):
+        return None
+
+    def preload(self, keys, debug_enabled=False, on_loaded=None):
+        self.preloaded.append(list(keys))
+
+
+def _fake_app(image_translation_enabled, src_lang='영어'):
+    return types.SimpleNamespace(
+        image_translation_enabled_var=types.SimpleNamespace(get=lambda: image_translation_enabled),
+        src_lang_var=types.SimpleNamespace(get=lambda: src_lang),
+        ocr_use_gpu_var=types.SimpleNamespace(get=lambda: False),
+        ocr_engine_registry=_RecordingRegistry(),
+        ocr_status_label=types.SimpleNamespace(config=lambda **kwargs: None),
+        _resolve_ocr_engine=resolve_ocr_engine,
+    )
+
+
+@pytest.mark.parametrize("prewarm_enabled, image_translation_enabled, expect_preload", [
+    (True, True, True), (False, True, False), (True, False, False),
+])
+def test_startup_preloads_engine_for_current_source_language(monkeypatch, prewarm_enabled, image_translation_enabled, expect_preload):
+    monkeypatch.setattr(config, 'STARTUP_PREWARM_ENABLED', prewarm_enabled)
+    monkeypatch.setattr(config, 'OCR_PRELOAD_UI_LANGS', [])
+    fake_app = _fake_app(image_translation_enabled)
+    main.Application._preload_ocr_engines(fake_app)
+
+    _, engine_name_internal, ocr_lang_code = resolve_ocr_engine('영어')
+    expected_preloads = [[OcrEngineRegistry.make_key(engine_name_internal, ocr_lang_code, False)]] if expect_preload else []
+    assert fake_app.ocr_engine_registry.preloaded == expected_preloads
+
+
+def test_start_during_preload_waits_for_the_same_engine(monkeypatch):
+    registry = OcrEngineRegistry(max_engines=2)
+    created_keys = []
+
+    def _slow_create_handler(key, debug_enabled):
+        time.sleep(0.2) # 모델 로드 중
+        created_keys.append(key)
+        return types.SimpleNamespace(ocr_engine=object()), 0
+
+    monkeypatch.setattr(registry, '_create_handler', _slow_create_handler)
+    engine_key = OcrEngineRegistry.make_key("paddleocr", "en", False)
+    loaded_keys = []
+    preload_thread = registry.preload([engine_key], on_loaded=lambda key, error: loaded_keys.append((key, error)))
+    time.sleep(0.05)
+
+    handler = registry.get_handler(engine_key, activate=True) # 번역 시작: 새로 만들지 않고 로딩 완료를 기다림
+    preload_thread.join(timeout=2)
+    assert created_keys == [engine_key] and registry.peek(engine_key) is handler
+    assert loaded_keys == [(engine_key, None)]
@@ -0,0 +1,56 @@
+# tests/test_startup.py
+# 시작 시간 관련 동작: OCR 라이브러리 설치 확인이 패키지를 import하지 않는지, --startup-timing이 import 시간과 단계 시각을 기록하는지 확인합니다.
+import builtins
+import logging
+import sys
+
+import pytest
+
+import startup_timing
+import utils
+
+
+@pytest.mark.parametrize("module_name, check", [("paddleocr", utils.check_paddleocr), ("easyocr", utils.check_easyocr)])
+def test_dependency_check_finds_package_without_importing(tmp_path, monkeypatch, module_name, check):
+    package_dir = tmp_path / module_name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("raise RuntimeError('설치 확인에서 import하면 안 됨')\n", encoding='utf-8')
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+    assert check() is False # 아직 경로에 없음
+    monkeypatch.syspath_prepend(str(tmp_path)) # 실행 중 설치된 것처럼 경로 추가
+    assert check() is True
+    assert module_name not in sys.modules
+
+
+@pytest.fixture
+def clean_timing_state(monkeypatch):
+    monkeypatch.setattr(startup_timing, '_marks', [])
+    monkeypatch.setattr(startup_timing, '_import_records', [])
+    yield
+    startup_timing.disable_import_timing()
+
+
+def test_startup_flag_is_read_from_argv():
+    assert startup_timing.is_requested(["main.py", "--startup-timing"])
+    assert not startup_timing.is_requested(["main.py"])
+
+
+def test_import_timing_records_new_modules_and_report_restores_import(tmp_path, monkeypatch, caplog, clean_timing_state):
+    (tmp_path / "timed_parent.py").write_text("import timed_child\n", encoding='utf-8')
+    (tmp_path / "timed_child.py").write_text("VALUE = 1\n", encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for module_name in ("timed_parent", "timed_child"): monkeypatch.delitem(sys.modules, module_name, raising=False)
+    original_import = builtins.__import__
+
+    startup_timing.enable_import_timing()
+    import timed_parent # noqa: F401
+    import timed_parent as timed_parent_again # noqa: F401 (이미 로드된 모듈은 기록하지 않음)
+    startup_timing.mark("창 생성 완료")
+
+    recorded = [(depth, name) for depth, name, _ in startup_timing._import_records]
+    assert recorded == [(1, "timed_child"), (0, "timed_parent")] # 하위 import가 먼저 끝나고 한 단계 깊게 기록
+    with caplog.at_level(logging.INFO, logger=startup_timing.__name__):
+        startup_timing.report()
+    assert "창 생성 완료" in caplog.text and "timed_parent" in caplog.text
+    assert builtins.__import__ is original_import # 보고 후에는 원래 import로 복구
@@ -0,0 +1,50 @@
+# tests/test_text_layout.py
+import os
+
+import pytest
+from PIL import ImageDraw, Image, ImageFont
+
+import config
+from text_layout import fit_text_to_box, split_break_units, split_grapheme_clusters
+
+FONT_PATH = os.path.join(config.FONTS_DIR, "NotoSansThai-VariableFont_wdth,wght.ttf")
+
+
+def test_break_units_by_script():
+    # 라틴/한글은 단어(뒤 공백 포함), 한자/가나는 글자 단위이며 닫는 문장부호는 앞 글자에 붙음
+    assert split_break_units("Hello world") == [("Hello", " "), ("world", "")]
+    assert split_break_units("안녕 하세요") == [("안녕", " "), ("하세요", "")]
+    assert split_break_units("你好。世界") == [("你", ""), ("好。", ""), ("世", ""), ("界", "")]
+
+
+def test_thai_combining_marks_stay_with_their_consonant():
+    assert split_grapheme_clusters("กี่น้ำ") == ["กี่", "น้ำ"]
+
+
+@pytest.mark.skipif(not os.path.exists(FONT_PATH), reason="테스트용 폰트 없음")
+@pytest.mark.parametrize("text, box_width, box_height", [
+    ("Translated caption text that needs wrapping", 300, 120),
+    ("Short", 400, 60),
+    ("첫 줄\n둘째 줄 텍스트", 200, 200),
+])
+def test_fit_matches_pillow_layout(text, box_width, box_height):
+    fonts = {}
+
+    def font_loader(size):
+        if size not in fonts: fonts[size] = ImageFont.truetype(FONT_PATH, size)
+        return fonts[size]
+
+    fit_result = fit_text_to_box(text, box_width, box_height, font_loader, lambda font, s: font.getlength(s),
+                                 min_font_size=6, max_font_size=80)
+
+    # 고른 크기로 Pillow가 실제로 그린 블록이 상자 안에 들어가야 함
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    bbox = draw.multiline_textbbox((0, 0), "\n".join(fit_result.lines), font=font_loader(fit_result.font_size),
+                                   spacing=fit_result.line_spacing)
+    assert bbox[2] - bbox[0] <= box_width
+    assert fit_result.height <= box_height and bbox[3] <= box_height + 1
+    # 한 크기 더 키우면 넘쳐야 함 (가장 큰 크기를 골랐는지)
+    if fit_result.font_size < 80:
+        larger = fit_text_to_box(text, box_width, box_height, font_loader, lambda font, s: font.getlength(s),
+                                 min_font_size=fit_result.font_size + 1, max_font_size=fit_result.font_size + 1)
+        assert larger.width > box_width or larger.height > box_height
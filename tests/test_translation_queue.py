@@ -0,0 +1,88 @@
+# tests/test_translation_queue.py
+# Ollama 호출 대신 호출 횟수와 동시 실행 수를 기록하는 가짜 translate_text로 번역 대기열의 중복 제거/동시성 제한/종료를 확인합니다.
+import queue
+import threading
+import time
+
+from translator import OllamaTranslator, TranslationQueue
+
+
+class _StubTranslator(OllamaTranslator):
+    def __init__(self, release_event=None, delay=0.0):
+        super().__init__()
+        self.release_event = release_event
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def translate_text(self, text, *args, **kwargs):
+        with self._lock:
+            self.calls.append(text)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.release_event is not None: self.release_event.wait(timeout=5)
+            if self.delay: time.sleep(self.delay)
+            return "T(" + text + ")"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _make_queue(stub_translator, max_workers=4):
+    event_queue = queue.Queue()
+    translation_queue = TranslationQueue(stub_translator, '영어', '한국어', 'model', None, event_queue, max_workers=max_workers)
+    return translation_queue, event_queue
+
+
+def _collect(event_queue, count):
+    return dict((key, text) for _, key, text in (event_queue.get(timeout=5) for _ in range(count)))
+
+
+def test_identical_inflight_texts_share_one_request():
+    release_event = threading.Event()
+    stub_translator = _StubTranslator(release_event)
+    translation_queue, event_queue = _make_queue(stub_translator)
+    try:
+        translation_queue.submit('a', "Same caption", is_ocr_text=True)
+        translation_queue.submit('b', "Same caption", is_ocr_text=True) # 첫 요청이 끝나기 전에 같은 텍스트
+        assert translation_queue.inflight_count() == 1
+        release_event.set()
+
+        assert _collect(event_queue, 2) == {'a': "T(Same caption)", 'b': "T(Same caption)"}
+        assert stub_translator.calls == ["Same caption"]
+        assert translation_queue.submitted_count == 2 and translation_queue.request_count == 1
+    finally:
+        translation_queue.shutdown()
+
+
+def test_concurrency_limit_caps_parallel_requests():
+    stub_translator = _StubTranslator(delay=0.05)
+    translation_queue, event_queue = _make_queue(stub_translator, max_workers=4)
+    try:
+        translation_queue.set_concurrency_limit(1)
+        for idx in range(4):
+            translation_queue.submit(idx, f"text {idx}")
+        assert _collect(event_queue, 4) == {idx: f"T(text {idx})" for idx in range(4)}
+        assert stub_translator.max_active == 1 and len(stub_translator.calls) == 4
+    finally:
+        translation_queue.shutdown()
+
+
+def test_shutdown_cancels_queued_requests_and_keeps_original_text():
+    release_event = threading.Event()
+    stub_translator = _StubTranslator(release_event)
+    translation_queue, event_queue = _make_queue(stub_translator, max_workers=1)
+    for idx in range(3):
+        translation_queue.submit(idx, f"text {idx}")
+    while not stub_translator.calls: time.sleep(0.01) # 첫 요청이 워커 스레드에서 시작될 때까지
+
+    translation_queue.shutdown() # 대기 중인 요청 취소 (cancel_futures)
+    release_event.set()
+
+    # 진행 중이던 요청은 번역되고, 취소된 요청은 원문 그대로 결과가 들어옴
+    assert _collect(event_queue, 3) == {0: "T(text 0)", 1: "text 1", 2: "text 2"}
+    assert stub_translator.calls == ["text 0"]
+    assert translation_queue.inflight_count() == 0
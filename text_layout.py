@@ -0,0 +1,240 @@
+# text_layout.py
+import importlib.util
+import logging
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from PIL import ImageFont
+
+logger = logging.getLogger(__name__)
+
+# 크기 탐색 시 글자 폭을 측정하는 기준 글꼴 크기. 다른 크기의 폭은 이 값에서 비례 환산 (벡터 폰트의 advance는 크기에 비례)
+REFERENCE_FONT_SIZE = 100
+# 비례 환산으로 고른 크기를 실제 폰트로 검증할 때 최대 축소 횟수 (힌팅/반올림 오차 보정용)
+MAX_VERIFY_STEPS = 6
+
+# 줄 처음에 올 수 없는 CJK 문장부호 (앞 글자에 붙여서 함께 줄바꿈)
+CJK_NO_LINE_START = set("、。，．・：；？！ー）」』】〕〉》〗〙〛〟'\"ゝゞヽヾぁぃぅぇぉっゃゅょゎァィゥェォッャュョヮヵヶ々〻‐゠–〜～,.!?)]}％%")
+# 태국어 결합 문자 (앞 자음에 붙어 하나의 클러스터를 이룸). 사라 암(U+0E33)은 결합 부호는 아니지만 줄 처음에 올 수 없음
+THAI_COMBINING_MARKS = set(chr(c) for c in [0x0E31, 0x0E33] + list(range(0x0E34, 0x0E3B)) + list(range(0x0E47, 0x0E4F)))
+
+_thai_word_tokenize = None
+_thai_tokenizer_checked = False
+
+
+class TextFitResult(NamedTuple):
+    font_size: int
+    lines: List[str]
+    width: int
+    height: int
+    line_spacing: int
+
+
+def char_script(char: str) -> str:
+    code_point = ord(char)
+    if char.isspace(): return 'space'
+    if 0x0E00 <= code_point <= 0x0E7F: return 'thai'
+    if (0x4E00 <= code_point <= 0x9FFF or 0x3400 <= code_point <= 0x4DBF or 0xF900 <= code_point <= 0xFAFF
+            or 0x3000 <= code_point <= 0x30FF or 0x31F0 <= code_point <= 0x31FF or 0xFF00 <= code_point <= 0xFFEF
+            or code_point >= 0x20000):
+        return 'cjk' # 한자/가나/전각 문자: 글자 단위 줄바꿈
+    return 'word' # 라틴/한글 등 공백으로 단어를 구분하는 문자: 단어 단위 줄바꿈
+
+
+def _get_thai_word_tokenize():
+    """pythainlp가 설치되어 있으면 사전 기반 태국어 단어 분리를 사용합니다 (없으면 클러스터 단위)."""
+    global _thai_word_tokenize, _thai_tokenizer_checked
+    if not _thai_tokenizer_checked:
+        _thai_tokenizer_checked = True
+        if importlib.util.find_spec("pythainlp") is not None:
+            try:
+                from pythainlp.tokenize import word_tokenize
+                _thai_word_tokenize = word_tokenize
+            except Exception as e_thai:
+                logger.warning(f"pythainlp 로드 실패, 태국어는 문자 클러스터 단위로 줄바꿈합니다: {e_thai}")
+    return _thai_word_tokenize
+
+
+def split_grapheme_clusters(text: str) -> List[str]:
+    """결합 문자(태국어 모음/성조 부호, 유니코드 결합 부호)를 앞 글자에 붙인 클러스터 목록을 반환합니다."""
+    clusters: List[str] = []
+    for char in text:
+        if clusters and (char in THAI_COMBINING_MARKS or 0x0300 <= ord(char) <= 0x036F):
+            clusters[-1] += char
+        else:
+            clusters.append(char)
+    return clusters
+
+
+def _segment_thai(run: str) -> List[str]:
+    word_tokenize = _get_thai_word_tokenize()
+    if word_tokenize is not None:
+        try:
+            return [w for w in word_tokenize(run, keep_whitespace=False) if w]
+        except Exception as e_tok:
+            logger.debug(f"태국어 단어 분리 실패, 클러스터 단위 사용: {e_tok}")
+    return split_grapheme_clusters(run)
+
+
+def split_break_units(paragraph: str) -> List[Tuple[str, str]]:
+    """
+    한 단락을 줄바꿈 가능한 단위 [(단위 텍스트, 뒤따르는 공백)] 로 나눕니다.
+    CJK는 글자 단위(줄 시작 금지 문장부호는 앞 글자에 붙임), 태국어는 단어(사전) 또는 클러스터 단위,
+    그 밖의 문자는 공백 기준 단어 단위입니다.
+    """
+    units: List[List[str]] = [] # [unit_text, trailing_space, script]
+    idx = 0
+    length = len(paragraph)
+    while idx < length:
+        char = paragraph[idx]
+        script = char_script(char)
+        if script == 'space':
+            if units: units[-1][1] += char
+            else: units.append(["", char, 'space'])
+            idx += 1
+        elif script == 'thai':
+            run_end = idx
+            while run_end < length and char_script(paragraph[run_end]) == 'thai':
+                run_end += 1
+            for thai_unit in _segment_thai(paragraph[idx:run_end]):
+                units.append([thai_unit, "", 'thai'])
+            idx = run_end
+        elif script == 'cjk':
+            if char in CJK_NO_LINE_START and units and not units[-1][1]:
+                units[-1][0] += char
+            else:
+                units.append([char, "", 'cjk'])
+            idx += 1
+        else:
+            if char in CJK_NO_LINE_START and units and not units[-1][1] and units[-1][2] == 'cjk':
+                units[-1][0] += char # CJK 뒤의 반각 문장부호
+            elif units and not units[-1][1] and units[-1][2] == 'word':
+                units[-1][0] += char
+            else:
+                units.append([char, "", 'word'])
+            idx += 1
+    return [(unit_text, trailing_space) for unit_text, trailing_space, _ in units]
+
+
+class _MeasuredText:
+    """단락별 줄바꿈 단위와 기준 크기에서의 폭을 한 번만 계산해 두고, 크기별 줄바꿈/높이 계산에 재사용합니다."""
+
+    def __init__(self, text: str, measure: Callable[[str], float]):
+        self.measure = measure
+        self.paragraphs: List[List[Tuple[str, str, float, float]]] = []
+        self._cluster_widths: Dict[str, List[Tuple[str, float]]] = {}
+        for paragraph in text.split("\n"):
+            self.paragraphs.append([(unit, space, measure(unit), measure(space) if space else 0.0)
+                                    for unit, space in split_break_units(paragraph)])
+
+    def clusters(self, unit: str) -> List[Tuple[str, float]]:
+        cluster_widths = self._cluster_widths.get(unit)
+        if cluster_widths is None:
+            cluster_widths = [(cluster, self.measure(cluster)) for cluster in split_grapheme_clusters(unit)]
+            self._cluster_widths[unit] = cluster_widths
+        return cluster_widths
+
+    def wrap(self, max_width: float, scale: float = 1.0) -> Tuple[List[str], float]:
+        """폭 max_width에 맞게 탐욕적으로 줄바꿈합니다. (줄 목록, 가장 긴 줄의 폭) 반환. 폭은 기준 폭 * scale."""
+        lines: List[str] = []
+        widest_line = 0.0
+        for paragraph_units in self.paragraphs:
+            current_line, current_width = "", 0.0
+            pending_space, pending_space_width = "", 0.0
+            for unit, space, unit_width_ref, space_width_ref in paragraph_units:
+                unit_width = unit_width_ref * scale
+                if current_line and current_width + pending_space_width + unit_width > max_width:
+                    lines.append(current_line); widest_line = max(widest_line, current_width)
+                    current_line, current_width = "", 0.0
+                    pending_space, pending_space_width = "", 0.0
+                if not current_line and unit_width > max_width: # 한 단위가 한 줄보다 길면 클러스터 단위로 나눔
+                    for cluster, cluster_width_ref in self.clusters(unit):
+                        cluster_width = cluster_width_ref * scale
+                        if current_line and current_width + cluster_width > max_width:
+                            lines.append(current_line); widest_line = max(widest_line, current_width)
+                            current_line, current_width = "", 0.0
+                        current_line += cluster
+                        current_width += cluster_width
+                elif unit:
+                    current_line += pending_space + unit
+                    current_width += pending_space_width + unit_width
+                pending_space, pending_space_width = space, space_width_ref * scale
+            lines.append(current_line if current_line else " ")
+            widest_line = max(widest_line, current_width)
+        return lines, widest_line
+
+
+def _vertical_metrics(font: 'ImageFont.ImageFont') -> Tuple[float, float]:
+    """(줄 상자 높이 = ascent + descent, multiline_text의 줄 간격 기준 = 'A' bbox 하단)을 반환합니다."""
+    try:
+        ascent, descent = font.getmetrics()
+        line_box_height = ascent + descent
+    except Exception:
+        bbox = font.getbbox("Ag")
+        line_box_height = bbox[3] - bbox[1]
+    try:
+        line_pitch_base = font.getbbox("A")[3]
+    except Exception:
+        line_pitch_base = line_box_height
+    return float(line_box_height), float(line_pitch_base)
+
+
+def _block_height(line_count: int, line_box_height: float, line_pitch_base: float, line_spacing: int) -> float:
+    # Pillow multiline_text: 줄 간격 = bbox("A")[3] + spacing, 첫 줄은 ascent 기준('la')에서 시작
+    return (line_count - 1) * (line_pitch_base + line_spacing) + line_box_height
+
+
+def fit_text_to_box(text: str, box_width: float, box_height: float,
+                    font_loader: Callable[[int], 'ImageFont.ImageFont'],
+                    advance_fn: Callable[['ImageFont.ImageFont', str], float],
+                    min_font_size: int, max_font_size: int,
+                    line_spacing_ratio: float = 0.2) -> TextFitResult:
+    """
+    box_width x box_height 영역에 들어가는 가장 큰 글꼴 크기와 줄바꿈 결과를 구합니다.
+    - 줄바꿈 단위와 글자 폭은 기준 크기에서 한 번만 측정하고(advance_fn은 글자별 폭 메모이즈 권장),
+      탐색 단계마다 폭은 비례 환산, 높이는 줄 수로 해석적으로 계산하므로 Pillow 레이아웃 호출이 없습니다.
+    - 고른 크기는 실제 폰트의 폭/높이로 검증하고, 넘치면 한 단계씩 줄입니다.
+    """
+    from PIL import ImageFont
+
+    max_font_size = max(min_font_size, int(max_font_size))
+    reference_font = font_loader(REFERENCE_FONT_SIZE)
+    is_scalable = isinstance(reference_font, ImageFont.FreeTypeFont)
+
+    if is_scalable:
+        measured_ref = _MeasuredText(text, lambda s: advance_fn(reference_font, s))
+        ref_line_box_height, ref_line_pitch_base = _vertical_metrics(reference_font)
+
+        def _fits_estimated(font_size: int) -> bool:
+            scale = font_size / REFERENCE_FONT_SIZE
+            lines, _ = measured_ref.wrap(box_width, scale)
+            block_height = _block_height(len(lines), ref_line_box_height * scale, ref_line_pitch_base * scale,
+                                         int(font_size * line_spacing_ratio))
+            return block_height <= box_height
+
+        low, high = min_font_size, max_font_size
+        best_size = min_font_size
+        while low <= high:
+            mid_size = (low + high) // 2
+            if _fits_estimated(mid_size):
+                best_size = mid_size
+                low = mid_size + 1
+            else:
+                high = mid_size - 1
+    else:
+        best_size = min_font_size # 크기 조절이 안 되는 비트맵 폰트
+
+    # 실제 폰트로 검증 (힌팅/반올림으로 비례 환산보다 넓어진 경우 한 단계씩 축소)
+    font_size = best_size
+    for verify_step in range(MAX_VERIFY_STEPS + 1):
+        sized_font = font_loader(font_size)
+        measured = _MeasuredText(text, lambda s, f=sized_font: advance_fn(f, s))
+        lines, widest_line = measured.wrap(box_width)
+        line_box_height, line_pitch_base = _vertical_metrics(sized_font)
+        line_spacing = int(font_size * line_spacing_ratio)
+        block_height = _block_height(len(lines), line_box_height, line_pitch_base, line_spacing)
+        fits = widest_line <= box_width and block_height <= box_height
+        if fits or font_size <= min_font_size or verify_step == MAX_VERIFY_STEPS or not is_scalable:
+            return TextFitResult(font_size, lines, int(round(widest_line)), int(round(block_height)), line_spacing)
+        font_size -= 1
+    return TextFitResult(font_size, lines, int(round(widest_line)), int(round(block_height)), line_spacing)
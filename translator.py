@@ -1,10 +1,11 @@
 # translator.py
 import logging
 import time
-from typing import TYPE_CHECKING, Optional, List, Dict # Dict 추가
+from typing import TYPE_CHECKING, Any, Hashable, Optional, List, Dict # Dict 추가
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import queue
 import hashlib # 캐시 키 생성에 사용 가능 (선택적)
 
 # 설정 파일 import
@@ -21,6 +22,8 @@ class OllamaTranslator:
     def __init__(self):
         # 실행 중 번역 캐시: {(src_lang, tgt_lang, model, text_hash): translated_text}
         self.translation_cache: Dict[str, str] = {}
+        # 요청마다 Ollama options에 더할 실행 설정 (예: CpuResourceManager의 num_thread). 번역 결과와 무관하므로 캐시 키에 포함하지 않음
+        self.runtime_options: Dict[str, Any] = {}
         logger.info(f"OllamaTranslator 초기화됨. 번역 작업자 수: {MAX_TRANSLATION_WORKERS}")
 
     def _get_cache_key(self, text_to_translate: str, src_lang_ui_name: str, tgt_lang_ui_name: str, model_name: str) -> str:
@@ -60,6 +63,7 @@ class OllamaTranslator:
                 "prompt": prompt,
                 "stream": False,
                 "options": {
+                    **self.runtime_options,
                     "temperature": current_temperature
                 }
             }
@@ -202,4 +206,111 @@ class OllamaTranslator:
         새 문서 번역 시작 시 호출하여 이전 문서의 캐시가 영향을 주지 않도록 할 수 있습니다.
         """
         logger.info(f"실행 중 번역 캐시({len(self.translation_cache)} 항목)가 비워졌습니다.")
-        self.translation_cache.clear()
\ No newline at end of file
+        self.translation_cache.clear()
+
+
+class TranslationQueue:
+    """
+    번역 요청을 하나의 스레드 풀에 계속 제출하고, 완료되는 대로 결과를 이벤트 큐에 넣는 번역 대기열.
+    결과는 event_queue에 ('translation', key, translated_text) 형태로 들어갑니다.
+    translate_texts_batch와 달리 호출 측이 결과를 기다리는 동안 다른 작업(OCR 결과 처리 등)을 함께 진행할 수 있습니다.
+    같은 텍스트가 번역 중에 다시 제출되면(여러 이미지에 반복되는 OCR 문구 등) 요청을 새로 보내지 않고 진행 중인 결과를 함께 받습니다.
+    """
+
+    def __init__(self, translator: OllamaTranslator, src_lang_ui_name: str, tgt_lang_ui_name: str,
+                 model_name: str, ollama_service_instance: 'OllamaService',
+                 event_queue: "queue.Queue", ocr_temperature: Optional[float] = None,
+                 stop_event: Optional[threading.Event] = None, max_workers: Optional[int] = None):
+        self.translator = translator
+        self.src_lang_ui_name = src_lang_ui_name
+        self.tgt_lang_ui_name = tgt_lang_ui_name
+        self.model_name = model_name
+        self.ollama_service_instance = ollama_service_instance
+        self.event_queue = event_queue
+        self.ocr_temperature = ocr_temperature
+        self.stop_event = stop_event
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or MAX_TRANSLATION_WORKERS,
+                                            thread_name_prefix="TranslationQueue")
+        self._lock = threading.Lock()
+        self._inflight: Dict[tuple, List[Hashable]] = {} # (text, is_ocr_text) -> 결과를 받을 key 목록
+        # 동시에 Ollama로 보낼 요청 수 상한 (CpuResourceManager가 조절, None이면 스레드 풀 크기만큼)
+        self._slot_condition = threading.Condition()
+        self._concurrency_limit: Optional[int] = None
+        self._active_requests = 0
+        self.submitted_count = 0
+        self.request_count = 0
+
+    def submit(self, key: Hashable, text: str, is_ocr_text: bool = False) -> None:
+        if not text or not text.strip() or text.startswith("오류:"):
+            self._post(key, text if text else "")
+            return
+        if self.stop_event and self.stop_event.is_set(): # 중단 시 원본 유지
+            self._post(key, text)
+            return
+
+        cache_key = self.translator._get_cache_key(text, self.src_lang_ui_name, self.tgt_lang_ui_name, self.model_name)
+        if cache_key in self.translator.translation_cache:
+            logger.debug(f"번역 대기열 캐시 사용 (키: {cache_key}): '{text[:30]}...'")
+            self._post(key, self.translator.translation_cache[cache_key])
+            return
+
+        inflight_key = (text, is_ocr_text)
+        with self._lock:
+            self.submitted_count += 1
+            waiting_keys = self._inflight.get(inflight_key)
+            if waiting_keys is not None: # 동일 텍스트 번역이 이미 진행 중
+                waiting_keys.append(key)
+                return
+            self._inflight[inflight_key] = [key]
+            self.request_count += 1
+        future = self._executor.submit(self._translate, text, is_ocr_text)
+        future.add_done_callback(lambda f, ik=inflight_key: self._on_done(ik, f))
+
+    def inflight_count(self) -> int:
+        """번역 대기 중이거나 진행 중인 (중복 제외) 요청 수."""
+        with self._lock:
+            return len(self._inflight)
+
+    def set_concurrency_limit(self, concurrency_limit: Optional[int]) -> None:
+        with self._slot_condition:
+            self._concurrency_limit = max(1, int(concurrency_limit)) if concurrency_limit is not None else None
+            self._slot_condition.notify_all()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.set_concurrency_limit(None) # 대기 중인 작업 스레드 깨우기
+
+    def _translate(self, text: str, is_ocr_text: bool) -> str:
+        with self._slot_condition:
+            while self._concurrency_limit is not None and self._active_requests >= self._concurrency_limit:
+                if self.stop_event and self.stop_event.is_set(): break
+                self._slot_condition.wait(timeout=0.5)
+            self._active_requests += 1
+        try:
+            if self.stop_event and self.stop_event.is_set():
+                return text
+            return self.translator.translate_text(text, self.src_lang_ui_name, self.tgt_lang_ui_name,
+                                                  self.model_name, self.ollama_service_instance,
+                                                  is_ocr_text, self.ocr_temperature)
+        finally:
+            with self._slot_condition:
+                self._active_requests -= 1
+                self._slot_condition.notify()
+
+    def _on_done(self, inflight_key: tuple, future) -> None:
+        text = inflight_key[0]
+        with self._lock:
+            waiting_keys = self._inflight.pop(inflight_key, [])
+        if future.cancelled():
+            translated_text = text
+        else:
+            try:
+                translated_text = future.result()
+            except Exception as e:
+                logger.error(f"번역 대기열 '{text[:20]}...' 처리 오류: {e}")
+                translated_text = f"오류: 대기열 처리 중 예외 - {text[:20]}..."
+        for key in waiting_keys:
+            self._post(key, translated_text)
+
+    def _post(self, key: Hashable, translated_text: str) -> None:
+        self.event_queue.put(('translation', key, translated_text))
@@ -1,5 +1,7 @@
 import subprocess
 import os
+import importlib
+import importlib.util
 import platform
 import sys
 import logging
@@ -7,12 +9,12 @@ import logging
 logger = logging.getLogger(__name__)
 
 def check_paddleocr():
-    """PaddleOCR 설치 여부를 확인합니다."""
+    """PaddleOCR 설치 여부를 확인합니다. 패키지를 import하지 않고 find_spec으로 찾기만 하므로 빠릅니다 (paddle 로드 없음)."""
     try:
-        import paddleocr # 패키지명 paddleocr (라이브러리 paddlepaddle)
-        logger.debug("paddleocr 모듈 import 성공.")
-        return True
-    except ImportError:
+        importlib.invalidate_caches() # 실행 중 pip 설치 직후에도 새 패키지를 찾을 수 있도록
+        if importlib.util.find_spec("paddleocr") is not None:
+            logger.debug("paddleocr 모듈 확인됨.")
+            return True
         logger.warning("paddleocr 모듈을 찾을 수 없습니다. (미설치)")
         return False
     except Exception as e:
@@ -36,12 +38,12 @@ def install_paddleocr():
         return False
 
 def check_easyocr():
-    """EasyOCR 설치 여부를 확인합니다."""
+    """EasyOCR 설치 여부를 확인합니다. 패키지를 import하지 않고 find_spec으로 찾기만 하므로 빠릅니다 (torch 로드 없음)."""
     try:
-        import easyocr
-        logger.debug("easyocr 모듈 import 성공.")
-        return True
-    except ImportError:
+        importlib.invalidate_caches() # 실행 중 pip 설치 직후에도 새 패키지를 찾을 수 있도록
+        if importlib.util.find_spec("easyocr") is not None:
+            logger.debug("easyocr 모듈 확인됨.")
+            return True
         logger.warning("easyocr 모듈을 찾을 수 없습니다. (미설치)")
         return False
     except Exception as e: